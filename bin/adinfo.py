@@ -39,37 +39,32 @@
 
 
 import dwf
+import enumeration
 
 print("DWF Version: " + dwf.GetVersion())
 
-number_of_devices = dwf.EnumDevices()
-print("Number of Devices: " + str(dwf.EnumDevices()))
+records = enumeration.devices()
+print("Number of Devices: " + str(len(records)))
 
-for each_device_index in range(0, number_of_devices):
-
-    device_name = dwf.EnumDeviceName(each_device_index)
-    serialnum = dwf.EnumSN(each_device_index)
-    device_type, device_revision = dwf.EnumDeviceType(each_device_index)
+for record in records:
 
     print("-------------------------------------------------------------------------------")
-    print("Device " + str(each_device_index) + " : ")
-    print("\tName: \'" + str(device_name) + "' " + serialnum)
-    print("\tID: " + str(device_type) + " rev: " + hex(device_revision))
+    print("Device " + str(record.index) + " : ")
+    print("\tName: \'" + str(record.name) + "' " + record.serial_number)
+    print("\tID: " + str(record.device_type) + " rev: " + hex(record.revision))
 
     print("\tConfigurations:")
 
-    config_count = dwf.EnumConfig(each_device_index)
-
-    for each_config_index in range (0, config_count):
+    for each_config_index in range (0, len(record.configurations)):
         config_str = "\t" + str(each_config_index)+"."
 
-        config_str += " AnalogIn: " + str(dwf.EnumConfigInfo(each_config_index, dwf.ConfigInfo.ANALOG_IN_CHANNEL_COUNT))
-        config_str += " x " + str(dwf.EnumConfigInfo(each_config_index, dwf.ConfigInfo.ANALOG_IN_BUFFER_SIZE))
-        config_str += " \tAnalogOut: " + str(dwf.EnumConfigInfo(each_config_index, dwf.ConfigInfo.ANALOG_OUT_CHANNEL_COUNT))
-        config_str += " x " + str(dwf.EnumConfigInfo(each_config_index, dwf.ConfigInfo.ANALOG_OUT_BUFFER_SIZE))
-        config_str += " \tDigitalIn: " + str(dwf.EnumConfigInfo(each_config_index, dwf.ConfigInfo.DIGITAL_IN_CHANNEL_COUNT))
-        config_str += " x " + str(dwf.EnumConfigInfo(each_config_index, dwf.ConfigInfo.DIGITAL_IN_BUFFER_SIZE))
-        config_str += " \tDigitalOut: " + str(dwf.EnumConfigInfo(each_config_index, dwf.ConfigInfo.DIGITAL_OUT_CHANNEL_COUNT))
-        config_str += " x " + str(dwf.EnumConfigInfo(each_config_index, dwf.ConfigInfo.DIGITAL_OUT_BUFFER_SIZE))
+        config_str += " AnalogIn: " + str(record.config_info(each_config_index, dwf.ConfigInfo.ANALOG_IN_CHANNEL_COUNT))
+        config_str += " x " + str(record.config_info(each_config_index, dwf.ConfigInfo.ANALOG_IN_BUFFER_SIZE))
+        config_str += " \tAnalogOut: " + str(record.config_info(each_config_index, dwf.ConfigInfo.ANALOG_OUT_CHANNEL_COUNT))
+        config_str += " x " + str(record.config_info(each_config_index, dwf.ConfigInfo.ANALOG_OUT_BUFFER_SIZE))
+        config_str += " \tDigitalIn: " + str(record.config_info(each_config_index, dwf.ConfigInfo.DIGITAL_IN_CHANNEL_COUNT))
+        config_str += " x " + str(record.config_info(each_config_index, dwf.ConfigInfo.DIGITAL_IN_BUFFER_SIZE))
+        config_str += " \tDigitalOut: " + str(record.config_info(each_config_index, dwf.ConfigInfo.DIGITAL_OUT_CHANNEL_COUNT))
+        config_str += " x " + str(record.config_info(each_config_index, dwf.ConfigInfo.DIGITAL_OUT_BUFFER_SIZE))
 
-        print(config_str)
\ No newline at end of file
+        print(config_str)
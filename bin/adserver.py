@@ -0,0 +1,66 @@
+#! /usr/bin/env python3
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Sample Usage
+# host:~$ python3 ./bin/adserver.py &
+# host:~$ python3 ./bin/i2cget.py 0x18 0x00
+#
+# While the server runs, the i2c tools send their transactions to it instead
+# of opening the device themselves.
+
+from pyanalogdiscovery import PyAnalogDiscoveryException, AnalogDiscoveryProConfiguration
+from dwf import DwfApiException
+import deviceserver
+import argparse
+import signal
+import sys
+
+def main(argv):
+
+    server = None
+    try:
+        parser = argparse.ArgumentParser(description='adserver keeps a Digilent Analog Discovery device open and serves I2C, GPIO and scope commands on a Unix socket, so that the i2c tools do not open and close the device on every run.')
+        parser.add_argument('--socket', default=None, help='The Unix socket to listen on (default $PYANALOGDISCOVERY_SOCKET, $XDG_RUNTIME_DIR/pyanalogdiscovery.sock, or /tmp/pyanalogdiscovery-<uid>.sock).')
+        parser.add_argument('--device-name', default=None, help='The user name of the device to open (default the first ADP3450).')
+        args = parser.parse_args(argv)
+
+        server = deviceserver.DeviceServer(args.socket, AnalogDiscoveryProConfiguration.SCOPE_32K_WAVEGEN_32K_LOGIC_32K_PATTERNS_16K, args.device_name)
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        print("Serving %s on %s" % (server.device.serial_num, server.socket_path))
+        server.serve_forever()
+
+    except KeyboardInterrupt:
+        pass
+    except PyAnalogDiscoveryException as e:
+        print("Error/Warning %d occurred\n%s" % (e.status, e))
+    except DwfApiException as e:
+        print("Error/Warning %d occurred\n%s" % (e.status, e))
+    finally:
+        if (server != None):
+            server.server_close()
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -36,55 +36,68 @@
 # 60: -- -- -- -- -- -- -- -- -- -- -- -- -- -- -- --
 # 70: -- -- -- -- -- -- -- --
 
-from pyanalogdiscovery import PyAnalogDiscovery, PyAnalogDiscoveryException, AnalogDiscoveryProConfiguration, I2cClockRate, Pins
+from pyanalogdiscovery import PyAnalogDiscovery, PyAnalogDiscoveryException, AnalogDiscoveryProConfiguration, I2cClockRate, I2cScanStrategy, Pins
 from dwf import DwfApiException
+import deviceserver
 import argparse
 import sys
 
+def print_table(found):
+
+    # Print Address Columnn Headers
+    print("   ", end='')
+    for lsb in range(16):
+        print("  %s" % hex(lsb).replace("0x",""), end='')
+
+    # Print Address Row Headers - with address if chip found
+    for msb in range(8):
+        print()
+        print("%s:" % format((msb << 4), '#04x').replace("0x",""), end='')
+
+        for lsb in range(16):
+            address = ((msb << 4) | lsb)
+            address_str = " %s" % format(address, '#04x').replace("0x","")
+
+            if ((address >= 0 and address < 3) or address > 0x77):
+                address_str = "   "
+            elif (address not in found):
+                address_str = " --"
+            print(address_str, end='')
+    print()
+
 def main(argv):
 
     analogdiscovery = None
     try:
         parser = argparse.ArgumentParser(description='i2cdetect is a userspace program to scan an I2C bus for devices using a Digilent Analog Discovery device. It outputs a table with the list of detected devices on the specified bus. The bus is specified via the scl and sda DIO lines of the Analog Discovery device.')
-        parser.add_argument('--scl', default=0, help='The DIO pin to use as the I2C clock line (default 0 if not specified).')
-        parser.add_argument('--sda', default=1, help='The DIO pin to use as the I2C data line (default 1 if not specified).')
-        parser.add_argument('--clock-rate', default=100000, help='The I2C clock rate in Herz (default 100,000 Hz-- or 100 KHz--if not specified).')
-        args = parser.parse_args()
+        parser.add_argument('--scl', default=0, type=int, help='The DIO pin to use as the I2C clock line (default 0 if not specified).')
+        parser.add_argument('--sda', default=1, type=int, help='The DIO pin to use as the I2C data line (default 1 if not specified).')
+        parser.add_argument('--clock-rate', default=100000, type=int, help='The I2C clock rate in Herz (default 100,000 Hz-- or 100 KHz--if not specified).')
+        parser.add_argument('--bus', action='append', metavar='SCL,SDA', help='Scan the bus on these DIO lines instead of --scl/--sda. May be given several times to scan several buses in one session.')
+        mode = parser.add_mutually_exclusive_group()
+        mode.add_argument('-q', dest='strategy', action='store_const', const=I2cScanStrategy.QUICK_WRITE, help='Probe with zero-length writes (the default).')
+        mode.add_argument('-r', dest='strategy', action='store_const', const=I2cScanStrategy.READ_BYTE, help='Probe with single byte reads.')
+        mode.add_argument('-w', dest='strategy', action='store_const', const=I2cScanStrategy.WRITE_READ, help='Probe by writing register 0 and reading one byte back.')
+        parser.set_defaults(strategy=I2cScanStrategy.QUICK_WRITE)
+        args = parser.parse_args(argv)
 
-        scl = Pins(args.scl)
-        sda = Pins(args.sda)
+        if (args.bus is None):
+            buses = [ (Pins(args.scl), Pins(args.sda)) ]
+        else:
+            buses = [ tuple(Pins(int(pin)) for pin in bus.split(',')) for bus in args.bus ]
         clock_rate = I2cClockRate(args.clock_rate)
 
-        analogdiscovery = PyAnalogDiscovery(AnalogDiscoveryProConfiguration.SCOPE_32K_WAVEGEN_32K_LOGIC_32K_PATTERNS_16K)
+        analogdiscovery = deviceserver.open_device(AnalogDiscoveryProConfiguration.SCOPE_32K_WAVEGEN_32K_LOGIC_32K_PATTERNS_16K)
         i2c = analogdiscovery.acquire_inter_integrated_circuit()
 
-        # Print Address Columnn Headers
-        print("   ", end='')
-        for lsb in range(16):
-            print("  %s" % hex(lsb).replace("0x",""), end='')
-
-        # Print Address Row Headers - with address if chip found
-        for msb in range(8):
-            print()
-            print("%s:" % format((msb << 4), '#04x').replace("0x",""), end='')
-
-            for lsb in range(16):
-                address = ((msb << 4) | lsb)
-                address_str = " %s" % format(address, '#04x').replace("0x","")
-
-                if ((address >= 0 and address < 3) or address > 0x77):
-                    address_str = "   "
-                else:
-                    is_nak = -1
-                    try:
-                        i2c.configure_bus(clock_rate, address, scl, sda)
-                        data_read, is_nak = i2c.write_read(write_data = [ 0x0 ], read_data_size = 1)
-                    except:
-                        pass
-                    if (is_nak != 0):
-                        address_str = " --"
-                print(address_str, end='')
-        print()
+        results = i2c.scan_buses(buses, clock_rate, args.strategy)
+        for (scl, sda), found in results.items():
+            if (len(results) > 1):
+                print("SCL %s, SDA %s:" % (scl, sda))
+            if (found is None):
+                print("Bus error, check the pullups")
+            else:
+                print_table(found)
 
     except PyAnalogDiscoveryException as e:
         print("Error/Warning %d occurred\n%s" % (e.status, e))
@@ -46,48 +46,84 @@
 
 from pyanalogdiscovery import PyAnalogDiscovery, PyAnalogDiscoveryException, AnalogDiscoveryProConfiguration, I2cClockRate, Pins
 from dwf import DwfApiException
+import deviceserver
+import i2cscript
 import argparse
 import sys
 
+def register_range(text):
+    first, _, last = text.partition('-')
+    try:
+        first, last = int(first, 0), int(last, 0)
+    except ValueError:
+        raise argparse.ArgumentTypeError("invalid register range '%s'" % text)
+    if (not (0x00 <= first <= last <= 0xFF)):
+        raise argparse.ArgumentTypeError("register range '%s' must satisfy 0x00 <= FIRST <= LAST <= 0xff" % text)
+    return (first, last)
+
+def print_table(data, first):
+
+    # Print Address Columnn Headers
+    print("   ", end='')
+    for least_significant_addr_byte in range(16):
+        print("  %s" % hex(least_significant_addr_byte).replace("0x",""), end='')
+    print()
+
+    # Print Address Row Headers - with values
+    last = first + len(data) - 1
+    for register_addr in range(first & 0xF0, last + 1, 16):
+        print("%s:" % format(register_addr, '#04x').replace("0x",""), end='')
+
+        data_read_str = ''
+        for register in range(register_addr, register_addr + 16):
+            if (register < first or register > last):
+                data_read_str += "   "
+            else:
+                data_read_str += " %s" % format(data[register - first], '#04x').replace("0x","")
+
+        print(data_read_str)
+
 def main(argv):
 
     analogdiscovery = None
     try:
-        parser = argparse.ArgumentParser(description='i2cdetect is a userspace program to scan an I2C bus for devices using a Digilent Analog Discovery device. It outputs a table with the list of detected devices on the specified bus. The bus is specified via the scl and sda DIO lines of the Analog Discovery device.')
-        parser.add_argument('--scl', default=0, help='The DIO pin to use as the I2C clock line (default 0 if not specified).')
-        parser.add_argument('--sda', default=1, help='The DIO pin to use as the I2C data line (default 1 if not specified).')
-        parser.add_argument('--clock-rate', default=100000, help='The I2C clock rate in Herz (default 100,000 Hz-- or 100 KHz--if not specified).')
-        parser.add_argument('address', type=lambda x: int(x,0), help='The I2C address to be scanned, and is an integer/hex number between 0x03 and 0x77.')
-        args = parser.parse_args()
+        parser = argparse.ArgumentParser(description='i2cdump is a small helper program to examine registers visible through the I2C bus using a Digilent Analog Discovery device. The bus is specified via the scl and sda DIO lines of the Analog Discovery device.')
+        parser.add_argument('--scl', default=0, type=int, help='The DIO pin to use as the I2C clock line (default 0 if not specified).')
+        parser.add_argument('--sda', default=1, type=int, help='The DIO pin to use as the I2C data line (default 1 if not specified).')
+        parser.add_argument('--clock-rate', default=100000, type=int, help='The I2C clock rate in Herz (default 100,000 Hz-- or 100 KHz--if not specified).')
+        parser.add_argument('-r', dest='range', default=(0x00, 0xFF), type=register_range, metavar='FIRST-LAST', help='Dump only the registers FIRST to LAST, e.g. 0x10-0x3f (default 0x00-0xff).')
+        parser.add_argument('--chunk', default=256, type=int, help='The number of registers fetched per transaction (default 256). Use 1 for devices that do not auto-increment the register address.')
+        parser.add_argument('--format', default='table', choices=['table', 'hex', 'binary'], help='Print a table (default), a plain hex stream, or write the raw bytes to stdout.')
+        parser.add_argument('--batch', metavar='FILE', default=None, help='Run the operations listed in FILE (- for stdin), one per line, on a single device session. Lines take the same arguments as the command line, optionally prefixed by get, set or dump.')
+        parser.add_argument('--json', action='store_true', help='In batch mode, write one JSON object per operation instead of text.')
+        parser.add_argument('address', type=lambda x: int(x,0), nargs='?', help='The I2C address to be scanned, and is an integer/hex number between 0x03 and 0x77.')
+        args = parser.parse_args(argv)
+        if (args.batch == None and args.address == None):
+            parser.error("address is required unless --batch is given")
 
         address = args.address
+        first, last = args.range
         scl = Pins(args.scl)
         sda = Pins(args.sda)
         clock_rate = I2cClockRate(args.clock_rate)
 
-        analogdiscovery = PyAnalogDiscovery(AnalogDiscoveryProConfiguration.SCOPE_32K_WAVEGEN_32K_LOGIC_32K_PATTERNS_16K)
+        analogdiscovery = deviceserver.open_device(AnalogDiscoveryProConfiguration.SCOPE_32K_WAVEGEN_32K_LOGIC_32K_PATTERNS_16K)
         i2c = analogdiscovery.acquire_inter_integrated_circuit()
 
-        i2c.configure_bus(clock_rate, address, scl, sda)
-
-        # Print Address Columnn Headers
-        print("   ", end='')
-        for least_significant_addr_byte in range(16):
-            print("  %s" % hex(least_significant_addr_byte).replace("0x",""), end='')
-        print()
-
-        # Print Address Row Headers - with values
-        for most_significant_addr_byte in range(16):
-            register_addr = (most_significant_addr_byte << 4)
-            print("%s:" % format(register_addr, '#04x').replace("0x",""), end='')
+        i2c.configure_bus(clock_rate, address or 0, scl, sda)
 
-            data_read, is_nak = i2c.write_read(write_data = [register_addr], read_data_size = 16)
+        if (args.batch != None):
+            return i2cscript.run_file(i2c, args.batch, 'dump', sys.stdout, args.json, args.chunk)
 
-            data_read_str = ''
-            for each_data in data_read:
-                data_read_str += " %s" % format(each_data, '#04x').replace("0x","")
+        data = i2c.dump(first, last, args.chunk)
 
-            print(data_read_str)
+        if (args.format == 'binary'):
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+        elif (args.format == 'hex'):
+            print(data.hex())
+        else:
+            print_table(data, first)
 
     except PyAnalogDiscoveryException as e:
         print("Error/Warning %d occurred\n%s" % (e.status, e))
@@ -98,4 +134,4 @@ def main(argv):
             analogdiscovery.release()
 
 if __name__ == "__main__":
-    main(sys.argv[1:])
\ No newline at end of file
+    sys.exit(main(sys.argv[1:]))
@@ -33,6 +33,8 @@
 
 from pyanalogdiscovery import PyAnalogDiscovery, PyAnalogDiscoveryException, AnalogDiscoveryProConfiguration, I2cClockRate, Pins
 from dwf import DwfApiException
+import deviceserver
+import i2cscript
 import argparse
 import sys
 
@@ -41,13 +43,17 @@ def main(argv):
     analogdiscovery = None
     try:
         parser = argparse.ArgumentParser(description='i2cget is a small helper program to read registers visible through the I2C bus (or SMBus) using a Digilent Analog Discovery device. The bus is specified via the scl and sda DIO lines of the Analog Discovery device.')
-        parser.add_argument('--scl', default=0, help='The DIO pin to use as the I2C clock line (default 0 if not specified).')
-        parser.add_argument('--sda', default=1, help='The DIO pin to use as the I2C data line (default 1 if not specified).')
-        parser.add_argument('--clock-rate', default=100000, help='The I2C clock rate in Herz (default 100,000 Hz (or 100 KHz) if not specified).')
-        parser.add_argument('chip_address', metavar='chip-address', type=lambda x: int(x,0), help='Specified the I2C chip address to use, and is an integer between 0x03 and 0x77.')
-        parser.add_argument('data_address', metavar='data-address', type=lambda x: int(x,0), help='Specifies the data (or register) address on that chip to read from, and is an integer between 0x00 and 0xFF.')
+        parser.add_argument('--scl', default=0, type=int, help='The DIO pin to use as the I2C clock line (default 0 if not specified).')
+        parser.add_argument('--sda', default=1, type=int, help='The DIO pin to use as the I2C data line (default 1 if not specified).')
+        parser.add_argument('--clock-rate', default=100000, type=int, help='The I2C clock rate in Herz (default 100,000 Hz (or 100 KHz) if not specified).')
+        parser.add_argument('--batch', metavar='FILE', default=None, help='Run the operations listed in FILE (- for stdin), one per line, on a single device session. Lines take the same arguments as the command line, optionally prefixed by get, set or dump.')
+        parser.add_argument('--json', action='store_true', help='In batch mode, write one JSON object per operation instead of text.')
+        parser.add_argument('chip_address', metavar='chip-address', type=lambda x: int(x,0), nargs='?', help='Specified the I2C chip address to use, and is an integer between 0x03 and 0x77.')
+        parser.add_argument('data_address', metavar='data-address', type=lambda x: int(x,0), nargs='?', help='Specifies the data (or register) address on that chip to read from, and is an integer between 0x00 and 0xFF.')
         parser.add_argument('read_amount', metavar='read-amount', default=1, type=int, nargs='?', help='Specifies the number of bytes to read (default 1 byte if not specified).')
-        args = parser.parse_args()
+        args = parser.parse_args(argv)
+        if (args.batch == None and args.data_address == None):
+            parser.error("chip-address and data-address are required unless --batch is given")
 
         chip_address = args.chip_address
         data_address = args.data_address
@@ -56,10 +62,13 @@ def main(argv):
         sda = Pins(args.sda)
         clock_rate = I2cClockRate(args.clock_rate)
 
-        analogdiscovery = PyAnalogDiscovery(AnalogDiscoveryProConfiguration.SCOPE_32K_WAVEGEN_32K_LOGIC_32K_PATTERNS_16K)
+        analogdiscovery = deviceserver.open_device(AnalogDiscoveryProConfiguration.SCOPE_32K_WAVEGEN_32K_LOGIC_32K_PATTERNS_16K)
         i2c = analogdiscovery.acquire_inter_integrated_circuit()
 
-        i2c.configure_bus(clock_rate, chip_address, scl, sda)
+        i2c.configure_bus(clock_rate, chip_address or 0, scl, sda)
+
+        if (args.batch != None):
+            return i2cscript.run_file(i2c, args.batch, 'get', sys.stdout, args.json)
 
         data_read, is_nak = i2c.write_read(write_data = [data_address], read_data_size = read_amount)
 
@@ -80,4 +89,4 @@ def main(argv):
             analogdiscovery.release()
 
 if __name__ == "__main__":
-    main(sys.argv[1:])
\ No newline at end of file
+    sys.exit(main(sys.argv[1:]))
\ No newline at end of file
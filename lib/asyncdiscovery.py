@@ -0,0 +1,178 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Asyncio front end. Driver calls block, so every device gets one worker thread
+# of its own and the coroutines of this module hand the blocking calls to it:
+# the event loop never waits on the USB link, calls on one device run in the
+# order they were awaited, and calls on different devices run in parallel.
+#
+#   async with await asyncdiscovery.AsyncPyAnalogDiscovery.open(configuration) as device:
+#       i2c = await device.acquire_inter_integrated_circuit()
+#       await i2c.configure_bus(I2cClockRate.ONE_HUNDRED_KHZ, 0x18, Pins.DIO_0, Pins.DIO_1)
+#       data, is_nak = await i2c.write_read_bytes(b'\x00', 2, timeout = 0.5)
+#
+# Every coroutine takes a timeout (seconds) and can be cancelled. A call still
+# queued behind others is dropped; a call the worker has already entered runs
+# to completion, since a driver call cannot be interrupted, and its result is
+# discarded.
+
+import asyncio
+import concurrent.futures
+import functools
+import handlepool
+from pyanalogdiscovery import PyAnalogDiscovery
+
+class AsyncPyAnalogDiscovery(object):
+    ''' A PyAnalogDiscovery driven from asyncio. Create it with the open()
+        coroutine; the device is opened and used only by the worker thread of
+        the instance, and closed by release() (or at the end of an async with
+        block).
+    '''
+    def __init__(self, device: PyAnalogDiscovery, executor: concurrent.futures.ThreadPoolExecutor):
+        self.device = device
+        self.device_name = device.device_name
+        self.serial_num = device.serial_num
+        self._executor = executor
+
+    @classmethod
+    async def open(cls, configuration, device_name: str = None, pool: handlepool.HandlePool = None, timeout: float = None, serial_number: str = None):
+        ''' Opens a device (see PyAnalogDiscovery) on a new worker thread and
+            returns the AsyncPyAnalogDiscovery driving it. If the open times
+            out or is cancelled after it started, the device is released as
+            soon as the constructor returns.
+        '''
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers = 1, thread_name_prefix = "dwf-device")
+        future = executor.submit(PyAnalogDiscovery, configuration, device_name, pool, serial_number)
+        try:
+            device = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except BaseException:
+            if (future.cancel() == False):
+                future.add_done_callback(_release_abandoned)
+            executor.shutdown(wait = False)
+            raise
+        return cls(device, executor)
+
+    async def call(self, function, *args, timeout: float = None, **kwargs):
+        ''' Runs function(*args, **kwargs) on the worker thread of the device
+            and returns its result. Use it for anything the coroutines of this
+            class do not cover, such as a dwf function on device.hdwf or a
+            whole sequence of session calls that must not be interleaved with
+            other calls.
+        '''
+        return await _run(self._executor, timeout, function, *args, **kwargs)
+
+    async def reset(self, timeout: float = None) -> None:
+        await self.call(self.device.reset, timeout = timeout)
+
+    async def acquire_inter_integrated_circuit(self, reset: bool = True, timeout: float = None):
+        return await self._acquire(self.device.acquire_inter_integrated_circuit, reset, timeout)
+
+    async def acquire_oscilloscope(self, reset: bool = True, timeout: float = None):
+        return await self._acquire(self.device.acquire_oscilloscope, reset, timeout, AsyncOscilloscope)
+
+    async def acquire_logic_analyzer(self, reset: bool = True, timeout: float = None):
+        return await self._acquire(self.device.acquire_logic_analyzer, reset, timeout)
+
+    async def acquire_waveform_generator(self, reset: bool = True, timeout: float = None):
+        return await self._acquire(self.device.acquire_waveform_generator, reset, timeout)
+
+    async def acquire_power_supply(self, reset: bool = True, timeout: float = None):
+        return await self._acquire(self.device.acquire_power_supply, reset, timeout)
+
+    async def acquire_digital_io(self, reset: bool = True, timeout: float = None):
+        return await self._acquire(self.device.acquire_digital_io, reset, timeout)
+
+    async def release(self) -> None:
+        ''' Releases the device once the calls already queued have run, then
+            stops the worker thread.
+        '''
+        if (self._executor is None):
+            return
+        executor = self._executor
+        self._executor = None
+        try:
+            await _run(executor, None, self.device.release)
+        finally:
+            executor.shutdown(wait = False)
+
+    async def _acquire(self, acquire, reset: bool, timeout: float, session_type = None):
+        session = await self.call(acquire, reset, timeout = timeout)
+        return (session_type or AsyncSession)(self, session)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.release()
+        return False
+
+class AsyncSession(object):
+    ''' Wraps an instrument session of PyAnalogDiscovery: every method of the
+        session becomes a coroutine running on the worker thread of the
+        device, with an extra timeout keyword argument. Other attributes
+        (hdwf, address, ...) are read from the session directly.
+    '''
+    def __init__(self, device: AsyncPyAnalogDiscovery, session):
+        self.device = device
+        self.session = session
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.session, name)
+        if (callable(attribute) == False):
+            return attribute
+        @functools.wraps(attribute)
+        async def method(*args, timeout: float = None, **kwargs):
+            return await self.device.call(attribute, *args, timeout = timeout, **kwargs)
+        return method
+
+class AsyncOscilloscope(AsyncSession):
+    async def capture(self, channel: int, out=None, poll_interval: float = 0.001, timeout: float = None):
+        ''' Starts an acquisition, waits for it to complete and returns the
+            samples of channel, as Oscilloscope.read does. The status is
+            polled every poll_interval seconds without holding the worker in
+            between, so calls on other sessions of the device can run while
+            the scope is acquiring. If the capture times out or is cancelled
+            the acquisition is left running; initiate() or reset_instrument()
+            starts over.
+        '''
+        return await asyncio.wait_for(self._capture(channel, out, poll_interval), timeout)
+
+    async def _capture(self, channel: int, out, poll_interval: float):
+        await self.device.call(self.session.initiate)
+        while (await self.device.call(self.session.is_done) == False):
+            await asyncio.sleep(poll_interval)
+        return await self.device.call(self.session.read, channel, out)
+
+def _release_abandoned(future: concurrent.futures.Future) -> None:
+    # Releases a device opened for a caller that stopped waiting for it.
+    if (future.cancelled() == False and future.exception() is None):
+        future.result().release()
+
+async def _run(executor: concurrent.futures.ThreadPoolExecutor, timeout: float, function, *args, **kwargs):
+    if (executor is None):
+        raise RuntimeError("device has been released")
+    # Cancelling the wrapped future cancels the executor future, which drops
+    # the call if the worker has not started it yet.
+    future = asyncio.wrap_future(executor.submit(function, *args, **kwargs))
+    return await asyncio.wait_for(future, timeout)
@@ -0,0 +1,472 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Local device server. A long-lived process (bin/adserver.py) keeps a device
+# open and serves I2C, GPIO and scope commands over a Unix socket, so that
+# short-lived tools skip the open and close of the device on every run.
+#
+# Every message is a frame made of a 5-byte little-endian header followed by
+# a payload. Requests carry (opcode u8, payload length u32); responses carry
+# (status u8, payload length u32). On success the payload is the result; on
+# failure it is an i32 status code followed by a UTF-8 message.
+#
+#   client = deviceserver.connect()
+#   if (client is not None):
+#       i2c = client.acquire_inter_integrated_circuit()
+
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+import dwf
+from pyanalogdiscovery import PyAnalogDiscovery, PyAnalogDiscoveryException, AnalogDiscoveryProConfiguration, I2cClockRate, I2cScanStrategy, Status
+from typing import List
+
+_REQUEST_HEADER = struct.Struct('<BI')
+_RESPONSE_HEADER = struct.Struct('<BI')
+_ERROR = struct.Struct('<i')
+_NAK = struct.Struct('<i')
+_PING = struct.Struct('<B')
+
+OP_PING = 0
+OP_I2C_CONFIGURE = 1
+OP_I2C_WRITE = 2
+OP_I2C_READ = 3
+OP_I2C_WRITE_READ = 4
+OP_I2C_SCAN = 5
+OP_I2C_DUMP = 6
+OP_GPIO_WRITE = 7
+OP_GPIO_READ = 8
+OP_SCOPE_CAPTURE = 9
+
+_I2C_CONFIGURE = struct.Struct('<IBBBB')
+_I2C_WRITE = struct.Struct('<B')
+_I2C_READ = struct.Struct('<BH')
+_I2C_WRITE_READ = struct.Struct('<BH')
+_I2C_SCAN = struct.Struct('<BBB')
+_I2C_DUMP = struct.Struct('<BBBH')
+_GPIO_WRITE = struct.Struct('<II')
+_GPIO_READ = struct.Struct('<I')
+_SCOPE_CAPTURE = struct.Struct('<BddId')
+
+STATUS_OK = 0
+STATUS_LIBRARY_ERROR = 1
+STATUS_DWF_ERROR = 2
+STATUS_SERVER_ERROR = 3
+STATUS_TIMEOUT = 4
+
+_I2C_OPCODES = (OP_I2C_WRITE, OP_I2C_READ, OP_I2C_WRITE_READ, OP_I2C_SCAN, OP_I2C_DUMP)
+
+def default_socket_path() -> str:
+    ''' The socket used when none is given: $PYANALOGDISCOVERY_SOCKET, then
+            the private $XDG_RUNTIME_DIR, then a per-user socket in the
+            temporary directory.
+    '''
+    path = os.environ.get('PYANALOGDISCOVERY_SOCKET')
+    if (path is None):
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+        if (runtime_dir is not None and os.path.isdir(runtime_dir)):
+            path = os.path.join(runtime_dir, 'pyanalogdiscovery.sock')
+        else:
+            path = os.path.join('/tmp', 'pyanalogdiscovery-%d.sock' % os.getuid())
+    return path
+
+def _receive(connection: socket.socket, count: int) -> bytes:
+    data = bytearray(count)
+    view = memoryview(data)
+    received = 0
+    while (received < count):
+        chunk = connection.recv_into(view[received:], count - received)
+        if (chunk == 0):
+            raise ConnectionError("device server connection closed")
+        received += chunk
+    return bytes(data)
+
+class RemoteException(PyAnalogDiscoveryException):
+    ''' A library error raised by the server. The message is the one the
+        server read from libdwf, so nothing is loaded on the client side.
+    '''
+    def __init__(self, status, message: str):
+        super().__init__(status, message)
+
+class RemoteDwfException(dwf.DwfApiException):
+    ''' A libdwf error raised by the server.
+    '''
+    def __init__(self, status, message: str):
+        super().__init__(status)
+        self.message = message
+
+    def __str__(self):
+        if (len(self.message) == 0):
+            return str(self.status)
+        return str(self.status) + "\n" + self.message
+
+# #------------------------------------------------------------------------------
+# Server
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def setup(self):
+        # The I2C bus this client configured. The server serves every client
+        # from one I2C session, so it is applied again before each I2C request.
+        self.i2c_bus = None
+
+    def handle(self):
+        server = self.server
+        while (True):
+            try:
+                opcode, length = _REQUEST_HEADER.unpack(_receive(self.request, _REQUEST_HEADER.size))
+                payload = _receive(self.request, length)
+            except ConnectionError:
+                return
+            try:
+                with server.device_lock:
+                    status, result = STATUS_OK, server.execute(opcode, payload, self)
+            except PyAnalogDiscoveryException as e:
+                status, result = STATUS_LIBRARY_ERROR, _ERROR.pack(int(e.status)) + str(e).encode('utf-8')
+            except dwf.DwfApiException as e:
+                status, result = STATUS_DWF_ERROR, _ERROR.pack(int(e.status)) + (dwf.GetLastErrorMsg() if (e.message is None) else e.message).encode('utf-8')
+            except TimeoutError as e:
+                status, result = STATUS_TIMEOUT, _ERROR.pack(-1) + str(e).encode('utf-8')
+            except Exception as e:
+                status, result = STATUS_SERVER_ERROR, _ERROR.pack(-1) + str(e).encode('utf-8')
+            self.request.sendall(_RESPONSE_HEADER.pack(status, len(result)) + result)
+
+class DeviceServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    ''' Owns an open PyAnalogDiscovery and serves it on a Unix socket. Clients
+        are served on their own threads; commands run one at a time.
+    '''
+    daemon_threads = True
+
+    def __init__(self, socket_path: str = None, configuration = AnalogDiscoveryProConfiguration.SCOPE_32K_WAVEGEN_32K_LOGIC_32K_PATTERNS_16K, device_name: str = None):
+        self.socket_path = default_socket_path() if (socket_path is None) else socket_path
+        if (os.path.exists(self.socket_path)):
+            client = connect(self.socket_path)
+            if (client is not None):
+                client.release()
+                raise OSError("a device server is already listening on %s" % self.socket_path)
+            os.unlink(self.socket_path)
+        self.device_lock = threading.Lock()
+        self.device = PyAnalogDiscovery(configuration, device_name)
+        self._i2c = None
+        self._i2c_bus = None
+        self._digital_io = None
+        self._oscilloscope = None
+        super().__init__(self.socket_path, _RequestHandler)
+        os.chmod(self.socket_path, 0o600)
+        self._handlers = { OP_PING: self._ping, OP_I2C_CONFIGURE: self._i2c_configure, OP_I2C_WRITE: self._i2c_write,
+                           OP_I2C_READ: self._i2c_read, OP_I2C_WRITE_READ: self._i2c_write_read, OP_I2C_SCAN: self._i2c_scan,
+                           OP_I2C_DUMP: self._i2c_dump, OP_GPIO_WRITE: self._gpio_write, OP_GPIO_READ: self._gpio_read,
+                           OP_SCOPE_CAPTURE: self._scope_capture }
+
+    def server_bind(self):
+        # Bound under a restrictive umask, so the socket is never open to
+        # other users, not even between bind() and the chmod() that follows.
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def server_close(self):
+        super().server_close()
+        if (os.path.exists(self.socket_path)):
+            os.unlink(self.socket_path)
+        self.device.release()
+
+    def execute(self, opcode: int, payload: bytes, connection: _RequestHandler = None) -> bytes:
+        handler = self._handlers.get(opcode)
+        if (handler is None):
+            raise ValueError("unknown opcode %d" % opcode)
+        if (connection is not None):
+            if (opcode == OP_I2C_CONFIGURE):
+                result = handler(payload)
+                connection.i2c_bus = self._i2c_bus
+                return result
+            if (opcode in _I2C_OPCODES and connection.i2c_bus is not None):
+                self._apply_i2c_bus(connection.i2c_bus)
+        return handler(payload)
+
+    def _i2c_session(self):
+        if (self._i2c is None):
+            self._i2c = self.device.acquire_inter_integrated_circuit()
+        return self._i2c
+
+    def _apply_i2c_bus(self, bus: tuple) -> None:
+        ''' Configures the I2C bus as (clock rate, scl pin, sda pin, clock
+            stretching). Nothing is sent when the bus is already set up so,
+            which is the common case of a single client.
+        '''
+        if (bus == self._i2c_bus):
+            return
+        i2c = self._i2c_session()
+        clock_rate, scl_pin, sda_pin, clock_stretching_enabled = bus
+        self._i2c_bus = None
+        i2c.configure_bus(clock_rate, i2c.address, scl_pin, sda_pin, clock_stretching_enabled)
+        self._i2c_bus = bus
+
+    def _ping(self, payload: bytes) -> bytes:
+        # The configuration index, then the configuration family, user name
+        # and serial number of the device, one per line.
+        configuration = self.device.configuration
+        identity = "\n".join((type(configuration).__name__, self.device.user_name, self.device.serial_num))
+        return _PING.pack(int(configuration)) + identity.encode('utf-8')
+
+    def _i2c_configure(self, payload: bytes) -> bytes:
+        clock_rate, scl_pin, sda_pin, clock_stretching_enabled, address = _I2C_CONFIGURE.unpack(payload)
+        self._i2c_bus = None
+        self._i2c_session().configure_bus(clock_rate, address, scl_pin, sda_pin, bool(clock_stretching_enabled))
+        self._i2c_bus = (clock_rate, scl_pin, sda_pin, bool(clock_stretching_enabled))
+        return b''
+
+    def _i2c_write(self, payload: bytes) -> bytes:
+        (address,) = _I2C_WRITE.unpack_from(payload)
+        return _NAK.pack(dwf.DigitalI2cWrite(self.device.hdwf, address, memoryview(payload)[_I2C_WRITE.size:]))
+
+    def _i2c_read(self, payload: bytes) -> bytes:
+        address, read_data_size = _I2C_READ.unpack(payload)
+        read_data, is_nak = dwf.DigitalI2cReadBytes(self.device.hdwf, address, read_data_size)
+        return _NAK.pack(is_nak) + read_data
+
+    def _i2c_write_read(self, payload: bytes) -> bytes:
+        address, read_data_size = _I2C_WRITE_READ.unpack_from(payload)
+        read_data, is_nak = dwf.DigitalI2cWriteReadBytes(self.device.hdwf, address, memoryview(payload)[_I2C_WRITE_READ.size:], read_data_size)
+        return _NAK.pack(is_nak) + read_data
+
+    def _i2c_scan(self, payload: bytes) -> bytes:
+        strategy, first_address, last_address = _I2C_SCAN.unpack(payload)
+        return bytes(self._i2c_session().scan(I2cScanStrategy(strategy), first_address, last_address))
+
+    def _i2c_dump(self, payload: bytes) -> bytes:
+        address, start, end, chunk = _I2C_DUMP.unpack(payload)
+        i2c = self._i2c_session()
+        configured_address = i2c.address
+        i2c.address = address
+        try:
+            return i2c.dump(start, end, chunk)
+        finally:
+            i2c.address = configured_address
+
+    def _digital_io_session(self):
+        # Not reset, so that lines driven before the first GPIO command keep
+        # their level.
+        if (self._digital_io is None):
+            self._digital_io = self.device.acquire_digital_io(reset = False)
+        return self._digital_io
+
+    def _gpio_write(self, payload: bytes) -> bytes:
+        mask, value = _GPIO_WRITE.unpack(payload)
+        self._digital_io_session().write(mask, value)
+        return b''
+
+    def _gpio_read(self, payload: bytes) -> bytes:
+        return _GPIO_READ.pack(self._digital_io_session().read() & 0xFFFFFFFF)
+
+    def _scope_capture(self, payload: bytes) -> bytes:
+        channel, voltage_range, sample_rate, number_of_samples, timeout = _SCOPE_CAPTURE.unpack(payload)
+        if (self._oscilloscope is None):
+            self._oscilloscope = self.device.acquire_oscilloscope()
+        scope = self._oscilloscope
+        with self.device.configure():
+            scope.configure_channel(channel, voltage_range)
+            scope.configure_acquisition(sample_rate, number_of_samples)
+        scope.initiate()
+        deadline = time.monotonic() + timeout
+        while (scope.is_done() == False):
+            if (time.monotonic() >= deadline):
+                scope.reset_instrument()
+                raise TimeoutError("scope capture did not complete within %g s" % timeout)
+            time.sleep(0.001)
+        return memoryview(scope.read(channel, number_of_samples = number_of_samples)).cast('B').tobytes()
+
+# #------------------------------------------------------------------------------
+# Client
+
+class DeviceClient(object):
+    ''' Connection to a DeviceServer. It offers the parts of PyAnalogDiscovery
+        the command line tools use, so either can be handed to them.
+
+        Every request waits at most timeout seconds for the server, and
+        raises TimeoutError when a server that accepted the connection does
+        not answer.
+    '''
+    def __init__(self, socket_path: str = None, timeout: float = 10.0):
+        self.socket_path = default_socket_path() if (socket_path is None) else socket_path
+        self.timeout = timeout
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        try:
+            self._socket.connect(self.socket_path)
+            result = self.call(OP_PING)
+        except BaseException:
+            self._socket.close()
+            raise
+        (self._configuration_index,) = _PING.unpack_from(result)
+        self._configuration_family, self.user_name, self.serial_num = result[_PING.size:].decode('utf-8').split("\n")
+
+    def serves(self, configuration, device_name: str = None, serial_number: str = None) -> bool:
+        ''' Returns True when the server has the device opened as requested:
+            with configuration, and with the user name device_name and the
+            serial number serial_number when they are given.
+        '''
+        return (type(configuration).__name__ == self._configuration_family and int(configuration) == self._configuration_index and
+                (device_name is None or device_name == self.user_name) and (serial_number is None or serial_number == self.serial_num))
+
+    def call(self, opcode: int, payload: bytes = b'', timeout: float = None) -> bytes:
+        ''' Sends one request and returns the payload of the response, or
+            raises the error the server reported. timeout overrides the
+            timeout of the client for this request.
+        '''
+        if (timeout is not None):
+            self._socket.settimeout(timeout)
+        try:
+            self._socket.sendall(_REQUEST_HEADER.pack(opcode, len(payload)) + payload)
+            status, length = _RESPONSE_HEADER.unpack(_receive(self._socket, _RESPONSE_HEADER.size))
+            result = _receive(self._socket, length)
+        finally:
+            if (timeout is not None):
+                self._socket.settimeout(self.timeout)
+        if (status == STATUS_OK):
+            return result
+        (code,) = _ERROR.unpack_from(result)
+        message = result[_ERROR.size:].decode('utf-8')
+        if (status == STATUS_LIBRARY_ERROR):
+            raise RemoteException(Status(code), message.partition("\n")[2])
+        if (status == STATUS_TIMEOUT):
+            raise TimeoutError(message)
+        if (status == STATUS_DWF_ERROR):
+            if (code in dwf.ErrorCodes.__members__.values()):
+                code = dwf.ErrorCodes(code)
+            raise RemoteDwfException(code, message)
+        raise RuntimeError(message)
+
+    def acquire_inter_integrated_circuit(self, reset: bool = True):
+        return RemoteInterIntegratedCircuit(self)
+
+    def gpio_write(self, mask: int, value: int) -> None:
+        ''' Drives the DIO lines in mask to the matching bits of value.
+        '''
+        self.call(OP_GPIO_WRITE, _GPIO_WRITE.pack(mask, value))
+
+    def gpio_read(self) -> int:
+        ''' Returns the state of the DIO lines.
+        '''
+        return _GPIO_READ.unpack(self.call(OP_GPIO_READ))[0]
+
+    def scope_capture(self, channel: int, voltage_range: float, sample_rate: float, number_of_samples: int, timeout: float = 10.0):
+        ''' Captures number_of_samples volts on a scope channel and returns
+            them as a memoryview of doubles. Raises TimeoutError when the
+            capture does not complete within timeout seconds.
+        '''
+        # The server gives up after timeout seconds; the client waits a bit
+        # longer so that it receives the server's TimeoutError.
+        payload = _SCOPE_CAPTURE.pack(channel, voltage_range, sample_rate, number_of_samples, timeout)
+        return memoryview(self.call(OP_SCOPE_CAPTURE, payload, timeout + self.timeout)).cast('d')
+
+    def release(self) -> None:
+        self._socket.close()
+
+class RemoteInterIntegratedCircuit(object):
+    ''' The InterIntegratedCircuit session API, served by a DeviceServer.
+    '''
+    def __init__(self, client: DeviceClient):
+        self.client = client
+        self.address = 0
+
+    def configure_bus(self, i2c_clock_rate, address, scl_pin: int, sda_pin: int, clock_stretching_enabled: bool = True) -> None:
+        self.address = address
+        self.client.call(OP_I2C_CONFIGURE, _I2C_CONFIGURE.pack(int(i2c_clock_rate), scl_pin, sda_pin, int(clock_stretching_enabled), address))
+
+    def read(self, read_data_size: int) -> (List[int], int):
+        read_data, is_nak = self.read_bytes(read_data_size)
+        return list(read_data), is_nak
+
+    def read_bytes(self, read_data_size: int) -> (bytes, int):
+        result = self.client.call(OP_I2C_READ, _I2C_READ.pack(self.address, read_data_size))
+        return result[_NAK.size:], _NAK.unpack_from(result)[0]
+
+    def write(self, write_data, address: int = None) -> int:
+        result = self.client.call(OP_I2C_WRITE, _I2C_WRITE.pack(self.address if (address is None) else address) + bytes(write_data))
+        return _NAK.unpack(result)[0]
+
+    def write_read(self, write_data, read_data_size: int) -> (List[int], int):
+        read_data, is_nak = self.write_read_bytes(write_data, read_data_size)
+        return list(read_data), is_nak
+
+    def write_read_bytes(self, write_data, read_data_size: int) -> (bytes, int):
+        result = self.client.call(OP_I2C_WRITE_READ, _I2C_WRITE_READ.pack(self.address, read_data_size) + bytes(write_data))
+        return result[_NAK.size:], _NAK.unpack_from(result)[0]
+
+    def write_read_into(self, write_data, buffer, read_data_size: int = None, address: int = None) -> int:
+        view = memoryview(buffer).cast('B')
+        read_data_size = len(view) if (read_data_size is None) else read_data_size
+        result = self.client.call(OP_I2C_WRITE_READ, _I2C_WRITE_READ.pack(self.address if (address is None) else address, read_data_size) + bytes(write_data))
+        view[:read_data_size] = result[_NAK.size:]
+        return _NAK.unpack_from(result)[0]
+
+    def dump(self, start: int = 0x00, end: int = 0xFF, chunk: int = 256) -> bytes:
+        if (not (0 <= start <= end <= 0xFF)):
+            raise ValueError("register range 0x%02x-0x%02x is outside 0x00-0xff" % (start, end))
+        return self.client.call(OP_I2C_DUMP, _I2C_DUMP.pack(self.address, start, end, chunk))
+
+    def scan(self, strategy: I2cScanStrategy = I2cScanStrategy.QUICK_WRITE, first_address: int = 0x03, last_address: int = 0x77) -> List[int]:
+        return list(self.client.call(OP_I2C_SCAN, _I2C_SCAN.pack(int(strategy), first_address, last_address)))
+
+    def scan_buses(self, bus_pins: List[tuple], i2c_clock_rate = I2cClockRate.ONE_HUNDRED_KHZ, strategy: I2cScanStrategy = I2cScanStrategy.QUICK_WRITE,
+                   first_address: int = 0x03, last_address: int = 0x77, clock_stretching_enabled: bool = True) -> dict:
+        results = {}
+        for scl_pin, sda_pin in bus_pins:
+            try:
+                self.configure_bus(i2c_clock_rate, self.address, scl_pin, sda_pin, clock_stretching_enabled)
+            except RemoteException as e:
+                if (e.status != Status.ERROR_I2C_BUS_ERROR_CHECK_THE_PULLUPS):
+                    raise
+                results[(scl_pin, sda_pin)] = None
+                continue
+            results[(scl_pin, sda_pin)] = self.scan(strategy, first_address, last_address)
+        return results
+
+def connect(socket_path: str = None, timeout: float = 10.0) -> DeviceClient:
+    ''' Returns a client connected to the device server, or None when no
+        server is listening on the socket or the server does not answer
+        within timeout seconds.
+    '''
+    try:
+        return DeviceClient(socket_path, timeout)
+    except (FileNotFoundError, ConnectionRefusedError, socket.timeout):
+        return None
+
+def open_device(configuration = AnalogDiscoveryProConfiguration.SCOPE_32K_WAVEGEN_32K_LOGIC_32K_PATTERNS_16K, device_name: str = None, serial_number: str = None):
+    ''' Returns a DeviceClient when a device server is running with the
+        device and configuration requested, otherwise a newly opened
+        PyAnalogDiscovery. Both are released with release(). Opening fails
+        when the server holds the requested device in another configuration.
+    '''
+    client = connect()
+    if (client is not None):
+        if (client.serves(configuration, device_name, serial_number)):
+            return client
+        client.release()
+    return PyAnalogDiscovery(configuration, device_name, serial_number = serial_number)
@@ -22,12 +22,22 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import array
 import ctypes
+import dwfprototypes
 import sys
+import threading
 import time
 from enum import IntEnum
 from typing import List
 
+# NumPy is optional. When it is installed, sample buffers allocated by this
+# module are NumPy arrays; otherwise they fall back to array.array.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # device handle
 # typedef int HDWF;
 
@@ -312,25 +322,95 @@ class Param(IntEnum):
     def __str__(self):
         return self.name.replace("_", " ").title()
 
-_dwf = None
-if sys.platform.startswith("win"):
-    _dwf = ctypes.cdll.dwf
-elif sys.platform.startswith("darwin"):
-    _dwf = ctypes.cdll.LoadLibrary("/Library/Frameworks/dwf.framework/dwf")
-else:
-    _dwf = ctypes.cdll.LoadLibrary("libdwf.so")
+def _DefaultLibraryPath() -> str:
+    if sys.platform.startswith("win"):
+        return "dwf"
+    elif sys.platform.startswith("darwin"):
+        return "/Library/Frameworks/dwf.framework/dwf"
+    else:
+        return "libdwf.so"
+
+class _Library(object):
+    '''
+    Loads libdwf on the first call into it, so that importing this module does
+    not need the native library, then resolves each entry point once and
+    declares its prototype from dwfprototypes.PROTOTYPES. Later lookups find
+    the configured foreign function in the instance dictionary, and ctypes
+    converts plain Python ints and floats passed by the wrappers.
+    '''
+    def __init__(self):
+        self._path = None
+        self._backend = None
+        self._lock = threading.Lock()
+
+    def load(self, path: str = None, backend = None) -> None:
+        with self._lock:
+            # Forget the entry points resolved from the previous backend.
+            for each_name in [name for name in vars(self) if name.startswith("FDwf")]:
+                delattr(self, each_name)
+            if (backend is None):
+                backend = ctypes.cdll.LoadLibrary(path or self._path or _DefaultLibraryPath())
+            self._path = path or self._path
+            self._backend = backend
+
+    def is_loaded(self) -> bool:
+        return (self._backend is not None)
+
+    def __getattr__(self, name: str):
+        if (not name.startswith("FDwf")):
+            raise AttributeError(name)
+        if (self._backend is None):
+            with self._lock:
+                if (self._backend is None):
+                    self._backend = ctypes.cdll.LoadLibrary(self._path or _DefaultLibraryPath())
+        function = getattr(self._backend, name)
+        argtypes = dwfprototypes.PROTOTYPES.get(name)
+        if (argtypes is not None and isinstance(self._backend, ctypes.CDLL)):
+            function.argtypes = argtypes
+            function.restype = ctypes.c_int
+        setattr(self, name, function)
+        return function
+
+_dwf = _Library()
+
+def LibraryLoad(path: str = None) -> None:
+    '''
+    Loads libdwf now, from path or from the default location for the platform.
+    Calling it is optional: otherwise the library is loaded on the first call
+    into it. Use it to load the library from a non-standard location, or to
+    surface a missing library at a well-defined point.
+    '''
+    _dwf.load(path)
+
+def LibraryBackendSet(backend) -> None:
+    '''
+    Replaces libdwf with backend, any object providing the FDwf entry points as
+    attributes with the C calling conventions of dwf.h (for instance a
+    simulator). Output arguments are passed as ctypes.byref objects.
+    '''
+    _dwf.load(backend = backend)
+
+def LibraryIsLoaded() -> bool:
+    '''
+    Returns True when libdwf (or a replacement backend) has been loaded.
+    '''
+    return _dwf.is_loaded()
 
 class DwfApiException(Exception):
-    def __init__(self, status):
+    def __init__(self, status, message: str = None):
         self.status = status
+        self.message = message
 
     def __str__(self):
-        string_buffer = ctypes.create_string_buffer(512)
-        _dwf.FDwfGetLastErrorMsg(string_buffer)
-        if (len(string_buffer.value) == 0):
+        message = self.message
+        if (message is None):
+            string_buffer = ctypes.create_string_buffer(512)
+            _dwf.FDwfGetLastErrorMsg(string_buffer)
+            message = str(string_buffer.value.decode('utf-8'))
+        if (len(message) == 0):
             return str(self.status)
         else:
-            return str(self.status) + "\n" + str(string_buffer.value.decode('utf-8'))
+            return str(self.status) + "\n" + message
 
 # Macro used to verify if bit is 1 or 0 in given bit field
 # #define IsBitSet(fs, bit) ((fs & (1<<bit)) != 0)
@@ -339,7 +419,124 @@ def IsBitSet(fs, bit):
 
 def _ThrowIfError(status: ctypes.c_int):
     if (status != 1):
-        raise DwfApiException(status)
+        # The message is read right away: by the time the exception is
+        # printed, a call from another thread may have replaced it.
+        string_buffer = ctypes.create_string_buffer(512)
+        _dwf.FDwfGetLastErrorMsg(string_buffer)
+        raise DwfApiException(status, str(string_buffer.value.decode('utf-8')))
+
+def AllocateSamples(typecode: str, count: int):
+    '''
+    Allocates an uninitialized sample buffer of count elements. The typecode
+    follows the array module convention ('d' double, 'h' short, ...). Returns a
+    NumPy array when NumPy is available, an array.array otherwise.
+    '''
+    if (numpy is not None):
+        return numpy.empty(count, dtype=typecode)
+    return array.array(typecode, bytes(count * array.array(typecode).itemsize))
+
+def _InputAsArray(ctype, typecode: str, data, count: int = None):
+    '''
+    Returns a ctypes array of ctype holding the samples of data, along with its
+    element count, for the arguments the driver only reads. Writable buffers of
+    the right item type are shared without a copy; anything else (read-only
+    buffers, other dtypes, sequences) is converted once.
+    '''
+    try:
+        return _BufferAsArray(ctype, data, count)
+    except (TypeError, ValueError):
+        pass
+    if (numpy is not None):
+        data = numpy.array(data, dtype=typecode, copy=True, order='C').ravel()
+    else:
+        data = array.array(typecode, data)
+    return _BufferAsArray(ctype, data, count)
+
+def _BufferAsBytes(buffer, count_of_bytes: int = None):
+    '''
+    Returns a ctypes byte array sharing memory with a writable, C-contiguous
+    buffer of any item type, along with its size in bytes. Used for the void *
+    data arguments whose sample width is only known at run time. When
+    count_of_bytes is None, the whole buffer is used.
+    '''
+    view = memoryview(buffer)
+    if (view.readonly):
+        raise ValueError("buffer must be writable")
+    if (not view.c_contiguous):
+        raise ValueError("buffer must be C-contiguous")
+    view = view.cast('B')
+    if (count_of_bytes is None):
+        count_of_bytes = view.nbytes
+    elif (count_of_bytes < 0 or count_of_bytes > view.nbytes):
+        raise ValueError("buffer holds %d bytes, %d requested" % (view.nbytes, count_of_bytes))
+    return (ctypes.c_ubyte * count_of_bytes).from_buffer(view), count_of_bytes
+
+# Scratch ctypes arrays for short transfers, one set per thread so that
+# concurrent sessions do not share them.
+_scratch = threading.local()
+
+def _ScratchBytes(slot: str, count: int):
+    '''
+    Returns a c_ubyte array of at least count bytes owned by the calling thread.
+    The array of a slot is reused by every call and only grows.
+    '''
+    scratch = getattr(_scratch, slot, None)
+    if (scratch is None or len(scratch) < count):
+        scratch = (ctypes.c_ubyte * max(count, 64))()
+        setattr(_scratch, slot, scratch)
+    return scratch
+
+def _ScratchNak():
+    '''
+    Returns the NAK output of the calling thread and a ctypes.byref to it.
+    '''
+    nak = getattr(_scratch, 'nak', None)
+    if (nak is None):
+        out_nak = ctypes.c_int(0)
+        nak = _scratch.nak = (out_nak, ctypes.byref(out_nak))
+    return nak
+
+def _WriteBytes(write_data):
+    '''
+    Copies write data, a list of ints or any bytes-like object, to the
+    scratch write array of the calling thread and returns it with its length.
+    '''
+    if (isinstance(write_data, (list, tuple))):
+        count = len(write_data)
+        rgbTx = _ScratchBytes('tx', count)
+        rgbTx[:count] = write_data
+    else:
+        view = memoryview(write_data).cast('B')
+        count = view.nbytes
+        rgbTx = _ScratchBytes('tx', count)
+        memoryview(rgbTx).cast('B')[:count] = view
+    return (rgbTx if (count > 0) else None), count
+
+def _BufferAsArray(ctype, buffer, count: int = None):
+    '''
+    Returns a ctypes array of ctype that shares memory with a writable,
+    C-contiguous buffer (NumPy array, array.array, bytearray, memoryview...),
+    along with its element count. The driver writes straight into the caller's
+    memory, so no copy and no per-sample Python object is made. When count is
+    None, the whole buffer is used.
+    '''
+    view = memoryview(buffer)
+    if (view.readonly):
+        raise ValueError("buffer must be writable")
+    if (not view.c_contiguous):
+        raise ValueError("buffer must be C-contiguous")
+    # Bytes are accepted as raw storage; any other item type must be ctype
+    # itself, not merely of the same size (int64 is not a double).
+    item_format = view.format.lstrip('@=' + ('<' if (sys.byteorder == 'little') else '>'))
+    if (item_format != 'B' and item_format != ctype._type_):
+        raise ValueError("buffer item format is '%s', expected '%s'" % (view.format, ctype._type_))
+    item_size = ctypes.sizeof(ctype)
+    capacity = view.nbytes // item_size
+    if (count is None):
+        count = capacity
+    elif (count < 0 or count > capacity):
+        raise ValueError("buffer holds %d samples, %d requested" % (capacity, count))
+    return (ctype * count).from_buffer(view), count
 
 #------------------------------------------------------------------------------
 # Error and version APIs:
@@ -358,7 +555,7 @@ def GetLastError() -> ErrorCodes:
     '''
     erc = ctypes.c_int()
     _dwf.FDwfGetLastError(ctypes.byref(erc))
-    return ErrorCodes(erc)
+    return ErrorCodes(erc.value)
 
 # DWFAPI int FDwfGetLastErrorMsg(char szError[512]);
 def GetLastErrorMsg() -> str:
@@ -372,7 +569,7 @@ def GetLastErrorMsg() -> str:
         leading to failure.
     '''
     out_err_message = ctypes.create_string_buffer(512)
-    _dwf.FDwfGetLastErrorMsg(ctypes.byref(out_err_message))
+    _dwf.FDwfGetLastErrorMsg(out_err_message)
     return str(out_err_message.value.decode('utf-8'))
 
 # DWFAPI int FDwfGetVersion(char szVersion[32]);  // Returns DLL version, for instance: "3.8.5"
@@ -382,7 +579,7 @@ def GetVersion() -> str:
     minor, and build numbers (i.e., “2.0.19”).
     '''
     out_version_str = ctypes.create_string_buffer(32)
-    _ThrowIfError(_dwf.FDwfGetVersion(ctypes.byref(out_version_str)))
+    _ThrowIfError(_dwf.FDwfGetVersion(out_version_str))
     return str(out_version_str.value.decode('utf-8'))
 
 # DWFAPI int FDwfParamSet(DwfParam param, int value);
@@ -391,7 +588,7 @@ def ParamSet(param: Param, value: int) -> None:
     Configures various global parameters that will be applied on newly opened
     devices.
     '''
-    _ThrowIfError(_dwf.FDwfParamSet(param, ctypes.c_int(value)))
+    _ThrowIfError(_dwf.FDwfParamSet(param, value))
 
 # DWFAPI int FDwfParamGet(DwfParam param, int *pvalue);
 # Warning no docs found for FDwfParamGet
@@ -428,7 +625,7 @@ def EnumDeviceType(device_index: int) -> (Device, int) :
     '''
     out_device_id = ctypes.c_int()
     out_device_revision = ctypes.c_int()
-    _ThrowIfError(_dwf.FDwfEnumDeviceType(ctypes.c_int(device_index), ctypes.byref(out_device_id), ctypes.byref(out_device_revision)))
+    _ThrowIfError(_dwf.FDwfEnumDeviceType(device_index, ctypes.byref(out_device_id), ctypes.byref(out_device_revision)))
     return (Device(out_device_id.value), int(out_device_revision.value))
 
 # DWFAPI int FDwfEnumDeviceIsOpened(int idxDevice, int *pfIsUsed);
@@ -438,7 +635,7 @@ def EnumDeviceIsOpened(device_index: int) -> bool:
     other process.
     '''
     out_device_is_opened = ctypes.c_int()
-    _ThrowIfError(_dwf.FDwfEnumDeviceType(ctypes.c_int(device_index), ctypes.byref(out_device_is_opened)))
+    _ThrowIfError(_dwf.FDwfEnumDeviceIsOpened(device_index, ctypes.byref(out_device_is_opened)))
     return bool(out_device_is_opened.value != 0)
 
 # DWFAPI int FDwfEnumUserName(int idxDevice, char szUserName[32]);
@@ -447,7 +644,7 @@ def EnumUserName(device_index: int) -> str:
     Retrieves the user name of the enumerated device.
     '''
     out_username = ctypes.create_string_buffer(32)
-    _ThrowIfError(_dwf.FDwfEnumUserName(ctypes.c_int(device_index), ctypes.byref(out_username)))
+    _ThrowIfError(_dwf.FDwfEnumUserName(device_index, out_username))
     return str(out_username.value.decode('utf-8'))
 
 # DWFAPI int FDwfEnumDeviceName(int idxDevice, char szDeviceName[32]);
@@ -456,7 +653,7 @@ def EnumDeviceName(device_index: int) -> str:
     Retrieves the device name of the enumerated device.
     '''
     out_devicename = ctypes.create_string_buffer(32)
-    _ThrowIfError(_dwf.FDwfEnumDeviceName(ctypes.c_int(device_index), ctypes.byref(out_devicename)))
+    _ThrowIfError(_dwf.FDwfEnumDeviceName(device_index, out_devicename))
     return str(out_devicename.value.decode('utf-8'))
 
 # DWFAPI int FDwfEnumSN(int idxDevice, char szSN[32]);
@@ -465,7 +662,7 @@ def EnumSN(device_index: int) -> str:
     Retrieves the 12-digit, unique serial number of the enumerated device.
     '''
     out_serialnum_str = ctypes.create_string_buffer(32)
-    _ThrowIfError(_dwf.FDwfEnumSN(ctypes.c_int(device_index), ctypes.byref(out_serialnum_str)))
+    _ThrowIfError(_dwf.FDwfEnumSN(device_index, out_serialnum_str))
     return str(out_serialnum_str.value.decode('utf-8'))
 
 # DWFAPI int FDwfEnumConfig(int idxDevice, int *pcConfig);
@@ -477,7 +674,7 @@ def EnumConfig(device_index: int) -> int:
     list identified by the configuration index.
     '''
     out_config_count = ctypes.c_int()
-    _ThrowIfError(_dwf.FDwfEnumConfig(ctypes.c_int(device_index), ctypes.byref(out_config_count)))
+    _ThrowIfError(_dwf.FDwfEnumConfig(device_index, ctypes.byref(out_config_count)))
     return int(out_config_count.value)
 
 # DWFAPI int FDwfEnumConfigInfo(int idxConfig, DwfEnumConfigInfo info, int *pv);
@@ -487,7 +684,7 @@ def EnumConfigInfo(config_index: int, config_info: ConfigInfo) -> int:
     declared in dwf.h:
     '''
     out_value = ctypes.c_int()
-    _ThrowIfError(_dwf.FDwfEnumConfigInfo(ctypes.c_int(config_index), ctypes.c_int(config_info), ctypes.byref(out_value)))
+    _ThrowIfError(_dwf.FDwfEnumConfigInfo(config_index, config_info, ctypes.byref(out_value)))
     return int(out_value.value)
 
 #------------------------------------------------------------------------------
@@ -502,7 +699,7 @@ def DeviceOpen(device_index: int) -> int:
     discovered device, use index -1.
     '''
     out_hdwf = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDeviceOpen(ctypes.c_int(device_index), ctypes.byref(out_hdwf)))
+    _ThrowIfError(_dwf.FDwfDeviceOpen(device_index, ctypes.byref(out_hdwf)))
     return int(out_hdwf.value)
 
 # DWFAPI int FDwfDeviceConfigOpen(int idxDev, int idxCfg, HDWF *phdwf);
@@ -512,7 +709,7 @@ def DeviceConfigOpen(device_index: int, config_index: int) -> int:
     configuration and retrieves a handle.
     '''
     out_hdwf = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDeviceConfigOpen(ctypes.c_int(device_index), ctypes.c_int(config_index), ctypes.byref(out_hdwf)))
+    _ThrowIfError(_dwf.FDwfDeviceConfigOpen(device_index, config_index, ctypes.byref(out_hdwf)))
     return int(out_hdwf.value)
 
 # DWFAPI int FDwfDeviceClose(HDWF hdwf);
@@ -522,7 +719,7 @@ def DeviceClose(hdwf: int) -> None:
     Once the function above has returned, the specified interface handle can no
     longer be used to access the device.
     '''
-    _ThrowIfError(_dwf.FDwfDeviceClose(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfDeviceClose(hdwf))
 
 # DWFAPI int FDwfDeviceCloseAll();
 def DeviceCloseAll() -> None:
@@ -533,7 +730,7 @@ def DeviceCloseAll() -> None:
     _ThrowIfError(_dwf.FDwfDeviceCloseAll())
 
 # DWFAPI int FDwfDeviceAutoConfigureSet(HDWF hdwf, int fAutoConfigure);
-def DeviceAutoConfigureSet(hdwf: int, auto_configure: bool) -> None:
+def DeviceAutoConfigureSet(hdwf: int, auto_configure: int) -> None:
     '''
     Enables or disables the AutoConfig setting for a specific device. When this
     setting is enabled, the device is automatically configured every time an
@@ -544,18 +741,18 @@ def DeviceAutoConfigureSet(hdwf: int, auto_configure: bool) -> None:
     analog-out configuration will be applied dynamically, without stopping the
     instrument.
     '''
-    _ThrowIfError(_dwf.FDwfDeviceAutoConfigureSet(ctypes.c_int(hdwf), ctypes.c_int(auto_configure)))
-    return int(out_hdwf.value)
+    _ThrowIfError(_dwf.FDwfDeviceAutoConfigureSet(hdwf, auto_configure))
 
 # DWFAPI int FDwfDeviceAutoConfigureGet(HDWF hdwf, int *pfAutoConfigure);
-def DeviceAutoConfigureGet(hdwf: int) -> bool:
+def DeviceAutoConfigureGet(hdwf: int) -> int:
     '''
-    Returns the AutoConfig setting in the device. See the function description
-    for FDwfDeviceAutoConfigureSet for details on this setting.
+    Returns the AutoConfig setting in the device: 0 (disabled), 1 (enabled) or
+    3 (dynamic). See the function description for FDwfDeviceAutoConfigureSet
+    for details on this setting.
     '''
     out_auto_configure = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDeviceAutoConfigureGet(ctypes.c_int(hdwf), ctypes.byref(out_auto_configure)))
-    return bool(out_auto_configure.value)
+    _ThrowIfError(_dwf.FDwfDeviceAutoConfigureGet(hdwf, ctypes.byref(out_auto_configure)))
+    return int(out_auto_configure.value)
 
 # DWFAPI int FDwfDeviceReset(HDWF hdwf);
 def DeviceReset(hdwf: int) -> None:
@@ -563,12 +760,12 @@ def DeviceReset(hdwf: int) -> None:
     Resets and configures (by default, having auto configure enabled) all
     device and instrument parameters to default values.
     '''
-    _ThrowIfError(_dwf.FDwfDeviceReset(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfDeviceReset(hdwf))
 
 # DWFAPI int FDwfDeviceEnableSet(HDWF hdwf, int fEnable);
 # Warning no docs found for FDwfDeviceEnableSet
 def DeviceEnableSet(hdwf: int, enable: bool) -> None:
-    _ThrowIfError(_dwf.FDwfDeviceEnableSet(ctypes.c_int(hdwf), ctypes.c_int(enable)))
+    _ThrowIfError(_dwf.FDwfDeviceEnableSet(hdwf, enable))
 
 # DWFAPI int FDwfDeviceTriggerInfo(HDWF hdwf, int *pfstrigsrc); // use IsBitSet
 def DeviceTriggerInfo(hdwf: int) -> int: # use IsBitSet
@@ -579,7 +776,7 @@ def DeviceTriggerInfo(hdwf: int) -> int: # use IsBitSet
     constants in dwf.h.
     '''
     out_trigger_source = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDeviceTriggerInfo(ctypes.c_int(hdwf), ctypes.byref(out_trigger_source)))
+    _ThrowIfError(_dwf.FDwfDeviceTriggerInfo(hdwf, ctypes.byref(out_trigger_source)))
     return int(out_trigger_source.value)
 
 # DWFAPI int FDwfDeviceTriggerSet(HDWF hdwf, int idxPin, TRIGSRC trigsrc);
@@ -588,7 +785,7 @@ def DeviceTriggerSet(hdwf: int, index_pin: int, trigger_source: TriggerSource) -
     Configures the trigger I/O pin with a specific TRIGSRC option.
     '''
     out_hdwf = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDeviceTriggerSet(ctypes.c_int(hdwf), ctypes.c_int(index_pin), ctypes.c_int(trigger_source)))
+    _ThrowIfError(_dwf.FDwfDeviceTriggerSet(hdwf, index_pin, trigger_source))
 
 # DWFAPI int FDwfDeviceTriggerGet(HDWF hdwf, int idxPin, TRIGSRC *ptrigsrc);
 def DeviceTriggerGet(hdwf: int, index_pin: int) -> TriggerSource:
@@ -596,8 +793,8 @@ def DeviceTriggerGet(hdwf: int, index_pin: int) -> TriggerSource:
     Returns the configured trigger setting for a trigger I/O pin. The trigger
     source can be “none”, and internal instrument, or an external trigger.
     '''
-    out_trigger_source = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDeviceTriggerGet(ctypes.c_int(hdwf), ctypes.c_int(index_pin), ctypes.byref(out_trigger_source)))
+    out_trigger_source = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfDeviceTriggerGet(hdwf, index_pin, ctypes.byref(out_trigger_source)))
     return TriggerSource(out_trigger_source.value)
 
 # DWFAPI int FDwfDeviceTriggerPC(HDWF hdwf);
@@ -605,7 +802,7 @@ def DeviceTriggerPC(hdwf: int):
     '''
     Generates one pulse on the PC trigger line.
     '''
-    _ThrowIfError(_dwf.FDwfDeviceTriggerPC(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfDeviceTriggerPC(hdwf))
 
 # DWFAPI int FDwfDeviceTriggerSlopeInfo(HDWF hdwf, int *pfsslope); // use IsBitSet
 def DeviceTriggerSlopeInfo(hdwf: int) -> int: # use IsBitSet
@@ -613,7 +810,7 @@ def DeviceTriggerSlopeInfo(hdwf: int) -> int: # use IsBitSet
     Returns the supported trigger slopes: rising, falling, and either edge.
     '''
     out_fsslope = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDeviceTriggerSlopeInfo(ctypes.c_int(hdwf), ctypes.byref(out_fsslope)))
+    _ThrowIfError(_dwf.FDwfDeviceTriggerSlopeInfo(hdwf, ctypes.byref(out_fsslope)))
     return int(out_fsslope.value)
 
 # DWFAPI int FDwfDeviceParamSet(HDWF hdwf, DwfParam param, int value);
@@ -621,7 +818,7 @@ def DeviceParamSet(hdwf: int, param: Param, value: int) -> None:
     '''
     Configures various parameters for the respective device.
     '''
-    _ThrowIfError(_dwf.FDwfDeviceParamSet(ctypes.c_int(hdwf), ctypes.c_int(param), ctypes.c_int(value)))
+    _ThrowIfError(_dwf.FDwfDeviceParamSet(hdwf, param, value))
 
 # DWFAPI int FDwfDeviceParamGet(HDWF hdwf, DwfParam param, int *pvalue);
 def DeviceParamGet(hdwf: int, param: Param) -> int:
@@ -629,7 +826,7 @@ def DeviceParamGet(hdwf: int, param: Param) -> int:
     Retrieves the parameter value.
     '''
     out_value = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDeviceParamGet(ctypes.c_int(hdwf), ctypes.c_int(param), ctypes.byref(out_value)))
+    _ThrowIfError(_dwf.FDwfDeviceParamGet(hdwf, param, ctypes.byref(out_value)))
     return int(out_value.value)
 
 ###############################################################################
@@ -647,7 +844,7 @@ def AnalogInReset(hdwf: int) -> None:
     configure is enabled (through FDwfDeviceAutoConfigureSet), the instrument is
     also configured.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInReset(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfAnalogInReset(hdwf))
 
 # DWFAPI int FDwfAnalogInConfigure(HDWF hdwf, int fReconfigure, int fStart);
 def AnalogInConfigure(hdwf: int, reconfigure: int, fStart: int) -> None:
@@ -655,12 +852,12 @@ def AnalogInConfigure(hdwf: int, reconfigure: int, fStart: int) -> None:
     Configures the instrument and start or stop the acquisition. To reset the
     Auto trigger timeout, set fReconfigure to TRUE.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInConfigure(ctypes.c_int(hdwf), ctypes.c_int(reconfigure), ctypes.c_int(fStart)))
+    _ThrowIfError(_dwf.FDwfAnalogInConfigure(hdwf, reconfigure, fStart))
 
 # DWFAPI int FDwfAnalogInTriggerForce(HDWF hdwf);
 # Warning no docs found for FDwfAnalogInTriggerForce
 def AnalogInTriggerForce(hdwf: int) -> None:
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerForce(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerForce(hdwf))
 
 # DWFAPI int FDwfAnalogInStatus(HDWF hdwf, int fReadData, DwfState *psts);
 def AnalogInStatus(hdwf: int, fReadData: int) -> int:
@@ -669,8 +866,8 @@ def AnalogInStatus(hdwf: int, fReadData: int) -> int:
     fReadData to TRUE. For single acquisition mode, the data will be read only
     when the acquisition is finished.
     '''
-    out_instrument_state = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInStatus(ctypes.c_int(hdwf), ctypes.c_int(fReadData), ctypes.byref(out_instrument_state)))
+    out_instrument_state = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfAnalogInStatus(hdwf, fReadData, ctypes.byref(out_instrument_state)))
     return int(out_instrument_state.value)
 
 # DWFAPI int FDwfAnalogInStatusSamplesLeft(HDWF hdwf, int *pcSamplesLeft);
@@ -679,7 +876,7 @@ def AnalogInStatusSamplesLeft(hdwf: int) -> int:
     Retrieves the number of samples left in the acquisition.
     '''
     out_cSamplesLeft = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInStatusSamplesLeft(ctypes.c_int(hdwf), ctypes.byref(out_cSamplesLeft)))
+    _ThrowIfError(_dwf.FDwfAnalogInStatusSamplesLeft(hdwf, ctypes.byref(out_cSamplesLeft)))
     return int(out_cSamplesLeft.value)
 
 # DWFAPI int FDwfAnalogInStatusSamplesValid(HDWF hdwf, int *pcSamplesValid);
@@ -688,7 +885,7 @@ def AnalogInStatusSamplesValid(hdwf: int) -> int:
     Retrieves the number of valid/acquired data samples.
     '''
     out_samples_valid = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInStatusSamplesValid(ctypes.c_int(hdwf), ctypes.byref(out_samples_valid)))
+    _ThrowIfError(_dwf.FDwfAnalogInStatusSamplesValid(hdwf, ctypes.byref(out_samples_valid)))
     return int(out_samples_valid.value)
 
 # DWFAPI int FDwfAnalogInStatusIndexWrite(HDWF hdwf, int *pidxWrite);
@@ -698,7 +895,7 @@ def AnalogInStatusIndexWrite(hdwf: int) -> int:
     mode to display the scan bar.
     '''
     out_write_index = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInStatusIndexWrite(ctypes.c_int(hdwf), ctypes.byref(out_write_index)))
+    _ThrowIfError(_dwf.FDwfAnalogInStatusIndexWrite(hdwf, ctypes.byref(out_write_index)))
     return int(out_write_index.value)
 
 # DWFAPI int FDwfAnalogInStatusAutoTriggered(HDWF hdwf, int *pfAuto);
@@ -707,57 +904,97 @@ def AnalogInStatusAutoTriggered(hdwf: int) -> int:
     Verifies if the acquisition is auto triggered.
     '''
     out_auto_triggered = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInStatusAutoTriggered(ctypes.c_int(hdwf), ctypes.byref(out_auto_triggered)))
+    _ThrowIfError(_dwf.FDwfAnalogInStatusAutoTriggered(hdwf, ctypes.byref(out_auto_triggered)))
     return int(out_auto_triggered.value)
 
 # DWFAPI int FDwfAnalogInStatusData(HDWF hdwf, int idxChannel, double *rgdVoltData, int cdData);
-def AnalogInStatusData(hdwf: int, channel_index: int, cd_data: int) -> float:
+def AnalogInStatusData(hdwf: int, channel_index: int, cd_data: int):
     '''
     Retrieves the acquired data samples from the specified idxChannel on the
-    AnalogIn instrument. It copies the data samples to the provided buffer.
+    AnalogIn instrument. It copies the data samples to a newly allocated buffer
+    of cd_data doubles. Use AnalogInStatusDataInto to reuse a buffer.
     '''
-    out_rg_double_volt_data = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInStatusData(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(cd_data), ctypes.byref(out_rg_double_volt_data)))
-    return float(out_rg_double_volt_data.value)
+    rg_double_volt_data = AllocateSamples('d', cd_data)
+    AnalogInStatusDataInto(hdwf, channel_index, rg_double_volt_data, cd_data)
+    return rg_double_volt_data
 
-# DWFAPI int FDwfAnalogInStatusData2(HDWF hdwf, int idxChannel, double *rgdVoltData, int idxData, int cdData);
-def AnalogInStatusData2(hdwf: int, channel_index: int, index_data: int, cd_data: int) -> float:
+def AnalogInStatusDataInto(hdwf: int, channel_index: int, buffer, cd_data: int = None) -> int:
     '''
     Retrieves the acquired data samples from the specified idxChannel on the
-    AnalogIn instrument. It copies the data samples to the provided buffer.
+    AnalogIn instrument straight into a caller supplied float64 buffer (NumPy
+    array, array.array('d') or any writable buffer). When cd_data is None the
+    whole buffer is filled. Returns the number of samples copied.
+    '''
+    out_rg_double_volt_data, cd_data = _BufferAsArray(ctypes.c_double, buffer, cd_data)
+    _ThrowIfError(_dwf.FDwfAnalogInStatusData(hdwf, channel_index, out_rg_double_volt_data, cd_data))
+    return cd_data
+
+# DWFAPI int FDwfAnalogInStatusData2(HDWF hdwf, int idxChannel, double *rgdVoltData, int idxData, int cdData);
+def AnalogInStatusData2(hdwf: int, channel_index: int, index_data: int, cd_data: int):
+    '''
+    Retrieves cd_data acquired data samples, starting at index_data, from the
+    specified idxChannel on the AnalogIn instrument. It copies the data samples
+    to a newly allocated buffer. Use AnalogInStatusData2Into to reuse a buffer.
+    '''
+    rg_double_volt_data = AllocateSamples('d', cd_data)
+    AnalogInStatusData2Into(hdwf, channel_index, rg_double_volt_data, index_data, cd_data)
+    return rg_double_volt_data
+
+def AnalogInStatusData2Into(hdwf: int, channel_index: int, buffer, index_data: int, cd_data: int = None) -> int:
+    '''
+    Retrieves acquired data samples, starting at index_data, from the specified
+    idxChannel on the AnalogIn instrument straight into a caller supplied
+    float64 buffer. When cd_data is None the whole buffer is filled. Returns the
+    number of samples copied.
     '''
-    out_rg_double_volt_data = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInStatusData2(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(index_data), ctypes.c_int(cd_data), ctypes.byref(out_rg_double_volt_data)))
-    return float(out_rg_double_volt_data.value)
+    out_rg_double_volt_data, cd_data = _BufferAsArray(ctypes.c_double, buffer, cd_data)
+    _ThrowIfError(_dwf.FDwfAnalogInStatusData2(hdwf, channel_index, out_rg_double_volt_data, index_data, cd_data))
+    return cd_data
 
 # DWFAPI int FDwfAnalogInStatusData16(HDWF hdwf, int idxChannel, short *rgu16Data, int idxData, int cdData);
-def AnalogInStatusData16(hdwf: int, channel_index: int, index_data: int, cd_data: int) -> int:
+def AnalogInStatusData16(hdwf: int, channel_index: int, index_data: int, cd_data: int):
     '''
     Retrieves the acquired raw data samples from the specified idxChannel on the
-    AnalogIn instrument. It copies the data samples to the provided buffer.
+    AnalogIn instrument. It copies the data samples to a newly allocated buffer
+    of cd_data 16-bit integers. Use AnalogInStatusData16Into to reuse a buffer.
+    '''
+    rg_16_data = AllocateSamples('h', cd_data)
+    AnalogInStatusData16Into(hdwf, channel_index, rg_16_data, index_data, cd_data)
+    return rg_16_data
+
+def AnalogInStatusData16Into(hdwf: int, channel_index: int, buffer, index_data: int, cd_data: int = None) -> int:
+    '''
+    Retrieves acquired raw data samples, starting at index_data, from the
+    specified idxChannel on the AnalogIn instrument straight into a caller
+    supplied int16 buffer. When cd_data is None the whole buffer is filled.
+    Returns the number of samples copied.
     '''
-    out_rg_u16_data = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInStatusData16(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(index_data), ctypes.c_int(cd_data), ctypes.byref(out_rg_u16_data)))
-    return int(out_rg_u16_data.value)
+    out_rg_16_data, cd_data = _BufferAsArray(ctypes.c_short, buffer, cd_data)
+    _ThrowIfError(_dwf.FDwfAnalogInStatusData16(hdwf, channel_index, out_rg_16_data, index_data, cd_data))
+    return cd_data
 
 # DWFAPI int FDwfAnalogInStatusNoise(HDWF hdwf, int idxChannel, double *rgdMin, double *rgdMax, int cdData);
-def AnalogInStatusNoise(hdwf: int, channel_index: int, cd_data: int) -> (float, float):
+def AnalogInStatusNoise(hdwf: int, channel_index: int, cd_data: int):
     '''
     Retrieves the acquired noise samples from the specified idxChannel on the
     AnalogIn instrument. It copies the data samples to the provided buffer.
     '''
-    out_rg_double_min = ctypes.c_double(0.0)
-    out_rg_double_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInStatusNoise(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(cd_data), ctypes.byref(out_rg_double_min), ctypes.byref(out_rg_double_max)))
-    return float(out_rg_double_min.value), float(out_rg_double_max.value)
+    rg_double_min = AllocateSamples('d', cd_data)
+    rg_double_max = AllocateSamples('d', cd_data)
+    out_rgdMin, cd_data = _BufferAsArray(ctypes.c_double, rg_double_min, cd_data)
+    out_rgdMax, cd_data = _BufferAsArray(ctypes.c_double, rg_double_max, cd_data)
+    _ThrowIfError(_dwf.FDwfAnalogInStatusNoise(hdwf, channel_index, out_rgdMin, out_rgdMax, cd_data))
+    return rg_double_min, rg_double_max
 
 # DWFAPI int FDwfAnalogInStatusNoise2(HDWF hdwf, int idxChannel, double *rgdMin, double *rgdMax, int idxData, int cdData);
 # Warning no docs found for FDwfAnalogInStatusNoise2
-def AnalogInStatusNoise2(hdwf: int, channel_index: int, index_data: int, cd_data: int) -> (float, float):
-    out_rg_double_min = ctypes.c_double(0.0)
-    out_rg_double_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInStatusNoise2(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(index_data), ctypes.c_int(cd_data), ctypes.byref(out_rg_double_min), ctypes.byref(out_rg_double_max)))
-    return float(out_rg_double_min.value), float(out_rg_double_max.value)
+def AnalogInStatusNoise2(hdwf: int, channel_index: int, index_data: int, cd_data: int):
+    rg_double_min = AllocateSamples('d', cd_data)
+    rg_double_max = AllocateSamples('d', cd_data)
+    out_rgdMin, cd_data = _BufferAsArray(ctypes.c_double, rg_double_min, cd_data)
+    out_rgdMax, cd_data = _BufferAsArray(ctypes.c_double, rg_double_max, cd_data)
+    _ThrowIfError(_dwf.FDwfAnalogInStatusNoise2(hdwf, channel_index, out_rgdMin, out_rgdMax, index_data, cd_data))
+    return rg_double_min, rg_double_max
 
 # DWFAPI int FDwfAnalogInStatusSample(HDWF hdwf, int idxChannel, double *pdVoltSample);
 def AnalogInStatusSample(hdwf: int, channel_index: int) -> float:
@@ -766,16 +1003,16 @@ def AnalogInStatusSample(hdwf: int, channel_index: int) -> float:
     AnalogIn instrument.
     '''
     out_dVoltSample = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInStatusSample(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_dVoltSample)))
+    _ThrowIfError(_dwf.FDwfAnalogInStatusSample(hdwf, channel_index, ctypes.byref(out_dVoltSample)))
     return float(out_dVoltSample.value)
 
 # DWFAPI int FDwfAnalogInStatusTime(HDWF hdwf, unsigned int *psecUtc, unsigned int *ptick, unsigned int *pticksPerSecond);
 # Warning no docs found for FDwfAnalogInStatusTime
 def AnalogInStatusTime(hdwf: int) -> (int, int, int):
-    out_secUtc = c_uint(0)
-    out_tick = c_uint(0)
-    out_ticksPerSecond = c_uint(0)
-    _ThrowIfError(_dwf.FDwfAnalogInStatusTime(ctypes.c_int(hdwf), ctypes.byref(out_secUtc), ctypes.byref(out_tick), ctypes.byref(out_ticksPerSecond)))
+    out_secUtc = ctypes.c_uint(0)
+    out_tick = ctypes.c_uint(0)
+    out_ticksPerSecond = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfAnalogInStatusTime(hdwf, ctypes.byref(out_secUtc), ctypes.byref(out_tick), ctypes.byref(out_ticksPerSecond)))
     return int(out_secUtc.value), int(out_tick.value), int(out_ticksPerSecond.value)
 
 # DWFAPI int FDwfAnalogInStatusRecord(HDWF hdwf, int *pcdDataAvailable, int *pcdDataLost, int *pcdDataCorrupt);
@@ -793,7 +1030,7 @@ def AnalogInStatusRecord(hdwf: int) -> (int, int, int):
     out_cdDataAvailable = ctypes.c_int(0)
     out_cdDataLost = ctypes.c_int(0)
     out_cdDataCorrupt = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInStatusRecord(ctypes.c_int(hdwf), ctypes.byref(out_cdDataAvailable), ctypes.byref(out_cdDataLost), ctypes.byref(out_cdDataCorrupt)))
+    _ThrowIfError(_dwf.FDwfAnalogInStatusRecord(hdwf, ctypes.byref(out_cdDataAvailable), ctypes.byref(out_cdDataLost), ctypes.byref(out_cdDataCorrupt)))
     return int(out_cdDataAvailable.value), int(out_cdDataLost.value), int(out_cdDataCorrupt.value)
 
 # DWFAPI int FDwfAnalogInRecordLengthSet(HDWF hdwf, double sLength);
@@ -802,7 +1039,7 @@ def AnalogInRecordLengthSet(hdwf: int, sLength: float) -> None:
     Sets the Record length in seconds. With length of zero, the record will run
     indefinitely.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInRecordLengthSet(ctypes.c_int(hdwf), ctypes.c_double(sLength)))
+    _ThrowIfError(_dwf.FDwfAnalogInRecordLengthSet(hdwf, sLength))
 
 #------------------------------------------------------------------------------
 # Acquisition configuration:
@@ -815,7 +1052,7 @@ def AnalogInFrequencyInfo(hdwf: int) -> (float, float):
     '''
     out_hz_min = ctypes.c_double(0.0)
     out_hz_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInFrequencyInfo(ctypes.c_int(hdwf), ctypes.byref(out_hz_min), ctypes.byref(out_hz_max)))
+    _ThrowIfError(_dwf.FDwfAnalogInFrequencyInfo(hdwf, ctypes.byref(out_hz_min), ctypes.byref(out_hz_max)))
     return float(out_hz_min.value), float(out_hz_max.value)
 
 # DWFAPI int FDwfAnalogInFrequencySet(HDWF hdwf, double hzFrequency);
@@ -823,7 +1060,7 @@ def AnalogInFrequencySet(hdwf: int, frequency_in_hz: float) -> None:
     '''
     Sets the sample frequency for the instrument
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInFrequencySet(ctypes.c_int(hdwf), ctypes.c_double(frequency_in_hz)))
+    _ThrowIfError(_dwf.FDwfAnalogInFrequencySet(hdwf, frequency_in_hz))
 
 # DWFAPI int FDwfAnalogInFrequencyGet(HDWF hdwf, double *phzFrequency);
 def AnalogInFrequencyGet(hdwf: int) -> float:
@@ -834,7 +1071,7 @@ def AnalogInFrequencyGet(hdwf: int) -> float:
     FDwfAnalogInChannelFilterSet function.
     '''
     out_frequency_in_hz = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInFrequencyGet(ctypes.c_int(hdwf), ctypes.byref(out_frequency_in_hz)))
+    _ThrowIfError(_dwf.FDwfAnalogInFrequencyGet(hdwf, ctypes.byref(out_frequency_in_hz)))
     return float(out_frequency_in_hz.value)
 
 # DWFAPI int FDwfAnalogInBitsInfo(HDWF hdwf, int *pnBits); // Returns the number of ADC bits
@@ -843,7 +1080,7 @@ def AnalogInBitsInfo(hdwf: int) -> int:
     Retrieves the number bits used by the AnalogIn ADC.
     '''
     out_number_of_bits = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInBitsInfo(ctypes.c_int(hdwf), ctypes.byref(out_number_of_bits)))
+    _ThrowIfError(_dwf.FDwfAnalogInBitsInfo(hdwf, ctypes.byref(out_number_of_bits)))
     return int(out_number_of_bits.value)
 
 # DWFAPI int FDwfAnalogInBufferSizeInfo(HDWF hdwf, int *pnSizeMin, int *pnSizeMax);
@@ -853,7 +1090,7 @@ def AnalogInBufferSizeInfo(hdwf: int) -> (int, int):
     '''
     out_size_min = ctypes.c_int(0)
     out_size_max = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInBufferSizeInfo(ctypes.c_int(hdwf), ctypes.byref(out_size_min), ctypes.byref(out_size_max)))
+    _ThrowIfError(_dwf.FDwfAnalogInBufferSizeInfo(hdwf, ctypes.byref(out_size_min), ctypes.byref(out_size_max)))
     return int(out_size_min.value), int(out_size_max.value)
 
 # DWFAPI int FDwfAnalogInBufferSizeSet(HDWF hdwf, int nSize);
@@ -861,7 +1098,7 @@ def AnalogInBufferSizeSet(hdwf: int, nSize: int) -> None:
     '''
     Adjusts the AnalogIn instrument buffer size.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInBufferSizeSet(ctypes.c_int(hdwf), ctypes.c_int(nSize)))
+    _ThrowIfError(_dwf.FDwfAnalogInBufferSizeSet(hdwf, nSize))
 
 # DWFAPI int FDwfAnalogInBufferSizeGet(HDWF hdwf, int *pnSize);
 def AnalogInBufferSizeGet(hdwf: int) -> int:
@@ -869,7 +1106,7 @@ def AnalogInBufferSizeGet(hdwf: int) -> int:
     Returns the used AnalogIn instrument buffer size.
     '''
     out_nSize = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInBufferSizeGet(ctypes.c_int(hdwf), ctypes.byref(out_nSize)))
+    _ThrowIfError(_dwf.FDwfAnalogInBufferSizeGet(hdwf, ctypes.byref(out_nSize)))
     return int(out_nSize.value)
 
 # DWFAPI int FDwfAnalogInNoiseSizeInfo(HDWF hdwf, int *pnSizeMax);
@@ -878,13 +1115,13 @@ def AnalogInNoiseSizeInfo(hdwf: int) -> int:
     Returns the maximum buffer size for the instrument.
     '''
     out_size_max = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInNoiseSizeInfo(ctypes.c_int(hdwf), ctypes.byref(out_size_max)))
+    _ThrowIfError(_dwf.FDwfAnalogInNoiseSizeInfo(hdwf, ctypes.byref(out_size_max)))
     return int(out_size_max.value)
 
 # DWFAPI int FDwfAnalogInNoiseSizeSet(HDWF hdwf, int nSize);
 # Warning no docs found for FDwfAnalogInNoiseSizeSet
 def AnalogInNoiseSizeSet(hdwf: int, nSize: int) -> None:
-    _ThrowIfError(_dwf.FDwfAnalogInNoiseSizeSet(ctypes.c_int(hdwf), ctypes.c_int(nSize)))
+    _ThrowIfError(_dwf.FDwfAnalogInNoiseSizeSet(hdwf, nSize))
 
 # DWFAPI int FDwfAnalogInNoiseSizeGet(HDWF hdwf, int *pnSize);
 def AnalogInNoiseSizeGet(hdwf: int) -> int:
@@ -895,7 +1132,7 @@ def AnalogInNoiseSizeGet(hdwf: int) -> int:
     sample buffer size to 4096 the noise buffer size will be 256.
     '''
     out_nSize = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInNoiseSizeGet(ctypes.c_int(hdwf), ctypes.byref(out_nSize)))
+    _ThrowIfError(_dwf.FDwfAnalogInNoiseSizeGet(hdwf, ctypes.byref(out_nSize)))
     return int(out_nSize.value)
 
 # DWFAPI int FDwfAnalogInAcquisitionModeInfo(HDWF hdwf, int *pfsacqmode); // use IsBitSet
@@ -907,7 +1144,7 @@ def AnalogInAcquisitionModeInfo(hdwf: int) -> int:
     acquisition mode selects one of the following modes, ACQMODE:
     '''
     out_fsacqmode = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInAcquisitionModeInfo(ctypes.c_int(hdwf), ctypes.byref(out_fsacqmode)))
+    _ThrowIfError(_dwf.FDwfAnalogInAcquisitionModeInfo(hdwf, ctypes.byref(out_fsacqmode)))
     return int(out_fsacqmode.value)
 
 # DWFAPI int FDwfAnalogInAcquisitionModeSet(HDWF hdwf, ACQMODE acqmode);
@@ -915,7 +1152,7 @@ def AnalogInAcquisitionModeSet(hdwf: int, acqmode: int) -> None:
     '''
     Sets the acquisition mode.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInAcquisitionModeSet(ctypes.c_int(hdwf), ctypes.c_int(acqmode)))
+    _ThrowIfError(_dwf.FDwfAnalogInAcquisitionModeSet(hdwf, acqmode))
 
 # DWFAPI int FDwfAnalogInAcquisitionModeGet(HDWF hdwf, ACQMODE *pacqmode);
 def AnalogInAcquisitionModeGet(hdwf: int) -> int:
@@ -923,7 +1160,7 @@ def AnalogInAcquisitionModeGet(hdwf: int) -> int:
     Retrieves the acquisition mode.
     '''
     out_acqmode = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInAcquisitionModeGet(ctypes.c_int(hdwf), ctypes.byref(out_acqmode)))
+    _ThrowIfError(_dwf.FDwfAnalogInAcquisitionModeGet(hdwf, ctypes.byref(out_acqmode)))
     return int(out_acqmode.value)
 
 #------------------------------------------------------------------------------
@@ -936,7 +1173,7 @@ def AnalogInChannelCount(hdwf: int) -> int:
     Reads the number of AnalogIn channels of the device.
     '''
     out_cChannel = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInChannelCount(ctypes.c_int(hdwf), ctypes.byref(out_cChannel)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelCount(hdwf, ctypes.byref(out_cChannel)))
     return int(out_cChannel.value)
 
 # DWFAPI int FDwfAnalogInChannelEnableSet(HDWF hdwf, int idxChannel, int fEnable);
@@ -944,7 +1181,7 @@ def AnalogInChannelEnableSet(hdwf: int, channel_index: int, enable: int) -> None
     '''
     Enables or disables the specified AnalogIn channel.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInChannelEnableSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(enable)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelEnableSet(hdwf, channel_index, enable))
 
 # DWFAPI int FDwfAnalogInChannelEnableGet(HDWF hdwf, int idxChannel, int *pfEnable);
 def AnalogInChannelEnableGet(hdwf: int, channel_index: int) -> int:
@@ -952,7 +1189,7 @@ def AnalogInChannelEnableGet(hdwf: int, channel_index: int) -> int:
     Gets the current enable/disable status of the specified AnalogIn channel.
     '''
     out_enable = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInChannelEnableGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_enable)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelEnableGet(hdwf, channel_index, ctypes.byref(out_enable)))
     return int(out_enable.value)
 
 # DWFAPI int FDwfAnalogInChannelFilterInfo(HDWF hdwf, int *pfsfilter); // use IsBitSet
@@ -965,7 +1202,7 @@ def AnalogInChannelFilterInfo(hdwf: int) -> int:
     frequency (maximum acquisition frequency).
     '''
     out_fsfilter = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInChannelFilterInfo(ctypes.c_int(hdwf), ctypes.byref(out_fsfilter)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelFilterInfo(hdwf, ctypes.byref(out_fsfilter)))
     return int(out_fsfilter.value)
 
 # DWFAPI int FDwfAnalogInChannelFilterSet(HDWF hdwf, int idxChannel, FILTER filter);
@@ -975,7 +1212,7 @@ def AnalogInChannelFilterSet(hdwf: int, channel_index: int, filter: int) -> None
     -1, each enabled AnalogIn channel filter will be configured to use the same,
     new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInChannelFilterSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(filter)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelFilterSet(hdwf, channel_index, filter))
 
 # DWFAPI int FDwfAnalogInChannelFilterGet(HDWF hdwf, int idxChannel, FILTER *pfilter);
 def AnalogInChannelFilterGet(hdwf: int, channel_index: int) -> int:
@@ -983,7 +1220,7 @@ def AnalogInChannelFilterGet(hdwf: int, channel_index: int) -> int:
     Returns the configured acquisition filter.
     '''
     out_filter = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInChannelFilterGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_filter)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelFilterGet(hdwf, channel_index, ctypes.byref(out_filter)))
     return int(out_filter.value)
 
 # DWFAPI int FDwfAnalogInChannelRangeInfo(HDWF hdwf, double *pvoltsMin, double *pvoltsMax, double *pnSteps);
@@ -995,7 +1232,7 @@ def AnalogInChannelRangeInfo(hdwf: int) -> (float, float, float):
     out_volts_min = ctypes.c_double(0.0)
     out_volts_max = ctypes.c_double(0.0)
     out_num_steps = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInChannelRangeInfo(ctypes.c_int(hdwf), ctypes.byref(out_volts_min), ctypes.byref(out_volts_max), ctypes.byref(out_num_steps)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelRangeInfo(hdwf, ctypes.byref(out_volts_min), ctypes.byref(out_volts_max), ctypes.byref(out_num_steps)))
     return float(out_volts_min.value), float(out_volts_max.value), float(out_num_steps.value)
 
 # DWFAPI int FDwfAnalogInChannelRangeSteps(HDWF hdwf, double rgVoltsStep[32], int *pnSteps);
@@ -1004,9 +1241,9 @@ def AnalogInChannelRangeSteps(hdwf: int) -> (List[float], int):
     Reads the range of steps supported by the device. For instance: 1, 2, 5, 10, etc.
     '''
     voltage_steps_data = []
-    out_voltage_steps_data = (ctypes.c_cdouble * 32)()
+    out_voltage_steps_data = (ctypes.c_double * 32)()
     out_number_range_steps = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInChannelRangeSteps(ctypes.c_int(hdwf), ctypes.byref(out_voltage_steps_data), ctypes.byref(out_number_range_steps)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelRangeSteps(hdwf, out_voltage_steps_data, ctypes.byref(out_number_range_steps)))
     for i in range(32): voltage_steps_data.append(out_voltage_steps_data[i])
     return voltage_steps_data, int(out_number_range_steps.value)
 
@@ -1016,7 +1253,7 @@ def AnalogInChannelRangeSet(hdwf: int, channel_index: int, voltsRange: float) ->
     Configures the range for each channel. With channel index -1, each enabled
     Analog In channel range will be configured to the same, new value.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInChannelRangeSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_double(voltsRange)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelRangeSet(hdwf, channel_index, voltsRange))
 
 # DWFAPI int FDwfAnalogInChannelRangeGet(HDWF hdwf, int idxChannel, double *pvoltsRange);
 def AnalogInChannelRangeGet(hdwf: int, channel_index: int) -> float:
@@ -1024,7 +1261,7 @@ def AnalogInChannelRangeGet(hdwf: int, channel_index: int) -> float:
     Returns the real range value for the given channel.
     '''
     out_voltsRange = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInChannelRangeGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_voltsRange)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelRangeGet(hdwf, channel_index, ctypes.byref(out_voltsRange)))
     return float(out_voltsRange.value)
 
 # DWFAPI int FDwfAnalogInChannelOffsetInfo(HDWF hdwf, double *pvoltsMin, double *pvoltsMax, double *pnSteps);
@@ -1036,7 +1273,7 @@ def AnalogInChannelOffsetInfo(hdwf: int) -> (float, float, float):
     out_volts_min = ctypes.c_double(0.0)
     out_volts_max = ctypes.c_double(0.0)
     out_num_steps = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInChannelOffsetInfo(ctypes.c_int(hdwf), ctypes.byref(out_volts_min), ctypes.byref(out_volts_max), ctypes.byref(out_num_steps)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelOffsetInfo(hdwf, ctypes.byref(out_volts_min), ctypes.byref(out_volts_max), ctypes.byref(out_num_steps)))
     return float(out_volts_min.value), float(out_volts_max.value), float(out_num_steps.value)
 
 # DWFAPI int FDwfAnalogInChannelOffsetSet(HDWF hdwf, int idxChannel, double voltOffset);
@@ -1046,7 +1283,7 @@ def AnalogInChannelOffsetSet(hdwf: int, channel_index: int, voltOffset: float) -
     -1, each enabled AnalogIn channel offset will be configured to the same
     level.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInChannelOffsetSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_double(voltOffset)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelOffsetSet(hdwf, channel_index, voltOffset))
 
 # DWFAPI int FDwfAnalogInChannelOffsetGet(HDWF hdwf, int idxChannel, double *pvoltOffset);
 def AnalogInChannelOffsetGet(hdwf: int, channel_index: int) -> float:
@@ -1054,7 +1291,7 @@ def AnalogInChannelOffsetGet(hdwf: int, channel_index: int) -> float:
     Returns for each AnalogIn channel the real offset level.
     '''
     out_voltOffset = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInChannelOffsetGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_voltOffset)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelOffsetGet(hdwf, channel_index, ctypes.byref(out_voltOffset)))
     return float(out_voltOffset.value)
 
 # DWFAPI int FDwfAnalogInChannelAttenuationSet(HDWF hdwf, int idxChannel, double xAttenuation);
@@ -1065,7 +1302,7 @@ def AnalogInChannelAttenuationSet(hdwf: int, channel_index: int, xAttenuation: f
     same level. The attenuation does not change the attenuation on the device,
     just informs the library about the externally applied attenuation.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInChannelAttenuationSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_double(xAttenuation)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelAttenuationSet(hdwf, channel_index, xAttenuation))
 
 # DWFAPI int FDwfAnalogInChannelAttenuationGet(HDWF hdwf, int idxChannel, double *pxAttenuation);
 def AnalogInChannelAttenuationGet(hdwf: int, channel_index: int) -> float:
@@ -1073,31 +1310,31 @@ def AnalogInChannelAttenuationGet(hdwf: int, channel_index: int) -> float:
     Returns for each AnalogIn channel the configured attenuation.
     '''
     out_xAttenuation = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInChannelAttenuationGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_xAttenuation)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelAttenuationGet(hdwf, channel_index, ctypes.byref(out_xAttenuation)))
     return float(out_xAttenuation.value)
 
 # DWFAPI int FDwfAnalogInChannelBandwidthSet(HDWF hdwf, int idxChannel, double hz);
 # Warning no docs found for FDwfAnalogInChannelBandwidthSet
 def AnalogInChannelBandwidthSet(hdwf: int, channel_index: int, hz: float) -> None:
-    _ThrowIfError(_dwf.FDwfAnalogInChannelBandwidthSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_double(hz)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelBandwidthSet(hdwf, channel_index, hz))
 
 # DWFAPI int FDwfAnalogInChannelBandwidthGet(HDWF hdwf, int idxChannel, double *hzMin);
 # Warning no docs found for FDwfAnalogInChannelBandwidthGet
 def AnalogInChannelBandwidthGet(hdwf: int, channel_index: int) -> float:
     out_hz_min = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInChannelBandwidthGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_hz_min)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelBandwidthGet(hdwf, channel_index, ctypes.byref(out_hz_min)))
     return float(out_hz_min.value)
 
 # DWFAPI int FDwfAnalogInChannelImpedanceSet(HDWF hdwf, int idxChannel, double hz);
 # Warning no docs found for FDwfAnalogInChannelImpedanceSet
 def AnalogInChannelImpedanceSet(hdwf: int, channel_index: int, hz: float) -> None:
-    _ThrowIfError(_dwf.FDwfAnalogInChannelImpedanceSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_double(hz)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelImpedanceSet(hdwf, channel_index, hz))
 
 # DWFAPI int FDwfAnalogInChannelImpedanceGet(HDWF hdwf, int idxChannel, double *hzMin);
 # Warning no docs found for FDwfAnalogInChannelImpedanceGet
 def AnalogInChannelImpedanceGet(hdwf: int, channel_index: int) -> float:
     out_hz_min = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInChannelImpedanceGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_hz_min)))
+    _ThrowIfError(_dwf.FDwfAnalogInChannelImpedanceGet(hdwf, channel_index, ctypes.byref(out_hz_min)))
     return float(out_hz_min.value)
 
 #------------------------------------------------------------------------------
@@ -1109,7 +1346,7 @@ def AnalogInTriggerSourceSet(hdwf: int, trigger_source: int) -> None:
     '''
     Configures the AnalogIn acquisition trigger source.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerSourceSet(ctypes.c_int(hdwf), ctypes.c_int(trigger_source)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerSourceSet(hdwf, trigger_source))
 
 # DWFAPI int FDwfAnalogInTriggerSourceGet(HDWF hdwf, TRIGSRC *ptrigsrc);
 def AnalogInTriggerSourceGet(hdwf: int) -> int:
@@ -1118,8 +1355,8 @@ def AnalogInTriggerSourceGet(hdwf: int) -> int:
     an internal instrument or external trigger. To use the trigger on AnalogIn
     channels (edge, pulse, etc.), use trigsrcDetectorAnalogIn
     '''
-    out_trigger_source = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerSourceGet(ctypes.c_int(hdwf), ctypes.byref(out_trigger_source)))
+    out_trigger_source = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerSourceGet(hdwf, ctypes.byref(out_trigger_source)))
     return int(out_trigger_source.value)
 
 # DWFAPI int FDwfAnalogInTriggerPositionInfo(HDWF hdwf, double *psecMin, double *psecMax, double *pnSteps);
@@ -1132,7 +1369,7 @@ def AnalogInTriggerPositionInfo(hdwf: int) -> (float, float, float):
     out_sec_min = ctypes.c_double(0.0)
     out_sec_max = ctypes.c_double(0.0)
     out_num_steps = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerPositionInfo(ctypes.c_int(hdwf), ctypes.byref(out_sec_min), ctypes.byref(out_sec_max), ctypes.byref(out_num_steps)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerPositionInfo(hdwf, ctypes.byref(out_sec_min), ctypes.byref(out_sec_max), ctypes.byref(out_num_steps)))
     return float(out_sec_min.value), float(out_sec_max.value), float(out_num_steps.value)
 
 # DWFAPI int FDwfAnalogInTriggerPositionSet(HDWF hdwf, double secPosition);
@@ -1140,7 +1377,7 @@ def AnalogInTriggerPositionSet(hdwf: int, secPosition: float) -> None:
     '''
     Configures the horizontal trigger position in seconds.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerPositionSet(ctypes.c_int(hdwf), ctypes.c_double(secPosition)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerPositionSet(hdwf, secPosition))
 
 # DWFAPI int FDwfAnalogInTriggerPositionGet(HDWF hdwf, double *psecPosition);
 def AnalogInTriggerPositionGet(hdwf: int) -> float:
@@ -1148,14 +1385,14 @@ def AnalogInTriggerPositionGet(hdwf: int) -> float:
     Returns the configured trigger position in seconds.
     '''
     out_secPosition = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerPositionGet(ctypes.c_int(hdwf), ctypes.byref(out_secPosition)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerPositionGet(hdwf, ctypes.byref(out_secPosition)))
     return float(out_secPosition.value)
 
 # DWFAPI int FDwfAnalogInTriggerPositionStatus(HDWF hdwf, double *psecPosition);
 # Warning no docs found for FDwfAnalogInTriggerPositionStatus
 def AnalogInTriggerPositionStatus(hdwf: int) -> float:
     out_secPosition = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerPositionStatus(ctypes.c_int(hdwf), ctypes.byref(out_secPosition)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerPositionStatus(hdwf, ctypes.byref(out_secPosition)))
     return float(out_secPosition.value)
 
 # DWFAPI int FDwfAnalogInTriggerAutoTimeoutInfo(HDWF hdwf, double *psecMin, double *psecMax, double *pnSteps);
@@ -1169,7 +1406,7 @@ def AnalogInTriggerAutoTimeoutInfo(hdwf: int) -> (float, float, float):
     out_sec_min = ctypes.c_double(0.0)
     out_sec_max = ctypes.c_double(0.0)
     out_num_steps = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerAutoTimeoutInfo(ctypes.c_int(hdwf), ctypes.byref(out_sec_min), ctypes.byref(out_sec_max), ctypes.byref(out_num_steps)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerAutoTimeoutInfo(hdwf, ctypes.byref(out_sec_min), ctypes.byref(out_sec_max), ctypes.byref(out_num_steps)))
     return float(out_sec_min.value), float(out_sec_max.value), float(out_num_steps.value)
 
 # DWFAPI int FDwfAnalogInTriggerAutoTimeoutSet(HDWF hdwf, double secTimeout);
@@ -1177,7 +1414,7 @@ def AnalogInTriggerAutoTimeoutSet(hdwf: int, secTimeout: float) -> None:
     '''
     Configures the auto trigger timeout value in seconds.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerAutoTimeoutSet(ctypes.c_int(hdwf), ctypes.c_double(secTimeout)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerAutoTimeoutSet(hdwf, secTimeout))
 
 # DWFAPI int FDwfAnalogInTriggerAutoTimeoutGet(HDWF hdwf, double *psecTimeout);
 def AnalogInTriggerAutoTimeoutGet(hdwf: int) -> float:
@@ -1185,7 +1422,7 @@ def AnalogInTriggerAutoTimeoutGet(hdwf: int) -> float:
     Returns the configured auto trigger timeout value in seconds.
     '''
     out_secTimeout = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerAutoTimeoutGet(ctypes.c_int(hdwf), ctypes.byref(out_secTimeout)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerAutoTimeoutGet(hdwf, ctypes.byref(out_secTimeout)))
     return float(out_secTimeout.value)
 
 # DWFAPI int FDwfAnalogInTriggerHoldOffInfo(HDWF hdwf, double *psecMin, double *psecMax, double *pnStep);
@@ -1200,7 +1437,7 @@ def AnalogInTriggerHoldOffInfo(hdwf: int) -> (float, float, float):
     out_sec_min = ctypes.c_double(0.0)
     out_sec_max = ctypes.c_double(0.0)
     out_nStep = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerHoldOffInfo(ctypes.c_int(hdwf), ctypes.byref(out_sec_min), ctypes.byref(out_sec_max), ctypes.byref(out_nStep)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerHoldOffInfo(hdwf, ctypes.byref(out_sec_min), ctypes.byref(out_sec_max), ctypes.byref(out_nStep)))
     return float(out_sec_min.value), float(out_sec_max.value), float(out_nStep.value)
 
 # DWFAPI int FDwfAnalogInTriggerHoldOffSet(HDWF hdwf, double secHoldOff);
@@ -1208,7 +1445,7 @@ def AnalogInTriggerHoldOffSet(hdwf: int, secHoldOff: float) -> None:
     '''
     Sets the trigger hold-off for the AnalongIn instrument in Seconds.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerHoldOffSet(ctypes.c_int(hdwf), ctypes.c_double(secHoldOff)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerHoldOffSet(hdwf, secHoldOff))
 
 # DWFAPI int FDwfAnalogInTriggerHoldOffGet(HDWF hdwf, double *psecHoldOff);
 def AnalogInTriggerHoldOffGet(hdwf: int) -> float:
@@ -1216,7 +1453,7 @@ def AnalogInTriggerHoldOffGet(hdwf: int) -> float:
     Gets the current trigger hold-off for the AnalongIn instrument in Seconds.
     '''
     out_secHoldOff = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerHoldOffGet(ctypes.c_int(hdwf), ctypes.byref(out_secHoldOff)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerHoldOffGet(hdwf, ctypes.byref(out_secHoldOff)))
     return float(out_secHoldOff.value)
 
 # DWFAPI int FDwfAnalogInTriggerTypeInfo(HDWF hdwf, int *pfstrigtype); // use IsBitSet
@@ -1228,7 +1465,7 @@ def AnalogInTriggerTypeInfo(hdwf: int) -> int:
     in dwf.h. These trigger type options are:
     '''
     out_fstrigtype = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerTypeInfo(ctypes.c_int(hdwf), ctypes.byref(out_fstrigtype)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerTypeInfo(hdwf, ctypes.byref(out_fstrigtype)))
     return int(out_fstrigtype.value)
 
 # DWFAPI int FDwfAnalogInTriggerTypeSet(HDWF hdwf, TRIGTYPE trigtype);
@@ -1236,7 +1473,7 @@ def AnalogInTriggerTypeSet(hdwf: int, trigger_type: int) -> None:
     '''
     Sets the trigger type for the instrument.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerTypeSet(ctypes.c_int(hdwf), ctypes.c_int(trigger_type)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerTypeSet(hdwf, trigger_type))
 
 # DWFAPI int FDwfAnalogInTriggerTypeGet(HDWF hdwf, TRIGTYPE *ptrigtype);
 def AnalogInTriggerTypeGet(hdwf: int) -> int:
@@ -1244,7 +1481,7 @@ def AnalogInTriggerTypeGet(hdwf: int) -> int:
     Gets the current trigger type for the instrument.
     '''
     out_trigger_type = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerTypeGet(ctypes.c_int(hdwf), ctypes.byref(out_trigger_type)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerTypeGet(hdwf, ctypes.byref(out_trigger_type)))
     return int(out_trigger_type.value)
 
 # DWFAPI int FDwfAnalogInTriggerChannelInfo(HDWF hdwf, int *pidxMin, int *pidxMax);
@@ -1254,7 +1491,7 @@ def AnalogInTriggerChannelInfo(hdwf: int) -> (int, int):
     '''
     out_index_min = ctypes.c_int(0)
     out_index_max = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerChannelInfo(ctypes.c_int(hdwf), ctypes.byref(out_index_min), ctypes.byref(out_index_max)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerChannelInfo(hdwf, ctypes.byref(out_index_min), ctypes.byref(out_index_max)))
     return int(out_index_min.value), int(out_index_max.value)
 
 # DWFAPI int FDwfAnalogInTriggerChannelSet(HDWF hdwf, int idxChannel);
@@ -1262,7 +1499,7 @@ def AnalogInTriggerChannelSet(hdwf: int, channel_index: int) -> None:
     '''
     Sets the trigger channel.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerChannelSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerChannelSet(hdwf, channel_index))
 
 # DWFAPI int FDwfAnalogInTriggerChannelGet(HDWF hdwf, int *pidxChannel);
 def AnalogInTriggerChannelGet(hdwf: int) -> int:
@@ -1270,7 +1507,7 @@ def AnalogInTriggerChannelGet(hdwf: int) -> int:
     Retrieves the current trigger channel index.
     '''
     out_channel_index = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerChannelGet(ctypes.c_int(hdwf), ctypes.byref(out_channel_index)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerChannelGet(hdwf, ctypes.byref(out_channel_index)))
     return int(out_channel_index.value)
 
 # DWFAPI int FDwfAnalogInTriggerFilterInfo(HDWF hdwf, int *pfsfilter); // use IsBitSet
@@ -1281,7 +1518,7 @@ def AnalogInTriggerFilterInfo(hdwf: int) -> int:
     defined using the FILTER constants in DWF.h.
     '''
     out_fsfilter = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerFilterInfo(ctypes.c_int(hdwf), ctypes.byref(out_fsfilter)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerFilterInfo(hdwf, ctypes.byref(out_fsfilter)))
     return int(out_fsfilter.value)
 
 # DWFAPI int FDwfAnalogInTriggerFilterSet(HDWF hdwf, FILTER filter);
@@ -1289,7 +1526,7 @@ def AnalogInTriggerFilterSet(hdwf: int, filter: int) -> None:
     '''
     Sets the trigger filter.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerFilterSet(ctypes.c_int(hdwf), ctypes.c_int(filter)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerFilterSet(hdwf, filter))
 
 # DWFAPI int FDwfAnalogInTriggerFilterGet(HDWF hdwf, FILTER *pfilter);
 def AnalogInTriggerFilterGet(hdwf: int) -> int:
@@ -1297,7 +1534,7 @@ def AnalogInTriggerFilterGet(hdwf: int) -> int:
     Gets the trigger filter.
     '''
     out_filter = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerFilterGet(ctypes.c_int(hdwf), ctypes.byref(out_filter)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerFilterGet(hdwf, ctypes.byref(out_filter)))
     return int(out_filter.value)
 
 # DWFAPI int FDwfAnalogInTriggerLevelInfo(HDWF hdwf, double *pvoltsMin, double *pvoltsMax, double *pnSteps);
@@ -1309,7 +1546,7 @@ def AnalogInTriggerLevelInfo(hdwf: int) -> (float, float, float):
     out_volts_min = ctypes.c_double(0.0)
     out_volts_max = ctypes.c_double(0.0)
     out_num_steps = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerLevelInfo(ctypes.c_int(hdwf), ctypes.byref(out_volts_min), ctypes.byref(out_volts_max), ctypes.byref(out_num_steps)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerLevelInfo(hdwf, ctypes.byref(out_volts_min), ctypes.byref(out_volts_max), ctypes.byref(out_num_steps)))
     return float(out_volts_min.value), float(out_volts_max.value), float(out_num_steps.value)
 
 # DWFAPI int FDwfAnalogInTriggerLevelSet(HDWF hdwf, double voltsLevel);
@@ -1317,7 +1554,7 @@ def AnalogInTriggerLevelSet(hdwf: int, voltage_level: float) -> None:
     '''
     Sets the trigger voltage level in Volts.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerLevelSet(ctypes.c_int(hdwf), ctypes.c_double(voltage_level)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerLevelSet(hdwf, voltage_level))
 
 # DWFAPI int FDwfAnalogInTriggerLevelGet(HDWF hdwf, double *pvoltsLevel);
 def AnalogInTriggerLevelGet(hdwf: int) -> float:
@@ -1325,7 +1562,7 @@ def AnalogInTriggerLevelGet(hdwf: int) -> float:
     Gets the current trigger voltage level in Volts.
     '''
     out_voltsLevel = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerLevelGet(ctypes.c_int(hdwf), ctypes.byref(out_voltsLevel)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerLevelGet(hdwf, ctypes.byref(out_voltsLevel)))
     return float(out_voltsLevel.value)
 
 # DWFAPI int FDwfAnalogInTriggerHysteresisInfo(HDWF hdwf, double *pvoltsMin, double *pvoltsMax, double *pnSteps);
@@ -1341,7 +1578,7 @@ def AnalogInTriggerHysteresisInfo(hdwf: int) -> (float, float, float):
     out_volts_min = ctypes.c_double(0.0)
     out_volts_max = ctypes.c_double(0.0)
     out_num_steps = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerHysteresisInfo(ctypes.c_int(hdwf), ctypes.byref(out_volts_min), ctypes.byref(out_volts_max), ctypes.byref(out_num_steps)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerHysteresisInfo(hdwf, ctypes.byref(out_volts_min), ctypes.byref(out_volts_max), ctypes.byref(out_num_steps)))
     return float(out_volts_min.value), float(out_volts_max.value), float(out_num_steps.value)
 
 # DWFAPI int FDwfAnalogInTriggerHysteresisSet(HDWF hdwf, double voltsLevel);
@@ -1349,7 +1586,7 @@ def AnalogInTriggerHysteresisSet(hdwf: int, voltage_level: float) -> None:
     '''
     Sets the trigger hysteresis level in Volts.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerHysteresisSet(ctypes.c_int(hdwf), ctypes.c_double(voltage_level)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerHysteresisSet(hdwf, voltage_level))
 
 # DWFAPI int FDwfAnalogInTriggerHysteresisGet(HDWF hdwf, double *pvoltsHysteresis);
 def AnalogInTriggerHysteresisGet(hdwf: int) -> float:
@@ -1357,7 +1594,7 @@ def AnalogInTriggerHysteresisGet(hdwf: int) -> float:
     Gets the current trigger hysteresis level in Volts.
     '''
     out_hysteresis_voltage = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerHysteresisGet(ctypes.c_int(hdwf), ctypes.byref(out_hysteresis_voltage)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerHysteresisGet(hdwf, ctypes.byref(out_hysteresis_voltage)))
     return float(out_hysteresis_voltage.value)
 
 # DWFAPI int FDwfAnalogInTriggerConditionInfo(HDWF hdwf, int *pfstrigcond); // use IsBitSet
@@ -1369,7 +1606,7 @@ def AnalogInTriggerConditionInfo(hdwf: int) -> int:
     constants in dwf.h. These trigger condition options are:
     '''
     out_fstrigcond = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerConditionInfo(ctypes.c_int(hdwf), ctypes.byref(out_fstrigcond)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerConditionInfo(hdwf, ctypes.byref(out_fstrigcond)))
     return int(out_fstrigcond.value)
 
 # DWFAPI int FDwfAnalogInTriggerConditionSet(HDWF hdwf, DwfTriggerSlope trigcond);
@@ -1377,7 +1614,7 @@ def AnalogInTriggerConditionSet(hdwf: int, trigcond: TriggerSlope) -> None:
     '''
     Sets the trigger condition for the instrument.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerConditionSet(ctypes.c_int(hdwf), ctypes.c_int(trigcond)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerConditionSet(hdwf, trigcond))
 
 # DWFAPI int FDwfAnalogInTriggerConditionGet(HDWF hdwf, DwfTriggerSlope *ptrigcond);
 def AnalogInTriggerConditionGet(hdwf: int) -> TriggerSlope:
@@ -1385,7 +1622,7 @@ def AnalogInTriggerConditionGet(hdwf: int) -> TriggerSlope:
     Sets the trigger condition for the instrument.
     '''
     out_trigcond = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerConditionGet(ctypes.c_int(hdwf), ctypes.byref(out_trigcond)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerConditionGet(hdwf, ctypes.byref(out_trigcond)))
     return TriggerSlope(out_trigcond.value)
 
 # DWFAPI int FDwfAnalogInTriggerLengthInfo(HDWF hdwf, double *psecMin, double *psecMax, double *pnSteps);
@@ -1398,7 +1635,7 @@ def AnalogInTriggerLengthInfo(hdwf: int) -> (float, float, float):
     out_sec_min = ctypes.c_double(0.0)
     out_sec_max = ctypes.c_double(0.0)
     out_num_steps = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerLengthInfo(ctypes.c_int(hdwf), ctypes.byref(out_sec_min), ctypes.byref(out_sec_max), ctypes.byref(out_num_steps)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerLengthInfo(hdwf, ctypes.byref(out_sec_min), ctypes.byref(out_sec_max), ctypes.byref(out_num_steps)))
     return float(out_sec_min.value), float(out_sec_max.value), float(out_num_steps.value)
 
 # DWFAPI int FDwfAnalogInTriggerLengthSet(HDWF hdwf, double secLength);
@@ -1406,7 +1643,7 @@ def AnalogInTriggerLengthSet(hdwf: int, secLength: float) -> None:
     '''
     Sets the trigger length in Seconds.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerLengthSet(ctypes.c_int(hdwf), ctypes.c_double(secLength)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerLengthSet(hdwf, secLength))
 
 # DWFAPI int FDwfAnalogInTriggerLengthGet(HDWF hdwf, double *psecLength);
 def AnalogInTriggerLengthGet(hdwf: int) -> float:
@@ -1414,7 +1651,7 @@ def AnalogInTriggerLengthGet(hdwf: int) -> float:
     Gets the current trigger length in Seconds.
     '''
     out_secLength = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerLengthGet(ctypes.c_int(hdwf), ctypes.byref(out_secLength)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerLengthGet(hdwf, ctypes.byref(out_secLength)))
     return float(out_secLength.value)
 
 # DWFAPI int FDwfAnalogInTriggerLengthConditionInfo(HDWF hdwf, int *pfstriglen); // use IsBitSet
@@ -1426,7 +1663,7 @@ def AnalogInTriggerLengthConditionInfo(hdwf: int) -> int:
     the TRIGLEN constants in DWF.h. These trigger length condition options are:
     '''
     out_fstriglen = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerLengthConditionInfo(ctypes.c_int(hdwf), ctypes.byref(out_fstriglen)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerLengthConditionInfo(hdwf, ctypes.byref(out_fstriglen)))
     return int(out_fstriglen.value)
 
 # DWFAPI int FDwfAnalogInTriggerLengthConditionSet(HDWF hdwf, TRIGLEN triglen);
@@ -1434,7 +1671,7 @@ def AnalogInTriggerLengthConditionSet(hdwf: int, trigger_length: int) -> None:
     '''
     Sets the trigger length condition for the AnalongIn instrument.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerLengthConditionSet(ctypes.c_int(hdwf), ctypes.c_int(trigger_length)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerLengthConditionSet(hdwf, trigger_length))
 
 # DWFAPI int FDwfAnalogInTriggerLengthConditionGet(HDWF hdwf, TRIGLEN *ptriglen);
 def AnalogInTriggerLengthConditionGet(hdwf: int) -> int:
@@ -1442,7 +1679,7 @@ def AnalogInTriggerLengthConditionGet(hdwf: int) -> int:
     Gets the current trigger length condition for the AnalongIn instrument.
     '''
     out_trigger_length = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerLengthConditionGet(ctypes.c_int(hdwf), ctypes.byref(out_trigger_length)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerLengthConditionGet(hdwf, ctypes.byref(out_trigger_length)))
     return int(out_trigger_length.value)
 
 # DWFAPI int FDwfAnalogInSamplingSourceSet(HDWF hdwf, TRIGSRC trigsrc);
@@ -1450,15 +1687,15 @@ def AnalogInSamplingSourceSet(hdwf: int, trigger_source: int) -> None:
     '''
     Configures the AnalogIn acquisition data sampling source.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInSamplingSourceSet(ctypes.c_int(hdwf), ctypes.c_int(trigger_source)))
+    _ThrowIfError(_dwf.FDwfAnalogInSamplingSourceSet(hdwf, trigger_source))
 
 # DWFAPI int FDwfAnalogInSamplingSourceGet(HDWF hdwf, TRIGSRC *ptrigsrc);
 def AnalogInSamplingSourceGet(hdwf: int) -> int:
     '''
     Returns the configured sampling source.
     '''
-    out_trigger_source = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInSamplingSourceGet(ctypes.c_int(hdwf), ctypes.byref(out_trigger_source)))
+    out_trigger_source = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfAnalogInSamplingSourceGet(hdwf, ctypes.byref(out_trigger_source)))
     return int(out_trigger_source.value)
 
 # DWFAPI int FDwfAnalogInSamplingSlopeSet(HDWF hdwf, DwfTriggerSlope slope);
@@ -1466,7 +1703,7 @@ def AnalogInSamplingSlopeSet(hdwf: int, slope: TriggerSlope) -> None:
     '''
     Sets the sampling slope for the instrument
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInSamplingSlopeSet(ctypes.c_int(hdwf), ctypes.c_int(slope)))
+    _ThrowIfError(_dwf.FDwfAnalogInSamplingSlopeSet(hdwf, slope))
 
 # DWFAPI int FDwfAnalogInSamplingSlopeGet(HDWF hdwf, DwfTriggerSlope *pslope);
 def AnalogInSamplingSlopeGet(hdwf: int) -> TriggerSlope:
@@ -1474,7 +1711,7 @@ def AnalogInSamplingSlopeGet(hdwf: int) -> TriggerSlope:
     Returns the sampling for the instrument.
     '''
     out_slope = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInSamplingSlopeGet(ctypes.c_int(hdwf), ctypes.byref(out_slope)))
+    _ThrowIfError(_dwf.FDwfAnalogInSamplingSlopeGet(hdwf, ctypes.byref(out_slope)))
     return TriggerSlope(out_slope.value)
 
 # DWFAPI int FDwfAnalogInSamplingDelaySet(HDWF hdwf, double sec);
@@ -1482,7 +1719,7 @@ def AnalogInSamplingDelaySet(hdwf: int, sec: float) -> None:
     '''
     Sets the sampling delay for the instrument.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogInSamplingDelaySet(ctypes.c_int(hdwf), ctypes.c_double(sec)))
+    _ThrowIfError(_dwf.FDwfAnalogInSamplingDelaySet(hdwf, sec))
 
 # DWFAPI int FDwfAnalogInSamplingDelayGet(HDWF hdwf, double *psec);
 def AnalogInSamplingDelayGet(hdwf: int) -> float:
@@ -1490,7 +1727,7 @@ def AnalogInSamplingDelayGet(hdwf: int) -> float:
     Returns the configured sampling delay.
     '''
     out_sec = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogInSamplingDelayGet(ctypes.c_int(hdwf), ctypes.byref(out_sec)))
+    _ThrowIfError(_dwf.FDwfAnalogInSamplingDelayGet(hdwf, ctypes.byref(out_sec)))
     return float(out_sec.value)
 
 ###############################################################################
@@ -1507,7 +1744,7 @@ def AnalogOutCount(hdwf: int) -> int:
     Returns the number of Analog Out channels by the device specified by hdwf.
     '''
     out_cChannel = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutCount(ctypes.c_int(hdwf), ctypes.byref(out_cChannel)))
+    _ThrowIfError(_dwf.FDwfAnalogOutCount(hdwf, ctypes.byref(out_cChannel)))
     return int(out_cChannel.value)
 
 # DWFAPI int FDwfAnalogOutMasterSet(HDWF hdwf, int idxChannel, int idxMaster);
@@ -1517,7 +1754,7 @@ def AnalogOutMasterSet(hdwf: int, channel_index: int, idxMaster: int) -> None:
     -1, each enabled Analog Out channel will be configured to use the same, new
     option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutMasterSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(idxMaster)))
+    _ThrowIfError(_dwf.FDwfAnalogOutMasterSet(hdwf, channel_index, idxMaster))
 
 # DWFAPI int FDwfAnalogOutMasterGet(HDWF hdwf, int idxChannel, int *pidxMaster);
 def AnalogOutMasterGet(hdwf: int, channel_index: int) -> int:
@@ -1525,7 +1762,7 @@ def AnalogOutMasterGet(hdwf: int, channel_index: int) -> int:
     Verifies the parameter set by FDwfAnalogOutMasterSet.
     '''
     out_idxMaster = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutMasterGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_idxMaster)))
+    _ThrowIfError(_dwf.FDwfAnalogOutMasterGet(hdwf, channel_index, ctypes.byref(out_idxMaster)))
     return int(out_idxMaster.value)
 
 # DWFAPI int FDwfAnalogOutTriggerSourceSet(HDWF hdwf, int idxChannel, TRIGSRC trigsrc);
@@ -1533,15 +1770,15 @@ def AnalogOutTriggerSourceSet(hdwf: int, channel_index: int, trigger_source: int
     '''
     Sets the trigger source for the channel on instrument.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutTriggerSourceSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(trigger_source)))
+    _ThrowIfError(_dwf.FDwfAnalogOutTriggerSourceSet(hdwf, channel_index, trigger_source))
 
 # DWFAPI int FDwfAnalogOutTriggerSourceGet(HDWF hdwf, int idxChannel, TRIGSRC *ptrigsrc);
 def AnalogOutTriggerSourceGet(hdwf: int, channel_index: int) -> int:
     '''
     Gets the current trigger source setting for the channel on instrument.
     '''
-    out_trigger_source = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutTriggerSourceGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_trigger_source)))
+    out_trigger_source = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfAnalogOutTriggerSourceGet(hdwf, channel_index, ctypes.byref(out_trigger_source)))
     return int(out_trigger_source.value)
 
 # DWFAPI int FDwfAnalogOutTriggerSlopeSet(HDWF hdwf, int idxChannel, DwfTriggerSlope slope);
@@ -1549,7 +1786,7 @@ def AnalogOutTriggerSlopeSet(hdwf: int, channel_index: int, slope: int) -> None:
     '''
     Sets the trigger slope for the channel on instrument
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutTriggerSlopeSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(slope)))
+    _ThrowIfError(_dwf.FDwfAnalogOutTriggerSlopeSet(hdwf, channel_index, slope))
 
 # DWFAPI int FDwfAnalogOutTriggerSlopeGet(HDWF hdwf, int idxChannel, DwfTriggerSlope *pslope);
 def AnalogOutTriggerSlopeGet(hdwf: int, channel_index: int) -> int:
@@ -1557,7 +1794,7 @@ def AnalogOutTriggerSlopeGet(hdwf: int, channel_index: int) -> int:
     Gets the current trigger slope setting for the channel on instrument.
     '''
     out_slope = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutTriggerSlopeGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_slope)))
+    _ThrowIfError(_dwf.FDwfAnalogOutTriggerSlopeGet(hdwf, channel_index, ctypes.byref(out_slope)))
     return int(out_slope.value)
 
 # DWFAPI int FDwfAnalogOutRunInfo(HDWF hdwf, int idxChannel, double *psecMin, double *psecMax);
@@ -1568,7 +1805,7 @@ def AnalogOutRunInfo(hdwf: int, channel_index: int) -> (float, float):
     '''
     out_sec_min = ctypes.c_double(0.0)
     out_sec_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutRunInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_sec_min), ctypes.byref(out_sec_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutRunInfo(hdwf, channel_index, ctypes.byref(out_sec_min), ctypes.byref(out_sec_max)))
     return float(out_sec_min.value), float(out_sec_max.value)
 
 # DWFAPI int FDwfAnalogOutRunSet(HDWF hdwf, int idxChannel, double secRun);
@@ -1576,7 +1813,7 @@ def AnalogOutRunSet(hdwf: int, channel_index: int, secRun: float) -> None:
     '''
     Sets the run length for the instrument in Seconds.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutRunSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_double(secRun)))
+    _ThrowIfError(_dwf.FDwfAnalogOutRunSet(hdwf, channel_index, secRun))
 
 # DWFAPI int FDwfAnalogOutRunGet(HDWF hdwf, int idxChannel, double *psecRun);
 def AnalogOutRunGet(hdwf: int, channel_index: int) -> float:
@@ -1584,7 +1821,7 @@ def AnalogOutRunGet(hdwf: int, channel_index: int) -> float:
     Reads the configured run length for the instrument in Seconds.
     '''
     out_secRun = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutRunGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_secRun)))
+    _ThrowIfError(_dwf.FDwfAnalogOutRunGet(hdwf, channel_index, ctypes.byref(out_secRun)))
     return float(out_secRun.value)
 
 # DWFAPI int FDwfAnalogOutRunStatus(HDWF hdwf, int idxChannel, double *psecRun);
@@ -1594,7 +1831,7 @@ def AnalogOutRunStatus(hdwf: int, channel_index: int) -> float:
     FDwfAnalogOutStatus call.
     '''
     out_secRun = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutRunStatus(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_secRun)))
+    _ThrowIfError(_dwf.FDwfAnalogOutRunStatus(hdwf, channel_index, ctypes.byref(out_secRun)))
     return float(out_secRun.value)
 
 # DWFAPI int FDwfAnalogOutWaitInfo(HDWF hdwf, int idxChannel, double *psecMin, double *psecMax);
@@ -1606,7 +1843,7 @@ def AnalogOutWaitInfo(hdwf: int, channel_index: int) -> (float, float):
     '''
     out_sec_min = ctypes.c_double(0.0)
     out_sec_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutWaitInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_sec_min), ctypes.byref(out_sec_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutWaitInfo(hdwf, channel_index, ctypes.byref(out_sec_min), ctypes.byref(out_sec_max)))
     return float(out_sec_min.value), float(out_sec_max.value)
 
 # DWFAPI int FDwfAnalogOutWaitSet(HDWF hdwf, int idxChannel, double secWait);
@@ -1614,7 +1851,7 @@ def AnalogOutWaitSet(hdwf: int, channel_index: int, secWait: float) -> None:
     '''
     Sets the wait length for the channel on instrument.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutWaitSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_double(secWait)))
+    _ThrowIfError(_dwf.FDwfAnalogOutWaitSet(hdwf, channel_index, secWait))
 
 # DWFAPI int FDwfAnalogOutWaitGet(HDWF hdwf, int idxChannel, double *psecWait);
 def AnalogOutWaitGet(hdwf: int, channel_index: int) -> float:
@@ -1622,7 +1859,7 @@ def AnalogOutWaitGet(hdwf: int, channel_index: int) -> float:
     Gets the current wait length for the channel on instrument.
     '''
     out_secWait = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutWaitGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_secWait)))
+    _ThrowIfError(_dwf.FDwfAnalogOutWaitGet(hdwf, channel_index, ctypes.byref(out_secWait)))
     return float(out_secWait.value)
 
 # DWFAPI int FDwfAnalogOutRepeatInfo(HDWF hdwf, int idxChannel, int *pnMin, int *pnMax);
@@ -1634,7 +1871,7 @@ def AnalogOutRepeatInfo(hdwf: int, channel_index: int) -> (int, int):
     '''
     out_min = ctypes.c_int(0)
     out_max = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutRepeatInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_min), ctypes.byref(out_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutRepeatInfo(hdwf, channel_index, ctypes.byref(out_min), ctypes.byref(out_max)))
     return int(out_min.value), int(out_max.value)
 
 # DWFAPI int FDwfAnalogOutRepeatSet(HDWF hdwf, int idxChannel, int cRepeat);
@@ -1642,7 +1879,7 @@ def AnalogOutRepeatSet(hdwf: int, channel_index: int, cRepeat: int) -> None:
     '''
     Sets the repeat count.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutRepeatSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(cRepeat)))
+    _ThrowIfError(_dwf.FDwfAnalogOutRepeatSet(hdwf, channel_index, cRepeat))
 
 # DWFAPI int FDwfAnalogOutRepeatGet(HDWF hdwf, int idxChannel, int *pcRepeat);
 def AnalogOutRepeatGet(hdwf: int, channel_index: int) -> int:
@@ -1650,7 +1887,7 @@ def AnalogOutRepeatGet(hdwf: int, channel_index: int) -> int:
     Reads the current repeat count.
     '''
     out_cRepeat = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutRepeatGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_cRepeat)))
+    _ThrowIfError(_dwf.FDwfAnalogOutRepeatGet(hdwf, channel_index, ctypes.byref(out_cRepeat)))
     return int(out_cRepeat.value)
 
 # DWFAPI int FDwfAnalogOutRepeatStatus(HDWF hdwf, int idxChannel, int *pcRepeat);
@@ -1660,7 +1897,7 @@ def AnalogOutRepeatStatus(hdwf: int, channel_index: int) -> int:
     FDwfAnalogOutStatus function call, it does not read from the device.
     '''
     out_cRepeat = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutRepeatStatus(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_cRepeat)))
+    _ThrowIfError(_dwf.FDwfAnalogOutRepeatStatus(hdwf, channel_index, ctypes.byref(out_cRepeat)))
     return int(out_cRepeat.value)
 
 # DWFAPI int FDwfAnalogOutRepeatTriggerSet(HDWF hdwf, int idxChannel, int fRepeatTrigger);
@@ -1669,7 +1906,7 @@ def AnalogOutRepeatTriggerSet(hdwf: int, channel_index: int, fRepeatTrigger: int
     Sets the repeat trigger option. To include the trigger in wait-run repeat
     cycles, set fRepeatTrigger to TRUE. It is disabled by default.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutRepeatTriggerSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(fRepeatTrigger)))
+    _ThrowIfError(_dwf.FDwfAnalogOutRepeatTriggerSet(hdwf, channel_index, fRepeatTrigger))
 
 # DWFAPI int FDwfAnalogOutRepeatTriggerGet(HDWF hdwf, int idxChannel, int *pfRepeatTrigger);
 def AnalogOutRepeatTriggerGet(hdwf: int, channel_index: int) -> int:
@@ -1677,7 +1914,7 @@ def AnalogOutRepeatTriggerGet(hdwf: int, channel_index: int) -> int:
     Verifies if the trigger has been included in wait-run repeat cycles.
     '''
     out_fRepeatTrigger = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutRepeatTriggerGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_fRepeatTrigger)))
+    _ThrowIfError(_dwf.FDwfAnalogOutRepeatTriggerGet(hdwf, channel_index, ctypes.byref(out_fRepeatTrigger)))
     return int(out_fRepeatTrigger.value)
 
 # EExplorer channel 3&4 current/voltage limitation
@@ -1690,7 +1927,7 @@ def AnalogOutLimitationInfo(hdwf: int, channel_index: int) -> (float, float):
     '''
     out_number_min = ctypes.c_double(0.0)
     out_number_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutLimitationInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_number_min), ctypes.byref(out_number_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutLimitationInfo(hdwf, channel_index, ctypes.byref(out_number_min), ctypes.byref(out_number_max)))
     return float(out_number_min.value), float(out_number_max.value)
 
 # DWFAPI int FDwfAnalogOutLimitationSet(HDWF hdwf, int idxChannel, double limit);
@@ -1700,7 +1937,7 @@ def AnalogOutLimitationSet(hdwf: int, channel_index: int, limit: float) -> None:
     channel index -1, each enabled Analog Out channel limitation will be
     configured to use the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutLimitationSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_double(limit)))
+    _ThrowIfError(_dwf.FDwfAnalogOutLimitationSet(hdwf, channel_index, limit))
 
 # DWFAPI int FDwfAnalogOutLimitationGet(HDWF hdwf, int idxChannel, double *plimit);
 def AnalogOutLimitationGet(hdwf: int, channel_index: int) -> float:
@@ -1709,7 +1946,7 @@ def AnalogOutLimitationGet(hdwf: int, channel_index: int) -> float:
     instrument.
     '''
     out_limit = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutLimitationGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_limit)))
+    _ThrowIfError(_dwf.FDwfAnalogOutLimitationGet(hdwf, channel_index, ctypes.byref(out_limit)))
     return float(out_limit.value)
 
 # DWFAPI int FDwfAnalogOutModeSet(HDWF hdwf, int idxChannel, DwfAnalogOutMode mode);
@@ -1721,7 +1958,7 @@ def AnalogOutModeSet(hdwf: int, channel_index: int, mode: int) -> None:
     Analog Out Channel 3 and 4, Positive and Negative Power supplies, to set
     current or voltage waveform generator mode.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutModeSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(mode)))
+    _ThrowIfError(_dwf.FDwfAnalogOutModeSet(hdwf, channel_index, mode))
 
 # DWFAPI int FDwfAnalogOutModeGet(HDWF hdwf, int idxChannel, DwfAnalogOutMode *pmode);
 def AnalogOutModeGet(hdwf: int, channel_index: int) -> int:
@@ -1730,7 +1967,7 @@ def AnalogOutModeGet(hdwf: int, channel_index: int) -> int:
     channel.
     '''
     out_mode = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutModeGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_mode)))
+    _ThrowIfError(_dwf.FDwfAnalogOutModeGet(hdwf, channel_index, ctypes.byref(out_mode)))
     return int(out_mode.value)
 
 # DWFAPI int FDwfAnalogOutIdleInfo(HDWF hdwf, int idxChannel, int *pfsidle);
@@ -1742,7 +1979,7 @@ def AnalogOutIdleInfo(hdwf: int, channel_index: int) -> int:
     dwf.h.
     '''
     out_fsidle = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutIdleInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_fsidle)))
+    _ThrowIfError(_dwf.FDwfAnalogOutIdleInfo(hdwf, channel_index, ctypes.byref(out_fsidle)))
     return int(out_fsidle.value)
 
 # DWFAPI int FDwfAnalogOutIdleSet(HDWF hdwf, int idxChannel, DwfAnalogOutIdle idle);
@@ -1752,7 +1989,7 @@ def AnalogOutIdleSet(hdwf: int, channel_index: int, idle: int) -> None:
     idle output selects the output while not running, Ready, Stopped, Done, or
     Wait states.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutIdleSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(idle)))
+    _ThrowIfError(_dwf.FDwfAnalogOutIdleSet(hdwf, channel_index, idle))
 
 # DWFAPI int FDwfAnalogOutIdleGet(HDWF hdwf, int idxChannel, DwfAnalogOutIdle *pidle);
 def AnalogOutIdleGet(hdwf: int, channel_index: int) -> int:
@@ -1761,7 +1998,7 @@ def AnalogOutIdleGet(hdwf: int, channel_index: int) -> int:
     channel.
     '''
     out_idle = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutIdleGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_idle)))
+    _ThrowIfError(_dwf.FDwfAnalogOutIdleGet(hdwf, channel_index, ctypes.byref(out_idle)))
     return int(out_idle.value)
 
 # DWFAPI int FDwfAnalogOutNodeInfo(HDWF hdwf, int idxChannel, int *pfsnode); // use IsBitSet
@@ -1772,7 +2009,7 @@ def AnalogOutNodeInfo(hdwf: int, channel_index: int) -> int:
     the IsBitSet Macro.
     '''
     out_fsnode = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_fsnode)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeInfo(hdwf, channel_index, ctypes.byref(out_fsnode)))
     return int(out_fsnode.value)
 
 # DWFAPI int FDwfAnalogOutNodeEnableSet(HDWF hdwf, int idxChannel, AnalogOutNode node, int fEnable);
@@ -1783,7 +2020,7 @@ def AnalogOutNodeEnableSet(hdwf: int, channel_index: int, node: int, enable: int
     channel index -1, each Analog Out channel enable will be configured to use
     the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeEnableSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.c_int(enable)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeEnableSet(hdwf, channel_index, node, enable))
 
 # DWFAPI int FDwfAnalogOutNodeEnableGet(HDWF hdwf, int idxChannel, AnalogOutNode node, int *pfEnable);
 def AnalogOutNodeEnableGet(hdwf: int, channel_index: int, node: int) -> int:
@@ -1791,7 +2028,7 @@ def AnalogOutNodeEnableGet(hdwf: int, channel_index: int, node: int) -> int:
     Verifies if a specific channel and node is enabled or disabled.
     '''
     out_enable = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeEnableGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_enable)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeEnableGet(hdwf, channel_index, node, ctypes.byref(out_enable)))
     return int(out_enable.value)
 
 # DWFAPI int FDwfAnalogOutNodeFunctionInfo(HDWF hdwf, int idxChannel, AnalogOutNode node, unsigned int *pfsfunc); // use IsBitSet
@@ -1802,8 +2039,8 @@ def AnalogOutNodeFunctionInfo(hdwf: int, channel_index: int, node: int) -> int:
     Macro. Individual bits are defined using the FUNC constants in dwf.h. These
     are:
     '''
-    out_fsfunc = c_uint(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeFunctionInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_fsfunc)))
+    out_fsfunc = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeFunctionInfo(hdwf, channel_index, node, ctypes.byref(out_fsfunc)))
     return int(out_fsfunc.value)
 
 # DWFAPI int FDwfAnalogOutNodeFunctionSet(HDWF hdwf, int idxChannel, AnalogOutNode node, FUNC func);
@@ -1813,7 +2050,7 @@ def AnalogOutNodeFunctionSet(hdwf: int, channel_index: int, node: int, func: int
     With channel index -1, each enabled Analog Out channel function will be
     configured to use the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeFunctionSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.c_int(func)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeFunctionSet(hdwf, channel_index, node, func))
 
 # DWFAPI int FDwfAnalogOutNodeFunctionGet(HDWF hdwf, int idxChannel, AnalogOutNode node, FUNC *pfunc);
 def AnalogOutNodeFunctionGet(hdwf: int, channel_index: int, node: int) -> int:
@@ -1821,8 +2058,8 @@ def AnalogOutNodeFunctionGet(hdwf: int, channel_index: int, node: int) -> int:
     Retrieves the current generator function option for the specified instrument
     channel.
     '''
-    out_func = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeFunctionGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_func)))
+    out_func = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeFunctionGet(hdwf, channel_index, node, ctypes.byref(out_func)))
     return int(out_func.value)
 
 # DWFAPI int FDwfAnalogOutNodeFrequencyInfo(HDWF hdwf, int idxChannel, AnalogOutNode node, double *phzMin, double *phzMax);
@@ -1835,7 +2072,7 @@ def AnalogOutNodeFrequencyInfo(hdwf: int, channel_index: int, node: int) -> (flo
     '''
     out_hz_min = ctypes.c_double(0.0)
     out_hz_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeFrequencyInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_hz_min), ctypes.byref(out_hz_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeFrequencyInfo(hdwf, channel_index, node, ctypes.byref(out_hz_min), ctypes.byref(out_hz_max)))
     return float(out_hz_min.value), float(out_hz_max.value)
 
 # DWFAPI int FDwfAnalogOutNodeFrequencySet(HDWF hdwf, int idxChannel, AnalogOutNode node, double hzFrequency);
@@ -1844,7 +2081,7 @@ def AnalogOutNodeFrequencySet(hdwf: int, channel_index: int, node: int, frequenc
     Sets the frequency. With channel index -1, each enabled Analog Out channel
     frequency will be configured to use the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeFrequencySet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.c_double(frequency_in_hz)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeFrequencySet(hdwf, channel_index, node, frequency_in_hz))
 
 # DWFAPI int FDwfAnalogOutNodeFrequencyGet(HDWF hdwf, int idxChannel, AnalogOutNode node, double *phzFrequency);
 def AnalogOutNodeFrequencyGet(hdwf: int, channel_index: int, node: int) -> float:
@@ -1853,7 +2090,7 @@ def AnalogOutNodeFrequencyGet(hdwf: int, channel_index: int, node: int) -> float
     instrument.
     '''
     out_frequency_in_hz = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeFrequencyGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_frequency_in_hz)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeFrequencyGet(hdwf, channel_index, node, ctypes.byref(out_frequency_in_hz)))
     return float(out_frequency_in_hz.value)
 
 # Carrier Amplitude or Modulation Index
@@ -1866,7 +2103,7 @@ def AnalogOutNodeAmplitudeInfo(hdwf: int, channel_index: int, node: int) -> (flo
     '''
     out_number_min = ctypes.c_double(0.0)
     out_number_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeAmplitudeInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_number_min), ctypes.byref(out_number_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeAmplitudeInfo(hdwf, channel_index, node, ctypes.byref(out_number_min), ctypes.byref(out_number_max)))
     return float(out_number_min.value), float(out_number_max.value)
 
 # DWFAPI int FDwfAnalogOutNodeAmplitudeSet(HDWF hdwf, int idxChannel, AnalogOutNode node, double vAmplitude);
@@ -1876,7 +2113,7 @@ def AnalogOutNodeAmplitudeSet(hdwf: int, channel_index: int, node: int, vAmplitu
     instrument. With channel index -1, each enabled Analog Out channel amplitude
     (or modulation index) will be configured to use the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeAmplitudeSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.c_double(vAmplitude)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeAmplitudeSet(hdwf, channel_index, node, vAmplitude))
 
 # DWFAPI int FDwfAnalogOutNodeAmplitudeGet(HDWF hdwf, int idxChannel, AnalogOutNode node, double *pvAmplitude);
 def AnalogOutNodeAmplitudeGet(hdwf: int, channel_index: int, node: int) -> float:
@@ -1885,7 +2122,7 @@ def AnalogOutNodeAmplitudeGet(hdwf: int, channel_index: int, node: int) -> float
     channel-node on the instrument.
     '''
     out_vAmplitude = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeAmplitudeGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_vAmplitude)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeAmplitudeGet(hdwf, channel_index, node, ctypes.byref(out_vAmplitude)))
     return float(out_vAmplitude.value)
 
 # DWFAPI int FDwfAnalogOutNodeOffsetInfo(HDWF hdwf, int idxChannel, AnalogOutNode node, double *pMin, double *pMax);
@@ -1896,7 +2133,7 @@ def AnalogOutNodeOffsetInfo(hdwf: int, channel_index: int, node: int) -> (float,
     '''
     out_number_min = ctypes.c_double(0.0)
     out_number_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeOffsetInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_number_min), ctypes.byref(out_number_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeOffsetInfo(hdwf, channel_index, node, ctypes.byref(out_number_min), ctypes.byref(out_number_max)))
     return float(out_number_min.value), float(out_number_max.value)
 
 # DWFAPI int FDwfAnalogOutNodeOffsetSet(HDWF hdwf, int idxChannel, AnalogOutNode node, double vOffset);
@@ -1906,7 +2143,7 @@ def AnalogOutNodeOffsetSet(hdwf: int, channel_index: int, node: int, vOffset: fl
     channel index -1, each enabled Analog Out channel offset will be configured
     to use the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeOffsetSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.c_double(vOffset)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeOffsetSet(hdwf, channel_index, node, vOffset))
 
 # DWFAPI int FDwfAnalogOutNodeOffsetGet(HDWF hdwf, int idxChannel, AnalogOutNode node, double *pvOffset);
 def AnalogOutNodeOffsetGet(hdwf: int, channel_index: int, node: int) -> float:
@@ -1915,7 +2152,7 @@ def AnalogOutNodeOffsetGet(hdwf: int, channel_index: int, node: int) -> float:
     instrument.
     '''
     out_vOffset = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeOffsetGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_vOffset)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeOffsetGet(hdwf, channel_index, node, ctypes.byref(out_vOffset)))
     return float(out_vOffset.value)
 
 # DWFAPI int FDwfAnalogOutNodeSymmetryInfo(HDWF hdwf, int idxChannel, AnalogOutNode node, double *ppercentageMin, double *ppercentageMax);
@@ -1927,7 +2164,7 @@ def AnalogOutNodeSymmetryInfo(hdwf: int, channel_index: int, node: int) -> (floa
     '''
     out_percentage_min = ctypes.c_double(0.0)
     out_percentage_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeSymmetryInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_percentage_min), ctypes.byref(out_percentage_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeSymmetryInfo(hdwf, channel_index, node, ctypes.byref(out_percentage_min), ctypes.byref(out_percentage_max)))
     return float(out_percentage_min.value), float(out_percentage_max.value)
 
 # DWFAPI int FDwfAnalogOutNodeSymmetrySet(HDWF hdwf, int idxChannel, AnalogOutNode node, double percentageSymmetry);
@@ -1937,7 +2174,7 @@ def AnalogOutNodeSymmetrySet(hdwf: int, channel_index: int, node: int, percentag
     instrument. With channel index -1, each enabled Analog Out channel symmetry
     will be configured to use the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeSymmetrySet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.c_double(percentage_symmetry)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeSymmetrySet(hdwf, channel_index, node, percentage_symmetry))
 
 # DWFAPI int FDwfAnalogOutNodeSymmetryGet(HDWF hdwf, int idxChannel, AnalogOutNode node, double *ppercentageSymmetry);
 def AnalogOutNodeSymmetryGet(hdwf: int, channel_index: int, node: int) -> float:
@@ -1946,7 +2183,7 @@ def AnalogOutNodeSymmetryGet(hdwf: int, channel_index: int, node: int) -> float:
     node of the instrument.
     '''
     out_percentage_symmetry = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeSymmetryGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_percentage_symmetry)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeSymmetryGet(hdwf, channel_index, node, ctypes.byref(out_percentage_symmetry)))
     return float(out_percentage_symmetry.value)
 
 # DWFAPI int FDwfAnalogOutNodePhaseInfo(HDWF hdwf, int idxChannel, AnalogOutNode node, double *pdegreeMin, double *pdegreeMax);
@@ -1957,7 +2194,7 @@ def AnalogOutNodePhaseInfo(hdwf: int, channel_index: int, node: int) -> (float,
     '''
     out_degree_min = ctypes.c_double(0.0)
     out_degree_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodePhaseInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_degree_min), ctypes.byref(out_degree_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodePhaseInfo(hdwf, channel_index, node, ctypes.byref(out_degree_min), ctypes.byref(out_degree_max)))
     return float(out_degree_min.value), float(out_degree_max.value)
 
 # DWFAPI int FDwfAnalogOutNodePhaseSet(HDWF hdwf, int idxChannel, AnalogOutNode node, double degreePhase);
@@ -1967,7 +2204,7 @@ def AnalogOutNodePhaseSet(hdwf: int, channel_index: int, node: int, degree_phase
     channel index -1, each enabled Analog Out channel phase will be configured
     to use the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutNodePhaseSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.c_double(degree_phase)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodePhaseSet(hdwf, channel_index, node, degree_phase))
 
 # DWFAPI int FDwfAnalogOutNodePhaseGet(HDWF hdwf, int idxChannel, AnalogOutNode node, double *pdegreePhase);
 def AnalogOutNodePhaseGet(hdwf: int, channel_index: int, node: int) -> float:
@@ -1975,7 +2212,7 @@ def AnalogOutNodePhaseGet(hdwf: int, channel_index: int, node: int) -> float:
     Gets the current phase for the specified channel-node on the instrument.
     '''
     out_degree_phase = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodePhaseGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_degree_phase)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodePhaseGet(hdwf, channel_index, node, ctypes.byref(out_degree_phase)))
     return float(out_degree_phase.value)
 
 # DWFAPI int FDwfAnalogOutNodeDataInfo(HDWF hdwf, int idxChannel, AnalogOutNode node, int *pnSamplesMin, int *pnSamplesMax);
@@ -1986,30 +2223,32 @@ def AnalogOutNodeDataInfo(hdwf: int, channel_index: int, node: int) -> (int, int
     '''
     out_samples_min = ctypes.c_int(0)
     out_samples_max = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeDataInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_samples_min), ctypes.byref(out_samples_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeDataInfo(hdwf, channel_index, node, ctypes.byref(out_samples_min), ctypes.byref(out_samples_max)))
     return int(out_samples_min.value), int(out_samples_max.value)
 
 # DWFAPI int FDwfAnalogOutNodeDataSet(HDWF hdwf, int idxChannel, AnalogOutNode node, double *rgdData, int cdData);
-def AnalogOutNodeDataSet(hdwf: int, channel_index: int, node: int, cd_data: int) -> float:
+def AnalogOutNodeDataSet(hdwf: int, channel_index: int, node: int, data, cd_data: int = None) -> None:
     '''
     Set the custom data or to prefill the buffer with play samples. The samples
-    are double precision floating point values (rgdData) normalized to ±1.
+    are double precision floating point values (rgdData) normalized to ±1. data
+    is a float64 NumPy array, array.array('d') or any buffer or sequence of
+    samples; the whole of it (or its first cd_data samples) is sent in a single
+    call.
     '''
-    out_rgdData = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodeDataSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.c_int(cd_data), ctypes.byref(out_rgdData)))
-    return float(out_rgdData.value)
+    rgdData, cd_data = _InputAsArray(ctypes.c_double, 'd', data, cd_data)
+    _ThrowIfError(_dwf.FDwfAnalogOutNodeDataSet(hdwf, channel_index, node, rgdData, cd_data))
 
 # needed for EExplorer, not used for ADiscovery
 # DWFAPI int FDwfAnalogOutCustomAMFMEnableSet(HDWF hdwf, int idxChannel, int fEnable);
 # Warning no docs found for FDwfAnalogOutCustomAMFMEnableSet
 def AnalogOutCustomAMFMEnableSet(hdwf: int, channel_index: int, enable: int) -> None:
-    _ThrowIfError(_dwf.FDwfAnalogOutCustomAMFMEnableSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(enable)))
+    _ThrowIfError(_dwf.FDwfAnalogOutCustomAMFMEnableSet(hdwf, channel_index, enable))
 
 # DWFAPI int FDwfAnalogOutCustomAMFMEnableGet(HDWF hdwf, int idxChannel, int *pfEnable);
 # Warning no docs found for FDwfAnalogOutCustomAMFMEnableGet
 def AnalogOutCustomAMFMEnableGet(hdwf: int, channel_index: int) -> int:
     out_enable = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutCustomAMFMEnableGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_enable)))
+    _ThrowIfError(_dwf.FDwfAnalogOutCustomAMFMEnableGet(hdwf, channel_index, ctypes.byref(out_enable)))
     return int(out_enable.value)
 
 #------------------------------------------------------------------------------
@@ -2023,7 +2262,7 @@ def AnalogOutReset(hdwf: int, channel_index: int) -> None:
     AnalogOut instrument parameters to default values for the specified channel.
     To reset instrument parameters across all channels, set idxChannel to -1.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutReset(ctypes.c_int(hdwf), ctypes.c_int(channel_index)))
+    _ThrowIfError(_dwf.FDwfAnalogOutReset(hdwf, channel_index))
 
 # DWFAPI int FDwfAnalogOutConfigure(HDWF hdwf, int idxChannel, int fStart);
 def AnalogOutConfigure(hdwf: int, channel_index: int, fStart: int) -> None:
@@ -2032,15 +2271,15 @@ def AnalogOutConfigure(hdwf: int, channel_index: int, fStart: int) -> None:
     dynamically without changing the state of the instrument. With channel index
     -1, each enabled Analog Out channel will be configured.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutConfigure(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(fStart)))
+    _ThrowIfError(_dwf.FDwfAnalogOutConfigure(hdwf, channel_index, fStart))
 
 # DWFAPI int FDwfAnalogOutStatus(HDWF hdwf, int idxChannel, DwfState *psts);
 def AnalogOutStatus(hdwf: int, channel_index: int) -> int:
     '''
     Checks the state of the instrument.
     '''
-    out_instrument_state = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutStatus(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_instrument_state)))
+    out_instrument_state = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfAnalogOutStatus(hdwf, channel_index, ctypes.byref(out_instrument_state)))
     return int(out_instrument_state.value)
 
 # DWFAPI int FDwfAnalogOutNodePlayStatus(HDWF hdwf, int idxChannel, AnalogOutNode node, int *cdDataFree, int *cdDataLost, int *cdDataCorrupted);
@@ -2057,22 +2296,22 @@ def AnalogOutNodePlayStatus(hdwf: int, channel_index: int, node: int) -> (int, i
     out_cdDataFree = ctypes.c_int(0)
     out_cdDataLost = ctypes.c_int(0)
     out_cdDataCorrupted = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodePlayStatus(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.byref(out_cdDataFree), ctypes.byref(out_cdDataLost), ctypes.byref(out_cdDataCorrupted)))
+    _ThrowIfError(_dwf.FDwfAnalogOutNodePlayStatus(hdwf, channel_index, node, ctypes.byref(out_cdDataFree), ctypes.byref(out_cdDataLost), ctypes.byref(out_cdDataCorrupted)))
     return int(out_cdDataFree.value), int(out_cdDataLost.value), int(out_cdDataCorrupted.value)
 
 # DWFAPI int FDwfAnalogOutNodePlayData(HDWF hdwf, int idxChannel, AnalogOutNode node, double *rgdData, int cdData);
-def AnalogOutNodePlayData(hdwf: int, channel_index: int, node: int, cd_data: int) -> float:
+def AnalogOutNodePlayData(hdwf: int, channel_index: int, node: int, data, cd_data: int = None) -> None:
     '''
     Sends new data samples for play mode. Before starting the Analog Out
     instrument, prefill the device buffer with the first set of samples using
     the AnalogOutNodeDataSet function. In the loop of sending the following
     samples, first call AnalogOutStatus to read the information from the device,
     then AnalogOutPlayStatus to find out how many new samples can be sent, then
-    send the samples with AnalogOutPlayData.
+    send the samples with AnalogOutPlayData. data is a buffer or sequence of
+    samples normalized to ±1, sent in a single call.
     '''
-    out_rgdData = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutNodePlayData(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node), ctypes.c_int(cd_data), ctypes.byref(out_rgdData)))
-    return float(out_rgdData.value)
+    rgdData, cd_data = _InputAsArray(ctypes.c_double, 'd', data, cd_data)
+    _ThrowIfError(_dwf.FDwfAnalogOutNodePlayData(hdwf, channel_index, node, rgdData, cd_data))
 
 ###############################################################################
 # ANALOG IO INSTRUMENT FUNCTIONS
@@ -2088,14 +2327,14 @@ def AnalogIOReset(hdwf: int) -> None:
     Resets and configures (by default, having auto configure enabled) all
     AnalogIO instrument parameters to default values.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogIOReset(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfAnalogIOReset(hdwf))
 
 # DWFAPI int FDwfAnalogIOConfigure(HDWF hdwf);
 def AnalogIOConfigure(hdwf: int) -> None:
     '''
     Configures the instrument.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogIOConfigure(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfAnalogIOConfigure(hdwf))
 
 # DWFAPI int FDwfAnalogIOStatus(HDWF hdwf);
 def AnalogIOStatus(hdwf: int) -> None:
@@ -2104,7 +2343,7 @@ def AnalogIOStatus(hdwf: int) -> None:
     status functions will return the information that was read from the device
     when the function above was called.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogIOStatus(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfAnalogIOStatus(hdwf))
 
 #------------------------------------------------------------------------------
 # Configure:
@@ -2121,7 +2360,7 @@ def AnalogIOEnableInfo(hdwf: int) -> (int, int):
     '''
     out_fSet = ctypes.c_int(0)
     out_fStatus = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogIOEnableInfo(ctypes.c_int(hdwf), ctypes.byref(out_fSet), ctypes.byref(out_fStatus)))
+    _ThrowIfError(_dwf.FDwfAnalogIOEnableInfo(hdwf, ctypes.byref(out_fSet), ctypes.byref(out_fStatus)))
     return int(out_fSet.value), int(out_fStatus.value)
 
 # DWFAPI int FDwfAnalogIOEnableSet(HDWF hdwf, int fMasterEnable);
@@ -2129,7 +2368,7 @@ def AnalogIOEnableSet(hdwf: int, master_enable: int) -> None:
     '''
     Sets the master enable switch.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogIOEnableSet(ctypes.c_int(hdwf), ctypes.c_int(master_enable)))
+    _ThrowIfError(_dwf.FDwfAnalogIOEnableSet(hdwf, master_enable))
 
 # DWFAPI int FDwfAnalogIOEnableGet(HDWF hdwf, int *pfMasterEnable);
 def AnalogIOEnableGet(hdwf: int) -> int:
@@ -2138,7 +2377,7 @@ def AnalogIOEnableGet(hdwf: int) -> int:
     from the device.
     '''
     out_master_enable = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogIOEnableGet(ctypes.c_int(hdwf), ctypes.byref(out_master_enable)))
+    _ThrowIfError(_dwf.FDwfAnalogIOEnableGet(hdwf, ctypes.byref(out_master_enable)))
     return int(out_master_enable.value)
 
 # DWFAPI int FDwfAnalogIOEnableStatus(HDWF hdwf, int *pfMasterEnable);
@@ -2148,7 +2387,7 @@ def AnalogIOEnableStatus(hdwf: int) -> int:
     switch on the board or an overcurrent protection circuit state.
     '''
     out_master_enable = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogIOEnableStatus(ctypes.c_int(hdwf), ctypes.byref(out_master_enable)))
+    _ThrowIfError(_dwf.FDwfAnalogIOEnableStatus(hdwf, ctypes.byref(out_master_enable)))
     return int(out_master_enable.value)
 
 # DWFAPI int FDwfAnalogIOChannelCount(HDWF hdwf, int *pnChannel);
@@ -2157,7 +2396,7 @@ def AnalogIOChannelCount(hdwf: int) -> int:
     Returns the number of AnalogIO channels available on the device.
     '''
     out_nChannel = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogIOChannelCount(ctypes.c_int(hdwf), ctypes.byref(out_nChannel)))
+    _ThrowIfError(_dwf.FDwfAnalogIOChannelCount(hdwf, ctypes.byref(out_nChannel)))
     return int(out_nChannel.value)
 
 # DWFAPI int FDwfAnalogIOChannelName(HDWF hdwf, int idxChannel, char szName[32], char szLabel[16]);
@@ -2167,7 +2406,7 @@ def AnalogIOChannelName(hdwf: int, channel_index: int) -> (str, str):
     '''
     out_name_str = ctypes.create_string_buffer(32)
     out_label_str = ctypes.create_string_buffer(16)
-    _ThrowIfError(_dwf.FDwfAnalogIOChannelName(ctypes.c_int(hdwf), ctypes.c_int(channel_index), types.byref(out_name_str), types.byref(out_label_str)))
+    _ThrowIfError(_dwf.FDwfAnalogIOChannelName(hdwf, channel_index, out_name_str, out_label_str))
     return str(out_name_str.value.decode('utf-8')), str(out_label_str.value.decode('utf-8'))
 
 # DWFAPI int FDwfAnalogIOChannelInfo(HDWF hdwf, int idxChannel, int *pnNodes);
@@ -2176,7 +2415,7 @@ def AnalogIOChannelInfo(hdwf: int, channel_index: int) -> int:
     Returns the number of nodes associated with the specified channel.
     '''
     out_nNodes = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogIOChannelInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_nNodes)))
+    _ThrowIfError(_dwf.FDwfAnalogIOChannelInfo(hdwf, channel_index, ctypes.byref(out_nNodes)))
     return int(out_nNodes.value)
 
 # DWFAPI int FDwfAnalogIOChannelNodeName(HDWF hdwf, int idxChannel, int idxNode, char szNodeName[32], char szNodeUnits[16]);
@@ -2186,7 +2425,7 @@ def AnalogIOChannelNodeName(hdwf: int, channel_index: int, node_index: int) -> (
     '''
     out_node_name = ctypes.create_string_buffer(32)
     out_node_units_str = ctypes.create_string_buffer(16)
-    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeName(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node_index), types.byref(out_node_name), types.byref(out_node_units_str)))
+    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeName(hdwf, channel_index, node_index, out_node_name, out_node_units_str))
     return str(out_node_name.value.decode('utf-8')), str(out_node_units_str.value.decode('utf-8'))
 
 # DWFAPI int FDwfAnalogIOChannelNodeInfo(HDWF hdwf, int idxChannel, int idxNode, ANALOGIO *panalogio);
@@ -2197,8 +2436,8 @@ def AnalogIOChannelNodeInfo(hdwf: int, channel_index: int, node_index: int) -> i
     bits are defined using the ANALOGIO constants in dwf.h. The acquisition mode
     selects one of the following modes, ANALOGIO:
     '''
-    out_analogio = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node_index), ctypes.byref(out_analogio)))
+    out_analogio = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeInfo(hdwf, channel_index, node_index, ctypes.byref(out_analogio)))
     return int(out_analogio.value)
 
 # DWFAPI int FDwfAnalogIOChannelNodeSetInfo(HDWF hdwf, int idxChannel, int idxNode, double *pmin, double *pmax, int *pnSteps);
@@ -2214,7 +2453,7 @@ def AnalogIOChannelNodeSetInfo(hdwf: int, channel_index: int, node_index: int) -
     out_min = ctypes.c_double(0.0)
     out_max = ctypes.c_double(0.0)
     out_num_steps = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeSetInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node_index), ctypes.byref(out_min), ctypes.byref(out_max), ctypes.byref(out_num_steps)))
+    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeSetInfo(hdwf, channel_index, node_index, ctypes.byref(out_min), ctypes.byref(out_max), ctypes.byref(out_num_steps)))
     return float(out_min.value), float(out_max.value), int(out_num_steps.value)
 
 # DWFAPI int FDwfAnalogIOChannelNodeSet(HDWF hdwf, int idxChannel, int idxNode, double value);
@@ -2222,7 +2461,7 @@ def AnalogIOChannelNodeSet(hdwf: int, channel_index: int, node_index: int, value
     '''
     Sets the node value for the specified node on the specified channel.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node_index), ctypes.c_double(value)))
+    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeSet(hdwf, channel_index, node_index, value))
 
 # DWFAPI int FDwfAnalogIOChannelNodeGet(HDWF hdwf, int idxChannel, int idxNode, double *pvalue);
 def AnalogIOChannelNodeGet(hdwf: int, channel_index: int, node_index: int) -> float:
@@ -2230,7 +2469,7 @@ def AnalogIOChannelNodeGet(hdwf: int, channel_index: int, node_index: int) -> fl
     Returns the currently set value of the node on the specified channel.
     '''
     out_value = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node_index), ctypes.byref(out_value)))
+    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeGet(hdwf, channel_index, node_index, ctypes.byref(out_value)))
     return float(out_value.value)
 
 # DWFAPI int FDwfAnalogIOChannelNodeStatusInfo(HDWF hdwf, int idxChannel, int idxNode, double *pmin, double *pmax, int *pnSteps);
@@ -2242,7 +2481,7 @@ def AnalogIOChannelNodeStatusInfo(hdwf: int, channel_index: int, node_index: int
     out_min = ctypes.c_double(0.0)
     out_max = ctypes.c_double(0.0)
     out_num_steps = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeStatusInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node_index), ctypes.byref(out_min), ctypes.byref(out_max), ctypes.byref(out_num_steps)))
+    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeStatusInfo(hdwf, channel_index, node_index, ctypes.byref(out_min), ctypes.byref(out_max), ctypes.byref(out_num_steps)))
     return float(out_min.value), float(out_max.value), int(out_num_steps.value)
 
 # DWFAPI int FDwfAnalogIOChannelNodeStatus(HDWF hdwf, int idxChannel, int idxNode, double *pvalue);
@@ -2251,7 +2490,7 @@ def AnalogIOChannelNodeStatus(hdwf: int, channel_index: int, node_index: int) ->
     Returns the value reading of the node.
     '''
     out_value = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeStatus(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(node_index), ctypes.byref(out_value)))
+    _ThrowIfError(_dwf.FDwfAnalogIOChannelNodeStatus(hdwf, channel_index, node_index, ctypes.byref(out_value)))
     return float(out_value.value)
 
 ###############################################################################
@@ -2270,7 +2509,7 @@ def DigitalIOReset(hdwf: int) -> None:
     enables to zero (tri-state), output value to zero, and configures the
     DigitalIO instrument
     '''
-    _ThrowIfError(_dwf.FDwfDigitalIOReset(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfDigitalIOReset(hdwf))
 
 # DWFAPI int FDwfDigitalIOConfigure(HDWF hdwf);
 def DigitalIOConfigure(hdwf: int) -> None:
@@ -2278,7 +2517,7 @@ def DigitalIOConfigure(hdwf: int) -> None:
     Configures the DigitalIO instrument. This doesn’t have to be used if
     AutoConfiguration is enabled.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalIOConfigure(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfDigitalIOConfigure(hdwf))
 
 # DWFAPI int FDwfDigitalIOStatus(HDWF hdwf);
 def DigitalIOStatus(hdwf: int) -> None:
@@ -2286,7 +2525,7 @@ def DigitalIOStatus(hdwf: int) -> None:
     Reads the status and input values, of the device DigitalIO to the PC. The
     status and values are accessed from the FDwfDigitalIOInputStatus function.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalIOStatus(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfDigitalIOStatus(hdwf))
 
 #------------------------------------------------------------------------------
 # Configure:
@@ -2298,8 +2537,8 @@ def DigitalIOOutputEnableInfo(hdwf: int) -> int:
     Returns the output enable mask (bit set) that can be used on this device.
     These are the pins that can be used as outputs on the device.
     '''
-    out_fsOutputEnableMask = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalIOOutputEnableInfo(ctypes.c_int(hdwf), ctypes.byref(out_fsOutputEnableMask)))
+    out_fsOutputEnableMask = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalIOOutputEnableInfo(hdwf, ctypes.byref(out_fsOutputEnableMask)))
     return int(out_fsOutputEnableMask.value)
 
 # DWFAPI int FDwfDigitalIOOutputEnableSet(HDWF hdwf, unsigned int fsOutputEnable);
@@ -2308,15 +2547,15 @@ def DigitalIOOutputEnableSet(hdwf: int, fsOutputEnable: int) -> None:
     Enables specific pins for output. This is done by setting bits in the
     fsOutEnable bit field (1 for enabled, 0 for disabled).
     '''
-    _ThrowIfError(_dwf.FDwfDigitalIOOutputEnableSet(ctypes.c_int(hdwf), ctypes.c_uint(fsOutputEnable)))
+    _ThrowIfError(_dwf.FDwfDigitalIOOutputEnableSet(hdwf, fsOutputEnable))
 
 # DWFAPI int FDwfDigitalIOOutputEnableGet(HDWF hdwf, unsigned int *pfsOutputEnable);
 def DigitalIOOutputEnableGet(hdwf: int) -> int:
     '''
     Returns a bit field that specifies which output pins have been enabled.
     '''
-    out_fsOutputEnable = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalIOOutputEnableGet(ctypes.c_int(hdwf), ctypes.byref(out_fsOutputEnable)))
+    out_fsOutputEnable = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalIOOutputEnableGet(hdwf, ctypes.byref(out_fsOutputEnable)))
     return int(out_fsOutputEnable.value)
 
 # DWFAPI int FDwfDigitalIOOutputInfo(HDWF hdwf, unsigned int *pfsOutputMask);
@@ -2325,8 +2564,8 @@ def DigitalIOOutputInfo(hdwf: int) -> int:
     Returns the settable output value mask (bit set) that can be used on this
     device.
     '''
-    out_fsOutputMask = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalIOOutputInfo(ctypes.c_int(hdwf), ctypes.byref(out_fsOutputMask)))
+    out_fsOutputMask = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalIOOutputInfo(hdwf, ctypes.byref(out_fsOutputMask)))
     return int(out_fsOutputMask.value)
 
 # DWFAPI int FDwfDigitalIOOutputSet(HDWF hdwf, unsigned int fsOutput);
@@ -2334,15 +2573,15 @@ def DigitalIOOutputSet(hdwf: int, fsOutput: int) -> None:
     '''
     Sets the output logic value on all output pins.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalIOOutputSet(ctypes.c_int(hdwf), ctypes.c_uint(fsOutput)))
+    _ThrowIfError(_dwf.FDwfDigitalIOOutputSet(hdwf, fsOutput))
 
 # DWFAPI int FDwfDigitalIOOutputGet(HDWF hdwf, unsigned int *pfsOutput);
 def DigitalIOOutputGet(hdwf: int) -> int:
     '''
     Returns the currently set output values across all output pins.
     '''
-    out_fsOutput = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalIOOutputGet(ctypes.c_int(hdwf), ctypes.byref(out_fsOutput)))
+    out_fsOutput = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalIOOutputGet(hdwf, ctypes.byref(out_fsOutput)))
     return int(out_fsOutput.value)
 
 # DWFAPI int FDwfDigitalIOInputInfo(HDWF hdwf, unsigned int *pfsInputMask);
@@ -2351,8 +2590,8 @@ def DigitalIOInputInfo(hdwf: int) -> int:
     returns the readable input value mask (bit set) that can be used on the
     device.
     '''
-    out_fsInputMask = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalIOInputInfo(ctypes.c_int(hdwf), ctypes.byref(out_fsInputMask)))
+    out_fsInputMask = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalIOInputInfo(hdwf, ctypes.byref(out_fsInputMask)))
     return int(out_fsInputMask.value)
 
 # DWFAPI int FDwfDigitalIOInputStatus(HDWF hdwf, unsigned int *pfsInput);
@@ -2362,60 +2601,60 @@ def DigitalIOInputStatus(hdwf: int) -> int:
     call the FDwfDigitalIOStatus function to read the Digital I/O states from
     the device.
     '''
-    out_fsInput = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalIOInputStatus(ctypes.c_int(hdwf), ctypes.byref(out_fsInput)))
+    out_fsInput = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalIOInputStatus(hdwf, ctypes.byref(out_fsInput)))
     return int(out_fsInput.value)
 
 # DWFAPI int FDwfDigitalIOOutputEnableInfo64(HDWF hdwf, unsigned long long *pfsOutputEnableMask);
 # Warning no docs found for FDwfDigitalIOOutputEnableInfo64
 def DigitalIOOutputEnableInfo64(hdwf: int) -> int:
-    out_fsOutputEnableMask = c_ulonglong(0)
-    _ThrowIfError(_dwf.FDwfDigitalIOOutputEnableInfo64(ctypes.c_int(hdwf), ctypes.byref(out_fsOutputEnableMask)))
+    out_fsOutputEnableMask = ctypes.c_ulonglong(0)
+    _ThrowIfError(_dwf.FDwfDigitalIOOutputEnableInfo64(hdwf, ctypes.byref(out_fsOutputEnableMask)))
     return int(out_fsOutputEnableMask.value)
 
 # DWFAPI int FDwfDigitalIOOutputEnableSet64(HDWF hdwf, unsigned long long fsOutputEnable);
 # Warning no docs found for FDwfDigitalIOOutputEnableSet64
 def DigitalIOOutputEnableSet64(hdwf: int, fsOutputEnable: int) -> None:
-    _ThrowIfError(_dwf.FDwfDigitalIOOutputEnableSet64(ctypes.c_int(hdwf), ctypes.c_ulonglong(fsOutputEnable)))
+    _ThrowIfError(_dwf.FDwfDigitalIOOutputEnableSet64(hdwf, fsOutputEnable))
 
 # DWFAPI int FDwfDigitalIOOutputEnableGet64(HDWF hdwf, unsigned long long *pfsOutputEnable);
 # Warning no docs found for FDwfDigitalIOOutputEnableGet64
 def DigitalIOOutputEnableGet64(hdwf: int) -> int:
-    out_fsOutputEnable = c_ulonglong(0)
-    _ThrowIfError(_dwf.FDwfDigitalIOOutputEnableGet64(ctypes.c_int(hdwf), ctypes.byref(out_fsOutputEnable)))
+    out_fsOutputEnable = ctypes.c_ulonglong(0)
+    _ThrowIfError(_dwf.FDwfDigitalIOOutputEnableGet64(hdwf, ctypes.byref(out_fsOutputEnable)))
     return int(out_fsOutputEnable.value)
 
 # DWFAPI int FDwfDigitalIOOutputInfo64(HDWF hdwf, unsigned long long *pfsOutputMask);
 # Warning no docs found for FDwfDigitalIOOutputInfo64
 def DigitalIOOutputInfo64(hdwf: int) -> int:
-    out_fsOutputMask = c_ulonglong(0)
-    _ThrowIfError(_dwf.FDwfDigitalIOOutputInfo64(ctypes.c_int(hdwf), ctypes.byref(out_fsOutputMask)))
+    out_fsOutputMask = ctypes.c_ulonglong(0)
+    _ThrowIfError(_dwf.FDwfDigitalIOOutputInfo64(hdwf, ctypes.byref(out_fsOutputMask)))
     return int(out_fsOutputMask.value)
 
 # DWFAPI int FDwfDigitalIOOutputSet64(HDWF hdwf, unsigned long long fsOutput);
 # Warning no docs found for FDwfDigitalIOOutputSet64
 def DigitalIOOutputSet64(hdwf: int, fsOutput: int) -> None:
-    _ThrowIfError(_dwf.FDwfDigitalIOOutputSet64(ctypes.c_int(hdwf), ctypes.c_ulonglong(fsOutput)))
+    _ThrowIfError(_dwf.FDwfDigitalIOOutputSet64(hdwf, fsOutput))
 
 # DWFAPI int FDwfDigitalIOOutputGet64(HDWF hdwf, unsigned long long *pfsOutput);
 # Warning no docs found for FDwfDigitalIOOutputGet64
 def DigitalIOOutputGet64(hdwf: int) -> int:
-    out_fsOutput = c_ulonglong(0)
-    _ThrowIfError(_dwf.FDwfDigitalIOOutputGet64(ctypes.c_int(hdwf), ctypes.byref(out_fsOutput)))
+    out_fsOutput = ctypes.c_ulonglong(0)
+    _ThrowIfError(_dwf.FDwfDigitalIOOutputGet64(hdwf, ctypes.byref(out_fsOutput)))
     return int(out_fsOutput.value)
 
 # DWFAPI int FDwfDigitalIOInputInfo64(HDWF hdwf, unsigned long long *pfsInputMask);
 # Warning no docs found for FDwfDigitalIOInputInfo64
 def DigitalIOInputInfo64(hdwf: int) -> int:
-    out_fsInputMask = c_ulonglong(0)
-    _ThrowIfError(_dwf.FDwfDigitalIOInputInfo64(ctypes.c_int(hdwf), ctypes.byref(out_fsInputMask)))
+    out_fsInputMask = ctypes.c_ulonglong(0)
+    _ThrowIfError(_dwf.FDwfDigitalIOInputInfo64(hdwf, ctypes.byref(out_fsInputMask)))
     return int(out_fsInputMask.value)
 
 # DWFAPI int FDwfDigitalIOInputStatus64(HDWF hdwf, unsigned long long *pfsInput);
 # Warning no docs found for FDwfDigitalIOInputStatus64
 def DigitalIOInputStatus64(hdwf: int) -> int:
-    out_fsInput = c_ulonglong(0)
-    _ThrowIfError(_dwf.FDwfDigitalIOInputStatus64(ctypes.c_int(hdwf), ctypes.byref(out_fsInput)))
+    out_fsInput = ctypes.c_ulonglong(0)
+    _ThrowIfError(_dwf.FDwfDigitalIOInputStatus64(hdwf, ctypes.byref(out_fsInput)))
     return int(out_fsInput.value)
 
 ###############################################################################
@@ -2429,7 +2668,7 @@ def DigitalInReset(hdwf: int) -> None:
     Resets and configures (by default, having auto configure enabled) all
     DigitalIn instrument parameters to default values.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInReset(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfDigitalInReset(hdwf))
 
 # DWFAPI int FDwfDigitalInConfigure(HDWF hdwf, int fReconfigure, int fStart);
 def DigitalInConfigure(hdwf: int, reconfigure: int, fStart: int) -> None:
@@ -2437,7 +2676,7 @@ def DigitalInConfigure(hdwf: int, reconfigure: int, fStart: int) -> None:
     Configures the instrument and start or stop the acquisition. To reset the
     Auto trigger timeout, set fReconfigure to TRUE.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInConfigure(ctypes.c_int(hdwf), ctypes.c_int(reconfigure), ctypes.c_int(fStart)))
+    _ThrowIfError(_dwf.FDwfDigitalInConfigure(hdwf, reconfigure, fStart))
 
 # DWFAPI int FDwfDigitalInStatus(HDWF hdwf, int fReadData, DwfState *psts);
 def DigitalInStatus(hdwf: int, fReadData: int) -> int:
@@ -2446,8 +2685,8 @@ def DigitalInStatus(hdwf: int, fReadData: int) -> int:
     fReadData to TRUE. For single acquisition mode, the data will be read only
     when the acquisition is finished.
     '''
-    out_instrument_state = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInStatus(ctypes.c_int(hdwf), ctypes.c_int(fReadData), ctypes.byref(out_instrument_state)))
+    out_instrument_state = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfDigitalInStatus(hdwf, fReadData, ctypes.byref(out_instrument_state)))
     return int(out_instrument_state.value)
 
 # DWFAPI int FDwfDigitalInStatusSamplesLeft(HDWF hdwf, int *pcSamplesLeft);
@@ -2456,7 +2695,7 @@ def DigitalInStatusSamplesLeft(hdwf: int) -> int:
     Retrieves the number of samples left in the acquisition.
     '''
     out_cSamplesLeft = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInStatusSamplesLeft(ctypes.c_int(hdwf), ctypes.byref(out_cSamplesLeft)))
+    _ThrowIfError(_dwf.FDwfDigitalInStatusSamplesLeft(hdwf, ctypes.byref(out_cSamplesLeft)))
     return int(out_cSamplesLeft.value)
 
 # DWFAPI int FDwfDigitalInStatusSamplesValid(HDWF hdwf, int *pcSamplesValid);
@@ -2465,7 +2704,7 @@ def DigitalInStatusSamplesValid(hdwf: int) -> int:
     Retrieves the number of valid/acquired data samples.
     '''
     out_samples_valid = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInStatusSamplesValid(ctypes.c_int(hdwf), ctypes.byref(out_samples_valid)))
+    _ThrowIfError(_dwf.FDwfDigitalInStatusSamplesValid(hdwf, ctypes.byref(out_samples_valid)))
     return int(out_samples_valid.value)
 
 # DWFAPI int FDwfDigitalInStatusIndexWrite(HDWF hdwf, int *pidxWrite);
@@ -2475,7 +2714,7 @@ def DigitalInStatusIndexWrite(hdwf: int) -> int:
     mode to display the scan bar.
     '''
     out_write_index = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInStatusIndexWrite(ctypes.c_int(hdwf), ctypes.byref(out_write_index)))
+    _ThrowIfError(_dwf.FDwfDigitalInStatusIndexWrite(hdwf, ctypes.byref(out_write_index)))
     return int(out_write_index.value)
 
 # DWFAPI int FDwfDigitalInStatusAutoTriggered(HDWF hdwf, int *pfAuto);
@@ -2484,37 +2723,72 @@ def DigitalInStatusAutoTriggered(hdwf: int) -> int:
     Verifies if the acquisition is auto triggered.
     '''
     out_auto_triggered = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInStatusAutoTriggered(ctypes.c_int(hdwf), ctypes.byref(out_auto_triggered)))
+    _ThrowIfError(_dwf.FDwfDigitalInStatusAutoTriggered(hdwf, ctypes.byref(out_auto_triggered)))
     return int(out_auto_triggered.value)
 
+# Sample typecodes of the DigitalIn sample formats (FDwfDigitalInSampleFormatSet)
+DIGITAL_IN_SAMPLE_TYPECODES = { 8: 'B', 16: 'H', 32: 'I' }
+
+def _DigitalInSampleTypecode(number_of_bits: int) -> str:
+    try:
+        return DIGITAL_IN_SAMPLE_TYPECODES[number_of_bits]
+    except KeyError:
+        raise ValueError("unsupported DigitalIn sample format: %d bits" % number_of_bits)
+
 # DWFAPI int FDwfDigitalInStatusData(HDWF hdwf, void *rgData, int countOfDataBytes);
-def DigitalInStatusData(hdwf: int, countOfDataBytes: int) -> int:
+def DigitalInStatusData(hdwf: int, countOfDataBytes: int, number_of_bits: int = 8):
     '''
     Retrieves the acquired data samples from the instrument. It copies the data
-    samples to the provided buffer. The sample format is specified by
-    FDwfDigitalInSampleFormatSet function.
+    samples to a newly allocated buffer whose item type matches number_of_bits,
+    the sample format specified by FDwfDigitalInSampleFormatSet.
     '''
-    out_rgData = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInStatusData(ctypes.c_int(hdwf), ctypes.c_int(countOfDataBytes), ctypes.byref(out_rgData)))
-    return int(out_rgData.value)
+    rgData = AllocateSamples(_DigitalInSampleTypecode(number_of_bits), countOfDataBytes // (number_of_bits // 8))
+    DigitalInStatusDataInto(hdwf, rgData, countOfDataBytes)
+    return rgData
+
+def DigitalInStatusDataInto(hdwf: int, buffer, countOfDataBytes: int = None) -> int:
+    '''
+    Retrieves the acquired data samples from the instrument straight into a
+    caller supplied buffer. The item type of the buffer should match the sample
+    format specified by FDwfDigitalInSampleFormatSet. When countOfDataBytes is
+    None the whole buffer is filled. Returns the number of bytes copied.
+    '''
+    out_rgData, countOfDataBytes = _BufferAsBytes(buffer, countOfDataBytes)
+    _ThrowIfError(_dwf.FDwfDigitalInStatusData(hdwf, out_rgData, countOfDataBytes))
+    return countOfDataBytes
 
 # DWFAPI int FDwfDigitalInStatusData2(HDWF hdwf, void *rgData, int idxSample, int countOfDataBytes);
-def DigitalInStatusData2(hdwf: int, idxSample: int, countOfDataBytes: int) -> int:
+def DigitalInStatusData2(hdwf: int, idxSample: int, countOfDataBytes: int, number_of_bits: int = 8):
     '''
-    Retrieves the acquired data samples from the instrument. It copies the data
-    samples to the provided buffer. The sample format is specified by
-    FDwfDigitalInSampleFormatSet function.
+    Retrieves the acquired data samples, starting at idxSample, from the
+    instrument. It copies the data samples to a newly allocated buffer whose
+    item type matches number_of_bits.
     '''
-    out_rgData = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInStatusData2(ctypes.c_int(hdwf), ctypes.c_int(idxSample), ctypes.c_int(countOfDataBytes), ctypes.byref(out_rgData)))
-    return int(out_rgData.value)
+    rgData = AllocateSamples(_DigitalInSampleTypecode(number_of_bits), countOfDataBytes // (number_of_bits // 8))
+    DigitalInStatusData2Into(hdwf, rgData, idxSample, countOfDataBytes)
+    return rgData
+
+def DigitalInStatusData2Into(hdwf: int, buffer, idxSample: int, countOfDataBytes: int = None) -> int:
+    '''
+    Retrieves the acquired data samples, starting at idxSample, from the
+    instrument straight into a caller supplied buffer. Returns the number of
+    bytes copied.
+    '''
+    out_rgData, countOfDataBytes = _BufferAsBytes(buffer, countOfDataBytes)
+    _ThrowIfError(_dwf.FDwfDigitalInStatusData2(hdwf, out_rgData, idxSample, countOfDataBytes))
+    return countOfDataBytes
 
 # DWFAPI int FDwfDigitalInStatusNoise2(HDWF hdwf, void *rgData, int idxSample, int countOfDataBytes);
 # Warning no docs found for FDwfDigitalInStatusNoise2
-def DigitalInStatusNoise2(hdwf: int, idxSample: int, countOfDataBytes: int) -> int:
-    out_rgData = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInStatusNoise2(ctypes.c_int(hdwf), ctypes.c_int(idxSample), ctypes.c_int(countOfDataBytes), ctypes.byref(out_rgData)))
-    return int(out_rgData.value)
+def DigitalInStatusNoise2(hdwf: int, idxSample: int, countOfDataBytes: int, number_of_bits: int = 8):
+    rgData = AllocateSamples(_DigitalInSampleTypecode(number_of_bits), countOfDataBytes // (number_of_bits // 8))
+    DigitalInStatusNoise2Into(hdwf, rgData, idxSample, countOfDataBytes)
+    return rgData
+
+def DigitalInStatusNoise2Into(hdwf: int, buffer, idxSample: int, countOfDataBytes: int = None) -> int:
+    out_rgData, countOfDataBytes = _BufferAsBytes(buffer, countOfDataBytes)
+    _ThrowIfError(_dwf.FDwfDigitalInStatusNoise2(hdwf, out_rgData, idxSample, countOfDataBytes))
+    return countOfDataBytes
 
 # DWFAPI int FDwfDigitalInStatusRecord(HDWF hdwf, int *pcdDataAvailable, int *pcdDataLost, int *pcdDataCorrupt);
 def DigitalInStatusRecord(hdwf: int) -> (int, int, int):
@@ -2531,16 +2805,16 @@ def DigitalInStatusRecord(hdwf: int) -> (int, int, int):
     out_cdDataAvailable = ctypes.c_int(0)
     out_cdDataLost = ctypes.c_int(0)
     out_cdDataCorrupt = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInStatusRecord(ctypes.c_int(hdwf), ctypes.byref(out_cdDataAvailable), ctypes.byref(out_cdDataLost), ctypes.byref(out_cdDataCorrupt)))
+    _ThrowIfError(_dwf.FDwfDigitalInStatusRecord(hdwf, ctypes.byref(out_cdDataAvailable), ctypes.byref(out_cdDataLost), ctypes.byref(out_cdDataCorrupt)))
     return int(out_cdDataAvailable.value), int(out_cdDataLost.value), int(out_cdDataCorrupt.value)
 
 # DWFAPI int FDwfDigitalInStatusTime(HDWF hdwf, unsigned int *psecUtc, unsigned int *ptick, unsigned int *pticksPerSecond);
 # Warning no docs found for FDwfDigitalInStatusTime
 def DigitalInStatusTime(hdwf: int) -> (int, int, int):
-    out_secUtc = c_uint(0)
-    out_tick = c_uint(0)
-    out_ticksPerSecond = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalInStatusTime(ctypes.c_int(hdwf), ctypes.byref(out_secUtc), ctypes.byref(out_tick), ctypes.byref(out_ticksPerSecond)))
+    out_secUtc = ctypes.c_uint(0)
+    out_tick = ctypes.c_uint(0)
+    out_ticksPerSecond = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalInStatusTime(hdwf, ctypes.byref(out_secUtc), ctypes.byref(out_tick), ctypes.byref(out_ticksPerSecond)))
     return int(out_secUtc.value), int(out_tick.value), int(out_ticksPerSecond.value)
 
 #------------------------------------------------------------------------------
@@ -2553,7 +2827,7 @@ def DigitalInInternalClockInfo(hdwf: int) -> float:
     Retrieves the internal clock frequency.
     '''
     out_hzFreq = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfDigitalInInternalClockInfo(ctypes.c_int(hdwf), ctypes.byref(out_hzFreq)))
+    _ThrowIfError(_dwf.FDwfDigitalInInternalClockInfo(hdwf, ctypes.byref(out_hzFreq)))
     return float(out_hzFreq.value)
 
 # DWFAPI int FDwfDigitalInClockSourceInfo(HDWF hdwf, int *pfsDwfDigitalInClockSource); // use IsBitSet
@@ -2565,7 +2839,7 @@ def DigitalInClockSourceInfo(hdwf: int) -> int:
     DwfDigitalInClockSource constants in dwf.h:
     '''
     out_fsDwfDigitalInClockSource = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInClockSourceInfo(ctypes.c_int(hdwf), ctypes.byref(out_fsDwfDigitalInClockSource)))
+    _ThrowIfError(_dwf.FDwfDigitalInClockSourceInfo(hdwf, ctypes.byref(out_fsDwfDigitalInClockSource)))
     return int(out_fsDwfDigitalInClockSource.value)
 
 # DWFAPI int FDwfDigitalInClockSourceSet(HDWF hdwf, DwfDigitalInClockSource v);
@@ -2573,7 +2847,7 @@ def DigitalInClockSourceSet(hdwf: int, v: int) -> None:
     '''
     Sets the clock source of instrument.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInClockSourceSet(ctypes.c_int(hdwf), ctypes.c_int(v)))
+    _ThrowIfError(_dwf.FDwfDigitalInClockSourceSet(hdwf, v))
 
 # DWFAPI int FDwfDigitalInClockSourceGet(HDWF hdwf, DwfDigitalInClockSource *pv);
 def DigitalInClockSourceGet(hdwf: int) -> int:
@@ -2581,7 +2855,7 @@ def DigitalInClockSourceGet(hdwf: int) -> int:
     Gets the clock source of instrument.
     '''
     out_v = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInClockSourceGet(ctypes.c_int(hdwf), ctypes.byref(out_v)))
+    _ThrowIfError(_dwf.FDwfDigitalInClockSourceGet(hdwf, ctypes.byref(out_v)))
     return int(out_v.value)
 
 # DWFAPI int FDwfDigitalInDividerInfo(HDWF hdwf, unsigned int *pdivMax);
@@ -2590,8 +2864,8 @@ def DigitalInDividerInfo(hdwf: int) -> int:
     Returns the maximum supported clock divider value. This specifies the sample
     rate.
     '''
-    out_div_max = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalInDividerInfo(ctypes.c_int(hdwf), ctypes.byref(out_div_max)))
+    out_div_max = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalInDividerInfo(hdwf, ctypes.byref(out_div_max)))
     return int(out_div_max.value)
 
 # DWFAPI int FDwfDigitalInDividerSet(HDWF hdwf, unsigned int div);
@@ -2599,15 +2873,15 @@ def DigitalInDividerSet(hdwf: int, div: int) -> None:
     '''
     Sets the clock divider value.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInDividerSet(ctypes.c_int(hdwf), ctypes.c_uint(div)))
+    _ThrowIfError(_dwf.FDwfDigitalInDividerSet(hdwf, div))
 
 # DWFAPI int FDwfDigitalInDividerGet(HDWF hdwf, unsigned int *pdiv);
 def DigitalInDividerGet(hdwf: int) -> int:
     '''
     Gets the configured clock divider value.
     '''
-    out_div = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalInDividerGet(ctypes.c_int(hdwf), ctypes.byref(out_div)))
+    out_div = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalInDividerGet(hdwf, ctypes.byref(out_div)))
     return int(out_div.value)
 
 # DWFAPI int FDwfDigitalInBitsInfo(HDWF hdwf, int *pnBits); // Returns the number of Digital In bits
@@ -2616,7 +2890,7 @@ def DigitalInBitsInfo(hdwf: int) -> int:
     Returns the number of Digital In bits.
     '''
     out_number_of_bits = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInBitsInfo(ctypes.c_int(hdwf), ctypes.byref(out_number_of_bits)))
+    _ThrowIfError(_dwf.FDwfDigitalInBitsInfo(hdwf, ctypes.byref(out_number_of_bits)))
     return int(out_number_of_bits.value)
 
 # DWFAPI int FDwfDigitalInSampleFormatSet(HDWF hdwf, int nBits);  // valid options 8/16/32
@@ -2625,7 +2899,7 @@ def DigitalInSampleFormatSet(hdwf: int, number_of_bits: int) -> None:
     Sets the sample format, the number of bits starting from least significant
     bit. Valid options are 8, 16, and 32.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInSampleFormatSet(ctypes.c_int(hdwf), ctypes.c_int(number_of_bits)))
+    _ThrowIfError(_dwf.FDwfDigitalInSampleFormatSet(hdwf, number_of_bits))
 
 # DWFAPI int FDwfDigitalInSampleFormatGet(HDWF hdwf, int *pnBits);
 def DigitalInSampleFormatGet(hdwf: int) -> int:
@@ -2633,7 +2907,7 @@ def DigitalInSampleFormatGet(hdwf: int) -> int:
     Returns the configured sample format.
     '''
     out_number_of_bits = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInSampleFormatGet(ctypes.c_int(hdwf), ctypes.byref(out_number_of_bits)))
+    _ThrowIfError(_dwf.FDwfDigitalInSampleFormatGet(hdwf, ctypes.byref(out_number_of_bits)))
     return int(out_number_of_bits.value)
 
 # DWFAPI int FDwfDigitalInInputOrderSet(HDWF hdwf, bool fDioFirst); // for Digital Discovery
@@ -2642,7 +2916,7 @@ def DigitalInInputOrderSet(hdwf: int, fDioFirst: int) -> None:
     Configures the order of values stored in the sampling array. If fDIOFirst =
     true DIO24..39 are placed at
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInInputOrderSet(ctypes.c_int(hdwf), ctypes.c_int(fDioFirst)))
+    _ThrowIfError(_dwf.FDwfDigitalInInputOrderSet(hdwf, fDioFirst))
 
 # DWFAPI int FDwfDigitalInBufferSizeInfo(HDWF hdwf, int *pnSizeMax);
 def DigitalInBufferSizeInfo(hdwf: int) -> int:
@@ -2650,7 +2924,7 @@ def DigitalInBufferSizeInfo(hdwf: int) -> int:
     Returns the Digital In maximum buffer size.
     '''
     out_size_max = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInBufferSizeInfo(ctypes.c_int(hdwf), ctypes.byref(out_size_max)))
+    _ThrowIfError(_dwf.FDwfDigitalInBufferSizeInfo(hdwf, ctypes.byref(out_size_max)))
     return int(out_size_max.value)
 
 # DWFAPI int FDwfDigitalInBufferSizeSet(HDWF hdwf, int nSize);
@@ -2658,7 +2932,7 @@ def DigitalInBufferSizeSet(hdwf: int, nSize: int) -> None:
     '''
     Set the buffer size.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInBufferSizeSet(ctypes.c_int(hdwf), ctypes.c_int(nSize)))
+    _ThrowIfError(_dwf.FDwfDigitalInBufferSizeSet(hdwf, nSize))
 
 # DWFAPI int FDwfDigitalInBufferSizeGet(HDWF hdwf, int *pnSize);
 def DigitalInBufferSizeGet(hdwf: int) -> int:
@@ -2666,7 +2940,7 @@ def DigitalInBufferSizeGet(hdwf: int) -> int:
     Returns the configured buffer size.
     '''
     out_nSize = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInBufferSizeGet(ctypes.c_int(hdwf), ctypes.byref(out_nSize)))
+    _ThrowIfError(_dwf.FDwfDigitalInBufferSizeGet(hdwf, ctypes.byref(out_nSize)))
     return int(out_nSize.value)
 
 # DWFAPI int FDwfDigitalInSampleModeInfo(HDWF hdwf, int *pfsDwfDigitalInSampleMode); // use IsBitSet
@@ -2677,7 +2951,7 @@ def DigitalInSampleModeInfo(hdwf: int) -> int:
     bits are defined using the DwfDigitalInSampleMode constants in dwf.h:
     '''
     out_fsDwfDigitalInSampleMode = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInSampleModeInfo(ctypes.c_int(hdwf), ctypes.byref(out_fsDwfDigitalInSampleMode)))
+    _ThrowIfError(_dwf.FDwfDigitalInSampleModeInfo(hdwf, ctypes.byref(out_fsDwfDigitalInSampleMode)))
     return int(out_fsDwfDigitalInSampleMode.value)
 
 # DWFAPI int FDwfDigitalInSampleModeSet(HDWF hdwf, DwfDigitalInSampleMode v);
@@ -2685,7 +2959,7 @@ def DigitalInSampleModeSet(hdwf: int, v: int) -> None:
     '''
     Set the sample mode.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInSampleModeSet(ctypes.c_int(hdwf), ctypes.c_int(v)))
+    _ThrowIfError(_dwf.FDwfDigitalInSampleModeSet(hdwf, v))
 
 # DWFAPI int FDwfDigitalInSampleModeGet(HDWF hdwf, DwfDigitalInSampleMode *pv);
 def DigitalInSampleModeGet(hdwf: int) -> int:
@@ -2693,7 +2967,7 @@ def DigitalInSampleModeGet(hdwf: int) -> int:
     Return the configured sample mode.
     '''
     out_v = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInSampleModeGet(ctypes.c_int(hdwf), ctypes.byref(out_v)))
+    _ThrowIfError(_dwf.FDwfDigitalInSampleModeGet(hdwf, ctypes.byref(out_v)))
     return int(out_v.value)
 
 # DWFAPI int FDwfDigitalInSampleSensibleSet(HDWF hdwf, unsigned int fs);
@@ -2702,7 +2976,7 @@ def DigitalInSampleSensibleSet(hdwf: int, fs: int) -> None:
     Selects the signals to be used for data compression in record acquisition
     mode.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInSampleSensibleSet(ctypes.c_int(hdwf), ctypes.c_uint(fs)))
+    _ThrowIfError(_dwf.FDwfDigitalInSampleSensibleSet(hdwf, fs))
 
 # DWFAPI int FDwfDigitalInSampleSensibleGet(HDWF hdwf, unsigned int *pfs);
 def DigitalInSampleSensibleGet(hdwf: int) -> int:
@@ -2710,8 +2984,8 @@ def DigitalInSampleSensibleGet(hdwf: int) -> int:
     Retrieves the signals being used for data compression in record acquisition
     mode.
     '''
-    out_fs = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalInSampleSensibleGet(ctypes.c_int(hdwf), ctypes.byref(out_fs)))
+    out_fs = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalInSampleSensibleGet(hdwf, ctypes.byref(out_fs)))
     return int(out_fs.value)
 
 # DWFAPI int FDwfDigitalInAcquisitionModeInfo(HDWF hdwf, int *pfsacqmode); // use IsBitSet
@@ -2723,7 +2997,7 @@ def DigitalInAcquisitionModeInfo(hdwf: int) -> int:
     acquisition mode selects one of the following modes, ACQMODE:
     '''
     out_fsacqmode = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInAcquisitionModeInfo(ctypes.c_int(hdwf), ctypes.byref(out_fsacqmode)))
+    _ThrowIfError(_dwf.FDwfDigitalInAcquisitionModeInfo(hdwf, ctypes.byref(out_fsacqmode)))
     return int(out_fsacqmode.value)
 
 # DWFAPI int FDwfDigitalInAcquisitionModeSet(HDWF hdwf, ACQMODE acqmode);
@@ -2731,7 +3005,7 @@ def DigitalInAcquisitionModeSet(hdwf: int, acqmode: int) -> None:
     '''
     Sets the acquisition mode.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInAcquisitionModeSet(ctypes.c_int(hdwf), ctypes.c_int(acqmode)))
+    _ThrowIfError(_dwf.FDwfDigitalInAcquisitionModeSet(hdwf, acqmode))
 
 # DWFAPI int FDwfDigitalInAcquisitionModeGet(HDWF hdwf, ACQMODE *pacqmode);
 def DigitalInAcquisitionModeGet(hdwf: int) -> int:
@@ -2739,7 +3013,7 @@ def DigitalInAcquisitionModeGet(hdwf: int) -> int:
     Retrieves the acquisition mode.
     '''
     out_acqmode = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInAcquisitionModeGet(ctypes.c_int(hdwf), ctypes.byref(out_acqmode)))
+    _ThrowIfError(_dwf.FDwfDigitalInAcquisitionModeGet(hdwf, ctypes.byref(out_acqmode)))
     return int(out_acqmode.value)
 
 #------------------------------------------------------------------------------
@@ -2751,15 +3025,15 @@ def DigitalInTriggerSourceSet(hdwf: int, trigger_source: int) -> None:
     '''
     Sets the trigger source for the instrument.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerSourceSet(ctypes.c_int(hdwf), ctypes.c_int(trigger_source)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerSourceSet(hdwf, trigger_source))
 
 # DWFAPI int FDwfDigitalInTriggerSourceGet(HDWF hdwf, TRIGSRC *ptrigsrc);
 def DigitalInTriggerSourceGet(hdwf: int) -> int:
     '''
     Gets the current trigger source setting for the instrument.
     '''
-    out_trigger_source = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerSourceGet(ctypes.c_int(hdwf), ctypes.byref(out_trigger_source)))
+    out_trigger_source = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerSourceGet(hdwf, ctypes.byref(out_trigger_source)))
     return int(out_trigger_source.value)
 
 # DWFAPI int FDwfDigitalInTriggerSlopeSet(HDWF hdwf, DwfTriggerSlope slope);
@@ -2767,7 +3041,7 @@ def DigitalInTriggerSlopeSet(hdwf: int, slope: int) -> None:
     '''
     Sets the trigger slope for the instrument.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerSlopeSet(ctypes.c_int(hdwf), ctypes.c_int(slope)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerSlopeSet(hdwf, slope))
 
 # DWFAPI int FDwfDigitalInTriggerSlopeGet(HDWF hdwf, DwfTriggerSlope *pslope);
 def DigitalInTriggerSlopeGet(hdwf: int) -> int:
@@ -2775,7 +3049,7 @@ def DigitalInTriggerSlopeGet(hdwf: int) -> int:
     Gets the current trigger source setting for the instrument.
     '''
     out_slope = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerSlopeGet(ctypes.c_int(hdwf), ctypes.byref(out_slope)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerSlopeGet(hdwf, ctypes.byref(out_slope)))
     return int(out_slope.value)
 
 # DWFAPI int FDwfDigitalInTriggerPositionInfo(HDWF hdwf, unsigned int *pnSamplesAfterTriggerMax);
@@ -2784,8 +3058,8 @@ def DigitalInTriggerPositionInfo(hdwf: int) -> int:
     Returns maximum values of the trigger position in samples. This can be
     greater than the specified buffer size.
     '''
-    out_samples_after_trigger_max = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerPositionInfo(ctypes.c_int(hdwf), ctypes.byref(out_samples_after_trigger_max)))
+    out_samples_after_trigger_max = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerPositionInfo(hdwf, ctypes.byref(out_samples_after_trigger_max)))
     return int(out_samples_after_trigger_max.value)
 
 # DWFAPI int FDwfDigitalInTriggerPositionSet(HDWF hdwf, unsigned int cSamplesAfterTrigger);
@@ -2793,15 +3067,15 @@ def DigitalInTriggerPositionSet(hdwf: int, cSamplesAfterTrigger: int) -> None:
     '''
     Sets the number of samples to acquire after trigger.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerPositionSet(ctypes.c_int(hdwf), ctypes.c_uint(cSamplesAfterTrigger)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerPositionSet(hdwf, cSamplesAfterTrigger))
 
 # DWFAPI int FDwfDigitalInTriggerPositionGet(HDWF hdwf, unsigned int *pcSamplesAfterTrigger);
 def DigitalInTriggerPositionGet(hdwf: int) -> int:
     '''
     Gets the configured trigger position.
     '''
-    out_cSamplesAfterTrigger = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerPositionGet(ctypes.c_int(hdwf), ctypes.byref(out_cSamplesAfterTrigger)))
+    out_cSamplesAfterTrigger = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerPositionGet(hdwf, ctypes.byref(out_cSamplesAfterTrigger)))
     return int(out_cSamplesAfterTrigger.value)
 
 # DWFAPI int FDwfDigitalInTriggerPrefillSet(HDWF hdwf, unsigned int cSamplesBeforeTrigger);
@@ -2814,15 +3088,15 @@ def DigitalInTriggerPrefillSet(hdwf: int, cSamplesBeforeTrigger: int) -> None:
     after trigger event. With prefill more than zero the recording will stream
     until trigger occurs plus the samples specified by trigger position.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerPrefillSet(ctypes.c_int(hdwf), ctypes.c_uint(cSamplesBeforeTrigger)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerPrefillSet(hdwf, cSamplesBeforeTrigger))
 
 # DWFAPI int FDwfDigitalInTriggerPrefillGet(HDWF hdwf, unsigned int *pcSamplesBeforeTrigger);
 def DigitalInTriggerPrefillGet(hdwf: int) -> int:
     '''
     Gets the configured trigger prefill.
     '''
-    out_cSamplesBeforeTrigger = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerPrefillGet(ctypes.c_int(hdwf), ctypes.byref(out_cSamplesBeforeTrigger)))
+    out_cSamplesBeforeTrigger = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerPrefillGet(hdwf, ctypes.byref(out_cSamplesBeforeTrigger)))
     return int(out_cSamplesBeforeTrigger.value)
 
 # DWFAPI int FDwfDigitalInTriggerAutoTimeoutInfo(HDWF hdwf, double *psecMin, double *psecMax, double *pnSteps);
@@ -2834,7 +3108,7 @@ def DigitalInTriggerAutoTimeoutInfo(hdwf: int) -> (float, float, float):
     out_sec_min = ctypes.c_double(0.0)
     out_sec_max = ctypes.c_double(0.0)
     out_num_steps = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerAutoTimeoutInfo(ctypes.c_int(hdwf), ctypes.byref(out_sec_min), ctypes.byref(out_sec_max), ctypes.byref(out_num_steps)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerAutoTimeoutInfo(hdwf, ctypes.byref(out_sec_min), ctypes.byref(out_sec_max), ctypes.byref(out_num_steps)))
     return float(out_sec_min.value), float(out_sec_max.value), float(out_num_steps.value)
 
 # DWFAPI int FDwfDigitalInTriggerAutoTimeoutSet(HDWF hdwf, double secTimeout);
@@ -2842,7 +3116,7 @@ def DigitalInTriggerAutoTimeoutSet(hdwf: int, secTimeout: float) -> None:
     '''
     Configures the auto trigger timeout value in seconds.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerAutoTimeoutSet(ctypes.c_int(hdwf), ctypes.c_double(secTimeout)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerAutoTimeoutSet(hdwf, secTimeout))
 
 # DWFAPI int FDwfDigitalInTriggerAutoTimeoutGet(HDWF hdwf, double *psecTimeout);
 def DigitalInTriggerAutoTimeoutGet(hdwf: int) -> float:
@@ -2852,17 +3126,17 @@ def DigitalInTriggerAutoTimeoutGet(hdwf: int) -> float:
     value the timeout is disabled, performing “Normal” acquisitions.
     '''
     out_secTimeout = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerAutoTimeoutGet(ctypes.c_int(hdwf), ctypes.byref(out_secTimeout)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerAutoTimeoutGet(hdwf, ctypes.byref(out_secTimeout)))
     return float(out_secTimeout.value)
 
 # DWFAPI int FDwfDigitalInTriggerInfo(HDWF hdwf, unsigned int *pfsLevelLow, unsigned int *pfsLevelHigh, unsigned int *pfsEdgeRise, unsigned int *pfsEdgeFall);
 # Warning no docs found for FDwfDigitalInTriggerInfo
 def DigitalInTriggerInfo(hdwf: int) -> (int, int, int, int):
-    out_fsLevelLow = c_uint(0)
-    out_fsLevelHigh = c_uint(0)
-    out_fsEdgeRise = c_uint(0)
-    out_fsEdgeFall = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerInfo(ctypes.c_int(hdwf), ctypes.byref(out_fsLevelLow), ctypes.byref(out_fsLevelHigh), ctypes.byref(out_fsEdgeRise), ctypes.byref(out_fsEdgeFall)))
+    out_fsLevelLow = ctypes.c_uint(0)
+    out_fsLevelHigh = ctypes.c_uint(0)
+    out_fsEdgeRise = ctypes.c_uint(0)
+    out_fsEdgeFall = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerInfo(hdwf, ctypes.byref(out_fsLevelLow), ctypes.byref(out_fsLevelHigh), ctypes.byref(out_fsEdgeRise), ctypes.byref(out_fsEdgeFall)))
     return int(out_fsLevelLow.value), int(out_fsLevelHigh.value), int(out_fsEdgeRise.value), int(out_fsEdgeFall.value)
 
 # DWFAPI int FDwfDigitalInTriggerSet(HDWF hdwf, unsigned int fsLevelLow, unsigned int fsLevelHigh, unsigned int fsEdgeRise, unsigned int fsEdgeFall);
@@ -2874,18 +3148,18 @@ def DigitalInTriggerSet(hdwf: int, fsLevelLow: int, fsLevelHigh: int, fsEdgeRise
     FDwfDigitalInTriggerInfo(hdwf, 1, 2, 4, 8) will generate trigger when DIO-0
     is low and DIO-1 is high and DIO-2 is rising or DIO-3 is falling.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerSet(ctypes.c_int(hdwf), ctypes.c_uint(fsLevelLow), ctypes.c_uint(fsLevelHigh), ctypes.c_uint(fsEdgeRise), ctypes.c_uint(fsEdgeFall)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerSet(hdwf, fsLevelLow, fsLevelHigh, fsEdgeRise, fsEdgeFall))
 
 # DWFAPI int FDwfDigitalInTriggerGet(HDWF hdwf, unsigned int *pfsLevelLow, unsigned int *pfsLevelHigh, unsigned int *pfsEdgeRise, unsigned int *pfsEdgeFall);
 def DigitalInTriggerGet(hdwf: int) -> (int, int, int, int):
     '''
     Returns the configured digital in trigger detector option.
     '''
-    out_fsLevelLow = c_uint(0)
-    out_fsLevelHigh = c_uint(0)
-    out_fsEdgeRise = c_uint(0)
-    out_fsEdgeFall = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerGet(ctypes.c_int(hdwf), ctypes.byref(out_fsLevelLow), ctypes.byref(out_fsLevelHigh), ctypes.byref(out_fsEdgeRise), ctypes.byref(out_fsEdgeFall)))
+    out_fsLevelLow = ctypes.c_uint(0)
+    out_fsLevelHigh = ctypes.c_uint(0)
+    out_fsEdgeRise = ctypes.c_uint(0)
+    out_fsEdgeFall = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerGet(hdwf, ctypes.byref(out_fsLevelLow), ctypes.byref(out_fsLevelHigh), ctypes.byref(out_fsEdgeRise), ctypes.byref(out_fsEdgeFall)))
     return int(out_fsLevelLow.value), int(out_fsLevelHigh.value), int(out_fsEdgeRise.value), int(out_fsEdgeFall.value)
 
 # the logic for trigger bits: Low and High and (Rise or Fall)
@@ -2896,14 +3170,14 @@ def DigitalInTriggerResetSet(hdwf: int, fsLevelLow: int, fsLevelHigh: int, fsEdg
     '''
     Configures the digital in trigger reset condition.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerResetSet(ctypes.c_int(hdwf), ctypes.c_uint(fsLevelLow), ctypes.c_uint(fsLevelHigh), ctypes.c_uint(fsEdgeRise), ctypes.c_uint(fsEdgeFall)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerResetSet(hdwf, fsLevelLow, fsLevelHigh, fsEdgeRise, fsEdgeFall))
 
 # DWFAPI int FDwfDigitalInTriggerCountSet(HDWF hdwf, int cCount, int fRestart);
 def DigitalInTriggerCountSet(hdwf: int, cCount: int, fRestart: int) -> None:
     '''
     Configures the trigger counter.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerCountSet(ctypes.c_int(hdwf), ctypes.c_int(cCount), ctypes.c_int(fRestart)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerCountSet(hdwf, cCount, fRestart))
 
 # DWFAPI int FDwfDigitalInTriggerLengthSet(HDWF hdwf, double secMin, double secMax, int idxSync);
 def DigitalInTriggerLengthSet(hdwf: int, sec_min: float, sec_max: float, idxSync: int) -> None:
@@ -2915,7 +3189,7 @@ def DigitalInTriggerLengthSet(hdwf: int, sec_min: float, sec_max: float, idxSync
     2 – PWM: use for 1-Wire. The min length specifies sampling time and max
         the timeout length.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerLengthSet(ctypes.c_int(hdwf), ctypes.c_double(sec_min), ctypes.c_double(sec_max), ctypes.c_int(idxSync)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerLengthSet(hdwf, sec_min, sec_max, idxSync))
 
 # DWFAPI int FDwfDigitalInTriggerMatchSet(HDWF hdwf, int iPin, unsigned int fsMask, unsigned int fsValue, int cBitStuffing);
 def DigitalInTriggerMatchSet(hdwf: int, iPin: int, fsMask: int, fsValue: int, cBitStuffing: int) -> None:
@@ -2925,7 +3199,7 @@ def DigitalInTriggerMatchSet(hdwf: int, iPin: int, fsMask: int, fsValue: int, cB
     on first to fourth bits received from a sequence of 8, b1010XXXX, set mask
     to 0x000000F0 and value to 0x000000A0.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerMatchSet(ctypes.c_int(hdwf), ctypes.c_int(iPin), ctypes.c_uint(fsMask), ctypes.c_uint(fsValue), ctypes.c_int(cBitStuffing)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerMatchSet(hdwf, iPin, fsMask, fsValue, cBitStuffing))
 
 ###############################################################################
 # DIGITAL OUT INSTRUMENT FUNCTIONS
@@ -2941,22 +3215,22 @@ def DigitalOutReset(hdwf: int) -> None:
     Resets and configures (by default, having auto configure enabled) all the
     instrument parameters to default values.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutReset(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfDigitalOutReset(hdwf))
 
 # DWFAPI int FDwfDigitalOutConfigure(HDWF hdwf, int fStart);
 def DigitalOutConfigure(hdwf: int, fStart: int) -> None:
     '''
     Starts or stops the instrument.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutConfigure(ctypes.c_int(hdwf), ctypes.c_int(fStart)))
+    _ThrowIfError(_dwf.FDwfDigitalOutConfigure(hdwf, fStart))
 
 # DWFAPI int FDwfDigitalOutStatus(HDWF hdwf, DwfState *psts);
 def DigitalOutStatus(hdwf: int) -> int:
     '''
     Checks the state of the instrument.
     '''
-    out_instrument_state = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutStatus(ctypes.c_int(hdwf), ctypes.byref(out_instrument_state)))
+    out_instrument_state = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfDigitalOutStatus(hdwf, ctypes.byref(out_instrument_state)))
     return int(out_instrument_state.value)
 
 #------------------------------------------------------------------------------
@@ -2969,7 +3243,7 @@ def DigitalOutInternalClockInfo(hdwf: int) -> float:
     Retrieves the internal clock frequency.
     '''
     out_hzFreq = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfDigitalOutInternalClockInfo(ctypes.c_int(hdwf), ctypes.byref(out_hzFreq)))
+    _ThrowIfError(_dwf.FDwfDigitalOutInternalClockInfo(hdwf, ctypes.byref(out_hzFreq)))
     return float(out_hzFreq.value)
 
 # DWFAPI int FDwfDigitalOutTriggerSourceSet(HDWF hdwf, TRIGSRC trigsrc);
@@ -2977,15 +3251,15 @@ def DigitalOutTriggerSourceSet(hdwf: int, trigger_source: int) -> None:
     '''
     Sets the trigger source for the instrument. Default setting is trigsrcNone.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutTriggerSourceSet(ctypes.c_int(hdwf), ctypes.c_int(trigger_source)))
+    _ThrowIfError(_dwf.FDwfDigitalOutTriggerSourceSet(hdwf, trigger_source))
 
 # DWFAPI int FDwfDigitalOutTriggerSourceGet(HDWF hdwf, TRIGSRC *ptrigsrc);
 def DigitalOutTriggerSourceGet(hdwf: int) -> int:
     '''
     Gets the current trigger source setting for the instrument.
     '''
-    out_trigger_source = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutTriggerSourceGet(ctypes.c_int(hdwf), ctypes.byref(out_trigger_source)))
+    out_trigger_source = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfDigitalOutTriggerSourceGet(hdwf, ctypes.byref(out_trigger_source)))
     return int(out_trigger_source.value)
 
 # DWFAPI int FDwfDigitalOutRunInfo(HDWF hdwf, double *psecMin, double *psecMax);
@@ -2996,7 +3270,7 @@ def DigitalOutRunInfo(hdwf: int) -> (float, float):
     '''
     out_sec_min = ctypes.c_double(0.0)
     out_sec_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfDigitalOutRunInfo(ctypes.c_int(hdwf), ctypes.byref(out_sec_min), ctypes.byref(out_sec_max)))
+    _ThrowIfError(_dwf.FDwfDigitalOutRunInfo(hdwf, ctypes.byref(out_sec_min), ctypes.byref(out_sec_max)))
     return float(out_sec_min.value), float(out_sec_max.value)
 
 # DWFAPI int FDwfDigitalOutRunSet(HDWF hdwf, double secRun);
@@ -3004,7 +3278,7 @@ def DigitalOutRunSet(hdwf: int, secRun: float) -> None:
     '''
     Sets the run length for the instrument in seconds.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutRunSet(ctypes.c_int(hdwf), ctypes.c_double(secRun)))
+    _ThrowIfError(_dwf.FDwfDigitalOutRunSet(hdwf, secRun))
 
 # DWFAPI int FDwfDigitalOutRunGet(HDWF hdwf, double *psecRun);
 def DigitalOutRunGet(hdwf: int) -> float:
@@ -3012,7 +3286,7 @@ def DigitalOutRunGet(hdwf: int) -> float:
     Reads the configured run length for the instrument in seconds.
     '''
     out_secRun = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfDigitalOutRunGet(ctypes.c_int(hdwf), ctypes.byref(out_secRun)))
+    _ThrowIfError(_dwf.FDwfDigitalOutRunGet(hdwf, ctypes.byref(out_secRun)))
     return float(out_secRun.value)
 
 # DWFAPI int FDwfDigitalOutRunStatus(HDWF hdwf, double *psecRun);
@@ -3022,7 +3296,7 @@ def DigitalOutRunStatus(hdwf: int) -> float:
     FDwfDigitalOutStatus call.
     '''
     out_secRun = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfDigitalOutRunStatus(ctypes.c_int(hdwf), ctypes.byref(out_secRun)))
+    _ThrowIfError(_dwf.FDwfDigitalOutRunStatus(hdwf, ctypes.byref(out_secRun)))
     return float(out_secRun.value)
 
 # DWFAPI int FDwfDigitalOutWaitInfo(HDWF hdwf, double *psecMin, double *psecMax);
@@ -3034,7 +3308,7 @@ def DigitalOutWaitInfo(hdwf: int) -> (float, float):
     '''
     out_sec_min = ctypes.c_double(0.0)
     out_sec_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfDigitalOutWaitInfo(ctypes.c_int(hdwf), ctypes.byref(out_sec_min), ctypes.byref(out_sec_max)))
+    _ThrowIfError(_dwf.FDwfDigitalOutWaitInfo(hdwf, ctypes.byref(out_sec_min), ctypes.byref(out_sec_max)))
     return float(out_sec_min.value), float(out_sec_max.value)
 
 # DWFAPI int FDwfDigitalOutWaitSet(HDWF hdwf, double secWait);
@@ -3042,7 +3316,7 @@ def DigitalOutWaitSet(hdwf: int, secWait: float) -> None:
     '''
     Sets the wait length.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutWaitSet(ctypes.c_int(hdwf), ctypes.c_double(secWait)))
+    _ThrowIfError(_dwf.FDwfDigitalOutWaitSet(hdwf, secWait))
 
 # DWFAPI int FDwfDigitalOutWaitGet(HDWF hdwf, double *psecWait);
 def DigitalOutWaitGet(hdwf: int) -> float:
@@ -3050,7 +3324,7 @@ def DigitalOutWaitGet(hdwf: int) -> float:
     Gets the current wait length.
     '''
     out_secWait = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfDigitalOutWaitGet(ctypes.c_int(hdwf), ctypes.byref(out_secWait)))
+    _ThrowIfError(_dwf.FDwfDigitalOutWaitGet(hdwf, ctypes.byref(out_secWait)))
     return float(out_secWait.value)
 
 # DWFAPI int FDwfDigitalOutRepeatInfo(HDWF hdwf, unsigned int *pnMin, unsigned int *pnMax);
@@ -3060,9 +3334,9 @@ def DigitalOutRepeatInfo(hdwf: int) -> (int, int):
     generated signal will be repeated. Zero value represents infinite repeats.
     Default value is one.
     '''
-    out_min = c_uint(0)
-    out_max = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutRepeatInfo(ctypes.c_int(hdwf), ctypes.byref(out_min), ctypes.byref(out_max)))
+    out_min = ctypes.c_uint(0)
+    out_max = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalOutRepeatInfo(hdwf, ctypes.byref(out_min), ctypes.byref(out_max)))
     return int(out_min.value), int(out_max.value)
 
 # DWFAPI int FDwfDigitalOutRepeatSet(HDWF hdwf, unsigned int cRepeat);
@@ -3070,15 +3344,15 @@ def DigitalOutRepeatSet(hdwf: int, cRepeat: int) -> None:
     '''
     Sets the repeat count.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutRepeatSet(ctypes.c_int(hdwf), ctypes.c_uint(cRepeat)))
+    _ThrowIfError(_dwf.FDwfDigitalOutRepeatSet(hdwf, cRepeat))
 
 # DWFAPI int FDwfDigitalOutRepeatGet(HDWF hdwf, unsigned int *pcRepeat);
 def DigitalOutRepeatGet(hdwf: int) -> int:
     '''
     Reads the current repeat count.
     '''
-    out_cRepeat = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutRepeatGet(ctypes.c_int(hdwf), ctypes.byref(out_cRepeat)))
+    out_cRepeat = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalOutRepeatGet(hdwf, ctypes.byref(out_cRepeat)))
     return int(out_cRepeat.value)
 
 # DWFAPI int FDwfDigitalOutRepeatStatus(HDWF hdwf, unsigned int *pcRepeat);
@@ -3087,8 +3361,8 @@ def DigitalOutRepeatStatus(hdwf: int) -> int:
     Reads the remaining repeat counts. It only returns information from the last
     FDwfDigitalOutStatus function call, it does not read from the device.
     '''
-    out_cRepeat = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutRepeatStatus(ctypes.c_int(hdwf), ctypes.byref(out_cRepeat)))
+    out_cRepeat = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalOutRepeatStatus(hdwf, ctypes.byref(out_cRepeat)))
     return int(out_cRepeat.value)
 
 # DWFAPI int FDwfDigitalOutTriggerSlopeSet(HDWF hdwf, DwfTriggerSlope slope);
@@ -3096,7 +3370,7 @@ def DigitalOutTriggerSlopeSet(hdwf: int, slope: int) -> None:
     '''
     Sets the trigger slope for the instrument.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutTriggerSlopeSet(ctypes.c_int(hdwf), ctypes.c_int(slope)))
+    _ThrowIfError(_dwf.FDwfDigitalOutTriggerSlopeSet(hdwf, slope))
 
 # DWFAPI int FDwfDigitalOutTriggerSlopeGet(HDWF hdwf, DwfTriggerSlope *pslope);
 def DigitalOutTriggerSlopeGet(hdwf: int) -> int:
@@ -3104,7 +3378,7 @@ def DigitalOutTriggerSlopeGet(hdwf: int) -> int:
     Gets the current trigger source setting for the instrument.
     '''
     out_slope = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutTriggerSlopeGet(ctypes.c_int(hdwf), ctypes.byref(out_slope)))
+    _ThrowIfError(_dwf.FDwfDigitalOutTriggerSlopeGet(hdwf, ctypes.byref(out_slope)))
     return int(out_slope.value)
 
 # DWFAPI int FDwfDigitalOutRepeatTriggerSet(HDWF hdwf, int fRepeatTrigger);
@@ -3113,7 +3387,7 @@ def DigitalOutRepeatTriggerSet(hdwf: int, fRepeatTrigger: int) -> None:
     Sets the repeat trigger option. To include the trigger in wait-run repeat
     cycles, set fRepeatTrigger to TRUE. It is disabled by default.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutRepeatTriggerSet(ctypes.c_int(hdwf), ctypes.c_int(fRepeatTrigger)))
+    _ThrowIfError(_dwf.FDwfDigitalOutRepeatTriggerSet(hdwf, fRepeatTrigger))
 
 # DWFAPI int FDwfDigitalOutRepeatTriggerGet(HDWF hdwf, int *pfRepeatTrigger);
 def DigitalOutRepeatTriggerGet(hdwf: int) -> int:
@@ -3121,7 +3395,7 @@ def DigitalOutRepeatTriggerGet(hdwf: int) -> int:
     Verifies if the trigger has been included in wait-run repeat cycles.
     '''
     out_fRepeatTrigger = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutRepeatTriggerGet(ctypes.c_int(hdwf), ctypes.byref(out_fRepeatTrigger)))
+    _ThrowIfError(_dwf.FDwfDigitalOutRepeatTriggerGet(hdwf, ctypes.byref(out_fRepeatTrigger)))
     return int(out_fRepeatTrigger.value)
 
 # DWFAPI int FDwfDigitalOutCount(HDWF hdwf, int *pcChannel);
@@ -3130,7 +3404,7 @@ def DigitalOutCount(hdwf: int) -> int:
     Returns the number of Digital Out channels by the device specified by hdwf.
     '''
     out_cChannel = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutCount(ctypes.c_int(hdwf), ctypes.byref(out_cChannel)))
+    _ThrowIfError(_dwf.FDwfDigitalOutCount(hdwf, ctypes.byref(out_cChannel)))
     return int(out_cChannel.value)
 
 # DWFAPI int FDwfDigitalOutEnableSet(HDWF hdwf, int idxChannel, int fEnable);
@@ -3138,7 +3412,7 @@ def DigitalOutEnableSet(hdwf: int, channel_index: int, enable: int) -> None:
     '''
     Enables or disables the channel specified by idxChannel.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutEnableSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(enable)))
+    _ThrowIfError(_dwf.FDwfDigitalOutEnableSet(hdwf, channel_index, enable))
 
 # DWFAPI int FDwfDigitalOutEnableGet(HDWF hdwf, int idxChannel, int *pfEnable);
 def DigitalOutEnableGet(hdwf: int, channel_index: int) -> int:
@@ -3146,7 +3420,7 @@ def DigitalOutEnableGet(hdwf: int, channel_index: int) -> int:
     Verifies if a specific channel is enabled or disabled.
     '''
     out_enable = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutEnableGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_enable)))
+    _ThrowIfError(_dwf.FDwfDigitalOutEnableGet(hdwf, channel_index, ctypes.byref(out_enable)))
     return int(out_enable.value)
 
 # DWFAPI int FDwfDigitalOutOutputInfo(HDWF hdwf, int idxChannel, int *pfsDwfDigitalOutOutput); // use IsBitSet
@@ -3158,7 +3432,7 @@ def DigitalOutOutputInfo(hdwf: int, channel_index: int) -> int:
     in DWF.h:
     '''
     out_fsDwfDigitalOutOutput = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutOutputInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_fsDwfDigitalOutOutput)))
+    _ThrowIfError(_dwf.FDwfDigitalOutOutputInfo(hdwf, channel_index, ctypes.byref(out_fsDwfDigitalOutOutput)))
     return int(out_fsDwfDigitalOutOutput.value)
 
 # DWFAPI int FDwfDigitalOutOutputSet(HDWF hdwf, int idxChannel, DwfDigitalOutOutput v);
@@ -3166,7 +3440,7 @@ def DigitalOutOutputSet(hdwf: int, channel_index: int, v: int) -> None:
     '''
     Specifies output mode of the channel.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutOutputSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(v)))
+    _ThrowIfError(_dwf.FDwfDigitalOutOutputSet(hdwf, channel_index, v))
 
 # DWFAPI int FDwfDigitalOutOutputGet(HDWF hdwf, int idxChannel, DwfDigitalOutOutput *pv);
 def DigitalOutOutputGet(hdwf: int, channel_index: int) -> int:
@@ -3174,7 +3448,7 @@ def DigitalOutOutputGet(hdwf: int, channel_index: int) -> int:
     Verifies if a specific channel output mode.
     '''
     out_v = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutOutputGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_v)))
+    _ThrowIfError(_dwf.FDwfDigitalOutOutputGet(hdwf, channel_index, ctypes.byref(out_v)))
     return int(out_v.value)
 
 # DWFAPI int FDwfDigitalOutTypeInfo(HDWF hdwf, int idxChannel, int *pfsDwfDigitalOutType); // use IsBitSet
@@ -3185,7 +3459,7 @@ def DigitalOutTypeInfo(hdwf: int, channel_index: int) -> int:
     Individual bits are defined using the DwfDigitalOutType constants in dwf.h:
     '''
     out_fsDwfDigitalOutType = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutTypeInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_fsDwfDigitalOutType)))
+    _ThrowIfError(_dwf.FDwfDigitalOutTypeInfo(hdwf, channel_index, ctypes.byref(out_fsDwfDigitalOutType)))
     return int(out_fsDwfDigitalOutType.value)
 
 # DWFAPI int FDwfDigitalOutTypeSet(HDWF hdwf, int idxChannel, DwfDigitalOutType v);
@@ -3193,7 +3467,7 @@ def DigitalOutTypeSet(hdwf: int, channel_index: int, v: int) -> None:
     '''
     Sets the output type of the specified channel.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutTypeSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(v)))
+    _ThrowIfError(_dwf.FDwfDigitalOutTypeSet(hdwf, channel_index, v))
 
 # DWFAPI int FDwfDigitalOutTypeGet(HDWF hdwf, int idxChannel, DwfDigitalOutType *pv);
 def DigitalOutTypeGet(hdwf: int, channel_index: int) -> int:
@@ -3201,7 +3475,7 @@ def DigitalOutTypeGet(hdwf: int, channel_index: int) -> int:
     Verifies the type of a specific channel.
     '''
     out_v = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutTypeGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_v)))
+    _ThrowIfError(_dwf.FDwfDigitalOutTypeGet(hdwf, channel_index, ctypes.byref(out_v)))
     return int(out_v.value)
 
 # DWFAPI int FDwfDigitalOutIdleInfo(HDWF hdwf, int idxChannel, int *pfsDwfDigitalOutIdle); // use IsBitSet
@@ -3213,7 +3487,7 @@ def DigitalOutIdleInfo(hdwf: int, channel_index: int) -> int:
     constants in dwf.h. Output while not running:
     '''
     out_fsDwfDigitalOutIdle = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutIdleInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_fsDwfDigitalOutIdle)))
+    _ThrowIfError(_dwf.FDwfDigitalOutIdleInfo(hdwf, channel_index, ctypes.byref(out_fsDwfDigitalOutIdle)))
     return int(out_fsDwfDigitalOutIdle.value)
 
 # DWFAPI int FDwfDigitalOutIdleSet(HDWF hdwf, int idxChannel, DwfDigitalOutIdle v);
@@ -3221,7 +3495,7 @@ def DigitalOutIdleSet(hdwf: int, channel_index: int, v: int) -> None:
     '''
     Sets the idle output of the specified channel.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutIdleSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(v)))
+    _ThrowIfError(_dwf.FDwfDigitalOutIdleSet(hdwf, channel_index, v))
 
 # DWFAPI int FDwfDigitalOutIdleGet(HDWF hdwf, int idxChannel, DwfDigitalOutIdle *pv);
 def DigitalOutIdleGet(hdwf: int, channel_index: int) -> int:
@@ -3229,7 +3503,7 @@ def DigitalOutIdleGet(hdwf: int, channel_index: int) -> int:
     Verifies the idle output of a specific channel.
     '''
     out_v = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutIdleGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_v)))
+    _ThrowIfError(_dwf.FDwfDigitalOutIdleGet(hdwf, channel_index, ctypes.byref(out_v)))
     return int(out_v.value)
 
 # DWFAPI int FDwfDigitalOutDividerInfo(HDWF hdwf, int idxChannel, unsigned int *vMin, unsigned int *vMax);
@@ -3237,9 +3511,9 @@ def DigitalOutDividerInfo(hdwf: int, channel_index: int) -> (int, int):
     '''
     Returns the supported clock divider value range.
     '''
-    out_v_min = c_uint(0)
-    out_v_max = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutDividerInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_v_min), ctypes.byref(out_v_max)))
+    out_v_min = ctypes.c_uint(0)
+    out_v_max = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalOutDividerInfo(hdwf, channel_index, ctypes.byref(out_v_min), ctypes.byref(out_v_max)))
     return int(out_v_min.value), int(out_v_max.value)
 
 # DWFAPI int FDwfDigitalOutDividerInitSet(HDWF hdwf, int idxChannel, unsigned int v);
@@ -3247,15 +3521,15 @@ def DigitalOutDividerInitSet(hdwf: int, channel_index: int, v: int) -> None:
     '''
     Sets the initial divider value of the specified channel.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutDividerInitSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_uint(v)))
+    _ThrowIfError(_dwf.FDwfDigitalOutDividerInitSet(hdwf, channel_index, v))
 
 # DWFAPI int FDwfDigitalOutDividerInitGet(HDWF hdwf, int idxChannel, unsigned int *pv);
 def DigitalOutDividerInitGet(hdwf: int, channel_index: int) -> int:
     '''
     Verifies the initial divider value of the specified channel.
     '''
-    out_v = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutDividerInitGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_v)))
+    out_v = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalOutDividerInitGet(hdwf, channel_index, ctypes.byref(out_v)))
     return int(out_v.value)
 
 # DWFAPI int FDwfDigitalOutDividerSet(HDWF hdwf, int idxChannel, unsigned int v);
@@ -3263,15 +3537,15 @@ def DigitalOutDividerSet(hdwf: int, channel_index: int, v: int) -> None:
     '''
     Sets the divider value of the specified channel.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutDividerSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_uint(v)))
+    _ThrowIfError(_dwf.FDwfDigitalOutDividerSet(hdwf, channel_index, v))
 
 # DWFAPI int FDwfDigitalOutDividerGet(HDWF hdwf, int idxChannel, unsigned int *pv);
 def DigitalOutDividerGet(hdwf: int, channel_index: int) -> int:
     '''
     Verifies the divider value of the specified channel.
     '''
-    out_v = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutDividerGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_v)))
+    out_v = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalOutDividerGet(hdwf, channel_index, ctypes.byref(out_v)))
     return int(out_v.value)
 
 # DWFAPI int FDwfDigitalOutCounterInfo(HDWF hdwf, int idxChannel, unsigned int *vMin, unsigned int *vMax);
@@ -3279,9 +3553,9 @@ def DigitalOutCounterInfo(hdwf: int, channel_index: int) -> (int, int):
     '''
     Returns the supported counter value range.
     '''
-    out_v_min = c_uint(0)
-    out_v_max = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutCounterInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_v_min), ctypes.byref(out_v_max)))
+    out_v_min = ctypes.c_uint(0)
+    out_v_max = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalOutCounterInfo(hdwf, channel_index, ctypes.byref(out_v_min), ctypes.byref(out_v_max)))
     return int(out_v_min.value), int(out_v_max.value)
 
 # DWFAPI int FDwfDigitalOutCounterInitSet(HDWF hdwf, int idxChannel, int fHigh, unsigned int v);
@@ -3289,7 +3563,7 @@ def DigitalOutCounterInitSet(hdwf: int, channel_index: int, fHigh: int, v: int)
     '''
     Sets the initial state and counter value of the specified channel.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutCounterInitSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(fHigh), ctypes.c_uint(v)))
+    _ThrowIfError(_dwf.FDwfDigitalOutCounterInitSet(hdwf, channel_index, fHigh, v))
 
 # DWFAPI int FDwfDigitalOutCounterInitGet(HDWF hdwf, int idxChannel, int *pfHigh, unsigned int *pv);
 def DigitalOutCounterInitGet(hdwf: int, channel_index: int) -> (int, int):
@@ -3297,8 +3571,8 @@ def DigitalOutCounterInitGet(hdwf: int, channel_index: int) -> (int, int):
     Retrieves the initial state and counter value for the specified channel.
     '''
     out_fHigh = ctypes.c_int(0)
-    out_v = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutCounterInitGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_fHigh), ctypes.byref(out_v)))
+    out_v = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalOutCounterInitGet(hdwf, channel_index, ctypes.byref(out_fHigh), ctypes.byref(out_v)))
     return int(out_fHigh.value), int(out_v.value)
 
 # DWFAPI int FDwfDigitalOutCounterSet(HDWF hdwf, int idxChannel, unsigned int vLow, unsigned int vHigh);
@@ -3306,16 +3580,16 @@ def DigitalOutCounterSet(hdwf: int, channel_index: int, vLow: int, vHigh: int) -
     '''
     Sets the counter low and high values for the specified channel.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutCounterSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_uint(vLow), ctypes.c_uint(vHigh)))
+    _ThrowIfError(_dwf.FDwfDigitalOutCounterSet(hdwf, channel_index, vLow, vHigh))
 
 # DWFAPI int FDwfDigitalOutCounterGet(HDWF hdwf, int idxChannel, unsigned int *pvLow, unsigned int *pvHigh);
 def DigitalOutCounterGet(hdwf: int, channel_index: int) -> (int, int):
     '''
     Verifies the low and high counter value of the specified channel.
     '''
-    out_vLow = c_uint(0)
-    out_vHigh = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutCounterGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_vLow), ctypes.byref(out_vHigh)))
+    out_vLow = ctypes.c_uint(0)
+    out_vHigh = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalOutCounterGet(hdwf, channel_index, ctypes.byref(out_vLow), ctypes.byref(out_vHigh)))
     return int(out_vLow.value), int(out_vHigh.value)
 
 # DWFAPI int FDwfDigitalOutDataInfo(HDWF hdwf, int idxChannel, unsigned int *pcountOfBitsMax);
@@ -3323,12 +3597,12 @@ def DigitalOutDataInfo(hdwf: int, channel_index: int) -> int:
     '''
     Returns the maximum buffers size, the number of custom data bits.
     '''
-    out_count_of_bits_max = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutDataInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_count_of_bits_max)))
+    out_count_of_bits_max = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalOutDataInfo(hdwf, channel_index, ctypes.byref(out_count_of_bits_max)))
     return int(out_count_of_bits_max.value)
 
 # DWFAPI int FDwfDigitalOutDataSet(HDWF hdwf, int idxChannel, void *rgBits, unsigned int countOfBits);
-def DigitalOutDataSet(hdwf: int, channel_index: int, countOfBits: int) -> int:
+def DigitalOutDataSet(hdwf: int, channel_index: int, data, countOfBits: int = None) -> None:
     '''
     Sets the custom data bits. The function also sets the counter initial, low
     and high value, according the number of bits. The data bits are sent out in
@@ -3336,9 +3610,10 @@ def DigitalOutDataSet(hdwf: int, channel_index: int, countOfBits: int) -> int:
     output value (I/O) and output enable (OE) bits, which should be an even
     number.
     '''
-    out_rgBits = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutDataSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_uint(countOfBits), ctypes.byref(out_rgBits)))
-    return int(out_rgBits.value)
+    rgBits, count_of_bytes = _InputAsArray(ctypes.c_ubyte, 'B', data)
+    if (countOfBits is None):
+        countOfBits = 8 * count_of_bytes
+    _ThrowIfError(_dwf.FDwfDigitalOutDataSet(hdwf, channel_index, rgBits, countOfBits))
 
 # bits order is lsb first
 # for TS output the count of bits its the total number of IO|OE bits, it should be an even number
@@ -3347,20 +3622,20 @@ def DigitalOutDataSet(hdwf: int, channel_index: int, countOfBits: int) -> int:
 # sample: IO|OE|IO|OE|...|OE|IO|OE|...
 
 # DWFAPI int FDwfDigitalOutPlayDataSet(HDWF hdwf, unsigned char *rgBits, unsigned int bitPerSample, unsigned int countOfSamples);
-def DigitalOutPlayDataSet(hdwf: int, bitPerSample: int, countOfSamples: int) -> int:
+def DigitalOutPlayDataSet(hdwf: int, data, bitPerSample: int, countOfSamples: int) -> None:
     '''
-    Sets the divider value of the specified channel.
+    Sets the samples for the digital out play mode, packed LSB first with
+    bitPerSample bits per sample.
     '''
-    out_rgBits = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutPlayDataSet(ctypes.c_int(hdwf), ctypes.c_uint(bitPerSample), ctypes.c_uint(countOfSamples), ctypes.byref(out_rgBits)))
-    return int(out_rgBits.value)
+    rgBits, count_of_bytes = _InputAsArray(ctypes.c_ubyte, 'B', data)
+    _ThrowIfError(_dwf.FDwfDigitalOutPlayDataSet(hdwf, rgBits, bitPerSample, countOfSamples))
 
 # DWFAPI int FDwfDigitalOutPlayRateSet(HDWF hdwf, double hzRate);
 def DigitalOutPlayRateSet(hdwf: int, hzRate: float) -> None:
     '''
     Sets the play rate.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalOutPlayRateSet(ctypes.c_int(hdwf), ctypes.c_double(hzRate)))
+    _ThrowIfError(_dwf.FDwfDigitalOutPlayRateSet(hdwf, hzRate))
 
 # DWFAPI int FDwfDigitalUartReset(HDWF hdwf);
 def DigitalUartReset(hdwf: int) -> None:
@@ -3368,70 +3643,68 @@ def DigitalUartReset(hdwf: int) -> None:
     Resets the UART configuration to default value. Use FDwfDigitalOutReset to
     reset the output.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalUartReset(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfDigitalUartReset(hdwf))
 
 # DWFAPI int FDwfDigitalUartRateSet(HDWF hdwf, double hz);
 def DigitalUartRateSet(hdwf: int, hz: float) -> None:
     '''
     Sets the data rate.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalUartRateSet(ctypes.c_int(hdwf), ctypes.c_double(hz)))
+    _ThrowIfError(_dwf.FDwfDigitalUartRateSet(hdwf, hz))
 
 # DWFAPI int FDwfDigitalUartBitsSet(HDWF hdwf, int cBits);
 def DigitalUartBitsSet(hdwf: int, cBits: int) -> None:
     '''
     Sets the character length, typically 8, 7, 6 or 5.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalUartBitsSet(ctypes.c_int(hdwf), ctypes.c_int(cBits)))
+    _ThrowIfError(_dwf.FDwfDigitalUartBitsSet(hdwf, cBits))
 
 # DWFAPI int FDwfDigitalUartParitySet(HDWF hdwf, int parity); # 0 none, 1 odd, 2 even
 def DigitalUartParitySet(hdwf: int, parity: int) -> None:
     '''
     Sets the parity bit: 0 for no parity, 1 for odd and 2 for even parity.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalUartParitySet(ctypes.c_int(hdwf), ctypes.c_int(parity)))
+    _ThrowIfError(_dwf.FDwfDigitalUartParitySet(hdwf, parity))
 
 # DWFAPI int FDwfDigitalUartStopSet(HDWF hdwf, double cBit);
 def DigitalUartStopSet(hdwf: int, cBit: float) -> None:
     '''
     Sets the stop length as number of bits.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalUartStopSet(ctypes.c_int(hdwf), ctypes.c_double(cBit)))
+    _ThrowIfError(_dwf.FDwfDigitalUartStopSet(hdwf, cBit))
 
 # DWFAPI int FDwfDigitalUartTxSet(HDWF hdwf, int idxChannel);
 def DigitalUartTxSet(hdwf: int, channel_index: int) -> None:
     '''
     Specifies the DIO channel to use for transmission.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalUartTxSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index)))
+    _ThrowIfError(_dwf.FDwfDigitalUartTxSet(hdwf, channel_index))
 
 # DWFAPI int FDwfDigitalUartRxSet(HDWF hdwf, int idxChannel);
 def DigitalUartRxSet(hdwf: int, channel_index: int) -> None:
     '''
     Specifies the DIO channel to use for reception.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalUartRxSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index)))
+    _ThrowIfError(_dwf.FDwfDigitalUartRxSet(hdwf, channel_index))
 
 # DWFAPI int FDwfDigitalUartTx(HDWF hdwf, char *szTx, int cTx);
-def DigitalUartTx(hdwf: int, cTx: int) -> int:
+def DigitalUartTx(hdwf: int, data: bytes) -> None:
     '''
     Transmits the specified characters.
     '''
-    out_szTx = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalUartTx(ctypes.c_int(hdwf), ctypes.c_int(cTx), ctypes.byref(out_szTx)))
-    return int(out_szTx.value)
+    _ThrowIfError(_dwf.FDwfDigitalUartTx(hdwf, bytes(data), len(data)))
 
 # DWFAPI int FDwfDigitalUartRx(HDWF hdwf, char *szRx, int cRx, int *pcRx, int *pParity);
-def DigitalUartRx(hdwf: int, cRx: int) -> (int, int, int):
+def DigitalUartRx(hdwf: int, cRx: int) -> (bytes, int):
     '''
     Initializes the reception with cRxMax zero. Otherwise returns the received
     characters since the last call.
     '''
-    out_szRx = ctypes.c_int(0)
+    out_szRx = ctypes.create_string_buffer(cRx + 1)
     out_cRx = ctypes.c_int(0)
     out_Parity = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalUartRx(ctypes.c_int(hdwf), ctypes.c_int(cRx), ctypes.byref(out_szRx), ctypes.byref(out_cRx), ctypes.byref(out_Parity)))
-    return int(out_szRx.value), int(out_cRx.value), int(out_Parity.value)
+    _ThrowIfError(_dwf.FDwfDigitalUartRx(hdwf, out_szRx, cRx, ctypes.byref(out_cRx), ctypes.byref(out_Parity)))
+    return out_szRx.raw[:out_cRx.value], int(out_Parity.value)
 
 # DWFAPI int FDwfDigitalSpiReset(HDWF hdwf);
 def DigitalSpiReset(hdwf: int) -> None:
@@ -3439,102 +3712,102 @@ def DigitalSpiReset(hdwf: int) -> None:
     Resets the SPI configuration to default value. Use FDwfDigitalOutReset to
     reset the outputs.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalSpiReset(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfDigitalSpiReset(hdwf))
 
 # DWFAPI int FDwfDigitalSpiFrequencySet(HDWF hdwf, double hz);
 def DigitalSpiFrequencySet(hdwf: int, hz: float) -> None:
     '''
     Sets the SPI frequency.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalSpiFrequencySet(ctypes.c_int(hdwf), ctypes.c_double(hz)))
+    _ThrowIfError(_dwf.FDwfDigitalSpiFrequencySet(hdwf, hz))
 
 # DWFAPI int FDwfDigitalSpiClockSet(HDWF hdwf, int idxChannel);
 def DigitalSpiClockSet(hdwf: int, channel_index: int) -> None:
     '''
     Specifies the DIO channel to use for SPI clock.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalSpiClockSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index)))
+    _ThrowIfError(_dwf.FDwfDigitalSpiClockSet(hdwf, channel_index))
 
 # DWFAPI int FDwfDigitalSpiDataSet(HDWF hdwf, int idxDQ, int idxChannel); # 0 DQ0_MOSI_SISO, 1 DQ1_MISO, 2 DQ2, 3 DQ3
 def DigitalSpiDataSet(hdwf: int, idxDQ: int, channel_index: int) -> None:
     '''
     Specifies the DIO channels to use for SPI data.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalSpiDataSet(ctypes.c_int(hdwf), ctypes.c_int(idxDQ), ctypes.c_int(channel_index)))
+    _ThrowIfError(_dwf.FDwfDigitalSpiDataSet(hdwf, idxDQ, channel_index))
 
 # DWFAPI int FDwfDigitalSpiIdleSet(HDWF hdwf, int idxDQ, DwfDigitalOutIdle idle);
 def DigitalSpiIdleSet(hdwf: int, idxDQ: int, idle: int) -> None:
     '''
     Specifies the DIO channels to use for SPI data.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalSpiIdleSet(ctypes.c_int(hdwf), ctypes.c_int(idxDQ), ctypes.c_int(idle)))
+    _ThrowIfError(_dwf.FDwfDigitalSpiIdleSet(hdwf, idxDQ, idle))
 
 # DWFAPI int FDwfDigitalSpiModeSet(HDWF hdwf, int iMode); # bit1 CPOL, bit0 CPHA
 def DigitalSpiModeSet(hdwf: int, iMode: int) -> None:
     '''
     Sets the SPI mode
     '''
-    _ThrowIfError(_dwf.FDwfDigitalSpiModeSet(ctypes.c_int(hdwf), ctypes.c_int(iMode)))
+    _ThrowIfError(_dwf.FDwfDigitalSpiModeSet(hdwf, iMode))
 
 # DWFAPI int FDwfDigitalSpiOrderSet(HDWF hdwf, int fMSBFirst); # bit order: 1 MSB first, 0 LSB first
 def DigitalSpiOrderSet(hdwf: int, fMSBFirst: int) -> None:
     '''
     Sets the bit order for SPI data.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalSpiOrderSet(ctypes.c_int(hdwf), ctypes.c_int(fMSBFirst)))
+    _ThrowIfError(_dwf.FDwfDigitalSpiOrderSet(hdwf, fMSBFirst))
 
 # DWFAPI int FDwfDigitalSpiSelect(HDWF hdwf, int idxChannel, int level); # 0 low, 1 high, -1 Z
 def DigitalSpiSelect(hdwf: int, channel_index: int, level: int) -> None:
     '''
     Controls the SPI CS signal(s).
     '''
-    _ThrowIfError(_dwf.FDwfDigitalSpiSelect(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(level)))
+    _ThrowIfError(_dwf.FDwfDigitalSpiSelect(hdwf, channel_index, level))
 
 # cDQ 0 SISO, 1 MOSI/MISO, 2 dual, 4 quad, # 1-32 bits / word
 # DWFAPI int FDwfDigitalSpiWriteRead(HDWF hdwf, int cDQ, int cBitPerWord, unsigned char *rgTX, int cTX, unsigned char *rgRX, int cRX);
-def DigitalSpiWriteRead(hdwf: int, cDQ: int, cBitPerWord: int, cTX: int, cRX: int) -> (int, int):
+def DigitalSpiWriteRead(hdwf: int, cDQ: int, cBitPerWord: int, write_data: List[int], cRX: int) -> List[int]:
     '''
     Performs SPI transfer of up to 8bit words. This function is intended for
     standard MOSI/MISO (cDQ 1) operations, but it can be used for other modes as
     long only write (rgTX/cTX) or read (rgRX/cRX) is specified. The number of
     clock signals generated is the maximum of cTX and cRX.
     '''
-    out_rgTX = ctypes.c_int(0)
-    out_rgRX = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalSpiWriteRead(ctypes.c_int(hdwf), ctypes.c_int(cDQ), ctypes.c_int(cBitPerWord), ctypes.c_int(cTX), ctypes.c_int(cRX), ctypes.byref(out_rgTX), ctypes.byref(out_rgRX)))
-    return int(out_rgTX.value), int(out_rgRX.value)
+    local_write_data = (ctypes.c_ubyte * len(write_data))(*write_data)
+    out_rgRX = (ctypes.c_ubyte * cRX)()
+    _ThrowIfError(_dwf.FDwfDigitalSpiWriteRead(hdwf, cDQ, cBitPerWord, local_write_data, len(write_data), out_rgRX, cRX))
+    return list(out_rgRX)
 
 # DWFAPI int FDwfDigitalSpiWriteRead16(HDWF hdwf, int cDQ, int cBitPerWord, unsigned short *rgTX, int cTX, unsigned short *rgRX, int cRX);
-def DigitalSpiWriteRead16(hdwf: int, cDQ: int, cBitPerWord: int, cTX: int, cRX: int) -> (int, int):
+def DigitalSpiWriteRead16(hdwf: int, cDQ: int, cBitPerWord: int, write_data: List[int], cRX: int) -> List[int]:
     '''
     Performs SPI transfer of up to 16-bit words. See FDwfDigitalSpiWriteRead for
     more information.
     '''
-    out_rgTX = ctypes.c_int(0)
-    out_rgRX = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalSpiWriteRead16(ctypes.c_int(hdwf), ctypes.c_int(cDQ), ctypes.c_int(cBitPerWord), ctypes.c_int(cTX), ctypes.c_int(cRX), ctypes.byref(out_rgTX), ctypes.byref(out_rgRX)))
-    return int(out_rgTX.value), int(out_rgRX.value)
+    local_write_data = (ctypes.c_ushort * len(write_data))(*write_data)
+    out_rgRX = (ctypes.c_ushort * cRX)()
+    _ThrowIfError(_dwf.FDwfDigitalSpiWriteRead16(hdwf, cDQ, cBitPerWord, local_write_data, len(write_data), out_rgRX, cRX))
+    return list(out_rgRX)
 
 # DWFAPI int FDwfDigitalSpiWriteRead32(HDWF hdwf, int cDQ, int cBitPerWord, unsigned int *rgTX, int cTX, unsigned int *rgRX, int cRX);
-def DigitalSpiWriteRead32(hdwf: int, cDQ: int, cBitPerWord: int, cTX: int, cRX: int) -> (int, int):
+def DigitalSpiWriteRead32(hdwf: int, cDQ: int, cBitPerWord: int, write_data: List[int], cRX: int) -> List[int]:
     '''
     Performs SPI transfer of up to 32-bit words. See FDwfDigitalSpiWriteRead for
     more information.
     '''
-    out_rgTX = c_uint(0)
-    out_rgRX = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalSpiWriteRead32(ctypes.c_int(hdwf), ctypes.c_int(cDQ), ctypes.c_int(cBitPerWord), ctypes.c_int(cTX), ctypes.c_int(cRX), ctypes.byref(out_rgTX), ctypes.byref(out_rgRX)))
-    return int(out_rgTX.value), int(out_rgRX.value)
+    local_write_data = (ctypes.c_uint * len(write_data))(*write_data)
+    out_rgRX = (ctypes.c_uint * cRX)()
+    _ThrowIfError(_dwf.FDwfDigitalSpiWriteRead32(hdwf, cDQ, cBitPerWord, local_write_data, len(write_data), out_rgRX, cRX))
+    return list(out_rgRX)
 
 # DWFAPI int FDwfDigitalSpiRead(HDWF hdwf, int cDQ, int cBitPerWord, unsigned char *rgRX, int cRX);
-def DigitalSpiRead(hdwf: int, cDQ: int, cBitPerWord: int, cRX: int) -> int:
+def DigitalSpiRead(hdwf: int, cDQ: int, cBitPerWord: int, cRX: int) -> List[int]:
     '''
     Performs SPI reception of up to 8-bit words. See FDwfDigitalSpiWriteRead for
     more information.
     '''
-    out_rgRX = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalSpiRead(ctypes.c_int(hdwf), ctypes.c_int(cDQ), ctypes.c_int(cBitPerWord), ctypes.c_int(cRX), ctypes.byref(out_rgRX)))
-    return int(out_rgRX.value)
+    out_rgRX = (ctypes.c_ubyte * cRX)()
+    _ThrowIfError(_dwf.FDwfDigitalSpiRead(hdwf, cDQ, cBitPerWord, out_rgRX, cRX))
+    return list(out_rgRX)
 
 # DWFAPI int FDwfDigitalSpiReadOne(HDWF hdwf, int cDQ, int cBitPerWord, unsigned int *pRX);
 def DigitalSpiReadOne(hdwf: int, cDQ: int, cBitPerWord: int) -> int:
@@ -3542,39 +3815,38 @@ def DigitalSpiReadOne(hdwf: int, cDQ: int, cBitPerWord: int) -> int:
     Performs SPI reception of up to 32 bits. See FDwfDigitalSpiWriteRead for
     more information.
     '''
-    out_RX = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalSpiReadOne(ctypes.c_int(hdwf), ctypes.c_int(cDQ), ctypes.c_int(cBitPerWord), ctypes.byref(out_RX)))
+    out_RX = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfDigitalSpiReadOne(hdwf, cDQ, cBitPerWord, ctypes.byref(out_RX)))
     return int(out_RX.value)
 
 # DWFAPI int FDwfDigitalSpiRead16(HDWF hdwf, int cDQ, int cBitPerWord, unsigned short *rgRX, int cRX);
-def DigitalSpiRead16(hdwf: int, cDQ: int, cBitPerWord: int, cRX: int) -> int:
+def DigitalSpiRead16(hdwf: int, cDQ: int, cBitPerWord: int, cRX: int) -> List[int]:
     '''
     Performs SPI read of up to 16-bit words. See FDwfDigitalSpiWriteRead for
     more information.
     '''
-    out_rgRX = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalSpiRead16(ctypes.c_int(hdwf), ctypes.c_int(cDQ), ctypes.c_int(cBitPerWord), ctypes.c_int(cRX), ctypes.byref(out_rgRX)))
-    return int(out_rgRX.value)
+    out_rgRX = (ctypes.c_ushort * cRX)()
+    _ThrowIfError(_dwf.FDwfDigitalSpiRead16(hdwf, cDQ, cBitPerWord, out_rgRX, cRX))
+    return list(out_rgRX)
 
 # DWFAPI int FDwfDigitalSpiRead32(HDWF hdwf, int cDQ, int cBitPerWord, unsigned int *rgRX, int cRX);
-def DigitalSpiRead32(hdwf: int, cDQ: int, cBitPerWord: int, cRX: int) -> int:
+def DigitalSpiRead32(hdwf: int, cDQ: int, cBitPerWord: int, cRX: int) -> List[int]:
     '''
     Performs SPI read of up to 32-bit words. See FDwfDigitalSpiWriteRead for
     more information.
     '''
-    out_rgRX = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalSpiRead32(ctypes.c_int(hdwf), ctypes.c_int(cDQ), ctypes.c_int(cBitPerWord), ctypes.c_int(cRX), ctypes.byref(out_rgRX)))
-    return int(out_rgRX.value)
+    out_rgRX = (ctypes.c_uint * cRX)()
+    _ThrowIfError(_dwf.FDwfDigitalSpiRead32(hdwf, cDQ, cBitPerWord, out_rgRX, cRX))
+    return list(out_rgRX)
 
 # DWFAPI int FDwfDigitalSpiWrite(HDWF hdwf, int cDQ, int cBitPerWord, unsigned char *rgTX, int cTX);
-def DigitalSpiWrite(hdwf: int, cDQ: int, cBitPerWord: int, cTX: int) -> int:
+def DigitalSpiWrite(hdwf: int, cDQ: int, cBitPerWord: int, write_data: List[int]) -> None:
     '''
     Performs SPI transmission of up to 8-bit words. See FDwfDigitalSpiWriteRead
     for more information.
     '''
-    out_rgTX = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalSpiWrite(ctypes.c_int(hdwf), ctypes.c_int(cDQ), ctypes.c_int(cBitPerWord), ctypes.c_int(cTX), ctypes.byref(out_rgTX)))
-    return int(out_rgTX.value)
+    local_write_data = (ctypes.c_ubyte * len(write_data))(*write_data)
+    _ThrowIfError(_dwf.FDwfDigitalSpiWrite(hdwf, cDQ, cBitPerWord, local_write_data, len(write_data)))
 
 # DWFAPI int FDwfDigitalSpiWriteOne(HDWF hdwf, int cDQ, int cBits, unsigned int vTX);
 def DigitalSpiWriteOne(hdwf: int, cDQ: int, cBits: int, vTX: int) -> None:
@@ -3582,34 +3854,32 @@ def DigitalSpiWriteOne(hdwf: int, cDQ: int, cBits: int, vTX: int) -> None:
     Performs SPI transmit of up to 32 bits. See FDwfDigitalSpiWriteRead for more
     information.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalSpiWriteOne(ctypes.c_int(hdwf), ctypes.c_int(cDQ), ctypes.c_int(cBits), ctypes.c_uint(vTX)))
+    _ThrowIfError(_dwf.FDwfDigitalSpiWriteOne(hdwf, cDQ, cBits, vTX))
 
 # DWFAPI int FDwfDigitalSpiWrite16(HDWF hdwf, int cDQ, int cBitPerWord, unsigned short *rgTX, int cTX);
-def DigitalSpiWrite16(hdwf: int, cDQ: int, cBitPerWord: int, cTX: int) -> int:
+def DigitalSpiWrite16(hdwf: int, cDQ: int, cBitPerWord: int, write_data: List[int]) -> None:
     '''
     Performs SPI read of up to 16-bit words. See FDwfDigitalSpiWriteRead for
     more information.
     '''
-    out_rgTX = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalSpiWrite16(ctypes.c_int(hdwf), ctypes.c_int(cDQ), ctypes.c_int(cBitPerWord), ctypes.c_int(cTX), ctypes.byref(out_rgTX)))
-    return int(out_rgTX.value)
+    local_write_data = (ctypes.c_ushort * len(write_data))(*write_data)
+    _ThrowIfError(_dwf.FDwfDigitalSpiWrite16(hdwf, cDQ, cBitPerWord, local_write_data, len(write_data)))
 
 # DWFAPI int FDwfDigitalSpiWrite32(HDWF hdwf, int cDQ, int cBitPerWord, unsigned int *rgTX, int cTX);
-def DigitalSpiWrite32(hdwf: int, cDQ: int, cBitPerWord: int, cTX: int) -> int:
+def DigitalSpiWrite32(hdwf: int, cDQ: int, cBitPerWord: int, write_data: List[int]) -> None:
     '''
     Performs SPI read of up to 32-bit words. See FDwfDigitalSpiWriteRead for
     more information.
     '''
-    out_rgTX = c_uint(0)
-    _ThrowIfError(_dwf.FDwfDigitalSpiWrite32(ctypes.c_int(hdwf), ctypes.c_int(cDQ), ctypes.c_int(cBitPerWord), ctypes.c_int(cTX), ctypes.byref(out_rgTX)))
-    return int(out_rgTX.value)
+    local_write_data = (ctypes.c_uint * len(write_data))(*write_data)
+    _ThrowIfError(_dwf.FDwfDigitalSpiWrite32(hdwf, cDQ, cBitPerWord, local_write_data, len(write_data)))
 
 # DWFAPI int FDwfDigitalI2cReset(HDWF hdwf);
 def DigitalI2cReset(hdwf: int) -> None:
     '''
     Resets the I2C configuration to default value.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalI2cReset(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfDigitalI2cReset(hdwf))
 
 # DWFAPI int FDwfDigitalI2cClear(HDWF hdwf, int *pfFree);
 def DigitalI2cClear(hdwf: int) -> int:
@@ -3618,7 +3888,7 @@ def DigitalI2cClear(hdwf: int) -> int:
     non-zero value if the bus is free.
     '''
     out_free = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalI2cClear(ctypes.c_int(hdwf), ctypes.byref(out_free)))
+    _ThrowIfError(_dwf.FDwfDigitalI2cClear(hdwf, ctypes.byref(out_free)))
     return int(out_free.value)
 
 # DWFAPI int FDwfDigitalI2cStretchSet(HDWF hdwf, int fEnable);
@@ -3626,14 +3896,14 @@ def DigitalI2cStretchSet(hdwf: int, enable: bool) -> None:
     '''
     Enables or disables clock stretching.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalI2cStretchSet(ctypes.c_int(hdwf), ctypes.c_int(enable)))
+    _ThrowIfError(_dwf.FDwfDigitalI2cStretchSet(hdwf, enable))
 
 # DWFAPI int FDwfDigitalI2cRateSet(HDWF hdwf, double hz);
 def DigitalI2cRateSet(hdwf: int, hz: float) -> None:
     '''
     Sets the data rate.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalI2cRateSet(ctypes.c_int(hdwf), ctypes.c_double(hz)))
+    _ThrowIfError(_dwf.FDwfDigitalI2cRateSet(hdwf, hz))
 
 # DWFAPI int FDwfDigitalI2cReadNakSet(HDWF hdwf, int fNakLastReadByte);
 def DigitalI2cReadNakSet(hdwf: int, fNakLastReadByte: int) -> None:
@@ -3641,21 +3911,21 @@ def DigitalI2cReadNakSet(hdwf: int, fNakLastReadByte: int) -> None:
     Specifies if the last read byte should be acknowledged or not. The I2C
     specifications require NAK, this parameter set to true.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalI2cReadNakSet(ctypes.c_int(hdwf), ctypes.c_int(fNakLastReadByte)))
+    _ThrowIfError(_dwf.FDwfDigitalI2cReadNakSet(hdwf, fNakLastReadByte))
 
 # DWFAPI int FDwfDigitalI2cSclSet(HDWF hdwf, int idxChannel);
 def DigitalI2cSclSet(hdwf: int, channel_index: int) -> None:
     '''
     Specifies the DIO channel to use for I2C clock.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalI2cSclSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index)))
+    _ThrowIfError(_dwf.FDwfDigitalI2cSclSet(hdwf, channel_index))
 
 # DWFAPI int FDwfDigitalI2cSdaSet(HDWF hdwf, int idxChannel);
 def DigitalI2cSdaSet(hdwf: int, channel_index: int) -> None:
     '''
     Specifies the DIO channel to use for I2C data.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalI2cSdaSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index)))
+    _ThrowIfError(_dwf.FDwfDigitalI2cSdaSet(hdwf, channel_index))
 
 # DWFAPI int FDwfDigitalI2cWriteRead(HDWF hdwf, unsigned char adr8bits, unsigned char *rgbTx, int cTx, unsigned char *rgRx, int cRx, int *pNak);
 def DigitalI2cWriteRead(hdwf: int, address: int, write_data: List[int], read_data_size: int) -> (List[int], int):
@@ -3668,40 +3938,71 @@ def DigitalI2cWriteRead(hdwf: int, address: int, write_data: List[int], read_dat
     the first address is acknowledged it returns 1. Returns negative value for
     other communication failures like timeout.
     '''
-    read_data = []
-    out_nak = ctypes.c_int(0)
-    out_read_data = (ctypes.c_uint8 * read_data_size)()
-    write_data_len = ctypes.c_int(len(write_data))
-    local_write_data = (ctypes.c_uint8 * write_data_len.value)(*write_data)
+    read_data, nak = DigitalI2cWriteReadBytes(hdwf, address, write_data, read_data_size)
+    return (list(read_data), nak)
 
-    _ThrowIfError(_dwf.FDwfDigitalI2cWriteRead(ctypes.c_int(hdwf), ctypes.c_int(address<<1), local_write_data, write_data_len, ctypes.byref(out_read_data), ctypes.c_int(read_data_size), ctypes.byref(out_nak)))
+def DigitalI2cWriteReadInto(hdwf: int, address: int, write_data, read_buffer, read_data_size: int = None) -> int:
+    '''
+    Performs DigitalI2cWriteRead, reading straight into read_buffer, a writable
+    buffer such as a bytearray, memoryview or NumPy array. read_data_size bytes
+    are read, the whole buffer by default. write_data is a list of ints or any
+    bytes-like object. Returns the NAK index.
+    '''
+    rgbTx, cTx = _WriteBytes(write_data)
+    rgRx, cRx = _BufferAsBytes(read_buffer, read_data_size)
+    out_nak, out_nak_reference = _ScratchNak()
+    _ThrowIfError(_dwf.FDwfDigitalI2cWriteRead(hdwf, address<<1, rgbTx, cTx, rgRx, cRx, out_nak_reference))
+    return int(out_nak.value)
 
-    #if (out_nak.value != 0):
-    #    print("Device Data NAK " + str(out_nak.value))
-    for i in range(read_data_size): read_data.append(out_read_data[i])
-    return (read_data, int(out_nak.value))
+def DigitalI2cWriteReadBytes(hdwf: int, address: int, write_data, read_data_size: int) -> (bytes, int):
+    '''
+    Performs DigitalI2cWriteRead and returns the bytes read along with the NAK
+    index. The transfer uses scratch arrays kept per thread; only the returned
+    bytes object is allocated.
+    '''
+    rgbTx, cTx = _WriteBytes(write_data)
+    rgRx = _ScratchBytes('rx', read_data_size)
+    out_nak, out_nak_reference = _ScratchNak()
+    _ThrowIfError(_dwf.FDwfDigitalI2cWriteRead(hdwf, address<<1, rgbTx, cTx, rgRx, read_data_size, out_nak_reference))
+    return (ctypes.string_at(rgRx, read_data_size), int(out_nak.value))
 
 # DWFAPI int FDwfDigitalI2cRead(HDWF hdwf, unsigned char adr8bits, unsigned char *rgbRx, int cRx, int *pNak);
-def DigitalI2cRead(hdwf: int, address: int, read_data_size: int) -> (int, int):
+def DigitalI2cRead(hdwf: int, address: int, read_data_size: int) -> (List[int], int):
     '''
     Performs I2C read. See DwfDigitalI2cWriteRead function for more information.
     '''
-    read_data = []
-    out_nak = ctypes.c_int(0)
-    out_read_data = (ctypes.c_uint8 * read_data_size)()
-    _ThrowIfError(_dwf.FDwfDigitalI2cRead(ctypes.c_int(hdwf), ctypes.c_int(address<<1), ctypes.byref(out_read_data), ctypes.c_int(read_data_size), ctypes.byref(out_nak)))
-    return (read_data, int(out_nak.value))
+    read_data, nak = DigitalI2cReadBytes(hdwf, address, read_data_size)
+    return (list(read_data), nak)
+
+def DigitalI2cReadInto(hdwf: int, address: int, read_buffer, read_data_size: int = None) -> int:
+    '''
+    Performs DigitalI2cRead straight into read_buffer. See
+    DigitalI2cWriteReadInto for more information.
+    '''
+    rgRx, cRx = _BufferAsBytes(read_buffer, read_data_size)
+    out_nak, out_nak_reference = _ScratchNak()
+    _ThrowIfError(_dwf.FDwfDigitalI2cRead(hdwf, address<<1, rgRx, cRx, out_nak_reference))
+    return int(out_nak.value)
+
+def DigitalI2cReadBytes(hdwf: int, address: int, read_data_size: int) -> (bytes, int):
+    '''
+    Performs DigitalI2cRead and returns the bytes read along with the NAK index.
+    See DigitalI2cWriteReadBytes for more information.
+    '''
+    rgRx = _ScratchBytes('rx', read_data_size)
+    out_nak, out_nak_reference = _ScratchNak()
+    _ThrowIfError(_dwf.FDwfDigitalI2cRead(hdwf, address<<1, rgRx, read_data_size, out_nak_reference))
+    return (ctypes.string_at(rgRx, read_data_size), int(out_nak.value))
 
 # DWFAPI int FDwfDigitalI2cWrite(HDWF hdwf, unsigned char adr8bits, unsigned char *rgbTx, int cTx, int *pNak);
-def DigitalI2cWrite(hdwf: int, address: int, write_data: List[int]) -> int:
+def DigitalI2cWrite(hdwf: int, address: int, write_data) -> int:
     '''
     Performs I2C write. See DwfDigitalI2cWriteRead function for more
-    information.
+    information. write_data is a list of ints or any bytes-like object.
     '''
-    out_nak = ctypes.c_int(0)
-    write_data_len = ctypes.c_int(len(write_data))
-    local_write_data = (ctypes.c_uint8 * write_data_len.value)(*write_data)
-    _ThrowIfError(_dwf.FDwfDigitalI2cWrite(ctypes.c_int(hdwf), ctypes.c_int(address<<1), local_write_data, write_data_len, ctypes.byref(out_nak)))
+    rgbTx, cTx = _WriteBytes(write_data)
+    out_nak, out_nak_reference = _ScratchNak()
+    _ThrowIfError(_dwf.FDwfDigitalI2cWrite(hdwf, address<<1, rgbTx, cTx, out_nak_reference))
     return int(out_nak.value)
 
 # DWFAPI int FDwfDigitalI2cWriteOne(HDWF hdwf, unsigned char adr8bits, unsigned char bTx, int *pNak);
@@ -3711,57 +4012,69 @@ def DigitalI2cWriteOne(hdwf: int, address: int, write_data: int) -> int:
     information.
     '''
     out_nak = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalI2cWriteOne(ctypes.c_int(hdwf), ctypes.c_int(address<<1), ctypes.c_int(write_data), ctypes.byref(out_nak)))
+    _ThrowIfError(_dwf.FDwfDigitalI2cWriteOne(hdwf, address<<1, write_data, ctypes.byref(out_nak)))
     return int(out_nak.value)
 
+def DigitalI2cWriteReadPrepared(hdwf: int, address: int, rgbTx, cTx: int, rgRx, cRx: int, pNak) -> None:
+    '''
+    Performs DigitalI2cWriteRead with arguments that are already in their ctypes
+    form: rgbTx and rgRx are c_ubyte arrays (or None for zero bytes) and pNak is
+    ctypes.byref of a c_int that receives the NAK index. Callers that repeat
+    the same transfers prepare the arrays once and skip the conversions.
+    '''
+    _ThrowIfError(_dwf.FDwfDigitalI2cWriteRead(hdwf, address<<1, rgbTx, cTx, rgRx, cRx, pNak))
+
 # DWFAPI int FDwfDigitalCanReset(HDWF hdwf);
 def DigitalCanReset(hdwf: int) -> None:
     '''
     Resets the CAN configuration to default value. Use FDwfDigitalOutReset to
     reset the output.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalCanReset(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfDigitalCanReset(hdwf))
 
 # DWFAPI int FDwfDigitalCanRateSet(HDWF hdwf, double hz);
 def DigitalCanRateSet(hdwf: int, hz: float) -> None:
     '''
     Sets the data rate.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalCanRateSet(ctypes.c_int(hdwf), ctypes.c_double(hz)))
+    _ThrowIfError(_dwf.FDwfDigitalCanRateSet(hdwf, hz))
 
 # DWFAPI int FDwfDigitalCanPolaritySet(HDWF hdwf, int fHigh); # 0 low, 1 high
 def DigitalCanPolaritySet(hdwf: int, fHigh: int) -> None:
     '''
     Sets the signal polarity.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalCanPolaritySet(ctypes.c_int(hdwf), ctypes.c_int(fHigh)))
+    _ThrowIfError(_dwf.FDwfDigitalCanPolaritySet(hdwf, fHigh))
 
 # DWFAPI int FDwfDigitalCanTxSet(HDWF hdwf, int idxChannel);
 def DigitalCanTxSet(hdwf: int, channel_index: int) -> None:
     '''
     Specifies the DIO channel to use for transmission.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalCanTxSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index)))
+    _ThrowIfError(_dwf.FDwfDigitalCanTxSet(hdwf, channel_index))
 
 # DWFAPI int FDwfDigitalCanRxSet(HDWF hdwf, int idxChannel);
 def DigitalCanRxSet(hdwf: int, channel_index: int) -> None:
     '''
     Specifies the DIO channel to use for reception.
     '''
-    _ThrowIfError(_dwf.FDwfDigitalCanRxSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index)))
+    _ThrowIfError(_dwf.FDwfDigitalCanRxSet(hdwf, channel_index))
 
 # DWFAPI int FDwfDigitalCanTx(HDWF hdwf, int vID, int fExtended, int fRemote, int cDLC, unsigned char *rgTX);
-def DigitalCanTx(hdwf: int, vID: int, fExtended: int, fRemote: int, cDLC: int) -> int:
+def DigitalCanTx(hdwf: int, vID: int, fExtended: int, fRemote: int, cDLC: int, data: List[int] = None) -> None:
     '''
-    Performs a CAN transmission. Specifying -1 for vID it initializes the TX
-    channel.
+    Performs a CAN transmission of up to 8 data bytes. Specifying -1 for vID
+    it initializes the TX channel, and data can be omitted.
     '''
-    out_rgTX = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalCanTx(ctypes.c_int(hdwf), ctypes.c_int(vID), ctypes.c_int(fExtended), ctypes.c_int(fRemote), ctypes.c_int(cDLC), ctypes.byref(out_rgTX)))
-    return int(out_rgTX.value)
+    if (data is None):
+        data = []
+    if (len(data) > 8):
+        raise ValueError("a CAN frame carries at most 8 data bytes, got %d" % len(data))
+    local_data = (ctypes.c_ubyte * 8)(*data)
+    _ThrowIfError(_dwf.FDwfDigitalCanTx(hdwf, vID, fExtended, fRemote, cDLC, local_data))
 
 # DWFAPI int FDwfDigitalCanRx(HDWF hdwf, int *pvID, int *pfExtended, int *pfRemote, int *pcDLC, unsigned char *rgRX, int cRX, int *pvStatus);
-def DigitalCanRx(hdwf: int, cRX: int) -> (int, int, int, int, int, int):
+def DigitalCanRx(hdwf: int, cRX: int) -> (int, int, int, int, List[int], int):
     '''
     Returns the received frames since the last call. With cRX zero initializes
     the reception.
@@ -3770,24 +4083,24 @@ def DigitalCanRx(hdwf: int, cRX: int) -> (int, int, int, int, int, int):
     out_fExtended = ctypes.c_int(0)
     out_fRemote = ctypes.c_int(0)
     out_cDLC = ctypes.c_int(0)
-    out_rgRX = ctypes.c_int(0)
+    out_rgRX = (ctypes.c_ubyte * cRX)()
     out_vStatus = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalCanRx(ctypes.c_int(hdwf), ctypes.c_int(cRX), ctypes.byref(out_vID), ctypes.byref(out_fExtended), ctypes.byref(out_fRemote), ctypes.byref(out_cDLC), ctypes.byref(out_rgRX), ctypes.byref(out_vStatus)))
-    return int(out_vID.value), int(out_fExtended.value), int(out_fRemote.value), int(out_cDLC.value), int(out_rgRX.value), int(out_vStatus.value)
+    _ThrowIfError(_dwf.FDwfDigitalCanRx(hdwf, ctypes.byref(out_vID), ctypes.byref(out_fExtended), ctypes.byref(out_fRemote), ctypes.byref(out_cDLC), out_rgRX, cRX, ctypes.byref(out_vStatus)))
+    return int(out_vID.value), int(out_fExtended.value), int(out_fRemote.value), int(out_cDLC.value), list(out_rgRX[:out_cDLC.value]), int(out_vStatus.value)
 
 # DWFAPI int FDwfAnalogImpedanceReset(HDWF hdwf);
 def AnalogImpedanceReset(hdwf: int) -> None:
     '''
     Resets the AI configuration to default value.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceReset(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceReset(hdwf))
 
 # DWFAPI int FDwfAnalogImpedanceModeSet(HDWF hdwf, int mode); # 0 W1-C1-DUT-C2-R-GND, 1 W1-C1-R-C2-DUT-GND, 8 Impedance Analyzer for AD
 def AnalogImpedanceModeSet(hdwf: int, mode: int) -> None:
     '''
     Specifies the circuit to be used.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceModeSet(ctypes.c_int(hdwf), ctypes.c_int(mode)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceModeSet(hdwf, mode))
 
 # DWFAPI int FDwfAnalogImpedanceModeGet(HDWF hdwf, int *mode);
 def AnalogImpedanceModeGet(hdwf: int) -> int:
@@ -3795,7 +4108,7 @@ def AnalogImpedanceModeGet(hdwf: int) -> int:
     Returns the selected circuit model.
     '''
     out_mode = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceModeGet(ctypes.c_int(hdwf), ctypes.byref(out_mode)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceModeGet(hdwf, ctypes.byref(out_mode)))
     return int(out_mode.value)
 
 # DWFAPI int FDwfAnalogImpedanceReferenceSet(HDWF hdwf, double ohms);
@@ -3804,7 +4117,7 @@ def AnalogImpedanceReferenceSet(hdwf: int, ohms: float) -> None:
     Specifies the reference resistor to be used. For AD IA module the resistor
     is selected by relays controlled by power supplies and digital IOs.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceReferenceSet(ctypes.c_int(hdwf), ctypes.c_double(ohms)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceReferenceSet(hdwf, ohms))
 
 # DWFAPI int FDwfAnalogImpedanceReferenceGet(HDWF hdwf, double *pohms);
 def AnalogImpedanceReferenceGet(hdwf: int) -> float:
@@ -3812,7 +4125,7 @@ def AnalogImpedanceReferenceGet(hdwf: int) -> float:
     Returns the reference resistor value.
     '''
     out_ohms = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceReferenceGet(ctypes.c_int(hdwf), ctypes.byref(out_ohms)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceReferenceGet(hdwf, ctypes.byref(out_ohms)))
     return float(out_ohms.value)
 
 # DWFAPI int FDwfAnalogImpedanceFrequencySet(HDWF hdwf, double hz);
@@ -3820,7 +4133,7 @@ def AnalogImpedanceFrequencySet(hdwf: int, hz: float) -> None:
     '''
     Configures the stimulus frequency.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceFrequencySet(ctypes.c_int(hdwf), ctypes.c_double(hz)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceFrequencySet(hdwf, hz))
 
 # DWFAPI int FDwfAnalogImpedanceFrequencyGet(HDWF hdwf, double *phz);
 def AnalogImpedanceFrequencyGet(hdwf: int) -> float:
@@ -3828,7 +4141,7 @@ def AnalogImpedanceFrequencyGet(hdwf: int) -> float:
     Returns the frequency value.
     '''
     out_hz = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceFrequencyGet(ctypes.c_int(hdwf), ctypes.byref(out_hz)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceFrequencyGet(hdwf, ctypes.byref(out_hz)))
     return float(out_hz.value)
 
 # DWFAPI int FDwfAnalogImpedanceAmplitudeSet(HDWF hdwf, double volts);
@@ -3836,7 +4149,7 @@ def AnalogImpedanceAmplitudeSet(hdwf: int, volts: float) -> None:
     '''
     Configures the stimulus signal amplitude, half of the peak to peak value.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceAmplitudeSet(ctypes.c_int(hdwf), ctypes.c_double(volts)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceAmplitudeSet(hdwf, volts))
 
 # DWFAPI int FDwfAnalogImpedanceAmplitudeGet(HDWF hdwf, double *pvolts);
 def AnalogImpedanceAmplitudeGet(hdwf: int) -> float:
@@ -3844,7 +4157,7 @@ def AnalogImpedanceAmplitudeGet(hdwf: int) -> float:
     Returns the amplitude value.
     '''
     out_volts = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceAmplitudeGet(ctypes.c_int(hdwf), ctypes.byref(out_volts)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceAmplitudeGet(hdwf, ctypes.byref(out_volts)))
     return float(out_volts.value)
 
 # DWFAPI int FDwfAnalogImpedanceOffsetSet(HDWF hdwf, double volts);
@@ -3852,7 +4165,7 @@ def AnalogImpedanceOffsetSet(hdwf: int, volts: float) -> None:
     '''
     Configures the stimulus signal offset.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceOffsetSet(ctypes.c_int(hdwf), ctypes.c_double(volts)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceOffsetSet(hdwf, volts))
 
 # DWFAPI int FDwfAnalogImpedanceOffsetGet(HDWF hdwf, double *pvolts);
 def AnalogImpedanceOffsetGet(hdwf: int) -> float:
@@ -3860,7 +4173,7 @@ def AnalogImpedanceOffsetGet(hdwf: int) -> float:
     Returns the offset value.
     '''
     out_volts = ctypes.c_double(0)
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceOffsetGet(ctypes.c_int(hdwf), ctypes.byref(out_volts)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceOffsetGet(hdwf, ctypes.byref(out_volts)))
     return float(out_volts.value)
 
 # DWFAPI int FDwfAnalogImpedanceProbeSet(HDWF hdwf, double ohmRes, double faradCap);
@@ -3870,7 +4183,7 @@ def AnalogImpedanceProbeSet(hdwf: int, ohmRes: float, faradCap: float) -> None:
     measurements. The default values are set specific for device when calling
     the FDwfAnalogImpedanceReset function.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceProbeSet(ctypes.c_int(hdwf), ctypes.c_double(ohmRes), ctypes.c_double(faradCap)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceProbeSet(hdwf, ohmRes, faradCap))
 
 # DWFAPI int FDwfAnalogImpedanceProbeGet(HDWF hdwf, double *pohmRes, double *pfaradCap);
 def AnalogImpedanceProbeGet(hdwf: int) -> (float, float):
@@ -3879,7 +4192,7 @@ def AnalogImpedanceProbeGet(hdwf: int) -> (float, float):
     '''
     out_ohmRes = ctypes.c_double(0.0)
     out_faradCap = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceProbeGet(ctypes.c_int(hdwf), ctypes.byref(out_ohmRes), ctypes.byref(out_faradCap)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceProbeGet(hdwf, ctypes.byref(out_ohmRes), ctypes.byref(out_faradCap)))
     return float(out_ohmRes.value), float(out_faradCap.value)
 
 # DWFAPI int FDwfAnalogImpedancePeriodSet(HDWF hdwf, int cMinPeriods);
@@ -3887,7 +4200,7 @@ def AnalogImpedancePeriodSet(hdwf: int, min_period: int) -> None:
     '''
     Specifies the minimum number of periods to be captured.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogImpedancePeriodSet(ctypes.c_int(hdwf), ctypes.c_int(min_period)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedancePeriodSet(hdwf, min_period))
 
 # DWFAPI int FDwfAnalogImpedancePeriodGet(HDWF hdwf, int *cMinPeriods);
 def AnalogImpedancePeriodGet(hdwf: int) -> int:
@@ -3895,7 +4208,7 @@ def AnalogImpedancePeriodGet(hdwf: int) -> int:
     Returns the periods value.
     '''
     out_min_period = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogImpedancePeriodGet(ctypes.c_int(hdwf), ctypes.byref(out_min_period)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedancePeriodGet(hdwf, ctypes.byref(out_min_period)))
     return int(out_min_period.value)
 
 # DWFAPI int FDwfAnalogImpedanceCompReset(HDWF hdwf);
@@ -3903,7 +4216,7 @@ def AnalogImpedanceCompReset(hdwf: int) -> None:
     '''
     Resets the currently configured compensation parameters.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceCompReset(ctypes.c_int(hdwf)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceCompReset(hdwf))
 
 # DWFAPI int FDwfAnalogImpedanceCompSet(HDWF hdwf, double ohmOpenResistance, double ohmOpenReactance, double ohmShortResistance, double ohmShortReactance);
 def AnalogImpedanceCompSet(hdwf: int, ohmOpenResistance: float, ohmOpenReactance: float, ohmShortResistance: float, ohmShortReactance: float) -> None:
@@ -3911,7 +4224,7 @@ def AnalogImpedanceCompSet(hdwf: int, ohmOpenResistance: float, ohmOpenReactance
     Specifies the open and short compensation parameters. These values are
     specific for the circuit/adapter.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceCompSet(ctypes.c_int(hdwf), ctypes.c_double(ohmOpenResistance), ctypes.c_double(ohmOpenReactance), ctypes.c_double(ohmShortResistance), ctypes.c_double(ohmShortReactance)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceCompSet(hdwf, ohmOpenResistance, ohmOpenReactance, ohmShortResistance, ohmShortReactance))
 
 # DWFAPI int FDwfAnalogImpedanceCompGet(HDWF hdwf, double *pohmOpenResistance, double *pohmOpenReactance, double *pohmShortResistance, double *pohmShortReactance);
 def AnalogImpedanceCompGet(hdwf: int) -> (float, float, float, float):
@@ -3922,21 +4235,21 @@ def AnalogImpedanceCompGet(hdwf: int) -> (float, float, float, float):
     out_ohmOpenReactance = ctypes.c_double(0.0)
     out_ohmShortResistance = ctypes.c_double(0.0)
     out_ohmShortReactance = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceCompGet(ctypes.c_int(hdwf), ctypes.byref(out_ohmOpenResistance), ctypes.byref(out_ohmOpenReactance), ctypes.byref(out_ohmShortResistance), ctypes.byref(out_ohmShortReactance)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceCompGet(hdwf, ctypes.byref(out_ohmOpenResistance), ctypes.byref(out_ohmOpenReactance), ctypes.byref(out_ohmShortResistance), ctypes.byref(out_ohmShortReactance)))
     return float(out_ohmOpenResistance.value), float(out_ohmOpenReactance.value), float(out_ohmShortResistance.value), float(out_ohmShortReactance.value)
 
 # DWFAPI int FDwfAnalogImpedanceConfigure(HDWF hdwf, int fStart); # 1 start, 0 stop
 # Warning no docs found for FDwfAnalogImpedanceConfigure
 def AnalogImpedanceConfigure(hdwf: int, fStart: int) -> None:
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceConfigure(ctypes.c_int(hdwf), ctypes.c_int(fStart)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceConfigure(hdwf, fStart))
 
 # DWFAPI int FDwfAnalogImpedanceStatus(HDWF hdwf, DwfState *psts);
 def AnalogImpedanceStatus(hdwf: int) -> int:
     '''
     Checks the state of the acquisition.
     '''
-    out_instrument_state = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceStatus(ctypes.c_int(hdwf), ctypes.byref(out_instrument_state)))
+    out_instrument_state = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceStatus(hdwf, ctypes.byref(out_instrument_state)))
     return int(out_instrument_state.value)
 
 # DWFAPI int FDwfAnalogImpedanceStatusInput(HDWF hdwf, int idxChannel, double *pgain, double *pradian);
@@ -3951,7 +4264,7 @@ def AnalogImpedanceStatusInput(hdwf: int, channel_index: int) -> (float, float):
     '''
     out_gain = ctypes.c_double(0.0)
     out_radian = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceStatusInput(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_gain), ctypes.byref(out_radian)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceStatusInput(hdwf, channel_index, ctypes.byref(out_gain), ctypes.byref(out_radian)))
     return float(out_gain.value), float(out_radian.value)
 
 # DWFAPI int FDwfAnalogImpedanceStatusMeasure(HDWF hdwf, DwfAnalogImpedance measure, double *pvalue);
@@ -3961,7 +4274,7 @@ def AnalogImpedanceStatusMeasure(hdwf: int, measure: int) -> float:
     characteristics and compensation parameters.
     '''
     out_value = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogImpedanceStatusMeasure(ctypes.c_int(hdwf), ctypes.c_int(measure), ctypes.byref(out_value)))
+    _ThrowIfError(_dwf.FDwfAnalogImpedanceStatusMeasure(hdwf, measure, ctypes.byref(out_value)))
     return float(out_value.value)
 
 # OBSOLETE but supported, avoid using the following in new projects:
@@ -3972,7 +4285,7 @@ def AnalogImpedanceStatusMeasure(hdwf: int, measure: int) -> float:
 # DWFAPI int FDwfDigitalInMixedSet(HDWF hdwf, int fEnable);
 # Warning no docs found for FDwfDigitalInMixedSet
 def DigitalInMixedSet(hdwf: int, enable: int) -> None:
-    _ThrowIfError(_dwf.FDwfDigitalInMixedSet(ctypes.c_int(hdwf), ctypes.c_int(enable)))
+    _ThrowIfError(_dwf.FDwfDigitalInMixedSet(hdwf, enable))
 
 # use DwfTriggerSlope
 # typedef int TRIGCOND;
@@ -3987,28 +4300,28 @@ class TriggerCondition(IntEnum):
 # Warning no docs found for FDwfAnalogInTriggerSourceInfo
 def AnalogInTriggerSourceInfo(hdwf: int) -> int:
     out_fstrigsrc = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogInTriggerSourceInfo(ctypes.c_int(hdwf), ctypes.byref(out_fstrigsrc)))
+    _ThrowIfError(_dwf.FDwfAnalogInTriggerSourceInfo(hdwf, ctypes.byref(out_fstrigsrc)))
     return int(out_fstrigsrc.value)
 
 # DWFAPI int FDwfAnalogOutTriggerSourceInfo(HDWF hdwf, int idxChannel, int *pfstrigsrc); # use IsBitSet
 # Warning no docs found for FDwfAnalogOutTriggerSourceInfo
 def AnalogOutTriggerSourceInfo(hdwf: int, channel_index: int) -> int:
     out_fstrigsrc = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutTriggerSourceInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_fstrigsrc)))
+    _ThrowIfError(_dwf.FDwfAnalogOutTriggerSourceInfo(hdwf, channel_index, ctypes.byref(out_fstrigsrc)))
     return int(out_fstrigsrc.value)
 
 # DWFAPI int FDwfDigitalInTriggerSourceInfo(HDWF hdwf, int *pfstrigsrc); # use IsBitSet
 # Warning no docs found for FDwfDigitalInTriggerSourceInfo
 def DigitalInTriggerSourceInfo(hdwf: int) -> int:
     out_fstrigsrc = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalInTriggerSourceInfo(ctypes.c_int(hdwf), ctypes.byref(out_fstrigsrc)))
+    _ThrowIfError(_dwf.FDwfDigitalInTriggerSourceInfo(hdwf, ctypes.byref(out_fstrigsrc)))
     return int(out_fstrigsrc.value)
 
 # DWFAPI int FDwfDigitalOutTriggerSourceInfo(HDWF hdwf, int *pfstrigsrc); # use IsBitSet
 # Warning no docs found for FDwfDigitalOutTriggerSourceInfo
 def DigitalOutTriggerSourceInfo(hdwf: int) -> int:
     out_fstrigsrc = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfDigitalOutTriggerSourceInfo(ctypes.c_int(hdwf), ctypes.byref(out_fstrigsrc)))
+    _ThrowIfError(_dwf.FDwfDigitalOutTriggerSourceInfo(hdwf, ctypes.byref(out_fstrigsrc)))
     return int(out_fstrigsrc.value)
 
 # use DwfState
@@ -4036,7 +4349,7 @@ def AnalogOutEnableSet(hdwf: int, channel_index: int, enable: int) -> None:
     -1, each Analog Out channel enable will be configured to use the same, new
     option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutEnableSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(enable)))
+    _ThrowIfError(_dwf.FDwfAnalogOutEnableSet(hdwf, channel_index, enable))
 
 # DWFAPI int FDwfAnalogOutEnableGet(HDWF hdwf, int idxChannel, int *pfEnable);
 def AnalogOutEnableGet(hdwf: int, channel_index: int) -> int:
@@ -4044,7 +4357,7 @@ def AnalogOutEnableGet(hdwf: int, channel_index: int) -> int:
     Verifies if a specific channel is enabled or disabled.
     '''
     out_enable = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutEnableGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_enable)))
+    _ThrowIfError(_dwf.FDwfAnalogOutEnableGet(hdwf, channel_index, ctypes.byref(out_enable)))
     return int(out_enable.value)
 
 # DWFAPI int FDwfAnalogOutFunctionInfo(HDWF hdwf, int idxChannel, unsigned int *pfsfunc); # use IsBitSet
@@ -4055,8 +4368,8 @@ def AnalogOutFunctionInfo(hdwf: int, channel_index: int) -> int:
     Macro. Individual bits are defined using the FUNC constants in dwf.h. These
     are:
     '''
-    out_fsfunc = c_uint(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutFunctionInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_fsfunc)))
+    out_fsfunc = ctypes.c_uint(0)
+    _ThrowIfError(_dwf.FDwfAnalogOutFunctionInfo(hdwf, channel_index, ctypes.byref(out_fsfunc)))
     return int(out_fsfunc.value)
 
 # DWFAPI int FDwfAnalogOutFunctionSet(HDWF hdwf, int idxChannel, FUNC func);
@@ -4066,7 +4379,7 @@ def AnalogOutFunctionSet(hdwf: int, channel_index: int, func: int) -> None:
     With channel index -1, each enabled Analog Out channel function will be
     configured to use the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutFunctionSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(func)))
+    _ThrowIfError(_dwf.FDwfAnalogOutFunctionSet(hdwf, channel_index, func))
 
 # DWFAPI int FDwfAnalogOutFunctionGet(HDWF hdwf, int idxChannel, FUNC *pfunc);
 def AnalogOutFunctionGet(hdwf: int, channel_index: int) -> int:
@@ -4074,8 +4387,8 @@ def AnalogOutFunctionGet(hdwf: int, channel_index: int) -> int:
     Retrieves the current generator function option for the specified instrument
     channel.
     '''
-    out_func = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutFunctionGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_func)))
+    out_func = ctypes.c_ubyte(0)
+    _ThrowIfError(_dwf.FDwfAnalogOutFunctionGet(hdwf, channel_index, ctypes.byref(out_func)))
     return int(out_func.value)
 
 # DWFAPI int FDwfAnalogOutFrequencyInfo(HDWF hdwf, int idxChannel, double *phzMin, double *phzMax);
@@ -4088,7 +4401,7 @@ def AnalogOutFrequencyInfo(hdwf: int, channel_index: int) -> (float, float):
     '''
     out_hz_min = ctypes.c_double(0.0)
     out_hz_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutFrequencyInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_hz_min), ctypes.byref(out_hz_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutFrequencyInfo(hdwf, channel_index, ctypes.byref(out_hz_min), ctypes.byref(out_hz_max)))
     return float(out_hz_min.value), float(out_hz_max.value)
 
 # DWFAPI int FDwfAnalogOutFrequencySet(HDWF hdwf, int idxChannel, double hzFrequency);
@@ -4097,7 +4410,7 @@ def AnalogOutFrequencySet(hdwf: int, channel_index: int, frequency_in_hz: float)
     Sets the frequency. With channel index -1, each enabled Analog Out channel
     frequency will be configured to use the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutFrequencySet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_double(frequency_in_hz)))
+    _ThrowIfError(_dwf.FDwfAnalogOutFrequencySet(hdwf, channel_index, frequency_in_hz))
 
 # DWFAPI int FDwfAnalogOutFrequencyGet(HDWF hdwf, int idxChannel, double *phzFrequency);
 def AnalogOutFrequencyGet(hdwf: int, channel_index: int) -> float:
@@ -4106,7 +4419,7 @@ def AnalogOutFrequencyGet(hdwf: int, channel_index: int) -> float:
     instrument.
     '''
     out_frequency_in_hz = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutFrequencyGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_frequency_in_hz)))
+    _ThrowIfError(_dwf.FDwfAnalogOutFrequencyGet(hdwf, channel_index, ctypes.byref(out_frequency_in_hz)))
     return float(out_frequency_in_hz.value)
 
 # DWFAPI int FDwfAnalogOutAmplitudeInfo(HDWF hdwf, int idxChannel, double *pvoltsMin, double *pvoltsMax);
@@ -4118,7 +4431,7 @@ def AnalogOutAmplitudeInfo(hdwf: int, channel_index: int) -> (float, float):
     '''
     out_volts_min = ctypes.c_double(0.0)
     out_volts_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutAmplitudeInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_volts_min), ctypes.byref(out_volts_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutAmplitudeInfo(hdwf, channel_index, ctypes.byref(out_volts_min), ctypes.byref(out_volts_max)))
     return float(out_volts_min.value), float(out_volts_max.value)
 
 # DWFAPI int FDwfAnalogOutAmplitudeSet(HDWF hdwf, int idxChannel, double voltsAmplitude);
@@ -4128,7 +4441,7 @@ def AnalogOutAmplitudeSet(hdwf: int, channel_index: int, voltsAmplitude: float)
     instrument. With channel index -1, each enabled Analog Out channel amplitude
     will be configured to use the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutAmplitudeSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_double(voltsAmplitude)))
+    _ThrowIfError(_dwf.FDwfAnalogOutAmplitudeSet(hdwf, channel_index, voltsAmplitude))
 
 # DWFAPI int FDwfAnalogOutAmplitudeGet(HDWF hdwf, int idxChannel, double *pvoltsAmplitude);
 def AnalogOutAmplitudeGet(hdwf: int, channel_index: int) -> float:
@@ -4137,7 +4450,7 @@ def AnalogOutAmplitudeGet(hdwf: int, channel_index: int) -> float:
     channel on the instrument.
     '''
     out_voltsAmplitude = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutAmplitudeGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_voltsAmplitude)))
+    _ThrowIfError(_dwf.FDwfAnalogOutAmplitudeGet(hdwf, channel_index, ctypes.byref(out_voltsAmplitude)))
     return float(out_voltsAmplitude.value)
 
 # DWFAPI int FDwfAnalogOutOffsetInfo(HDWF hdwf, int idxChannel, double *pvoltsMin, double *pvoltsMax);
@@ -4147,7 +4460,7 @@ def AnalogOutOffsetInfo(hdwf: int, channel_index: int) -> (float, float):
     '''
     out_volts_min = ctypes.c_double(0.0)
     out_volts_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutOffsetInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_volts_min), ctypes.byref(out_volts_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutOffsetInfo(hdwf, channel_index, ctypes.byref(out_volts_min), ctypes.byref(out_volts_max)))
     return float(out_volts_min.value), float(out_volts_max.value)
 
 # DWFAPI int FDwfAnalogOutOffsetSet(HDWF hdwf, int idxChannel, double voltsOffset);
@@ -4157,7 +4470,7 @@ def AnalogOutOffsetSet(hdwf: int, channel_index: int, voltsOffset: float) -> Non
     channel index -1, each enabled Analog Out channel offset will be configured
     to use the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutOffsetSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_double(voltsOffset)))
+    _ThrowIfError(_dwf.FDwfAnalogOutOffsetSet(hdwf, channel_index, voltsOffset))
 
 # DWFAPI int FDwfAnalogOutOffsetGet(HDWF hdwf, int idxChannel, double *pvoltsOffset);
 def AnalogOutOffsetGet(hdwf: int, channel_index: int) -> float:
@@ -4165,7 +4478,7 @@ def AnalogOutOffsetGet(hdwf: int, channel_index: int) -> float:
     Gets the current offset value for the specified channel on the instrument.
     '''
     out_voltsOffset = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutOffsetGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_voltsOffset)))
+    _ThrowIfError(_dwf.FDwfAnalogOutOffsetGet(hdwf, channel_index, ctypes.byref(out_voltsOffset)))
     return float(out_voltsOffset.value)
 
 # DWFAPI int FDwfAnalogOutSymmetryInfo(HDWF hdwf, int idxChannel, double *ppercentageMin, double *ppercentageMax);
@@ -4177,7 +4490,7 @@ def AnalogOutSymmetryInfo(hdwf: int, channel_index: int) -> (float, float):
     '''
     out_percentage_min = ctypes.c_double(0.0)
     out_percentage_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutSymmetryInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_percentage_min), ctypes.byref(out_percentage_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutSymmetryInfo(hdwf, channel_index, ctypes.byref(out_percentage_min), ctypes.byref(out_percentage_max)))
     return float(out_percentage_min.value), float(out_percentage_max.value)
 
 # DWFAPI int FDwfAnalogOutSymmetrySet(HDWF hdwf, int idxChannel, double percentageSymmetry);
@@ -4187,7 +4500,7 @@ def AnalogOutSymmetrySet(hdwf: int, channel_index: int, percentage_symmetry: flo
     instrument. With channel index -1, each enabled Analog Out channel symmetry
     will be configured to use the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutSymmetrySet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_double(percentage_symmetry)))
+    _ThrowIfError(_dwf.FDwfAnalogOutSymmetrySet(hdwf, channel_index, percentage_symmetry))
 
 # DWFAPI int FDwfAnalogOutSymmetryGet(HDWF hdwf, int idxChannel, double *ppercentageSymmetry);
 def AnalogOutSymmetryGet(hdwf: int, channel_index: int) -> float:
@@ -4196,7 +4509,7 @@ def AnalogOutSymmetryGet(hdwf: int, channel_index: int) -> float:
     the instrument.
     '''
     out_percentage_symmetry = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutSymmetryGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_percentage_symmetry)))
+    _ThrowIfError(_dwf.FDwfAnalogOutSymmetryGet(hdwf, channel_index, ctypes.byref(out_percentage_symmetry)))
     return float(out_percentage_symmetry.value)
 
 # DWFAPI int FDwfAnalogOutPhaseInfo(HDWF hdwf, int idxChannel, double *pdegreeMin, double *pdegreeMax);
@@ -4207,7 +4520,7 @@ def AnalogOutPhaseInfo(hdwf: int, channel_index: int) -> (float, float):
     '''
     out_degree_min = ctypes.c_double(0.0)
     out_degree_max = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutPhaseInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_degree_min), ctypes.byref(out_degree_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutPhaseInfo(hdwf, channel_index, ctypes.byref(out_degree_min), ctypes.byref(out_degree_max)))
     return float(out_degree_min.value), float(out_degree_max.value)
 
 # DWFAPI int FDwfAnalogOutPhaseSet(HDWF hdwf, int idxChannel, double degreePhase);
@@ -4217,7 +4530,7 @@ def AnalogOutPhaseSet(hdwf: int, channel_index: int, degree_phase: float) -> Non
     index -1, each enabled Analog Out channel phase will be configured to use
     the same, new option.
     '''
-    _ThrowIfError(_dwf.FDwfAnalogOutPhaseSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_double(degree_phase)))
+    _ThrowIfError(_dwf.FDwfAnalogOutPhaseSet(hdwf, channel_index, degree_phase))
 
 # DWFAPI int FDwfAnalogOutPhaseGet(HDWF hdwf, int idxChannel, double *pdegreePhase);
 def AnalogOutPhaseGet(hdwf: int, channel_index: int) -> float:
@@ -4225,7 +4538,7 @@ def AnalogOutPhaseGet(hdwf: int, channel_index: int) -> float:
     Gets the current phase for the specified channel on the instrument.
     '''
     out_degree_phase = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutPhaseGet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_degree_phase)))
+    _ThrowIfError(_dwf.FDwfAnalogOutPhaseGet(hdwf, channel_index, ctypes.byref(out_degree_phase)))
     return float(out_degree_phase.value)
 
 # DWFAPI int FDwfAnalogOutDataInfo(HDWF hdwf, int idxChannel, int *pnSamplesMin, int *pnSamplesMax);
@@ -4236,18 +4549,17 @@ def AnalogOutDataInfo(hdwf: int, channel_index: int) -> (int, int):
     '''
     out_samples_min = ctypes.c_int(0)
     out_samples_max = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutDataInfo(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_samples_min), ctypes.byref(out_samples_max)))
+    _ThrowIfError(_dwf.FDwfAnalogOutDataInfo(hdwf, channel_index, ctypes.byref(out_samples_min), ctypes.byref(out_samples_max)))
     return int(out_samples_min.value), int(out_samples_max.value)
 
 # DWFAPI int FDwfAnalogOutDataSet(HDWF hdwf, int idxChannel, double *rgdData, int cdData);
-def AnalogOutDataSet(hdwf: int, channel_index: int, cd_data: int) -> float:
+def AnalogOutDataSet(hdwf: int, channel_index: int, data, cd_data: int = None) -> None:
     '''
     Sets the custom data or to prefill the buffer with play samples. The samples
     are double precision floating point values (rgdData) normalized to ±1.
     '''
-    out_rgdData = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutDataSet(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(cd_data), ctypes.byref(out_rgdData)))
-    return float(out_rgdData.value)
+    rgdData, cd_data = _InputAsArray(ctypes.c_double, 'd', data, cd_data)
+    _ThrowIfError(_dwf.FDwfAnalogOutDataSet(hdwf, channel_index, rgdData, cd_data))
 
 # DWFAPI int FDwfAnalogOutPlayStatus(HDWF hdwf, int idxChannel, int *cdDataFree, int *cdDataLost, int *cdDataCorrupted);
 def AnalogOutPlayStatus(hdwf: int, channel_index: int) -> (int, int, int):
@@ -4263,11 +4575,11 @@ def AnalogOutPlayStatus(hdwf: int, channel_index: int) -> (int, int, int):
     out_cdDataFree = ctypes.c_int(0)
     out_cdDataLost = ctypes.c_int(0)
     out_cdDataCorrupted = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfAnalogOutPlayStatus(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.byref(out_cdDataFree), ctypes.byref(out_cdDataLost), ctypes.byref(out_cdDataCorrupted)))
+    _ThrowIfError(_dwf.FDwfAnalogOutPlayStatus(hdwf, channel_index, ctypes.byref(out_cdDataFree), ctypes.byref(out_cdDataLost), ctypes.byref(out_cdDataCorrupted)))
     return int(out_cdDataFree.value), int(out_cdDataLost.value), int(out_cdDataCorrupted.value)
 
 # DWFAPI int FDwfAnalogOutPlayData(HDWF hdwf, int idxChannel, double *rgdData, int cdData);
-def AnalogOutPlayData(hdwf: int, channel_index: int, cd_data: int) -> float:
+def AnalogOutPlayData(hdwf: int, channel_index: int, data, cd_data: int = None) -> None:
     '''
     Sends new data samples for play mode. Before starting the Analog Out
     instrument, prefill the device buffer with the first set of samples using
@@ -4276,34 +4588,33 @@ def AnalogOutPlayData(hdwf: int, channel_index: int, cd_data: int) -> float:
     AnalogOutPlayStatus to find out how many new samples can be sent, then send
     the samples with AnalogOutPlayData.
     '''
-    out_rgdData = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfAnalogOutPlayData(ctypes.c_int(hdwf), ctypes.c_int(channel_index), ctypes.c_int(cd_data), ctypes.byref(out_rgdData)))
-    return float(out_rgdData.value)
+    rgdData, cd_data = _InputAsArray(ctypes.c_double, 'd', data, cd_data)
+    _ThrowIfError(_dwf.FDwfAnalogOutPlayData(hdwf, channel_index, rgdData, cd_data))
 
 # DWFAPI int FDwfEnumAnalogInChannels(int idxDevice, int *pnChannels);
 # Warning no docs found for FDwfEnumAnalogInChannels
 def EnumAnalogInChannels(device_index: int) -> int:
     out_number_of_channels = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfEnumAnalogInChannels(ctypes.c_int(device_index), ctypes.byref(out_number_of_channels)))
+    _ThrowIfError(_dwf.FDwfEnumAnalogInChannels(device_index, ctypes.byref(out_number_of_channels)))
     return int(out_number_of_channels.value)
 
 # DWFAPI int FDwfEnumAnalogInBufferSize(int idxDevice, int *pnBufferSize);
 # Warning no docs found for FDwfEnumAnalogInBufferSize
 def EnumAnalogInBufferSize(device_index: int) -> int:
     out_buffer_size = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfEnumAnalogInBufferSize(ctypes.c_int(device_index), ctypes.byref(out_buffer_size)))
+    _ThrowIfError(_dwf.FDwfEnumAnalogInBufferSize(device_index, ctypes.byref(out_buffer_size)))
     return int(out_buffer_size.value)
 
 # DWFAPI int FDwfEnumAnalogInBits(int idxDevice, int *pnBits);
 # Warning no docs found for FDwfEnumAnalogInBits
 def EnumAnalogInBits(device_index: int) -> int:
     out_number_of_bits = ctypes.c_int(0)
-    _ThrowIfError(_dwf.FDwfEnumAnalogInBits(ctypes.c_int(device_index), ctypes.byref(out_number_of_bits)))
+    _ThrowIfError(_dwf.FDwfEnumAnalogInBits(device_index, ctypes.byref(out_number_of_bits)))
     return int(out_number_of_bits.value)
 
 # DWFAPI int FDwfEnumAnalogInFrequency(int idxDevice, double *phzFrequency);
 # Warning no docs found for FDwfEnumAnalogInFrequency
 def EnumAnalogInFrequency(device_index: int) -> float:
     out_frequency_in_hz = ctypes.c_double(0.0)
-    _ThrowIfError(_dwf.FDwfEnumAnalogInFrequency(ctypes.c_int(device_index), ctypes.byref(out_frequency_in_hz)))
+    _ThrowIfError(_dwf.FDwfEnumAnalogInFrequency(device_index, ctypes.byref(out_frequency_in_hz)))
     return float(out_frequency_in_hz.value)
@@ -0,0 +1,480 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Prototypes of the libdwf entry points, transcribed by hand from the DWFAPI
+# declarations in dwf.h. dwf.py declares them as argtypes on each foreign
+# function the first time it is resolved, so that wrappers can pass plain
+# Python ints and floats and ctypes checks every argument. Every entry point
+# returns an int status (restype c_int). Keep this table in sync with dwf.h
+# when the header is updated; tests/test_dwf.py checks it against the DWFAPI
+# comments in dwf.py.
+
+from ctypes import POINTER, c_bool, c_char_p, c_double, c_int, c_short, c_ubyte, c_uint, c_ulonglong, c_ushort, c_void_p
+
+# typedefs from dwf.h
+HDWF                    = c_int
+ENUMFILTER              = c_int
+DEVID                   = c_int
+DEVVER                  = c_int
+TRIGSRC                 = c_ubyte
+DwfState                = c_ubyte
+DwfEnumConfigInfo       = c_int
+ACQMODE                 = c_int
+FILTER                  = c_int
+TRIGTYPE                = c_int
+DwfTriggerSlope         = c_int
+TRIGLEN                 = c_int
+DWFERC                  = c_int
+FUNC                    = c_ubyte
+ANALOGIO                = c_ubyte
+AnalogOutNode           = c_int
+DwfAnalogOutMode        = c_int
+DwfAnalogOutIdle        = c_int
+DwfDigitalInClockSource = c_int
+DwfDigitalInSampleMode  = c_int
+DwfDigitalOutOutput     = c_int
+DwfDigitalOutType       = c_int
+DwfDigitalOutIdle       = c_int
+DwfAnalogImpedance      = c_int
+DwfParam                = c_int
+TRIGCOND                = c_int
+STS                     = c_ubyte
+
+PROTOTYPES = {
+    'FDwfGetLastError': [POINTER(DWFERC)],
+    'FDwfGetLastErrorMsg': [c_char_p],
+    'FDwfGetVersion': [c_char_p],
+    'FDwfParamSet': [DwfParam, c_int],
+    'FDwfParamGet': [DwfParam, POINTER(c_int)],
+    'FDwfEnum': [ENUMFILTER, POINTER(c_int)],
+    'FDwfEnumDeviceType': [c_int, POINTER(DEVID), POINTER(DEVVER)],
+    'FDwfEnumDeviceIsOpened': [c_int, POINTER(c_int)],
+    'FDwfEnumUserName': [c_int, c_char_p],
+    'FDwfEnumDeviceName': [c_int, c_char_p],
+    'FDwfEnumSN': [c_int, c_char_p],
+    'FDwfEnumConfig': [c_int, POINTER(c_int)],
+    'FDwfEnumConfigInfo': [c_int, DwfEnumConfigInfo, POINTER(c_int)],
+    'FDwfDeviceOpen': [c_int, POINTER(HDWF)],
+    'FDwfDeviceConfigOpen': [c_int, c_int, POINTER(HDWF)],
+    'FDwfDeviceClose': [HDWF],
+    'FDwfDeviceCloseAll': [],
+    'FDwfDeviceAutoConfigureSet': [HDWF, c_int],
+    'FDwfDeviceAutoConfigureGet': [HDWF, POINTER(c_int)],
+    'FDwfDeviceReset': [HDWF],
+    'FDwfDeviceEnableSet': [HDWF, c_int],
+    'FDwfDeviceTriggerInfo': [HDWF, POINTER(c_int)],
+    'FDwfDeviceTriggerSet': [HDWF, c_int, TRIGSRC],
+    'FDwfDeviceTriggerGet': [HDWF, c_int, POINTER(TRIGSRC)],
+    'FDwfDeviceTriggerPC': [HDWF],
+    'FDwfDeviceTriggerSlopeInfo': [HDWF, POINTER(c_int)],
+    'FDwfDeviceParamSet': [HDWF, DwfParam, c_int],
+    'FDwfDeviceParamGet': [HDWF, DwfParam, POINTER(c_int)],
+    'FDwfAnalogInReset': [HDWF],
+    'FDwfAnalogInConfigure': [HDWF, c_int, c_int],
+    'FDwfAnalogInTriggerForce': [HDWF],
+    'FDwfAnalogInStatus': [HDWF, c_int, POINTER(DwfState)],
+    'FDwfAnalogInStatusSamplesLeft': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInStatusSamplesValid': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInStatusIndexWrite': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInStatusAutoTriggered': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInStatusData': [HDWF, c_int, POINTER(c_double), c_int],
+    'FDwfAnalogInStatusData2': [HDWF, c_int, POINTER(c_double), c_int, c_int],
+    'FDwfAnalogInStatusData16': [HDWF, c_int, POINTER(c_short), c_int, c_int],
+    'FDwfAnalogInStatusNoise': [HDWF, c_int, POINTER(c_double), POINTER(c_double), c_int],
+    'FDwfAnalogInStatusNoise2': [HDWF, c_int, POINTER(c_double), POINTER(c_double), c_int, c_int],
+    'FDwfAnalogInStatusSample': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogInStatusTime': [HDWF, POINTER(c_uint), POINTER(c_uint), POINTER(c_uint)],
+    'FDwfAnalogInStatusRecord': [HDWF, POINTER(c_int), POINTER(c_int), POINTER(c_int)],
+    'FDwfAnalogInRecordLengthSet': [HDWF, c_double],
+    'FDwfAnalogInRecordLengthGet': [HDWF, POINTER(c_double)],
+    'FDwfAnalogInFrequencyInfo': [HDWF, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogInFrequencySet': [HDWF, c_double],
+    'FDwfAnalogInFrequencyGet': [HDWF, POINTER(c_double)],
+    'FDwfAnalogInBitsInfo': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInBufferSizeInfo': [HDWF, POINTER(c_int), POINTER(c_int)],
+    'FDwfAnalogInBufferSizeSet': [HDWF, c_int],
+    'FDwfAnalogInBufferSizeGet': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInNoiseSizeInfo': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInNoiseSizeSet': [HDWF, c_int],
+    'FDwfAnalogInNoiseSizeGet': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInAcquisitionModeInfo': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInAcquisitionModeSet': [HDWF, ACQMODE],
+    'FDwfAnalogInAcquisitionModeGet': [HDWF, POINTER(ACQMODE)],
+    'FDwfAnalogInChannelCount': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInChannelEnableSet': [HDWF, c_int, c_int],
+    'FDwfAnalogInChannelEnableGet': [HDWF, c_int, POINTER(c_int)],
+    'FDwfAnalogInChannelFilterInfo': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInChannelFilterSet': [HDWF, c_int, FILTER],
+    'FDwfAnalogInChannelFilterGet': [HDWF, c_int, POINTER(FILTER)],
+    'FDwfAnalogInChannelRangeInfo': [HDWF, POINTER(c_double), POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogInChannelRangeSteps': [HDWF, POINTER(c_double), POINTER(c_int)],
+    'FDwfAnalogInChannelRangeSet': [HDWF, c_int, c_double],
+    'FDwfAnalogInChannelRangeGet': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogInChannelOffsetInfo': [HDWF, POINTER(c_double), POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogInChannelOffsetSet': [HDWF, c_int, c_double],
+    'FDwfAnalogInChannelOffsetGet': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogInChannelAttenuationSet': [HDWF, c_int, c_double],
+    'FDwfAnalogInChannelAttenuationGet': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogInChannelBandwidthSet': [HDWF, c_int, c_double],
+    'FDwfAnalogInChannelBandwidthGet': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogInChannelImpedanceSet': [HDWF, c_int, c_double],
+    'FDwfAnalogInChannelImpedanceGet': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogInTriggerSourceSet': [HDWF, TRIGSRC],
+    'FDwfAnalogInTriggerSourceGet': [HDWF, POINTER(TRIGSRC)],
+    'FDwfAnalogInTriggerPositionInfo': [HDWF, POINTER(c_double), POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogInTriggerPositionSet': [HDWF, c_double],
+    'FDwfAnalogInTriggerPositionGet': [HDWF, POINTER(c_double)],
+    'FDwfAnalogInTriggerPositionStatus': [HDWF, POINTER(c_double)],
+    'FDwfAnalogInTriggerAutoTimeoutInfo': [HDWF, POINTER(c_double), POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogInTriggerAutoTimeoutSet': [HDWF, c_double],
+    'FDwfAnalogInTriggerAutoTimeoutGet': [HDWF, POINTER(c_double)],
+    'FDwfAnalogInTriggerHoldOffInfo': [HDWF, POINTER(c_double), POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogInTriggerHoldOffSet': [HDWF, c_double],
+    'FDwfAnalogInTriggerHoldOffGet': [HDWF, POINTER(c_double)],
+    'FDwfAnalogInTriggerTypeInfo': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInTriggerTypeSet': [HDWF, TRIGTYPE],
+    'FDwfAnalogInTriggerTypeGet': [HDWF, POINTER(TRIGTYPE)],
+    'FDwfAnalogInTriggerChannelInfo': [HDWF, POINTER(c_int), POINTER(c_int)],
+    'FDwfAnalogInTriggerChannelSet': [HDWF, c_int],
+    'FDwfAnalogInTriggerChannelGet': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInTriggerFilterInfo': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInTriggerFilterSet': [HDWF, FILTER],
+    'FDwfAnalogInTriggerFilterGet': [HDWF, POINTER(FILTER)],
+    'FDwfAnalogInTriggerLevelInfo': [HDWF, POINTER(c_double), POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogInTriggerLevelSet': [HDWF, c_double],
+    'FDwfAnalogInTriggerLevelGet': [HDWF, POINTER(c_double)],
+    'FDwfAnalogInTriggerHysteresisInfo': [HDWF, POINTER(c_double), POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogInTriggerHysteresisSet': [HDWF, c_double],
+    'FDwfAnalogInTriggerHysteresisGet': [HDWF, POINTER(c_double)],
+    'FDwfAnalogInTriggerConditionInfo': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInTriggerConditionSet': [HDWF, DwfTriggerSlope],
+    'FDwfAnalogInTriggerConditionGet': [HDWF, POINTER(DwfTriggerSlope)],
+    'FDwfAnalogInTriggerLengthInfo': [HDWF, POINTER(c_double), POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogInTriggerLengthSet': [HDWF, c_double],
+    'FDwfAnalogInTriggerLengthGet': [HDWF, POINTER(c_double)],
+    'FDwfAnalogInTriggerLengthConditionInfo': [HDWF, POINTER(c_int)],
+    'FDwfAnalogInTriggerLengthConditionSet': [HDWF, TRIGLEN],
+    'FDwfAnalogInTriggerLengthConditionGet': [HDWF, POINTER(TRIGLEN)],
+    'FDwfAnalogInSamplingSourceSet': [HDWF, TRIGSRC],
+    'FDwfAnalogInSamplingSourceGet': [HDWF, POINTER(TRIGSRC)],
+    'FDwfAnalogInSamplingSlopeSet': [HDWF, DwfTriggerSlope],
+    'FDwfAnalogInSamplingSlopeGet': [HDWF, POINTER(DwfTriggerSlope)],
+    'FDwfAnalogInSamplingDelaySet': [HDWF, c_double],
+    'FDwfAnalogInSamplingDelayGet': [HDWF, POINTER(c_double)],
+    'FDwfAnalogOutCount': [HDWF, POINTER(c_int)],
+    'FDwfAnalogOutMasterSet': [HDWF, c_int, c_int],
+    'FDwfAnalogOutMasterGet': [HDWF, c_int, POINTER(c_int)],
+    'FDwfAnalogOutTriggerSourceSet': [HDWF, c_int, TRIGSRC],
+    'FDwfAnalogOutTriggerSourceGet': [HDWF, c_int, POINTER(TRIGSRC)],
+    'FDwfAnalogOutTriggerSlopeSet': [HDWF, c_int, DwfTriggerSlope],
+    'FDwfAnalogOutTriggerSlopeGet': [HDWF, c_int, POINTER(DwfTriggerSlope)],
+    'FDwfAnalogOutRunInfo': [HDWF, c_int, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogOutRunSet': [HDWF, c_int, c_double],
+    'FDwfAnalogOutRunGet': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogOutRunStatus': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogOutWaitInfo': [HDWF, c_int, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogOutWaitSet': [HDWF, c_int, c_double],
+    'FDwfAnalogOutWaitGet': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogOutRepeatInfo': [HDWF, c_int, POINTER(c_int), POINTER(c_int)],
+    'FDwfAnalogOutRepeatSet': [HDWF, c_int, c_int],
+    'FDwfAnalogOutRepeatGet': [HDWF, c_int, POINTER(c_int)],
+    'FDwfAnalogOutRepeatStatus': [HDWF, c_int, POINTER(c_int)],
+    'FDwfAnalogOutRepeatTriggerSet': [HDWF, c_int, c_int],
+    'FDwfAnalogOutRepeatTriggerGet': [HDWF, c_int, POINTER(c_int)],
+    'FDwfAnalogOutLimitationInfo': [HDWF, c_int, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogOutLimitationSet': [HDWF, c_int, c_double],
+    'FDwfAnalogOutLimitationGet': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogOutModeSet': [HDWF, c_int, DwfAnalogOutMode],
+    'FDwfAnalogOutModeGet': [HDWF, c_int, POINTER(DwfAnalogOutMode)],
+    'FDwfAnalogOutIdleInfo': [HDWF, c_int, POINTER(c_int)],
+    'FDwfAnalogOutIdleSet': [HDWF, c_int, DwfAnalogOutIdle],
+    'FDwfAnalogOutIdleGet': [HDWF, c_int, POINTER(DwfAnalogOutIdle)],
+    'FDwfAnalogOutNodeInfo': [HDWF, c_int, POINTER(c_int)],
+    'FDwfAnalogOutNodeEnableSet': [HDWF, c_int, AnalogOutNode, c_int],
+    'FDwfAnalogOutNodeEnableGet': [HDWF, c_int, AnalogOutNode, POINTER(c_int)],
+    'FDwfAnalogOutNodeFunctionInfo': [HDWF, c_int, AnalogOutNode, POINTER(c_uint)],
+    'FDwfAnalogOutNodeFunctionSet': [HDWF, c_int, AnalogOutNode, FUNC],
+    'FDwfAnalogOutNodeFunctionGet': [HDWF, c_int, AnalogOutNode, POINTER(FUNC)],
+    'FDwfAnalogOutNodeFrequencyInfo': [HDWF, c_int, AnalogOutNode, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogOutNodeFrequencySet': [HDWF, c_int, AnalogOutNode, c_double],
+    'FDwfAnalogOutNodeFrequencyGet': [HDWF, c_int, AnalogOutNode, POINTER(c_double)],
+    'FDwfAnalogOutNodeAmplitudeInfo': [HDWF, c_int, AnalogOutNode, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogOutNodeAmplitudeSet': [HDWF, c_int, AnalogOutNode, c_double],
+    'FDwfAnalogOutNodeAmplitudeGet': [HDWF, c_int, AnalogOutNode, POINTER(c_double)],
+    'FDwfAnalogOutNodeOffsetInfo': [HDWF, c_int, AnalogOutNode, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogOutNodeOffsetSet': [HDWF, c_int, AnalogOutNode, c_double],
+    'FDwfAnalogOutNodeOffsetGet': [HDWF, c_int, AnalogOutNode, POINTER(c_double)],
+    'FDwfAnalogOutNodeSymmetryInfo': [HDWF, c_int, AnalogOutNode, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogOutNodeSymmetrySet': [HDWF, c_int, AnalogOutNode, c_double],
+    'FDwfAnalogOutNodeSymmetryGet': [HDWF, c_int, AnalogOutNode, POINTER(c_double)],
+    'FDwfAnalogOutNodePhaseInfo': [HDWF, c_int, AnalogOutNode, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogOutNodePhaseSet': [HDWF, c_int, AnalogOutNode, c_double],
+    'FDwfAnalogOutNodePhaseGet': [HDWF, c_int, AnalogOutNode, POINTER(c_double)],
+    'FDwfAnalogOutNodeDataInfo': [HDWF, c_int, AnalogOutNode, POINTER(c_int), POINTER(c_int)],
+    'FDwfAnalogOutNodeDataSet': [HDWF, c_int, AnalogOutNode, POINTER(c_double), c_int],
+    'FDwfAnalogOutCustomAMFMEnableSet': [HDWF, c_int, c_int],
+    'FDwfAnalogOutCustomAMFMEnableGet': [HDWF, c_int, POINTER(c_int)],
+    'FDwfAnalogOutReset': [HDWF, c_int],
+    'FDwfAnalogOutConfigure': [HDWF, c_int, c_int],
+    'FDwfAnalogOutStatus': [HDWF, c_int, POINTER(DwfState)],
+    'FDwfAnalogOutNodePlayStatus': [HDWF, c_int, AnalogOutNode, POINTER(c_int), POINTER(c_int), POINTER(c_int)],
+    'FDwfAnalogOutNodePlayData': [HDWF, c_int, AnalogOutNode, POINTER(c_double), c_int],
+    'FDwfAnalogIOReset': [HDWF],
+    'FDwfAnalogIOConfigure': [HDWF],
+    'FDwfAnalogIOStatus': [HDWF],
+    'FDwfAnalogIOEnableInfo': [HDWF, POINTER(c_int), POINTER(c_int)],
+    'FDwfAnalogIOEnableSet': [HDWF, c_int],
+    'FDwfAnalogIOEnableGet': [HDWF, POINTER(c_int)],
+    'FDwfAnalogIOEnableStatus': [HDWF, POINTER(c_int)],
+    'FDwfAnalogIOChannelCount': [HDWF, POINTER(c_int)],
+    'FDwfAnalogIOChannelName': [HDWF, c_int, c_char_p, c_char_p],
+    'FDwfAnalogIOChannelInfo': [HDWF, c_int, POINTER(c_int)],
+    'FDwfAnalogIOChannelNodeName': [HDWF, c_int, c_int, c_char_p, c_char_p],
+    'FDwfAnalogIOChannelNodeInfo': [HDWF, c_int, c_int, POINTER(ANALOGIO)],
+    'FDwfAnalogIOChannelNodeSetInfo': [HDWF, c_int, c_int, POINTER(c_double), POINTER(c_double), POINTER(c_int)],
+    'FDwfAnalogIOChannelNodeSet': [HDWF, c_int, c_int, c_double],
+    'FDwfAnalogIOChannelNodeGet': [HDWF, c_int, c_int, POINTER(c_double)],
+    'FDwfAnalogIOChannelNodeStatusInfo': [HDWF, c_int, c_int, POINTER(c_double), POINTER(c_double), POINTER(c_int)],
+    'FDwfAnalogIOChannelNodeStatus': [HDWF, c_int, c_int, POINTER(c_double)],
+    'FDwfDigitalIOReset': [HDWF],
+    'FDwfDigitalIOConfigure': [HDWF],
+    'FDwfDigitalIOStatus': [HDWF],
+    'FDwfDigitalIOOutputEnableInfo': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalIOOutputEnableSet': [HDWF, c_uint],
+    'FDwfDigitalIOOutputEnableGet': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalIOOutputInfo': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalIOOutputSet': [HDWF, c_uint],
+    'FDwfDigitalIOOutputGet': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalIOInputInfo': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalIOInputStatus': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalIOOutputEnableInfo64': [HDWF, POINTER(c_ulonglong)],
+    'FDwfDigitalIOOutputEnableSet64': [HDWF, c_ulonglong],
+    'FDwfDigitalIOOutputEnableGet64': [HDWF, POINTER(c_ulonglong)],
+    'FDwfDigitalIOOutputInfo64': [HDWF, POINTER(c_ulonglong)],
+    'FDwfDigitalIOOutputSet64': [HDWF, c_ulonglong],
+    'FDwfDigitalIOOutputGet64': [HDWF, POINTER(c_ulonglong)],
+    'FDwfDigitalIOInputInfo64': [HDWF, POINTER(c_ulonglong)],
+    'FDwfDigitalIOInputStatus64': [HDWF, POINTER(c_ulonglong)],
+    'FDwfDigitalInReset': [HDWF],
+    'FDwfDigitalInConfigure': [HDWF, c_int, c_int],
+    'FDwfDigitalInStatus': [HDWF, c_int, POINTER(DwfState)],
+    'FDwfDigitalInStatusSamplesLeft': [HDWF, POINTER(c_int)],
+    'FDwfDigitalInStatusSamplesValid': [HDWF, POINTER(c_int)],
+    'FDwfDigitalInStatusIndexWrite': [HDWF, POINTER(c_int)],
+    'FDwfDigitalInStatusAutoTriggered': [HDWF, POINTER(c_int)],
+    'FDwfDigitalInStatusData': [HDWF, c_void_p, c_int],
+    'FDwfDigitalInStatusData2': [HDWF, c_void_p, c_int, c_int],
+    'FDwfDigitalInStatusNoise2': [HDWF, c_void_p, c_int, c_int],
+    'FDwfDigitalInStatusRecord': [HDWF, POINTER(c_int), POINTER(c_int), POINTER(c_int)],
+    'FDwfDigitalInStatusTime': [HDWF, POINTER(c_uint), POINTER(c_uint), POINTER(c_uint)],
+    'FDwfDigitalInInternalClockInfo': [HDWF, POINTER(c_double)],
+    'FDwfDigitalInClockSourceInfo': [HDWF, POINTER(c_int)],
+    'FDwfDigitalInClockSourceSet': [HDWF, DwfDigitalInClockSource],
+    'FDwfDigitalInClockSourceGet': [HDWF, POINTER(DwfDigitalInClockSource)],
+    'FDwfDigitalInDividerInfo': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalInDividerSet': [HDWF, c_uint],
+    'FDwfDigitalInDividerGet': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalInBitsInfo': [HDWF, POINTER(c_int)],
+    'FDwfDigitalInSampleFormatSet': [HDWF, c_int],
+    'FDwfDigitalInSampleFormatGet': [HDWF, POINTER(c_int)],
+    'FDwfDigitalInInputOrderSet': [HDWF, c_bool],
+    'FDwfDigitalInBufferSizeInfo': [HDWF, POINTER(c_int)],
+    'FDwfDigitalInBufferSizeSet': [HDWF, c_int],
+    'FDwfDigitalInBufferSizeGet': [HDWF, POINTER(c_int)],
+    'FDwfDigitalInSampleModeInfo': [HDWF, POINTER(c_int)],
+    'FDwfDigitalInSampleModeSet': [HDWF, DwfDigitalInSampleMode],
+    'FDwfDigitalInSampleModeGet': [HDWF, POINTER(DwfDigitalInSampleMode)],
+    'FDwfDigitalInSampleSensibleSet': [HDWF, c_uint],
+    'FDwfDigitalInSampleSensibleGet': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalInAcquisitionModeInfo': [HDWF, POINTER(c_int)],
+    'FDwfDigitalInAcquisitionModeSet': [HDWF, ACQMODE],
+    'FDwfDigitalInAcquisitionModeGet': [HDWF, POINTER(ACQMODE)],
+    'FDwfDigitalInTriggerSourceSet': [HDWF, TRIGSRC],
+    'FDwfDigitalInTriggerSourceGet': [HDWF, POINTER(TRIGSRC)],
+    'FDwfDigitalInTriggerSlopeSet': [HDWF, DwfTriggerSlope],
+    'FDwfDigitalInTriggerSlopeGet': [HDWF, POINTER(DwfTriggerSlope)],
+    'FDwfDigitalInTriggerPositionInfo': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalInTriggerPositionSet': [HDWF, c_uint],
+    'FDwfDigitalInTriggerPositionGet': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalInTriggerPrefillSet': [HDWF, c_uint],
+    'FDwfDigitalInTriggerPrefillGet': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalInTriggerAutoTimeoutInfo': [HDWF, POINTER(c_double), POINTER(c_double), POINTER(c_double)],
+    'FDwfDigitalInTriggerAutoTimeoutSet': [HDWF, c_double],
+    'FDwfDigitalInTriggerAutoTimeoutGet': [HDWF, POINTER(c_double)],
+    'FDwfDigitalInTriggerInfo': [HDWF, POINTER(c_uint), POINTER(c_uint), POINTER(c_uint), POINTER(c_uint)],
+    'FDwfDigitalInTriggerSet': [HDWF, c_uint, c_uint, c_uint, c_uint],
+    'FDwfDigitalInTriggerGet': [HDWF, POINTER(c_uint), POINTER(c_uint), POINTER(c_uint), POINTER(c_uint)],
+    'FDwfDigitalInTriggerResetSet': [HDWF, c_uint, c_uint, c_uint, c_uint],
+    'FDwfDigitalInTriggerCountSet': [HDWF, c_int, c_int],
+    'FDwfDigitalInTriggerLengthSet': [HDWF, c_double, c_double, c_int],
+    'FDwfDigitalInTriggerMatchSet': [HDWF, c_int, c_uint, c_uint, c_int],
+    'FDwfDigitalOutReset': [HDWF],
+    'FDwfDigitalOutConfigure': [HDWF, c_int],
+    'FDwfDigitalOutStatus': [HDWF, POINTER(DwfState)],
+    'FDwfDigitalOutInternalClockInfo': [HDWF, POINTER(c_double)],
+    'FDwfDigitalOutTriggerSourceSet': [HDWF, TRIGSRC],
+    'FDwfDigitalOutTriggerSourceGet': [HDWF, POINTER(TRIGSRC)],
+    'FDwfDigitalOutRunInfo': [HDWF, POINTER(c_double), POINTER(c_double)],
+    'FDwfDigitalOutRunSet': [HDWF, c_double],
+    'FDwfDigitalOutRunGet': [HDWF, POINTER(c_double)],
+    'FDwfDigitalOutRunStatus': [HDWF, POINTER(c_double)],
+    'FDwfDigitalOutWaitInfo': [HDWF, POINTER(c_double), POINTER(c_double)],
+    'FDwfDigitalOutWaitSet': [HDWF, c_double],
+    'FDwfDigitalOutWaitGet': [HDWF, POINTER(c_double)],
+    'FDwfDigitalOutRepeatInfo': [HDWF, POINTER(c_uint), POINTER(c_uint)],
+    'FDwfDigitalOutRepeatSet': [HDWF, c_uint],
+    'FDwfDigitalOutRepeatGet': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalOutRepeatStatus': [HDWF, POINTER(c_uint)],
+    'FDwfDigitalOutTriggerSlopeSet': [HDWF, DwfTriggerSlope],
+    'FDwfDigitalOutTriggerSlopeGet': [HDWF, POINTER(DwfTriggerSlope)],
+    'FDwfDigitalOutRepeatTriggerSet': [HDWF, c_int],
+    'FDwfDigitalOutRepeatTriggerGet': [HDWF, POINTER(c_int)],
+    'FDwfDigitalOutCount': [HDWF, POINTER(c_int)],
+    'FDwfDigitalOutEnableSet': [HDWF, c_int, c_int],
+    'FDwfDigitalOutEnableGet': [HDWF, c_int, POINTER(c_int)],
+    'FDwfDigitalOutOutputInfo': [HDWF, c_int, POINTER(c_int)],
+    'FDwfDigitalOutOutputSet': [HDWF, c_int, DwfDigitalOutOutput],
+    'FDwfDigitalOutOutputGet': [HDWF, c_int, POINTER(DwfDigitalOutOutput)],
+    'FDwfDigitalOutTypeInfo': [HDWF, c_int, POINTER(c_int)],
+    'FDwfDigitalOutTypeSet': [HDWF, c_int, DwfDigitalOutType],
+    'FDwfDigitalOutTypeGet': [HDWF, c_int, POINTER(DwfDigitalOutType)],
+    'FDwfDigitalOutIdleInfo': [HDWF, c_int, POINTER(c_int)],
+    'FDwfDigitalOutIdleSet': [HDWF, c_int, DwfDigitalOutIdle],
+    'FDwfDigitalOutIdleGet': [HDWF, c_int, POINTER(DwfDigitalOutIdle)],
+    'FDwfDigitalOutDividerInfo': [HDWF, c_int, POINTER(c_uint), POINTER(c_uint)],
+    'FDwfDigitalOutDividerInitSet': [HDWF, c_int, c_uint],
+    'FDwfDigitalOutDividerInitGet': [HDWF, c_int, POINTER(c_uint)],
+    'FDwfDigitalOutDividerSet': [HDWF, c_int, c_uint],
+    'FDwfDigitalOutDividerGet': [HDWF, c_int, POINTER(c_uint)],
+    'FDwfDigitalOutCounterInfo': [HDWF, c_int, POINTER(c_uint), POINTER(c_uint)],
+    'FDwfDigitalOutCounterInitSet': [HDWF, c_int, c_int, c_uint],
+    'FDwfDigitalOutCounterInitGet': [HDWF, c_int, POINTER(c_int), POINTER(c_uint)],
+    'FDwfDigitalOutCounterSet': [HDWF, c_int, c_uint, c_uint],
+    'FDwfDigitalOutCounterGet': [HDWF, c_int, POINTER(c_uint), POINTER(c_uint)],
+    'FDwfDigitalOutDataInfo': [HDWF, c_int, POINTER(c_uint)],
+    'FDwfDigitalOutDataSet': [HDWF, c_int, c_void_p, c_uint],
+    'FDwfDigitalOutPlayDataSet': [HDWF, POINTER(c_ubyte), c_uint, c_uint],
+    'FDwfDigitalOutPlayRateSet': [HDWF, c_double],
+    'FDwfDigitalUartReset': [HDWF],
+    'FDwfDigitalUartRateSet': [HDWF, c_double],
+    'FDwfDigitalUartBitsSet': [HDWF, c_int],
+    'FDwfDigitalUartParitySet': [HDWF, c_int],
+    'FDwfDigitalUartStopSet': [HDWF, c_double],
+    'FDwfDigitalUartTxSet': [HDWF, c_int],
+    'FDwfDigitalUartRxSet': [HDWF, c_int],
+    'FDwfDigitalUartTx': [HDWF, c_char_p, c_int],
+    'FDwfDigitalUartRx': [HDWF, c_char_p, c_int, POINTER(c_int), POINTER(c_int)],
+    'FDwfDigitalSpiReset': [HDWF],
+    'FDwfDigitalSpiFrequencySet': [HDWF, c_double],
+    'FDwfDigitalSpiClockSet': [HDWF, c_int],
+    'FDwfDigitalSpiDataSet': [HDWF, c_int, c_int],
+    'FDwfDigitalSpiIdleSet': [HDWF, c_int, DwfDigitalOutIdle],
+    'FDwfDigitalSpiModeSet': [HDWF, c_int],
+    'FDwfDigitalSpiOrderSet': [HDWF, c_int],
+    'FDwfDigitalSpiSelect': [HDWF, c_int, c_int],
+    'FDwfDigitalSpiWriteRead': [HDWF, c_int, c_int, POINTER(c_ubyte), c_int, POINTER(c_ubyte), c_int],
+    'FDwfDigitalSpiWriteRead16': [HDWF, c_int, c_int, POINTER(c_ushort), c_int, POINTER(c_ushort), c_int],
+    'FDwfDigitalSpiWriteRead32': [HDWF, c_int, c_int, POINTER(c_uint), c_int, POINTER(c_uint), c_int],
+    'FDwfDigitalSpiRead': [HDWF, c_int, c_int, POINTER(c_ubyte), c_int],
+    'FDwfDigitalSpiReadOne': [HDWF, c_int, c_int, POINTER(c_uint)],
+    'FDwfDigitalSpiRead16': [HDWF, c_int, c_int, POINTER(c_ushort), c_int],
+    'FDwfDigitalSpiRead32': [HDWF, c_int, c_int, POINTER(c_uint), c_int],
+    'FDwfDigitalSpiWrite': [HDWF, c_int, c_int, POINTER(c_ubyte), c_int],
+    'FDwfDigitalSpiWriteOne': [HDWF, c_int, c_int, c_uint],
+    'FDwfDigitalSpiWrite16': [HDWF, c_int, c_int, POINTER(c_ushort), c_int],
+    'FDwfDigitalSpiWrite32': [HDWF, c_int, c_int, POINTER(c_uint), c_int],
+    'FDwfDigitalI2cReset': [HDWF],
+    'FDwfDigitalI2cClear': [HDWF, POINTER(c_int)],
+    'FDwfDigitalI2cStretchSet': [HDWF, c_int],
+    'FDwfDigitalI2cRateSet': [HDWF, c_double],
+    'FDwfDigitalI2cReadNakSet': [HDWF, c_int],
+    'FDwfDigitalI2cSclSet': [HDWF, c_int],
+    'FDwfDigitalI2cSdaSet': [HDWF, c_int],
+    'FDwfDigitalI2cWriteRead': [HDWF, c_ubyte, POINTER(c_ubyte), c_int, POINTER(c_ubyte), c_int, POINTER(c_int)],
+    'FDwfDigitalI2cRead': [HDWF, c_ubyte, POINTER(c_ubyte), c_int, POINTER(c_int)],
+    'FDwfDigitalI2cWrite': [HDWF, c_ubyte, POINTER(c_ubyte), c_int, POINTER(c_int)],
+    'FDwfDigitalI2cWriteOne': [HDWF, c_ubyte, c_ubyte, POINTER(c_int)],
+    'FDwfDigitalCanReset': [HDWF],
+    'FDwfDigitalCanRateSet': [HDWF, c_double],
+    'FDwfDigitalCanPolaritySet': [HDWF, c_int],
+    'FDwfDigitalCanTxSet': [HDWF, c_int],
+    'FDwfDigitalCanRxSet': [HDWF, c_int],
+    'FDwfDigitalCanTx': [HDWF, c_int, c_int, c_int, c_int, POINTER(c_ubyte)],
+    'FDwfDigitalCanRx': [HDWF, POINTER(c_int), POINTER(c_int), POINTER(c_int), POINTER(c_int), POINTER(c_ubyte), c_int, POINTER(c_int)],
+    'FDwfAnalogImpedanceReset': [HDWF],
+    'FDwfAnalogImpedanceModeSet': [HDWF, c_int],
+    'FDwfAnalogImpedanceModeGet': [HDWF, POINTER(c_int)],
+    'FDwfAnalogImpedanceReferenceSet': [HDWF, c_double],
+    'FDwfAnalogImpedanceReferenceGet': [HDWF, POINTER(c_double)],
+    'FDwfAnalogImpedanceFrequencySet': [HDWF, c_double],
+    'FDwfAnalogImpedanceFrequencyGet': [HDWF, POINTER(c_double)],
+    'FDwfAnalogImpedanceAmplitudeSet': [HDWF, c_double],
+    'FDwfAnalogImpedanceAmplitudeGet': [HDWF, POINTER(c_double)],
+    'FDwfAnalogImpedanceOffsetSet': [HDWF, c_double],
+    'FDwfAnalogImpedanceOffsetGet': [HDWF, POINTER(c_double)],
+    'FDwfAnalogImpedanceProbeSet': [HDWF, c_double, c_double],
+    'FDwfAnalogImpedanceProbeGet': [HDWF, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogImpedancePeriodSet': [HDWF, c_int],
+    'FDwfAnalogImpedancePeriodGet': [HDWF, POINTER(c_int)],
+    'FDwfAnalogImpedanceCompReset': [HDWF],
+    'FDwfAnalogImpedanceCompSet': [HDWF, c_double, c_double, c_double, c_double],
+    'FDwfAnalogImpedanceCompGet': [HDWF, POINTER(c_double), POINTER(c_double), POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogImpedanceConfigure': [HDWF, c_int],
+    'FDwfAnalogImpedanceStatus': [HDWF, POINTER(DwfState)],
+    'FDwfAnalogImpedanceStatusInput': [HDWF, c_int, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogImpedanceStatusMeasure': [HDWF, DwfAnalogImpedance, POINTER(c_double)],
+    'FDwfDigitalInMixedSet': [HDWF, c_int],
+    'FDwfAnalogInTriggerSourceInfo': [HDWF, POINTER(c_int)],
+    'FDwfAnalogOutTriggerSourceInfo': [HDWF, c_int, POINTER(c_int)],
+    'FDwfDigitalInTriggerSourceInfo': [HDWF, POINTER(c_int)],
+    'FDwfDigitalOutTriggerSourceInfo': [HDWF, POINTER(c_int)],
+    'FDwfAnalogOutEnableSet': [HDWF, c_int, c_int],
+    'FDwfAnalogOutEnableGet': [HDWF, c_int, POINTER(c_int)],
+    'FDwfAnalogOutFunctionInfo': [HDWF, c_int, POINTER(c_uint)],
+    'FDwfAnalogOutFunctionSet': [HDWF, c_int, FUNC],
+    'FDwfAnalogOutFunctionGet': [HDWF, c_int, POINTER(FUNC)],
+    'FDwfAnalogOutFrequencyInfo': [HDWF, c_int, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogOutFrequencySet': [HDWF, c_int, c_double],
+    'FDwfAnalogOutFrequencyGet': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogOutAmplitudeInfo': [HDWF, c_int, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogOutAmplitudeSet': [HDWF, c_int, c_double],
+    'FDwfAnalogOutAmplitudeGet': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogOutOffsetInfo': [HDWF, c_int, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogOutOffsetSet': [HDWF, c_int, c_double],
+    'FDwfAnalogOutOffsetGet': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogOutSymmetryInfo': [HDWF, c_int, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogOutSymmetrySet': [HDWF, c_int, c_double],
+    'FDwfAnalogOutSymmetryGet': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogOutPhaseInfo': [HDWF, c_int, POINTER(c_double), POINTER(c_double)],
+    'FDwfAnalogOutPhaseSet': [HDWF, c_int, c_double],
+    'FDwfAnalogOutPhaseGet': [HDWF, c_int, POINTER(c_double)],
+    'FDwfAnalogOutDataInfo': [HDWF, c_int, POINTER(c_int), POINTER(c_int)],
+    'FDwfAnalogOutDataSet': [HDWF, c_int, POINTER(c_double), c_int],
+    'FDwfAnalogOutPlayStatus': [HDWF, c_int, POINTER(c_int), POINTER(c_int), POINTER(c_int)],
+    'FDwfAnalogOutPlayData': [HDWF, c_int, POINTER(c_double), c_int],
+    'FDwfEnumAnalogInChannels': [c_int, POINTER(c_int)],
+    'FDwfEnumAnalogInBufferSize': [c_int, POINTER(c_int)],
+    'FDwfEnumAnalogInBits': [c_int, POINTER(c_int)],
+    'FDwfEnumAnalogInFrequency': [c_int, POINTER(c_double)],
+}
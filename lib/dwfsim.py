@@ -0,0 +1,819 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# In-process simulator of libdwf, for running the wrappers without hardware.
+#
+#   import dwf, dwfsim
+#   simulator = dwfsim.Simulator([dwfsim.SimulatedDevice.analog_discovery2()])
+#   simulator.devices[0].add_i2c_slave(dwfsim.I2cRegisterMap(0x18))
+#   dwf.LibraryBackendSet(simulator)
+#
+# Every FDwf entry point of dwf.h is available. Enumeration, device open and
+# close, AnalogIn, DigitalIn, AnalogOut play, DigitalIO, AnalogIO and I2C are
+# modelled; any other Set function stores its values so that the matching Get
+# function returns them, and the remaining functions succeed and return zeros.
+# The simulation is deterministic: acquisitions follow a sample clock rather
+# than the wall clock, and each status call in record or play mode moves a
+# fixed number of samples.
+
+import array
+import ctypes
+import math
+import re
+import threading
+import time
+import dwf
+import dwfprototypes
+
+_BYREF = type(ctypes.byref(ctypes.c_int()))
+
+def _is_output(argument) -> bool:
+    return isinstance(argument, _BYREF)
+
+def _set(reference, value) -> None:
+    getattr(reference, '_obj', reference).value = value
+
+def _copy(destination, source, start: int, count: int) -> None:
+    # Copies count items of source, from item start, to a ctypes array.
+    size = memoryview(source).itemsize
+    memoryview(destination).cast('B')[:count * size] = memoryview(source).cast('B')[start * size:(start + count) * size]
+
+def _bytes(data, count: int) -> bytes:
+    return bytes(memoryview(data).cast('B')[:count]) if (count > 0) else b''
+
+def _wait(seconds: float) -> None:
+    # time.sleep() alone is too coarse for the tens of microseconds of a USB
+    # round trip, so the last millisecond is spun.
+    deadline = time.perf_counter() + seconds
+    if (seconds > 0.002):
+        time.sleep(seconds - 0.001)
+    while (time.perf_counter() < deadline):
+        pass
+
+class _SimulatorError(Exception):
+    def __init__(self, error_code: dwf.ErrorCodes, message: str):
+        self.error_code = error_code
+        self.message = message
+
+class Sine(object):
+    ''' A sine wave signal for SimulatedDevice.analog_in_signals. It is called
+        with the sample time in seconds, a float or a NumPy array.
+    '''
+    def __init__(self, frequency: float, amplitude: float = 1.0, offset: float = 0.0, phase: float = 0.0):
+        self.frequency = frequency
+        self.amplitude = amplitude
+        self.offset = offset
+        self.phase = phase
+
+    def __call__(self, t):
+        sin = dwf.numpy.sin if (dwf.numpy is not None and isinstance(t, dwf.numpy.ndarray)) else math.sin
+        return self.amplitude * sin(2.0 * math.pi * self.frequency * t + self.phase) + self.offset
+
+class I2cRegisterMap(object):
+    ''' An I2C slave device with 8-bit registers behind a register pointer, the
+        model most sensors and EEPROMs follow: the first byte written sets the
+        pointer, the following bytes are written from it, and reads start at
+        it. The pointer increments after every byte and wraps around.
+    '''
+    def __init__(self, address: int, registers = None, size: int = 256):
+        self.address = address
+        self.registers = bytearray(size)
+        self.pointer = 0
+        if (registers is not None):
+            for each_register, each_value in dict(registers).items():
+                self.registers[each_register] = each_value
+
+    def write(self, data: bytes) -> None:
+        if (len(data) == 0):
+            return
+        self.pointer = data[0] % len(self.registers)
+        for each_byte in data[1:]:
+            self.registers[self.pointer] = each_byte
+            self.pointer = (self.pointer + 1) % len(self.registers)
+
+    def read(self, count: int) -> bytes:
+        data = bytearray(count)
+        for i in range(count):
+            data[i] = self.registers[self.pointer]
+            self.pointer = (self.pointer + 1) % len(self.registers)
+        return bytes(data)
+
+class SimulatedDevice(object):
+    ''' A simulated Analog Discovery device. configurations is a list with one
+        dictionary of dwf.ConfigInfo values per device configuration.
+        analog_io_channels describes the AnalogIO channels as
+        (name, label, [(node_name, units, dwf.AnalogNodeType, minimum, maximum, steps), ...]).
+
+        The signal models can be changed at any time: analog_in_signals maps
+        an AnalogIn channel to a function of time, digital_in_signal is a
+        function of the DigitalIn sample index, digital_io_inputs holds the
+        levels seen on DIO pins that are not driven, and i2c_slaves maps 7-bit
+        addresses to slave models such as I2cRegisterMap.
+    '''
+    def __init__(self, device_id: dwf.Device, device_name: str, user_name: str, serial_number: str, configurations: list, revision: int = 3,
+                 analog_in_bits: int = 14, analog_in_max_frequency: float = 100e6, digital_in_clock: float = 100e6, analog_io_channels: list = None):
+        self.device_id = device_id
+        self.device_name = device_name
+        self.user_name = user_name
+        self.serial_number = serial_number
+        self.configurations = configurations
+        self.revision = revision
+        self.analog_in_bits = analog_in_bits
+        self.analog_in_max_frequency = analog_in_max_frequency
+        self.digital_in_clock = digital_in_clock
+        self.analog_io_channels = analog_io_channels if (analog_io_channels is not None) else []
+        self.analog_in_signals = {}
+        for each_channel in range(max(configuration[dwf.ConfigInfo.ANALOG_IN_CHANNEL_COUNT] for configuration in configurations)):
+            self.analog_in_signals[each_channel] = Sine(1000.0 * (each_channel + 1))
+        self.digital_in_signal = lambda sample_index: sample_index
+        self.digital_io_inputs = 0
+        self.i2c_slaves = {}
+        self.i2c_bus_free = True
+        self.record_samples_per_status = 4096
+        self.play_samples_per_status = 4096
+        self.is_opened = False
+
+    def add_i2c_slave(self, slave) -> None:
+        self.i2c_slaves[slave.address] = slave
+
+    @classmethod
+    def analog_discovery2(cls, serial_number: str = "SN:210321A00000", user_name: str = "Discovery2"):
+        configurations = []
+        for scope, wavegen, logic in ((8192, 4096, 4096), (16384, 1024, 1024), (2048, 16384, 0), (512, 256, 16384), (8192, 4096, 4096), (8192, 4096, 2048), (512, 256, 16384)):
+            configurations.append({ dwf.ConfigInfo.ANALOG_IN_CHANNEL_COUNT: 2, dwf.ConfigInfo.ANALOG_OUT_CHANNEL_COUNT: 2,
+                                    dwf.ConfigInfo.ANALOG_IO_CHANNEL_COUNT: 2, dwf.ConfigInfo.DIGITAL_IN_CHANNEL_COUNT: 16,
+                                    dwf.ConfigInfo.DIGITAL_OUT_CHANNEL_COUNT: 16, dwf.ConfigInfo.DIGITAL_IO_CHANNEL_COUNT: 16,
+                                    dwf.ConfigInfo.ANALOG_IN_BUFFER_SIZE: scope, dwf.ConfigInfo.ANALOG_OUT_BUFFER_SIZE: wavegen,
+                                    dwf.ConfigInfo.DIGITAL_IN_BUFFER_SIZE: logic, dwf.ConfigInfo.DIGITAL_OUT_BUFFER_SIZE: 1024 })
+        supplies = [("Positive Supply", "V+", [("Enable", "", dwf.AnalogNodeType.ENABLE, 0.0, 1.0, 2), ("Voltage", "V", dwf.AnalogNodeType.VOLTAGE, 0.5, 5.0, 451)]),
+                    ("Negative Supply", "V-", [("Enable", "", dwf.AnalogNodeType.ENABLE, 0.0, 1.0, 2), ("Voltage", "V", dwf.AnalogNodeType.VOLTAGE, -5.0, -0.5, 451)])]
+        return cls(dwf.Device.ANALOG_DISCOVERY2, "Analog Discovery 2", user_name, serial_number, configurations,
+                   analog_in_bits = 14, analog_in_max_frequency = 100e6, digital_in_clock = 100e6, analog_io_channels = supplies)
+
+    @classmethod
+    def analog_discovery_pro(cls, serial_number: str = "SN:210018B00000", user_name: str = "ADP3450"):
+        configurations = []
+        for scope, wavegen, logic, patterns in ((32768, 32768, 32768, 16384), (65536, 4096, 8192, 1024)):
+            configurations.append({ dwf.ConfigInfo.ANALOG_IN_CHANNEL_COUNT: 4, dwf.ConfigInfo.ANALOG_OUT_CHANNEL_COUNT: 1,
+                                    dwf.ConfigInfo.ANALOG_IO_CHANNEL_COUNT: 1, dwf.ConfigInfo.DIGITAL_IN_CHANNEL_COUNT: 16,
+                                    dwf.ConfigInfo.DIGITAL_OUT_CHANNEL_COUNT: 16, dwf.ConfigInfo.DIGITAL_IO_CHANNEL_COUNT: 16,
+                                    dwf.ConfigInfo.ANALOG_IN_BUFFER_SIZE: scope, dwf.ConfigInfo.ANALOG_OUT_BUFFER_SIZE: wavegen,
+                                    dwf.ConfigInfo.DIGITAL_IN_BUFFER_SIZE: logic, dwf.ConfigInfo.DIGITAL_OUT_BUFFER_SIZE: patterns })
+        digital_supply = [("Digital Supply", "VIO", [("Enable", "", dwf.AnalogNodeType.ENABLE, 0.0, 1.0, 2), ("Voltage", "V", dwf.AnalogNodeType.VOLTAGE, 1.2, 3.3, 22)])]
+        return cls(dwf.Device.ANALOG_DISCOVERY_PRO_3X50, "Analog Discovery Pro 3450", user_name, serial_number, configurations,
+                   analog_in_bits = 14, analog_in_max_frequency = 125e6, digital_in_clock = 125e6, analog_io_channels = digital_supply)
+
+class _Session(object):
+    # The state of an opened device.
+    def __init__(self, device: SimulatedDevice, configuration: dict):
+        self.device = device
+        self.configuration = configuration
+        self.params = {}
+        self.reset_analog_in()
+        self.reset_digital_in()
+        self.analog_out = {}
+
+    def reset_analog_in(self) -> None:
+        self.analog_in_state = dwf.InstrumentState.READY
+        self.analog_in_clock = 0
+        self.analog_in_volts = {}
+        self.analog_in_raw = {}
+        self.analog_in_valid = 0
+        self.analog_in_available = 0
+        self.analog_in_recorded = 0
+
+    def reset_digital_in(self) -> None:
+        self.digital_in_state = dwf.InstrumentState.READY
+        self.digital_in_clock = 0
+        self.digital_in_data = array.array('B')
+        self.digital_in_valid = 0
+        self.digital_in_available = 0
+        self.digital_in_recorded = 0
+
+    def get(self, stem: str, indices: tuple = ()):
+        values = self.params.get((stem, indices))
+        if (values is None):
+            return self.default(stem, indices)
+        return values[0]
+
+    def default(self, stem: str, indices: tuple):
+        configuration = self.configuration
+        defaults = {
+            'AnalogInFrequency':        min(100e6, self.device.analog_in_max_frequency),
+            'AnalogInBufferSize':       configuration[dwf.ConfigInfo.ANALOG_IN_BUFFER_SIZE],
+            'AnalogInChannelEnable':    1,
+            'AnalogInChannelRange':     5.0,
+            'AnalogInChannelAttenuation': 1.0,
+            'DigitalInDivider':         1,
+            'DigitalInSampleFormat':    16,
+            'DigitalInBufferSize':      configuration[dwf.ConfigInfo.DIGITAL_IN_BUFFER_SIZE],
+            'AnalogOutNodeFrequency':   1000.0,
+            'AnalogOutNodeAmplitude':   1.0,
+            'AnalogOutNodeSymmetry':    50.0,
+            'AnalogOutRepeat':          1,
+            'DigitalI2cRate':           100e3,
+            'DeviceAutoConfigure':      1,
+        }
+        return defaults.get(stem, 0)
+
+class Simulator(object):
+    ''' A replacement for libdwf, to be passed to dwf.LibraryBackendSet. Each
+        call into the simulator is serialized like calls into libdwf, and
+        takes latency seconds, or latencies[name] seconds for the entry points
+        named in latencies, to model the USB round trip.
+    '''
+    def __init__(self, devices: list = None, latency: float = 0.0, latencies: dict = None):
+        if (devices is None):
+            devices = [SimulatedDevice.analog_discovery_pro()]
+        self.devices = devices
+        self.latency = latency
+        self.latencies = latencies if (latencies is not None) else {}
+        self.call_count = 0
+        self._enumerated = list(devices)
+        self._enumerated_configurations = []
+        self._sessions = {}
+        self._next_handle = 1
+        self._params = {}
+        self._last_error = (dwf.ErrorCodes.NO_ERC, "")
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name: str):
+        if (not name.startswith('FDwf')):
+            raise AttributeError(name)
+        handler = getattr(type(self), '_' + name, None)
+        if (handler is None):
+            if (name not in dwfprototypes.PROTOTYPES):
+                raise AttributeError(name)
+            handler = self._generic_handler(name)
+        keeps_error = name in ('FDwfGetLastError', 'FDwfGetLastErrorMsg')
+        def entry_point(*args):
+            with self._lock:
+                self.call_count += 1
+                latency = self.latencies.get(name, self.latency)
+                if (latency > 0):
+                    _wait(latency)
+                if (not keeps_error):
+                    self._last_error = (dwf.ErrorCodes.NO_ERC, "")
+                try:
+                    handler(self, *args)
+                except _SimulatorError as e:
+                    self._last_error = (e.error_code, e.message)
+                    return 0
+                return 1
+        entry_point.__name__ = name
+        setattr(self, name, entry_point)
+        return entry_point
+
+    def _session(self, hdwf: int) -> _Session:
+        session = self._sessions.get(hdwf)
+        if (session is None):
+            raise _SimulatorError(dwf.ErrorCodes.INVALID_PARAMETER0, "Invalid device handle provided")
+        return session
+
+    def _enumerated_device(self, device_index: int) -> SimulatedDevice:
+        if (device_index < 0 or device_index >= len(self._enumerated)):
+            raise _SimulatorError(dwf.ErrorCodes.INVALID_PARAMETER0, "Invalid device index provided")
+        return self._enumerated[device_index]
+
+    @staticmethod
+    def _generic_handler(name: str):
+        match = re.match(r'FDwf(\w+?)(Set|Get)(64)?$', name)
+        if (match is not None and match.group(2) == 'Set'):
+            stem = match.group(1)
+            getter = dwfprototypes.PROTOTYPES.get('FDwf' + stem + 'Get' + (match.group(3) or ''), [])
+            value_count = max(1, len([each for each in getter if isinstance(each, type) and issubclass(each, ctypes._Pointer)]))
+            def setter(self, hdwf, *args):
+                session = self._session(hdwf)
+                indices = tuple(each for each in args[:-value_count] if isinstance(each, (int, float)))
+                session.params[(stem, indices)] = tuple(args[-value_count:])
+            return setter
+        if (match is not None):
+            stem = match.group(1)
+            def getter(self, hdwf, *args):
+                session = self._session(hdwf)
+                indices = tuple(each for each in args if not _is_output(each))
+                outputs = [each for each in args if _is_output(each)]
+                values = session.params.get((stem, indices))
+                if (values is None):
+                    values = (session.default(stem, indices),)
+                for each_output, each_value in zip(outputs, values + (0,) * len(outputs)):
+                    _set(each_output, each_value)
+            return getter
+        reset = re.match(r'FDwf(\w+)Reset$', name)
+        def other(self, hdwf, *args):
+            session = self._session(hdwf)
+            if (reset is not None):
+                prefix = reset.group(1)
+                for each_key in [key for key in session.params if key[0].startswith(prefix)]:
+                    del session.params[each_key]
+                if (prefix in ('AnalogIn', 'Device')):
+                    session.reset_analog_in()
+                if (prefix in ('DigitalIn', 'Device')):
+                    session.reset_digital_in()
+            for each_output in args:
+                if (_is_output(each_output)):
+                    _set(each_output, 0)
+        return other
+
+    # #--------------------------------------------------------------------------
+    # System and enumeration
+
+    def _FDwfGetLastError(self, pdwferc):
+        _set(pdwferc, self._last_error[0])
+
+    def _FDwfGetLastErrorMsg(self, szError):
+        szError.value = self._last_error[1].encode('utf-8')[:511]
+
+    def _FDwfGetVersion(self, szVersion):
+        szVersion.value = b"3.16.3"
+
+    def _FDwfParamSet(self, param, value):
+        self._params[param] = value
+
+    def _FDwfParamGet(self, param, pvalue):
+        _set(pvalue, self._params.get(param, 0))
+
+    def _FDwfEnum(self, enumfilter, pcDevice):
+        self._enumerated = [device for device in self.devices if enumfilter in (dwf.EnumFilter.ALL, device.device_id)]
+        _set(pcDevice, len(self._enumerated))
+
+    def _FDwfEnumDeviceType(self, idxDevice, pDeviceId, pDeviceRevision):
+        device = self._enumerated_device(idxDevice)
+        _set(pDeviceId, device.device_id)
+        _set(pDeviceRevision, device.revision)
+
+    def _FDwfEnumDeviceIsOpened(self, idxDevice, pfIsUsed):
+        _set(pfIsUsed, int(self._enumerated_device(idxDevice).is_opened))
+
+    def _FDwfEnumUserName(self, idxDevice, szUserName):
+        szUserName.value = self._enumerated_device(idxDevice).user_name.encode('utf-8')[:31]
+
+    def _FDwfEnumDeviceName(self, idxDevice, szDeviceName):
+        szDeviceName.value = self._enumerated_device(idxDevice).device_name.encode('utf-8')[:31]
+
+    def _FDwfEnumSN(self, idxDevice, szSN):
+        szSN.value = self._enumerated_device(idxDevice).serial_number.encode('utf-8')[:31]
+
+    def _FDwfEnumConfig(self, idxDevice, pcConfig):
+        self._enumerated_configurations = self._enumerated_device(idxDevice).configurations
+        _set(pcConfig, len(self._enumerated_configurations))
+
+    def _FDwfEnumConfigInfo(self, idxConfig, info, pv):
+        if (idxConfig < 0 or idxConfig >= len(self._enumerated_configurations)):
+            raise _SimulatorError(dwf.ErrorCodes.INVALID_PARAMETER0, "Invalid configuration index provided")
+        _set(pv, self._enumerated_configurations[idxConfig].get(info, 0))
+
+    def _FDwfEnumAnalogInChannels(self, idxDevice, pnChannels):
+        _set(pnChannels, self._enumerated_device(idxDevice).configurations[0][dwf.ConfigInfo.ANALOG_IN_CHANNEL_COUNT])
+
+    def _FDwfEnumAnalogInBufferSize(self, idxDevice, pnBufferSize):
+        _set(pnBufferSize, self._enumerated_device(idxDevice).configurations[0][dwf.ConfigInfo.ANALOG_IN_BUFFER_SIZE])
+
+    def _FDwfEnumAnalogInBits(self, idxDevice, pnBits):
+        _set(pnBits, self._enumerated_device(idxDevice).analog_in_bits)
+
+    def _FDwfEnumAnalogInFrequency(self, idxDevice, phzFrequency):
+        _set(phzFrequency, self._enumerated_device(idxDevice).analog_in_max_frequency)
+
+    # #--------------------------------------------------------------------------
+    # Device
+
+    def _FDwfDeviceOpen(self, idxDevice, phdwf):
+        self._FDwfDeviceConfigOpen(idxDevice, 0, phdwf)
+
+    def _FDwfDeviceConfigOpen(self, idxDev, idxCfg, phdwf):
+        _set(phdwf, dwf.hdwfNone)
+        if (idxDev == -1):
+            available = [device for device in self._enumerated if not device.is_opened]
+            if (len(available) == 0):
+                raise _SimulatorError(dwf.ErrorCodes.UNKNOWN_ERROR, "No device available")
+            device = available[0]
+        else:
+            device = self._enumerated_device(idxDev)
+        if (device.is_opened):
+            raise _SimulatorError(dwf.ErrorCodes.ALREADY_OPENED, "Device already opened")
+        if (idxCfg < 0 or idxCfg >= len(device.configurations)):
+            raise _SimulatorError(dwf.ErrorCodes.INVALID_PARAMETER1, "Invalid configuration index provided")
+        device.is_opened = True
+        hdwf = self._next_handle
+        self._next_handle += 1
+        self._sessions[hdwf] = _Session(device, device.configurations[idxCfg])
+        _set(phdwf, hdwf)
+
+    def _FDwfDeviceClose(self, hdwf):
+        self._session(hdwf).device.is_opened = False
+        del self._sessions[hdwf]
+
+    def _FDwfDeviceCloseAll(self):
+        for each_hdwf in list(self._sessions):
+            self._FDwfDeviceClose(each_hdwf)
+
+    # #--------------------------------------------------------------------------
+    # AnalogIn
+
+    def _acquire_analog_in(self, session: _Session, count: int) -> None:
+        # Samples every enabled channel for count sample clocks, quantized
+        # like the ADC and scaled to 16 bits like FDwfAnalogInStatusData16.
+        device = session.device
+        frequency = session.get('AnalogInFrequency')
+        first_sample = session.analog_in_clock
+        session.analog_in_clock += count
+        numpy = dwf.numpy
+        lsb_mask = ~((1 << (16 - device.analog_in_bits)) - 1)
+        for each_channel in range(session.configuration[dwf.ConfigInfo.ANALOG_IN_CHANNEL_COUNT]):
+            if (not session.get('AnalogInChannelEnable', (each_channel,))):
+                continue
+            signal = device.analog_in_signals.get(each_channel, lambda t: 0.0)
+            volts_range = session.get('AnalogInChannelRange', (each_channel,))
+            volts_offset = session.get('AnalogInChannelOffset', (each_channel,))
+            if (numpy is not None):
+                t = numpy.arange(first_sample, first_sample + count, dtype=numpy.float64) / frequency
+                volts = numpy.broadcast_to(numpy.asarray(signal(t), dtype=numpy.float64), (count,))
+                raw = numpy.clip(numpy.rint((volts - volts_offset) * (65536.0 / volts_range)), -32768, 32767).astype(numpy.int16) & lsb_mask
+                session.analog_in_raw[each_channel] = raw
+                session.analog_in_volts[each_channel] = raw * (volts_range / 65536.0) + volts_offset
+            else:
+                raw = array.array('h', bytes(2 * count))
+                volts = array.array('d', bytes(8 * count))
+                for i in range(count):
+                    code = int(round((signal((first_sample + i) / frequency) - volts_offset) * (65536.0 / volts_range)))
+                    raw[i] = min(max(code, -32768), 32767) & lsb_mask
+                    volts[i] = raw[i] * (volts_range / 65536.0) + volts_offset
+                session.analog_in_raw[each_channel] = raw
+                session.analog_in_volts[each_channel] = volts
+        session.analog_in_valid = count
+
+    def _FDwfAnalogInConfigure(self, hdwf, fReconfigure, fStart):
+        session = self._session(hdwf)
+        if (fStart):
+            session.analog_in_state = dwf.InstrumentState.ARMED
+            session.analog_in_recorded = 0
+        elif (fReconfigure or session.analog_in_state != dwf.InstrumentState.DONE):
+            session.analog_in_state = dwf.InstrumentState.READY
+
+    def _FDwfAnalogInStatus(self, hdwf, fReadData, psts):
+        session = self._session(hdwf)
+        session.analog_in_available = 0
+        if (session.analog_in_state in (dwf.InstrumentState.ARMED, dwf.InstrumentState.RUNNING)):
+            if (session.get('AnalogInAcquisitionMode') == dwf.AcquisitionMode.RECORD):
+                count = session.device.record_samples_per_status
+                record_samples = int(round(session.get('AnalogInRecordLength') * session.get('AnalogInFrequency')))
+                if (record_samples > 0):
+                    count = min(count, record_samples - session.analog_in_recorded)
+                self._acquire_analog_in(session, count)
+                session.analog_in_available = count
+                session.analog_in_recorded += count
+                if (record_samples > 0 and session.analog_in_recorded >= record_samples):
+                    session.analog_in_state = dwf.InstrumentState.DONE
+                else:
+                    session.analog_in_state = dwf.InstrumentState.RUNNING
+            else:
+                self._acquire_analog_in(session, session.get('AnalogInBufferSize'))
+                session.analog_in_state = dwf.InstrumentState.DONE
+        _set(psts, session.analog_in_state)
+
+    def _FDwfAnalogInStatusSamplesValid(self, hdwf, pcSamplesValid):
+        _set(pcSamplesValid, self._session(hdwf).analog_in_valid)
+
+    def _FDwfAnalogInStatusIndexWrite(self, hdwf, pidxWrite):
+        session = self._session(hdwf)
+        _set(pidxWrite, session.analog_in_clock % session.get('AnalogInBufferSize'))
+
+    def _FDwfAnalogInStatusRecord(self, hdwf, pcdDataAvailable, pcdDataLost, pcdDataCorrupt):
+        _set(pcdDataAvailable, self._session(hdwf).analog_in_available)
+        _set(pcdDataLost, 0)
+        _set(pcdDataCorrupt, 0)
+
+    def _analog_in_samples(self, hdwf: int, idxChannel: int, idxData: int, cdData: int, raw: bool):
+        session = self._session(hdwf)
+        samples = (session.analog_in_raw if raw else session.analog_in_volts).get(idxChannel)
+        if (samples is None):
+            raise _SimulatorError(dwf.ErrorCodes.INVALID_PARAMETER1, "Channel is not enabled")
+        if (idxData < 0 or cdData < 0 or idxData + cdData > session.analog_in_valid):
+            raise _SimulatorError(dwf.ErrorCodes.INVALID_PARAMETER3, "Data index or count out of range")
+        return samples
+
+    def _FDwfAnalogInStatusData(self, hdwf, idxChannel, rgdVoltData, cdData):
+        _copy(rgdVoltData, self._analog_in_samples(hdwf, idxChannel, 0, cdData, False), 0, cdData)
+
+    def _FDwfAnalogInStatusData2(self, hdwf, idxChannel, rgdVoltData, idxData, cdData):
+        _copy(rgdVoltData, self._analog_in_samples(hdwf, idxChannel, idxData, cdData, False), idxData, cdData)
+
+    def _FDwfAnalogInStatusData16(self, hdwf, idxChannel, rgu16Data, idxData, cdData):
+        _copy(rgu16Data, self._analog_in_samples(hdwf, idxChannel, idxData, cdData, True), idxData, cdData)
+
+    def _FDwfAnalogInStatusSample(self, hdwf, idxChannel, pdVoltSample):
+        session = self._session(hdwf)
+        frequency = session.get('AnalogInFrequency')
+        signal = session.device.analog_in_signals.get(idxChannel, lambda t: 0.0)
+        _set(pdVoltSample, float(signal(session.analog_in_clock / frequency)))
+
+    def _FDwfAnalogInFrequencyInfo(self, hdwf, phzMin, phzMax):
+        session = self._session(hdwf)
+        _set(phzMin, session.device.analog_in_max_frequency / 2.0**31)
+        _set(phzMax, session.device.analog_in_max_frequency)
+
+    def _FDwfAnalogInBitsInfo(self, hdwf, pnBits):
+        _set(pnBits, self._session(hdwf).device.analog_in_bits)
+
+    def _FDwfAnalogInBufferSizeInfo(self, hdwf, pnSizeMin, pnSizeMax):
+        session = self._session(hdwf)
+        _set(pnSizeMin, 16)
+        _set(pnSizeMax, session.configuration[dwf.ConfigInfo.ANALOG_IN_BUFFER_SIZE])
+
+    def _FDwfAnalogInChannelCount(self, hdwf, pcChannel):
+        _set(pcChannel, self._session(hdwf).configuration[dwf.ConfigInfo.ANALOG_IN_CHANNEL_COUNT])
+
+    def _FDwfAnalogInChannelRangeInfo(self, hdwf, pvoltsMin, pvoltsMax, pnSteps):
+        self._session(hdwf)
+        _set(pvoltsMin, 0.5)
+        _set(pvoltsMax, 50.0)
+        _set(pnSteps, 2)
+
+    def _FDwfAnalogInChannelOffsetInfo(self, hdwf, pvoltsMin, pvoltsMax, pnSteps):
+        self._session(hdwf)
+        _set(pvoltsMin, -25.0)
+        _set(pvoltsMax, 25.0)
+        _set(pnSteps, 1024)
+
+    # #--------------------------------------------------------------------------
+    # DigitalIn
+
+    def _acquire_digital_in(self, session: _Session, count: int) -> None:
+        typecode = dwf.DIGITAL_IN_SAMPLE_TYPECODES[session.get('DigitalInSampleFormat')]
+        first_sample = session.digital_in_clock
+        session.digital_in_clock += count
+        signal = session.device.digital_in_signal
+        if (dwf.numpy is not None):
+            samples = dwf.numpy.asarray(signal(dwf.numpy.arange(first_sample, first_sample + count, dtype=dwf.numpy.int64)))
+            session.digital_in_data = dwf.numpy.broadcast_to(samples, (count,)).astype(typecode)
+        else:
+            mask = (1 << (8 * array.array(typecode).itemsize)) - 1
+            session.digital_in_data = array.array(typecode, (signal(first_sample + i) & mask for i in range(count)))
+        session.digital_in_valid = count
+
+    def _FDwfDigitalInConfigure(self, hdwf, fReconfigure, fStart):
+        session = self._session(hdwf)
+        if (fStart):
+            session.digital_in_state = dwf.InstrumentState.ARMED
+            session.digital_in_recorded = 0
+        elif (fReconfigure or session.digital_in_state != dwf.InstrumentState.DONE):
+            session.digital_in_state = dwf.InstrumentState.READY
+
+    def _FDwfDigitalInStatus(self, hdwf, fReadData, psts):
+        session = self._session(hdwf)
+        session.digital_in_available = 0
+        if (session.digital_in_state in (dwf.InstrumentState.ARMED, dwf.InstrumentState.RUNNING)):
+            if (session.get('DigitalInAcquisitionMode') == dwf.AcquisitionMode.RECORD):
+                count = session.device.record_samples_per_status
+                record_samples = session.get('DigitalInTriggerPosition')
+                if (record_samples > 0):
+                    count = min(count, record_samples - session.digital_in_recorded)
+                self._acquire_digital_in(session, count)
+                session.digital_in_available = count
+                session.digital_in_recorded += count
+                if (record_samples > 0 and session.digital_in_recorded >= record_samples):
+                    session.digital_in_state = dwf.InstrumentState.DONE
+                else:
+                    session.digital_in_state = dwf.InstrumentState.RUNNING
+            else:
+                self._acquire_digital_in(session, session.get('DigitalInBufferSize'))
+                session.digital_in_state = dwf.InstrumentState.DONE
+        _set(psts, session.digital_in_state)
+
+    def _FDwfDigitalInStatusSamplesValid(self, hdwf, pcSamplesValid):
+        _set(pcSamplesValid, self._session(hdwf).digital_in_valid)
+
+    def _FDwfDigitalInStatusIndexWrite(self, hdwf, pidxWrite):
+        session = self._session(hdwf)
+        _set(pidxWrite, session.digital_in_clock % max(1, session.get('DigitalInBufferSize')))
+
+    def _FDwfDigitalInStatusRecord(self, hdwf, pcdDataAvailable, pcdDataLost, pcdDataCorrupt):
+        _set(pcdDataAvailable, self._session(hdwf).digital_in_available)
+        _set(pcdDataLost, 0)
+        _set(pcdDataCorrupt, 0)
+
+    def _digital_in_bytes(self, hdwf: int, idxSample: int, countOfDataBytes: int):
+        session = self._session(hdwf)
+        data = memoryview(session.digital_in_data).cast('B')
+        first_byte = idxSample * memoryview(session.digital_in_data).itemsize
+        if (idxSample < 0 or countOfDataBytes < 0 or first_byte + countOfDataBytes > len(data)):
+            raise _SimulatorError(dwf.ErrorCodes.INVALID_PARAMETER2, "Data index or count out of range")
+        return data, first_byte
+
+    def _FDwfDigitalInStatusData(self, hdwf, rgData, countOfDataBytes):
+        data, first_byte = self._digital_in_bytes(hdwf, 0, countOfDataBytes)
+        _copy(rgData, data, first_byte, countOfDataBytes)
+
+    def _FDwfDigitalInStatusData2(self, hdwf, rgData, idxSample, countOfDataBytes):
+        data, first_byte = self._digital_in_bytes(hdwf, idxSample, countOfDataBytes)
+        _copy(rgData, data, first_byte, countOfDataBytes)
+
+    def _FDwfDigitalInInternalClockInfo(self, hdwf, phzFreq):
+        _set(phzFreq, self._session(hdwf).device.digital_in_clock)
+
+    def _FDwfDigitalInDividerInfo(self, hdwf, pdivMax):
+        self._session(hdwf)
+        _set(pdivMax, 0x3FFFFFFF)
+
+    def _FDwfDigitalInBitsInfo(self, hdwf, pnBits):
+        _set(pnBits, self._session(hdwf).configuration[dwf.ConfigInfo.DIGITAL_IN_CHANNEL_COUNT])
+
+    def _FDwfDigitalInBufferSizeInfo(self, hdwf, pnSizeMax):
+        _set(pnSizeMax, self._session(hdwf).configuration[dwf.ConfigInfo.DIGITAL_IN_BUFFER_SIZE])
+
+    # #--------------------------------------------------------------------------
+    # AnalogOut
+
+    def _analog_out(self, session: _Session, idxChannel: int) -> dict:
+        if (idxChannel < 0 or idxChannel >= session.configuration[dwf.ConfigInfo.ANALOG_OUT_CHANNEL_COUNT]):
+            raise _SimulatorError(dwf.ErrorCodes.INVALID_PARAMETER1, "Invalid channel index provided")
+        return session.analog_out.setdefault(idxChannel, { 'state': dwf.InstrumentState.READY, 'data': None, 'queued': 0, 'lost': 0 })
+
+    def _FDwfAnalogOutCount(self, hdwf, pcChannel):
+        _set(pcChannel, self._session(hdwf).configuration[dwf.ConfigInfo.ANALOG_OUT_CHANNEL_COUNT])
+
+    def _FDwfAnalogOutNodeDataInfo(self, hdwf, idxChannel, node, pnSamplesMin, pnSamplesMax):
+        session = self._session(hdwf)
+        self._analog_out(session, idxChannel)
+        _set(pnSamplesMin, 16)
+        _set(pnSamplesMax, session.configuration[dwf.ConfigInfo.ANALOG_OUT_BUFFER_SIZE])
+
+    def _FDwfAnalogOutNodeDataSet(self, hdwf, idxChannel, node, rgdData, cdData):
+        channel = self._analog_out(self._session(hdwf), idxChannel)
+        channel['data'] = array.array('d', memoryview(rgdData).cast('B')[:8 * cdData].cast('d'))
+        channel['queued'] = cdData
+
+    def _FDwfAnalogOutNodePlayData(self, hdwf, idxChannel, node, rgdData, cdData):
+        session = self._session(hdwf)
+        channel = self._analog_out(session, idxChannel)
+        if (channel['queued'] + cdData > session.configuration[dwf.ConfigInfo.ANALOG_OUT_BUFFER_SIZE]):
+            raise _SimulatorError(dwf.ErrorCodes.INVALID_PARAMETER4, "More samples than free buffer space")
+        channel['queued'] += cdData
+
+    def _FDwfAnalogOutConfigure(self, hdwf, idxChannel, fStart):
+        session = self._session(hdwf)
+        channels = range(session.configuration[dwf.ConfigInfo.ANALOG_OUT_CHANNEL_COUNT]) if (idxChannel < 0) else [idxChannel]
+        for each_channel in channels:
+            # 3 applies the configuration without changing the state.
+            if (fStart != 3):
+                self._analog_out(session, each_channel)['state'] = dwf.InstrumentState.RUNNING if (fStart) else dwf.InstrumentState.READY
+
+    def _FDwfAnalogOutStatus(self, hdwf, idxChannel, psts):
+        session = self._session(hdwf)
+        channel = self._analog_out(session, idxChannel)
+        if (channel['state'] == dwf.InstrumentState.RUNNING and session.get('AnalogOutNodeFunction', (idxChannel, dwf.AnalogOutNode.CARRIER)) == dwf.Function.PLAY):
+            played = session.device.play_samples_per_status
+            consumed = min(played, channel['queued'])
+            channel['queued'] -= consumed
+            channel['lost'] += played - consumed
+        _set(psts, channel['state'])
+
+    def _FDwfAnalogOutNodePlayStatus(self, hdwf, idxChannel, node, cdDataFree, cdDataLost, cdDataCorrupted):
+        session = self._session(hdwf)
+        channel = self._analog_out(session, idxChannel)
+        _set(cdDataFree, session.configuration[dwf.ConfigInfo.ANALOG_OUT_BUFFER_SIZE] - channel['queued'])
+        _set(cdDataLost, channel['lost'])
+        _set(cdDataCorrupted, 0)
+        channel['lost'] = 0
+
+    # Obsolete AnalogOut functions, acting on the carrier node.
+
+    def _FDwfAnalogOutDataSet(self, hdwf, idxChannel, rgdData, cdData):
+        self._FDwfAnalogOutNodeDataSet(hdwf, idxChannel, dwf.AnalogOutNode.CARRIER, rgdData, cdData)
+
+    def _FDwfAnalogOutPlayData(self, hdwf, idxChannel, rgdData, cdData):
+        self._FDwfAnalogOutNodePlayData(hdwf, idxChannel, dwf.AnalogOutNode.CARRIER, rgdData, cdData)
+
+    def _FDwfAnalogOutPlayStatus(self, hdwf, idxChannel, cdDataFree, cdDataLost, cdDataCorrupted):
+        self._FDwfAnalogOutNodePlayStatus(hdwf, idxChannel, dwf.AnalogOutNode.CARRIER, cdDataFree, cdDataLost, cdDataCorrupted)
+
+    # #--------------------------------------------------------------------------
+    # AnalogIO
+
+    def _analog_io_node(self, session: _Session, idxChannel: int, idxNode: int = None):
+        channels = session.device.analog_io_channels
+        if (idxChannel < 0 or idxChannel >= len(channels)):
+            raise _SimulatorError(dwf.ErrorCodes.INVALID_PARAMETER1, "Invalid channel index provided")
+        if (idxNode is None):
+            return channels[idxChannel]
+        if (idxNode < 0 or idxNode >= len(channels[idxChannel][2])):
+            raise _SimulatorError(dwf.ErrorCodes.INVALID_PARAMETER2, "Invalid node index provided")
+        return channels[idxChannel][2][idxNode]
+
+    def _FDwfAnalogIOEnableInfo(self, hdwf, pfSet, pfStatus):
+        self._session(hdwf)
+        _set(pfSet, 1)
+        _set(pfStatus, 1)
+
+    def _FDwfAnalogIOEnableStatus(self, hdwf, pfMasterEnable):
+        _set(pfMasterEnable, self._session(hdwf).get('AnalogIOEnable'))
+
+    def _FDwfAnalogIOChannelCount(self, hdwf, pnChannel):
+        _set(pnChannel, len(self._session(hdwf).device.analog_io_channels))
+
+    def _FDwfAnalogIOChannelName(self, hdwf, idxChannel, szName, szLabel):
+        name, label, nodes = self._analog_io_node(self._session(hdwf), idxChannel)
+        szName.value = name.encode('utf-8')[:31]
+        szLabel.value = label.encode('utf-8')[:15]
+
+    def _FDwfAnalogIOChannelInfo(self, hdwf, idxChannel, pnNodes):
+        _set(pnNodes, len(self._analog_io_node(self._session(hdwf), idxChannel)[2]))
+
+    def _FDwfAnalogIOChannelNodeName(self, hdwf, idxChannel, idxNode, szNodeName, szNodeUnits):
+        node = self._analog_io_node(self._session(hdwf), idxChannel, idxNode)
+        szNodeName.value = node[0].encode('utf-8')[:31]
+        szNodeUnits.value = node[1].encode('utf-8')[:15]
+
+    def _FDwfAnalogIOChannelNodeInfo(self, hdwf, idxChannel, idxNode, panalogio):
+        _set(panalogio, self._analog_io_node(self._session(hdwf), idxChannel, idxNode)[2])
+
+    def _FDwfAnalogIOChannelNodeSetInfo(self, hdwf, idxChannel, idxNode, pmin, pmax, pnSteps):
+        node = self._analog_io_node(self._session(hdwf), idxChannel, idxNode)
+        _set(pmin, node[3])
+        _set(pmax, node[4])
+        _set(pnSteps, node[5])
+
+    def _FDwfAnalogIOChannelNodeStatusInfo(self, hdwf, idxChannel, idxNode, pmin, pmax, pnSteps):
+        self._FDwfAnalogIOChannelNodeSetInfo(hdwf, idxChannel, idxNode, pmin, pmax, pnSteps)
+
+    def _FDwfAnalogIOChannelNodeStatus(self, hdwf, idxChannel, idxNode, pvalue):
+        # Supplies read back their set point while the master enable and the
+        # channel enable node are both on, and zero otherwise.
+        session = self._session(hdwf)
+        node = self._analog_io_node(session, idxChannel, idxNode)
+        enabled = session.get('AnalogIOEnable') and session.get('AnalogIOChannelNode', (idxChannel, 0))
+        value = session.get('AnalogIOChannelNode', (idxChannel, idxNode))
+        _set(pvalue, float(value) if (enabled or node[2] == dwf.AnalogNodeType.ENABLE) else 0.0)
+
+    # #--------------------------------------------------------------------------
+    # DigitalIO
+
+    def _FDwfDigitalIOOutputEnableInfo(self, hdwf, pfsOutputEnableMask):
+        _set(pfsOutputEnableMask, (1 << self._session(hdwf).configuration[dwf.ConfigInfo.DIGITAL_IO_CHANNEL_COUNT]) - 1)
+
+    _FDwfDigitalIOOutputEnableInfo64 = _FDwfDigitalIOOutputEnableInfo
+    _FDwfDigitalIOOutputInfo = _FDwfDigitalIOOutputEnableInfo
+    _FDwfDigitalIOOutputInfo64 = _FDwfDigitalIOOutputEnableInfo
+    _FDwfDigitalIOInputInfo = _FDwfDigitalIOOutputEnableInfo
+    _FDwfDigitalIOInputInfo64 = _FDwfDigitalIOOutputEnableInfo
+
+    def _FDwfDigitalIOInputStatus(self, hdwf, pfsInput):
+        # Driven pins read back their output level, the others the level set
+        # in digital_io_inputs.
+        session = self._session(hdwf)
+        mask = (1 << session.configuration[dwf.ConfigInfo.DIGITAL_IO_CHANNEL_COUNT]) - 1
+        output_enable = session.get('DigitalIOOutputEnable')
+        _set(pfsInput, ((session.get('DigitalIOOutput') & output_enable) | (session.device.digital_io_inputs & ~output_enable)) & mask)
+
+    _FDwfDigitalIOInputStatus64 = _FDwfDigitalIOInputStatus
+
+    # #--------------------------------------------------------------------------
+    # I2C
+
+    def _i2c_slave(self, session: _Session, adr8bits: int, pNak):
+        # An address nobody answers is NAKed on the first byte.
+        slave = session.device.i2c_slaves.get(adr8bits >> 1)
+        _set(pNak, 0 if (slave is not None) else 1)
+        return slave
+
+    def _FDwfDigitalI2cClear(self, hdwf, pfFree):
+        _set(pfFree, int(self._session(hdwf).device.i2c_bus_free))
+
+    def _FDwfDigitalI2cWriteRead(self, hdwf, adr8bits, rgbTx, cTx, rgRx, cRx, pNak):
+        slave = self._i2c_slave(self._session(hdwf), adr8bits, pNak)
+        if (slave is not None):
+            if (cTx > 0):
+                slave.write(_bytes(rgbTx, cTx))
+            if (cRx > 0):
+                _copy(rgRx, slave.read(cRx), 0, cRx)
+
+    def _FDwfDigitalI2cRead(self, hdwf, adr8bits, rgbRx, cRx, pNak):
+        self._FDwfDigitalI2cWriteRead(hdwf, adr8bits, b'', 0, rgbRx, cRx, pNak)
+
+    def _FDwfDigitalI2cWrite(self, hdwf, adr8bits, rgbTx, cTx, pNak):
+        self._FDwfDigitalI2cWriteRead(hdwf, adr8bits, rgbTx, cTx, None, 0, pNak)
+
+    def _FDwfDigitalI2cWriteOne(self, hdwf, adr8bits, bTx, pNak):
+        self._FDwfDigitalI2cWriteRead(hdwf, adr8bits, bytes([bTx]), 1, None, 0, pNak)
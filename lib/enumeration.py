@@ -0,0 +1,218 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Cached device enumeration. dwf.EnumDevices is a USB scan; this module takes
+# one snapshot of every connected device (names, serial number, type,
+# configurations) and serves lookups from it until it gets older than its
+# time to live, or until a lookup finds that a device has come or gone.
+#
+#   record = enumeration.find(serial_number = "SN:210018B04951")
+#   hdwf = enumeration.open_device(record, config_index = 0)
+#   enumeration.close_device(hdwf, record.serial_number)
+
+import threading
+import time
+import dwf
+from typing import List
+
+class DeviceRecord(object):
+    ''' The enumeration data of one device, as of the last snapshot. index is
+        the position of the device in the driver's enumeration list, which is
+        what dwf.DeviceOpen and dwf.DeviceConfigOpen expect. configurations
+        holds one tuple per configuration, indexed by dwf.ConfigInfo.
+    '''
+    __slots__ = ('index', 'name', 'user_name', 'serial_number', 'device_type', 'revision', 'is_opened', 'configurations')
+
+    def __init__(self, index: int, name: str, user_name: str, serial_number: str, device_type: int, revision: int, is_opened: bool, configurations: tuple):
+        self.index = index
+        self.name = name
+        self.user_name = user_name
+        self.serial_number = serial_number
+        self.device_type = device_type
+        self.revision = revision
+        self.is_opened = is_opened
+        self.configurations = configurations
+
+    def config_info(self, config_index: int, config_info: dwf.ConfigInfo) -> int:
+        ''' Returns the same value as dwf.EnumConfigInfo, from the snapshot.
+        '''
+        return self.configurations[config_index][config_info]
+
+    def matches(self, filter: dwf.EnumFilter) -> bool:
+        return (filter == dwf.EnumFilter.ALL or int(filter) == int(self.device_type))
+
+    def __repr__(self):
+        return "DeviceRecord(%d, %r, %r, %r)" % (self.index, self.name, self.user_name, self.serial_number)
+
+class DeviceTable(object):
+    ''' A snapshot of the connected devices, indexed by serial number and by
+        user name. The snapshot is retaken on the first lookup after ttl
+        seconds, on refresh(), and when a lookup misses, in case the device
+        was plugged in after the snapshot.
+    '''
+    def __init__(self, ttl: float = 5.0):
+        self.ttl = ttl
+        self.scans = 0
+        self._records = []
+        self._by_serial_number = {}
+        self._by_user_name = {}
+        self._timestamp = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> List[DeviceRecord]:
+        ''' Enumerates the devices and replaces the snapshot.
+        '''
+        with self._lock:
+            records = []
+            for index in range(dwf.EnumDevices(dwf.EnumFilter.ALL)):
+                device_type, revision = dwf.EnumDeviceType(index)
+                configurations = []
+                for config_index in range(dwf.EnumConfig(index)):
+                    configurations.append(tuple([0] + [ dwf.EnumConfigInfo(config_index, info) for info in dwf.ConfigInfo ]))
+                records.append(DeviceRecord(index, dwf.EnumDeviceName(index), dwf.EnumUserName(index), dwf.EnumSN(index),
+                                            device_type, revision, dwf.EnumDeviceIsOpened(index), tuple(configurations)))
+            self._records = records
+            self._by_serial_number = { record.serial_number: record for record in records }
+            self._by_user_name = {}
+            for record in records:
+                self._by_user_name.setdefault(record.user_name, record)
+            self._timestamp = time.monotonic()
+            self.scans += 1
+            return records
+
+    def invalidate(self) -> None:
+        ''' Makes the next lookup take a new snapshot.
+        '''
+        self._timestamp = None
+
+    def devices(self, filter: dwf.EnumFilter = dwf.EnumFilter.ALL) -> List[DeviceRecord]:
+        ''' Returns the records of the devices matching filter.
+        '''
+        return [ record for record in self._current() if record.matches(filter) ]
+
+    def find(self, user_name: str = None, serial_number: str = None, filter: dwf.EnumFilter = dwf.EnumFilter.ALL) -> DeviceRecord:
+        ''' Returns the record of the first device matching every criterion
+            given, or None. A miss retakes the snapshot once before giving up.
+        '''
+        self._current()
+        for attempt in range(2):
+            record = self._lookup(user_name, serial_number, filter)
+            if (record is not None or attempt == 1):
+                return record
+            self.refresh()
+
+    def open_device(self, record: DeviceRecord, config_index: int = 0) -> int:
+        ''' Opens the device of a record with dwf.DeviceConfigOpen and returns
+            the handle. The enumeration list of the driver is checked first,
+            and the snapshot retaken if the device moved or another module
+            re-enumerated with a filter in between; record.index is updated to
+            the index the device was opened with, and record.is_opened set
+            until close_device.
+        '''
+        if (self._driver_index_of(record) != record.index):
+            self.refresh()
+            current = self._by_serial_number.get(record.serial_number)
+            if (current is None):
+                return dwf.hdwfNone
+            record.index = current.index
+        hdwf = dwf.DeviceConfigOpen(record.index, config_index)
+        with self._lock:
+            record.is_opened = True
+            current = self._by_serial_number.get(record.serial_number)
+            if (current is not None):
+                current.is_opened = True
+        return hdwf
+
+    def close_device(self, hdwf: int, serial_number: str) -> None:
+        ''' Closes a handle returned by open_device with dwf.DeviceClose and
+            marks the device as no longer opened in the snapshot.
+        '''
+        try:
+            dwf.DeviceClose(hdwf)
+        finally:
+            with self._lock:
+                current = self._by_serial_number.get(serial_number)
+                if (current is not None):
+                    current.is_opened = False
+
+    def _current(self) -> List[DeviceRecord]:
+        timestamp = self._timestamp
+        if (timestamp is None or time.monotonic() - timestamp > self.ttl):
+            return self.refresh()
+        return self._records
+
+    def _lookup(self, user_name: str, serial_number: str, filter: dwf.EnumFilter) -> DeviceRecord:
+        if (serial_number is not None):
+            record = self._by_serial_number.get(serial_number)
+            if (record is None or (user_name is not None and record.user_name != user_name)):
+                return None
+            return record if (record.matches(filter)) else None
+        if (user_name is not None and filter == dwf.EnumFilter.ALL):
+            return self._by_user_name.get(user_name)
+        for record in self._records:
+            if ((user_name is None or record.user_name == user_name) and record.matches(filter)):
+                return record
+        return None
+
+    def _driver_index_of(self, record: DeviceRecord) -> int:
+        try:
+            if (dwf.EnumSN(record.index) == record.serial_number):
+                return record.index
+        except dwf.DwfApiException:
+            pass
+        return -1
+
+# The table shared by the library.
+table = DeviceTable()
+
+def devices(filter: dwf.EnumFilter = dwf.EnumFilter.ALL) -> List[DeviceRecord]:
+    ''' Returns the records of the connected devices matching filter.
+    '''
+    return table.devices(filter)
+
+def find(user_name: str = None, serial_number: str = None, filter: dwf.EnumFilter = dwf.EnumFilter.ALL) -> DeviceRecord:
+    ''' Returns the record of a connected device by user name and/or serial
+        number, or None.
+    '''
+    return table.find(user_name, serial_number, filter)
+
+def open_device(record: DeviceRecord, config_index: int = 0) -> int:
+    ''' Opens the device of a record and returns its handle.
+    '''
+    return table.open_device(record, config_index)
+
+def close_device(hdwf: int, serial_number: str) -> None:
+    ''' Closes a handle returned by open_device.
+    '''
+    table.close_device(hdwf, serial_number)
+
+def refresh() -> List[DeviceRecord]:
+    ''' Enumerates the devices again now.
+    '''
+    return table.refresh()
+
+def invalidate() -> None:
+    ''' Makes the next lookup enumerate the devices again.
+    '''
+    table.invalidate()
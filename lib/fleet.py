@@ -0,0 +1,513 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Fleet of devices driven in parallel, one worker process per device. Each
+# worker opens its device once and runs jobs from the fleet queue, so devices
+# are not serialized behind one interpreter lock or one USB call at a time.
+# A job is a function taking the PyAnalogDiscovery of the worker as its first
+# argument, routed to a device by serial number or to the least busy idle
+# device of a type:
+#
+#   def capture(device, channel, sample_rate, number_of_samples):
+#       scope = device.acquire_oscilloscope()
+#       scope.configure_channel(channel, 5.0)
+#       scope.configure_acquisition(sample_rate, number_of_samples)
+#       scope.initiate()
+#       while (scope.is_done() == False):
+#           pass
+#       return scope.read(channel)
+#
+#   with fleet.Fleet() as devices:
+#       future = devices.submit(capture, 0, 1e6, 8192, device_type = dwf.EnumFilter.ANALOG_DISCOVERY_PRO_3X50)
+#       samples = future.result()
+#
+# Workers are started with the 'spawn' method (a forked child would inherit
+# the driver's USB threads), so jobs must be importable functions. Large
+# buffer results (NumPy arrays, array.array, bytes) come back through shared
+# memory rather than the pipe. A worker that dies is restarted; the job it
+# was running fails with WorkerCrashedError.
+
+import array
+import collections
+import concurrent.futures
+import multiprocessing
+import multiprocessing.connection
+import pickle
+import threading
+import time
+import traceback
+from multiprocessing import shared_memory
+from typing import List
+import dwf
+import enumeration
+from pyanalogdiscovery import AnalogDiscovery2Configuration, AnalogDiscoveryProConfiguration, PyAnalogDiscovery
+
+# The configuration each worker opens its device with, by device type.
+DEFAULT_CONFIGURATIONS = {
+    dwf.Device.ANALOG_DISCOVERY2: AnalogDiscovery2Configuration.SCOPE_8K_WAVEGEN_4K_LOGIC_4K_PATTERNS_1K,
+    dwf.Device.ANALOG_DISCOVERY_PRO_3X50: AnalogDiscoveryProConfiguration.SCOPE_32K_WAVEGEN_32K_LOGIC_32K_PATTERNS_16K,
+}
+
+# Messages from the workers.
+_READY = 0
+_OPEN_FAILED = 1
+_DONE = 2
+_FAILED = 3
+
+class WorkerCrashedError(Exception):
+    ''' The worker process of a device exited while running a job.
+    '''
+    def __init__(self, serial_number: str, exitcode: int):
+        super().__init__("worker of %s exited with code %s while running a job" % (serial_number, exitcode))
+        self.serial_number = serial_number
+        self.exitcode = exitcode
+
+class RemoteTraceback(Exception):
+    ''' Set as the cause of an exception raised by a job, with the traceback
+        of the worker.
+    '''
+    def __str__(self):
+        return self.args[0]
+
+class _SharedBuffer(object):
+    ''' A large buffer result, copied into a shared memory block by the worker
+        and out of it by the fleet, which frees the block.
+    '''
+    def __init__(self, buffer):
+        self.dtype = None
+        self.shape = None
+        self.typecode = None
+        if (dwf.numpy is not None and isinstance(buffer, dwf.numpy.ndarray)):
+            buffer = dwf.numpy.ascontiguousarray(buffer)
+            self.dtype = buffer.dtype.str
+            self.shape = buffer.shape
+        elif (isinstance(buffer, array.array)):
+            self.typecode = buffer.typecode
+        elif (not isinstance(buffer, (bytes, bytearray)) and memoryview(buffer).format in array.typecodes):
+            self.typecode = memoryview(buffer).format
+        view = memoryview(buffer).cast('B')
+        self.nbytes = len(view)
+        block = shared_memory.SharedMemory(create = True, size = max(1, self.nbytes))
+        try:
+            block.buf[:self.nbytes] = view
+            self.name = block.name
+        finally:
+            block.close()
+
+    def load(self):
+        block = shared_memory.SharedMemory(name = self.name)
+        try:
+            view = block.buf[:self.nbytes]
+            if (self.dtype is not None):
+                result = dwf.numpy.frombuffer(view, dtype = self.dtype).reshape(self.shape).copy()
+            elif (self.typecode is not None):
+                result = array.array(self.typecode)
+                result.frombytes(view)
+            else:
+                result = bytes(view)
+            view.release()
+            return result
+        finally:
+            block.close()
+            block.unlink()
+
+def _pack(result, threshold: int):
+    # Moves the large buffers of a result, or of a tuple or list result, to
+    # shared memory.
+    if (isinstance(result, (tuple, list))):
+        return type(result)(_pack(each_item, threshold) for each_item in result)
+    if (isinstance(result, (bytes, bytearray, memoryview, array.array)) or (dwf.numpy is not None and isinstance(result, dwf.numpy.ndarray))):
+        if (memoryview(result).nbytes >= threshold):
+            return _SharedBuffer(result)
+    return result
+
+def _unpack(result):
+    if (isinstance(result, (tuple, list))):
+        return type(result)(_unpack(each_item) for each_item in result)
+    if (isinstance(result, _SharedBuffer)):
+        return result.load()
+    return result
+
+def _portable(exception: BaseException) -> BaseException:
+    # Library exceptions do not all survive pickling; send a plain one then.
+    try:
+        return pickle.loads(pickle.dumps(exception))
+    except Exception:
+        return RuntimeError("%s: %s" % (type(exception).__name__, exception))
+
+def _worker_main(serial_number: str, configuration, connection, initializer, initargs: tuple, shared_memory_threshold: int) -> None:
+    # Runs in the worker process: opens the device, then runs one job per
+    # message until it receives an empty one.
+    if (initializer is not None):
+        initializer(*initargs)
+    try:
+        device = PyAnalogDiscovery(configuration, serial_number = serial_number)
+    except Exception as e:
+        connection.send((_OPEN_FAILED, _portable(e), traceback.format_exc()))
+        return
+    try:
+        connection.send((_READY,))
+        while (True):
+            try:
+                payload = connection.recv_bytes()
+            except EOFError:
+                break
+            if (len(payload) == 0):
+                break
+            start = time.perf_counter()
+            try:
+                function, args, kwargs = pickle.loads(payload)
+                result = _pack(function(device, *args, **kwargs), shared_memory_threshold)
+                busy_seconds = time.perf_counter() - start
+                try:
+                    connection.send((_DONE, result, busy_seconds))
+                    continue
+                except (pickle.PicklingError, TypeError, AttributeError) as e:
+                    # Frees the shared memory blocks of the result.
+                    _unpack(result)
+                    raise TypeError("job result cannot be sent back: %s" % e)
+            except Exception as e:
+                busy_seconds = time.perf_counter() - start
+                connection.send((_FAILED, _portable(e), traceback.format_exc(), busy_seconds))
+    finally:
+        device.release()
+
+class _Job(object):
+    __slots__ = ('payload', 'serial_number', 'device_type', 'future', 'dispatched')
+
+    def __init__(self, payload: bytes, serial_number: str, device_type: dwf.EnumFilter):
+        self.payload = payload
+        self.serial_number = serial_number
+        self.device_type = device_type
+        self.future = concurrent.futures.Future()
+        self.dispatched = None
+
+    def accepts(self, worker) -> bool:
+        return ((self.serial_number is None or self.serial_number == worker.serial_number) and
+                (self.device_type is None or worker.record.matches(self.device_type)))
+
+class _Worker(object):
+    def __init__(self, record: enumeration.DeviceRecord):
+        self.record = record
+        self.serial_number = record.serial_number
+        self.process = None
+        self.connection = None
+        self.job = None
+        self.is_ready = False
+        self.is_stopping = False
+        self.is_dead = False
+        self.restart_at = None
+        self.restarts = 0
+        self.jobs_done = 0
+        self.jobs_failed = 0
+        self.busy_seconds = 0.0
+        self.last_error = None
+
+    @property
+    def is_alive(self) -> bool:
+        # Running, or waiting to be restarted.
+        return (self.process is not None or self.restart_at is not None)
+
+    @property
+    def state(self) -> str:
+        if (self.is_dead):
+            return 'dead'
+        if (self.process is None):
+            return 'restarting'
+        if (self.is_ready == False):
+            return 'starting'
+        return 'busy' if (self.job is not None) else 'idle'
+
+class Fleet(object):
+    ''' One worker process per connected device (those matching filter, or
+        the serial numbers given), and a queue of jobs handed to the workers
+        as they become idle, oldest first.
+
+        A worker that exits is restarted after restart_delay seconds, up to
+        max_restarts times; after that its device is dropped and the jobs
+        only it could run fail. initializer(*initargs) runs first in every
+        worker, to set up logging or a simulated backend. Buffer results of
+        at least shared_memory_threshold bytes come back through shared
+        memory.
+    '''
+    def __init__(self, serial_numbers: List[str] = None, filter: dwf.EnumFilter = dwf.EnumFilter.ALL, configurations: dict = None,
+                 initializer = None, initargs: tuple = (), shared_memory_threshold: int = 65536, max_restarts: int = 5, restart_delay: float = 1.0,
+                 mp_context = None):
+        self.configurations = dict(DEFAULT_CONFIGURATIONS)
+        if (configurations is not None):
+            self.configurations.update(configurations)
+        self.initializer = initializer
+        self.initargs = initargs
+        self.shared_memory_threshold = shared_memory_threshold
+        self.max_restarts = max_restarts
+        self.restart_delay = restart_delay
+        self._context = mp_context if (mp_context is not None) else multiprocessing.get_context('spawn')
+        self._lock = threading.Lock()
+        self._pending = collections.deque()
+        self._is_shutdown = False
+        self._workers = {}
+        for record in enumeration.devices(filter):
+            if (serial_numbers is None or record.serial_number in serial_numbers):
+                if (record.device_type in self.configurations):
+                    self._workers[record.serial_number] = _Worker(record)
+        if (len(self._workers) == 0):
+            raise LookupError("no supported device connected")
+        self._started = time.monotonic()
+        with self._lock:
+            for worker in self._workers.values():
+                self._start(worker)
+        self._supervisor = threading.Thread(target = self._supervise, name = "dwf-fleet", daemon = True)
+        self._supervisor.start()
+
+    @property
+    def devices(self) -> List[enumeration.DeviceRecord]:
+        ''' The records of the devices of the fleet.
+        '''
+        return [ worker.record for worker in self._workers.values() ]
+
+    def submit(self, function, *args, serial_number: str = None, device_type: dwf.EnumFilter = None, **kwargs) -> concurrent.futures.Future:
+        ''' Queues function(device, *args, **kwargs) and returns a Future of
+            its result. The job runs on the device with serial_number, or on
+            the first idle device matching device_type, or on the first idle
+            device. function and its arguments are pickled right away, so a
+            job that cannot be sent to a worker raises here.
+        '''
+        job = _Job(pickle.dumps((function, args, kwargs)), serial_number, device_type)
+        with self._lock:
+            if (self._is_shutdown):
+                raise RuntimeError("cannot submit jobs after shutdown")
+            if (not any(worker.is_alive and job.accepts(worker) for worker in self._workers.values())):
+                raise LookupError("no device of the fleet can run the job")
+            self._pending.append(job)
+            self._dispatch()
+        return job.future
+
+    def broadcast(self, function, *args, **kwargs) -> dict:
+        ''' Queues the same job on every device and returns a dictionary of
+            Futures by serial number.
+        '''
+        return { serial_number: self.submit(function, *args, serial_number = serial_number, **kwargs)
+                 for serial_number, worker in self._workers.items() if (worker.is_alive) }
+
+    def queue_depth(self) -> int:
+        ''' Returns the number of jobs waiting for an idle worker.
+        '''
+        return len(self._pending)
+
+    def stats(self) -> dict:
+        ''' Returns a dictionary by serial number of the state of each worker
+            ('starting', 'idle', 'busy', 'restarting' or 'dead'), the number
+            of queued jobs it can run, the jobs it completed and failed, its
+            restarts, its utilization (the fraction of the fleet lifetime it
+            spent running jobs) and the error of its last failed open.
+        '''
+        now = time.monotonic()
+        elapsed = max(now - self._started, 1e-9)
+        stats = {}
+        with self._lock:
+            for serial_number, worker in self._workers.items():
+                busy_seconds = worker.busy_seconds
+                if (worker.job is not None):
+                    busy_seconds += now - worker.job.dispatched
+                stats[serial_number] = {
+                    'name': worker.record.name,
+                    'state': worker.state,
+                    'queue_depth': sum(1 for job in self._pending if job.accepts(worker)),
+                    'jobs_done': worker.jobs_done,
+                    'jobs_failed': worker.jobs_failed,
+                    'restarts': worker.restarts,
+                    'busy_seconds': busy_seconds,
+                    'utilization': min(1.0, busy_seconds / elapsed),
+                    'last_error': None if (worker.last_error is None) else str(worker.last_error),
+                }
+        return stats
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        ''' Stops accepting jobs and stops each worker once the queue holds no
+            job for it. cancel_futures cancels the queued jobs first. With
+            wait, returns once every worker has exited.
+        '''
+        with self._lock:
+            self._is_shutdown = True
+            if (cancel_futures):
+                for job in self._pending:
+                    job.future.cancel()
+                self._pending.clear()
+            self._dispatch()
+        if (wait):
+            self._supervisor.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+        return False
+
+    def _start(self, worker: _Worker) -> None:
+        connection, child_connection = self._context.Pipe()
+        worker.process = self._context.Process(target = _worker_main, name = "dwf-fleet-" + worker.serial_number, daemon = True,
+                                               args = (worker.serial_number, self.configurations[worker.record.device_type], child_connection,
+                                                       self.initializer, self.initargs, self.shared_memory_threshold))
+        worker.process.start()
+        child_connection.close()
+        worker.connection = connection
+        worker.is_ready = False
+        worker.is_stopping = False
+        worker.restart_at = None
+
+    def _dispatch(self) -> None:
+        # Hands queued jobs to idle workers, oldest job first; a job that
+        # several idle workers can run goes to the least busy one. Called with
+        # the lock held.
+        idle = [ worker for worker in self._workers.values() if (worker.is_ready and worker.job is None) ]
+        for job in list(self._pending):
+            if (len(idle) == 0):
+                break
+            candidates = [ worker for worker in idle if job.accepts(worker) ]
+            if (len(candidates) == 0):
+                continue
+            self._pending.remove(job)
+            if (job.future.set_running_or_notify_cancel() == False):
+                continue
+            worker = min(candidates, key = lambda worker: worker.busy_seconds)
+            idle.remove(worker)
+            worker.job = job
+            job.dispatched = time.monotonic()
+            try:
+                worker.connection.send_bytes(job.payload)
+            except OSError:
+                # The worker is exiting; the job fails when its exit is seen.
+                pass
+        if (self._is_shutdown):
+            for worker in idle:
+                if (not any(job.accepts(worker) for job in self._pending)):
+                    self._stop(worker)
+
+    def _stop(self, worker: _Worker) -> None:
+        worker.is_ready = False
+        worker.is_stopping = True
+        try:
+            worker.connection.send_bytes(b'')
+        except OSError:
+            pass
+
+    def _supervise(self) -> None:
+        while (True):
+            with self._lock:
+                now = time.monotonic()
+                for worker in self._workers.values():
+                    if (worker.restart_at is not None and now >= worker.restart_at):
+                        self._start(worker)
+                if (self._is_shutdown and not any(worker.is_alive for worker in self._workers.values())):
+                    return
+                waitables = {}
+                for worker in self._workers.values():
+                    if (worker.process is not None):
+                        waitables[worker.connection] = worker
+                        waitables[worker.process.sentinel] = worker
+            ready = multiprocessing.connection.wait(list(waitables), timeout = 0.1)
+            completions = []
+            with self._lock:
+                for each_ready in ready:
+                    worker = waitables[each_ready]
+                    if (worker.process is None):
+                        # Its exit was handled earlier in this round.
+                        continue
+                    if (isinstance(each_ready, int)):
+                        self._exited(worker, completions)
+                        continue
+                    try:
+                        message = each_ready.recv()
+                    except (EOFError, OSError):
+                        self._exited(worker, completions)
+                        continue
+                    self._received(worker, message, completions)
+                self._dispatch()
+            # Futures run their callbacks, which may submit jobs, without the lock.
+            for future, result, exception in completions:
+                if (exception is not None):
+                    future.set_exception(exception)
+                else:
+                    future.set_result(result)
+
+    def _received(self, worker: _Worker, message: tuple, completions: list) -> None:
+        if (message[0] == _READY):
+            worker.is_ready = True
+            return
+        if (message[0] == _OPEN_FAILED):
+            exception, remote_traceback = message[1], message[2]
+            exception.__cause__ = RemoteTraceback(remote_traceback)
+            worker.last_error = exception
+            return
+        job = worker.job
+        worker.job = None
+        worker.busy_seconds += message[-1]
+        if (message[0] == _DONE):
+            worker.jobs_done += 1
+            try:
+                completions.append((job.future, _unpack(message[1]), None))
+            except Exception as e:
+                completions.append((job.future, None, e))
+        else:
+            worker.jobs_failed += 1
+            exception, remote_traceback = message[1], message[2]
+            exception.__cause__ = RemoteTraceback(remote_traceback)
+            completions.append((job.future, None, exception))
+
+    def _exited(self, worker: _Worker, completions: list) -> None:
+        # Messages sent before the exit are still in the pipe.
+        try:
+            while (worker.connection.poll()):
+                self._received(worker, worker.connection.recv(), completions)
+        except (EOFError, OSError):
+            pass
+        worker.connection.close()
+        worker.connection = None
+        worker.process.join()
+        exitcode = worker.process.exitcode
+        worker.process = None
+        worker.is_ready = False
+        if (worker.job is not None):
+            worker.jobs_failed += 1
+            worker.busy_seconds += time.monotonic() - worker.job.dispatched
+            completions.append((worker.job.future, None, WorkerCrashedError(worker.serial_number, exitcode)))
+            worker.job = None
+        if (worker.is_stopping or self._is_shutdown):
+            self._fail_orphans(completions)
+            return
+        if (worker.restarts >= self.max_restarts):
+            worker.is_dead = True
+            self._fail_orphans(completions)
+            return
+        worker.restarts += 1
+        worker.restart_at = time.monotonic() + self.restart_delay
+
+    def _fail_orphans(self, completions: list) -> None:
+        # Fails the queued jobs that no remaining worker can run.
+        for job in list(self._pending):
+            if (not any(worker.is_alive and job.accepts(worker) for worker in self._workers.values())):
+                self._pending.remove(job)
+                if (job.future.set_running_or_notify_cancel()):
+                    completions.append((job.future, None, LookupError("no device of the fleet can run the job")))
@@ -0,0 +1,219 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Pool of open device handles. Opening a device loads its FPGA configuration,
+# the slowest call of the library; the pool keeps handles open per (serial
+# number, configuration index) and hands them out as leases. When a lease is
+# returned the device is reset instead of closed, and handles left idle for
+# idle_timeout seconds are closed by a background thread.
+#
+#   with handlepool.pool.acquire("SN:210018B04951", 0) as lease:
+#       dwf.AnalogInReset(lease.hdwf)
+
+import atexit
+import threading
+import time
+import dwf
+import enumeration
+
+class Lease(object):
+    ''' Exclusive use of a pooled handle until release() is called (or the
+        with block ends). hdwf is dwf.hdwfNone once the lease is released.
+    '''
+    def __init__(self, pool, entry):
+        self._pool = pool
+        self._entry = entry
+        self.hdwf = entry.hdwf
+        self.serial_number = entry.serial_number
+        self.config_index = entry.config_index
+
+    def release(self) -> None:
+        ''' Resets the device and returns the handle to the pool.
+        '''
+        if (self._entry is not None):
+            entry = self._entry
+            self._entry = None
+            self.hdwf = dwf.hdwfNone
+            self._pool._release(entry)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
+
+class _PooledHandle(object):
+    def __init__(self, serial_number: str, config_index: int, hdwf: int):
+        self.serial_number = serial_number
+        self.config_index = config_index
+        self.hdwf = hdwf
+        self.leased = False
+        self.idle_since = None
+
+class HandlePool(object):
+    ''' Open handles by serial number. A device can only be opened once, so a
+        serial number has at most one handle; asking for another
+        configuration closes the idle handle and opens the device again.
+        acquire() waits for a leased handle to be released.
+
+        opens and reuses count the handles opened and the leases served
+        without opening.
+    '''
+    def __init__(self, idle_timeout: float = 30.0):
+        self.idle_timeout = idle_timeout
+        self.opens = 0
+        self.reuses = 0
+        self._handles = {}
+        self._condition = threading.Condition()
+        self._reaper = None
+
+    def acquire(self, serial_number: str, config_index: int = 0, timeout: float = None) -> Lease:
+        ''' Leases the handle of a device opened with config_index, opening it
+            if needed. Waits up to timeout seconds (forever by default) while
+            the device is leased; raises TimeoutError if it stays leased.
+        '''
+        deadline = None if (timeout is None) else time.monotonic() + timeout
+        with self._condition:
+            while (True):
+                entry = self._handles.get(serial_number)
+                if (entry is None or entry.leased == False):
+                    break
+                remaining = None if (deadline is None) else deadline - time.monotonic()
+                if (remaining is not None and remaining <= 0):
+                    raise TimeoutError("device %s is leased" % serial_number)
+                self._condition.wait(remaining)
+            if (entry is not None and entry.config_index == config_index):
+                self.reuses += 1
+                entry.leased = True
+                entry.idle_since = None
+                return Lease(self, entry)
+            # The device is opened outside the condition so that it does not
+            # hold up the leases of other devices or the reaper. Until then a
+            # leased placeholder makes acquire() wait for this device.
+            stale = entry
+            entry = _PooledHandle(serial_number, config_index, dwf.hdwfNone)
+            entry.leased = True
+            self._handles[serial_number] = entry
+        try:
+            if (stale is not None):
+                self._close_handle(stale)
+            entry.hdwf = self._open(serial_number, config_index)
+        except BaseException:
+            with self._condition:
+                del self._handles[serial_number]
+                self._condition.notify_all()
+            raise
+        with self._condition:
+            self.opens += 1
+            self._condition.notify_all()
+        return Lease(self, entry)
+
+    def close_idle(self, older_than: float = 0.0) -> int:
+        ''' Closes the handles idle for more than older_than seconds and
+            returns how many were closed.
+        '''
+        with self._condition:
+            idle = self._take_idle(older_than)
+        self._close(idle)
+        return len(idle)
+
+    def close_all(self) -> None:
+        ''' Closes every idle handle. Leased handles are closed when their
+            lease is released.
+        '''
+        self.close_idle()
+
+    def _open(self, serial_number: str, config_index: int) -> int:
+        record = enumeration.find(serial_number = serial_number)
+        hdwf = dwf.hdwfNone if (record is None) else enumeration.open_device(record, config_index)
+        if (hdwf == dwf.hdwfNone):
+            raise LookupError("device %s is not connected" % serial_number)
+        return hdwf
+
+    def _take_idle(self, older_than: float) -> list:
+        # Called with the condition held. The entries are marked leased so
+        # that acquire() waits for them to be closed rather than opening a
+        # device that is still open.
+        now = time.monotonic()
+        idle = [ entry for entry in self._handles.values() if (entry.leased == False and now - entry.idle_since >= older_than) ]
+        for entry in idle:
+            entry.leased = True
+        return idle
+
+    def _close(self, entries: list) -> None:
+        # Called without the condition, so that closing a device does not
+        # hold up the leases of the others.
+        if (len(entries) == 0):
+            return
+        for entry in entries:
+            self._close_handle(entry)
+        with self._condition:
+            for entry in entries:
+                del self._handles[entry.serial_number]
+            self._condition.notify_all()
+
+    def _close_handle(self, entry: _PooledHandle) -> None:
+        try:
+            enumeration.close_device(entry.hdwf, entry.serial_number)
+        except dwf.DwfApiException:
+            pass
+
+    def _release(self, entry: _PooledHandle) -> None:
+        # The reset runs outside the condition; the entry stays leased until
+        # it is done, so no one else uses the handle meanwhile.
+        try:
+            dwf.DeviceReset(entry.hdwf)
+        except dwf.DwfApiException:
+            # The device is gone or in an unknown state; do not reuse it.
+            with self._condition:
+                del self._handles[entry.serial_number]
+                self._condition.notify_all()
+            self._close_handle(entry)
+            return
+        with self._condition:
+            entry.leased = False
+            entry.idle_since = time.monotonic()
+            self._condition.notify_all()
+            if (self._reaper is None):
+                self._reaper = threading.Thread(target = self._reap_loop, name = "dwf-handle-pool", daemon = True)
+                self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        # Runs while there are idle handles; _release starts it again.
+        while (True):
+            with self._condition:
+                idle = self._take_idle(self.idle_timeout)
+                if (len(idle) == 0):
+                    idle_since = [ entry.idle_since for entry in self._handles.values() if (entry.leased == False) ]
+                    if (len(idle_since) == 0):
+                        self._reaper = None
+                        return
+                    self._condition.wait(min(idle_since) + self.idle_timeout - time.monotonic())
+                    continue
+            self._close(idle)
+
+# The pool shared by the library. Its idle handles are closed at exit.
+pool = HandlePool()
+atexit.register(pool.close_all)
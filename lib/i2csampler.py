@@ -0,0 +1,335 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Periodic sampling of I2C sensors. Each job reads length registers of a slave
+# every period seconds. Releases are anchored to the start time, so sampling
+# does not drift. Jobs are served earliest deadline first (a sample is due by
+# the next release of its job). The jobs due within merge_window of each
+# other are run as one I2cBatch. Reads of adjacent registers of one slave are
+# merged into a single transaction. Samples go into a ring buffer per job,
+# with their timestamps.
+#
+#   sampler = i2csampler.I2cSampler(i2c)
+#   temperature = sampler.add(0x48, 0x00, 2, period = 0.1)
+#   humidity = sampler.add(0x40, 0xE5, 2, period = 1.0)
+#   sampler.start()
+#   timestamp, data = temperature.latest()
+
+import array
+import collections
+import threading
+import time
+from typing import List
+from pyanalogdiscovery import I2cBatch, I2cClockRate
+
+class SampleJob(object):
+    ''' A periodic read of length registers starting at register, with the
+        last capacity samples kept in a ring buffer.
+
+        Metrics: samples taken, naks (reads the slave did not acknowledge,
+        which store no sample), deadline_misses (samples completed after the
+        next release of the job, or skipped because the sampler fell a whole
+        period behind), and the jitter of the sample times against the
+        release times, in seconds.
+    '''
+    def __init__(self, address: int, register: int, length: int, period: float, name: str = None, capacity: int = 256):
+        self.address = address
+        self.register = register
+        self.length = length
+        self.period = period
+        self.name = name if (name is not None) else "0x%02x:0x%02x" % (address, register)
+        self.capacity = capacity
+        self.release = None
+        self.samples = 0
+        self.naks = 0
+        self.deadline_misses = 0
+        self.max_jitter = 0.0
+        self._jitter_sum = 0.0
+        self._timestamps = array.array('d', bytes(8 * capacity))
+        self._data = bytearray(capacity * length)
+        self._lock = threading.Lock()
+
+    @property
+    def deadline(self) -> float:
+        return self.release + self.period
+
+    @property
+    def mean_jitter(self) -> float:
+        return (self._jitter_sum / self.samples) if (self.samples > 0) else 0.0
+
+    def latest(self) -> (float, bytes):
+        ''' Returns the timestamp and data of the last sample, or None.
+        '''
+        with self._lock:
+            if (self.samples == 0):
+                return None
+            slot = (self.samples - 1) % self.capacity
+            return self._timestamps[slot], bytes(self._data[slot * self.length:(slot + 1) * self.length])
+
+    def history(self) -> List[tuple]:
+        ''' Returns the samples in the ring buffer, oldest first, as a list of
+            (timestamp, data) tuples.
+        '''
+        with self._lock:
+            count = min(self.samples, self.capacity)
+            history = []
+            for each_sample in range(self.samples - count, self.samples):
+                slot = each_sample % self.capacity
+                history.append((self._timestamps[slot], bytes(self._data[slot * self.length:(slot + 1) * self.length])))
+            return history
+
+    def _store(self, timestamp: float, data) -> None:
+        jitter = abs(timestamp - self.release)
+        with self._lock:
+            slot = self.samples % self.capacity
+            self._timestamps[slot] = timestamp
+            self._data[slot * self.length:(slot + 1) * self.length] = data
+            self.samples += 1
+        self._jitter_sum += jitter
+        self.max_jitter = max(self.max_jitter, jitter)
+
+    def _advance(self, completed: float) -> None:
+        if (completed > self.deadline):
+            self.deadline_misses += 1
+        self.release += self.period
+        if (self.deadline <= completed):
+            # More than a period behind: skip the releases that can no longer
+            # make their deadline instead of running them late in a burst.
+            skipped = int((completed - self.release) // self.period)
+            self.release += skipped * self.period
+            self.deadline_misses += skipped
+
+    def __repr__(self):
+        return "SampleJob(%r, period=%g)" % (self.name, self.period)
+
+class _Plan(object):
+    # The compiled batch for one set of jobs, and where the data of each job
+    # is in it: (job, operation index, offset in the operation).
+    def __init__(self, jobs: List[SampleJob], max_burst: int, merge_gap: int):
+        self.batch = I2cBatch()
+        self.entries = []
+        jobs = sorted(jobs, key = lambda job: (job.address, job.register))
+        index = 0
+        while (index < len(jobs)):
+            first = jobs[index]
+            start, stop = first.register, first.register + first.length
+            group = [first]
+            index += 1
+            while (index < len(jobs)):
+                job = jobs[index]
+                if (job.address != first.address or job.register > stop + merge_gap or max(stop, job.register + job.length) - start > max_burst):
+                    break
+                stop = max(stop, job.register + job.length)
+                group.append(job)
+                index += 1
+            operation = self.batch.write_read(first.address, bytes([start]), stop - start)
+            for job in group:
+                self.entries.append((job, operation, job.register - start))
+        self.batch.compile()
+
+def _transaction_bits(read_data_size: int) -> int:
+    # Start, address, register, repeated start, address, data, stop: nine
+    # clocks per byte.
+    return 9 * (3 + read_data_size) + 3
+
+class I2cSampler(object):
+    ''' Earliest-deadline-first scheduler of periodic reads on a configured
+        InterIntegratedCircuit session.
+
+        On every pass, the jobs released within merge_window seconds are
+        taken in deadline order and run as one batch. If max_batch_time is
+        set, a pass stops taking jobs once the estimated bus time at
+        i2c_clock_rate would exceed it, so an overloaded bus serves the most
+        urgent jobs first. Reads of one slave are merged when their register
+        ranges are at most merge_gap registers apart, up to max_burst bytes
+        per transaction. The default gap of zero only merges touching
+        ranges, since reading registers in between can have side effects.
+        Compiled batches are cached per set of jobs.
+
+        bus_utilization is the fraction of the elapsed time spent in I2C
+        transfers.
+    '''
+    def __init__(self, i2c, merge_window: float = 0.002, max_batch_time: float = None, i2c_clock_rate: float = I2cClockRate.ONE_HUNDRED_KHZ,
+                 max_burst: int = 32, merge_gap: int = 0, plan_cache_size: int = 64):
+        self.i2c = i2c
+        self.merge_window = merge_window
+        self.max_batch_time = max_batch_time
+        self.i2c_clock_rate = float(i2c_clock_rate)
+        self.max_burst = max_burst
+        self.merge_gap = merge_gap
+        self.plan_cache_size = plan_cache_size
+        self.jobs = []
+        self.batches = 0
+        self.transactions = 0
+        self.busy_seconds = 0.0
+        self._plans = collections.OrderedDict()
+        self._started = None
+        self._error = None
+        self._stop_requested = threading.Event()
+        self._thread = None
+
+    def add(self, address: int, register: int, length: int, period: float, name: str = None, capacity: int = 256, phase: float = 0.0) -> SampleJob:
+        ''' Adds a periodic read and returns its job. The first release is
+            phase seconds after the sampler starts (or after now, if it is
+            already running).
+        '''
+        if (length > self.max_burst):
+            raise ValueError("job reads %d bytes, more than max_burst (%d)" % (length, self.max_burst))
+        job = SampleJob(address, register, length, period, name, capacity)
+        if (self._started is not None):
+            job.release = time.monotonic() + phase
+        else:
+            job.release = phase
+        self.jobs = self.jobs + [job]
+        return job
+
+    def remove(self, job: SampleJob) -> None:
+        self.jobs = [ each_job for each_job in self.jobs if each_job is not job ]
+        self._plans.clear()
+
+    @property
+    def bus_utilization(self) -> float:
+        if (self._started is None):
+            return 0.0
+        return min(1.0, self.busy_seconds / max(time.monotonic() - self._started, 1e-9))
+
+    def stats(self) -> dict:
+        ''' Returns the batch and transaction counts, the bus utilization,
+            and the sample, nak, deadline miss and jitter metrics of every
+            job, by job name.
+        '''
+        return {
+            'batches': self.batches,
+            'transactions': self.transactions,
+            'bus_utilization': self.bus_utilization,
+            'jobs': { job.name: { 'samples': job.samples, 'naks': job.naks, 'deadline_misses': job.deadline_misses,
+                                  'mean_jitter': job.mean_jitter, 'max_jitter': job.max_jitter } for job in self.jobs },
+        }
+
+    def run_once(self) -> float:
+        ''' Runs the jobs that are due, if any, and returns the time
+            (time.monotonic()) of the next release.
+        '''
+        jobs = self.jobs
+        if (self._started is None):
+            self._started = time.monotonic()
+            for job in jobs:
+                job.release += self._started
+        now = time.monotonic()
+        due = sorted((job for job in jobs if (job.release <= now + self.merge_window)), key = lambda job: job.deadline)
+        if (self.max_batch_time is not None):
+            due = self._within_budget(due)
+        if (len(due) > 0):
+            plan = self._plan(due)
+            start = time.monotonic()
+            self.i2c.run(plan.batch)
+            completed = time.monotonic()
+            self.busy_seconds += completed - start
+            self.batches += 1
+            self.transactions += len(plan.batch)
+            # The transfer time is unknown per operation; stamp every sample
+            # with the middle of the batch.
+            timestamp = (start + completed) / 2
+            naks = plan.batch.naks
+            for job, operation, offset in plan.entries:
+                if (naks[operation] != 0):
+                    job.naks += 1
+                else:
+                    job._store(timestamp, plan.batch.result(operation)[offset:offset + job.length])
+                job._advance(completed)
+        return min((job.release for job in jobs), default = None)
+
+    def run(self, duration: float = None) -> None:
+        ''' Samples until stop() is called or for duration seconds.
+        '''
+        end = None if (duration is None) else time.monotonic() + duration
+        while (self._stop_requested.is_set() == False):
+            next_release = self.run_once()
+            now = time.monotonic()
+            if (end is not None and now >= end):
+                break
+            wakeup = now + 0.1 if (next_release is None) else next_release
+            if (end is not None):
+                wakeup = min(wakeup, end)
+            if (wakeup > now):
+                self._stop_requested.wait(wakeup - now)
+
+    def start(self) -> None:
+        ''' Starts sampling in a background thread.
+        '''
+        if (self._thread is not None):
+            raise RuntimeError("sampler already started")
+        self._stop_requested.clear()
+        self._thread = threading.Thread(target = self._run_thread, name = type(self).__name__, daemon = True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        ''' Stops the background thread, and raises the error that stopped it
+            early, if any.
+        '''
+        self._stop_requested.set()
+        if (self._thread is not None):
+            self._thread.join()
+            self._thread = None
+        if (self._error is not None):
+            error, self._error = self._error, None
+            raise error
+
+    def __enter__(self):
+        if (self._thread is None):
+            self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _run_thread(self) -> None:
+        try:
+            self.run()
+        except Exception as e:
+            self._error = e
+
+    def _within_budget(self, due: List[SampleJob]) -> List[SampleJob]:
+        # Takes jobs in deadline order while the estimated bus time fits; the
+        # most urgent job always runs.
+        selected = []
+        bits = 0
+        for job in due:
+            bits += _transaction_bits(job.length)
+            if (len(selected) > 0 and bits / self.i2c_clock_rate > self.max_batch_time):
+                break
+            selected.append(job)
+        return selected
+
+    def _plan(self, jobs: List[SampleJob]) -> _Plan:
+        key = frozenset(id(job) for job in jobs)
+        plan = self._plans.get(key)
+        if (plan is None):
+            plan = _Plan(jobs, self.max_burst, self.merge_gap)
+            self._plans[key] = plan
+            if (len(self._plans) > self.plan_cache_size):
+                self._plans.popitem(last = False)
+        else:
+            self._plans.move_to_end(key)
+        return plan
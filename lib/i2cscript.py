@@ -0,0 +1,146 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Batch mode of the i2c tools. A script holds one operation per line, with the
+# arguments the tools take on the command line, optionally prefixed by the
+# operation name so that one script can mix them:
+#
+#   # chip  register  bytes...
+#   set 0x18 0x20 0x57
+#   get 0x18 0x20
+#   get 0x18 0x00 16
+#   dump 0x18 0x00-0x3f
+#
+# Lines without a name run the operation of the tool reading the script.
+# Blank lines and lines starting with '#' are skipped. Every operation runs on
+# the same device session and bus, and its result is written as soon as it
+# completes, as text or as one JSON object per line.
+
+import json
+import shlex
+import sys
+from pyanalogdiscovery import PyAnalogDiscoveryException, Status
+from dwf import DwfApiException
+
+COMMANDS = ('get', 'set', 'dump')
+
+class ScriptError(Exception):
+    ''' A line of the script that cannot be parsed.
+    '''
+    def __init__(self, line_number: int, message: str):
+        super().__init__("line %d: %s" % (line_number, message))
+        self.line_number = line_number
+
+def _integer(text: str, name: str, low: int, high: int) -> int:
+    value = int(text, 0)
+    if (value < low or value > high):
+        raise ValueError("%s %s is out of range (0x%02x-0x%02x)" % (name, text, low, high))
+    return value
+
+def parse_line(line: str, line_number: int, default_command: str):
+    ''' Returns (command, arguments) for a script line, or None for a blank
+        or comment line. Arguments are converted to integers and range
+        checked; a dump range is returned as a (first, last) tuple.
+    '''
+    try:
+        words = shlex.split(line, comments = True)
+        if (len(words) == 0):
+            return None
+        command = default_command
+        if (words[0] in COMMANDS):
+            command = words.pop(0)
+        if (command == 'dump'):
+            if (len(words) not in (1, 2)):
+                raise ValueError("dump takes a chip address and an optional FIRST-LAST range")
+            first, last = 0x00, 0xFF
+            if (len(words) == 2):
+                first, _, last = words[1].partition('-')
+                first, last = _integer(first, "register", 0x00, 0xFF), _integer(last, "register", 0x00, 0xFF)
+                if (first > last):
+                    raise ValueError("range %s is empty" % words[1])
+            return command, (_integer(words[0], "chip address", 0x03, 0x77), first, last)
+        if (command == 'get' and len(words) not in (2, 3)):
+            raise ValueError("get takes a chip address, a register address and an optional byte count")
+        if (command == 'set' and len(words) < 3):
+            raise ValueError("set takes a chip address, a register address and at least one byte")
+        arguments = [ _integer(words[0], "chip address", 0x03, 0x77), _integer(words[1], "register", 0x00, 0xFF) ]
+        if (command == 'get'):
+            arguments += [ _integer(word, "byte count", 1, 0x100) for word in words[2:] ]
+        else:
+            arguments += [ _integer(word, "byte", 0x00, 0xFF) for word in words[2:] ]
+    except ValueError as e:
+        raise ScriptError(line_number, str(e))
+    return command, tuple(arguments)
+
+def run(i2c, lines, default_command: str, output, use_json: bool = False, chunk: int = 256) -> int:
+    ''' Runs every line of a script on a configured I2C session (local or
+        served by a device server), writing results to output as they
+        complete. Stops at the first failing line and returns the number of
+        failed lines (0 or 1).
+    '''
+    for line_number, line in enumerate(lines, 1):
+        try:
+            operation = parse_line(line, line_number, default_command)
+            if (operation is None):
+                continue
+            command, arguments = operation
+            i2c.address = arguments[0]
+            result = { 'line': line_number, 'command': command, 'chip': arguments[0] }
+            if (command == 'get'):
+                read_amount = arguments[2] if (len(arguments) == 3) else 1
+                data, is_nak = i2c.write_read_bytes(bytes([arguments[1]]), read_amount)
+                result.update(register = arguments[1], data = list(data), nak = is_nak)
+                text = " ".join(format(each_data, '02x') for each_data in data)
+            elif (command == 'set'):
+                is_nak = i2c.write(bytes(arguments[1:]))
+                result.update(register = arguments[1], nak = is_nak)
+                text = None
+            else:
+                data = i2c.dump(arguments[1], arguments[2], chunk)
+                result.update(first = arguments[1], last = arguments[2], data = list(data))
+                text = data.hex()
+            if (result.get('nak', 0) != 0):
+                raise PyAnalogDiscoveryException(Status.ERROR_I2C_SLAVE_NAK)
+        except (ScriptError, PyAnalogDiscoveryException, DwfApiException) as e:
+            if (use_json):
+                output.write(json.dumps({ 'line': line_number, 'error': str(e) }) + "\n")
+            else:
+                output.write("Error on line %d\n%s\n" % (line_number, e))
+            output.flush()
+            return 1
+        if (use_json):
+            output.write(json.dumps(result) + "\n")
+        elif (text is not None):
+            output.write(text + "\n")
+        output.flush()
+    return 0
+
+def run_file(i2c, path: str, default_command: str, output, use_json: bool = False, chunk: int = 256) -> int:
+    ''' Runs the script in the file at path, or on stdin when path is '-',
+        like run(). The file is closed afterwards; stdin is left open.
+    '''
+    if (path == '-'):
+        return run(i2c, sys.stdin, default_command, output, use_json, chunk)
+    with open(path) as lines:
+        return run(i2c, lines, default_command, output, use_json, chunk)
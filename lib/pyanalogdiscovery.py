@@ -24,8 +24,16 @@
 
 from ctypes import create_string_buffer, c_double, c_uint8, c_int, cdll, byref
 from enum import IntEnum
+import array
+import functools
+import hashlib
 import sys
+import threading
+import time
 import dwf
+import enumeration
+import handlepool
+import streaming
 from typing import List
 
 class Pins(IntEnum):
@@ -68,6 +76,13 @@ class I2cClockRate(IntEnum):
     def __str__(self):
         return self.name.replace("_", " ").title()
 
+class I2cScanStrategy(IntEnum):
+    QUICK_WRITE = 0
+    READ_BYTE = 1
+    WRITE_READ = 2
+    def __str__(self):
+        return self.name.replace("_", " ").title()
+
 class ClockPhase(IntEnum):
     FIRST_EDGE = 0
     SECOND_EDGE = 1
@@ -84,19 +99,438 @@ class Status(IntEnum):
     SUCCESS = 0
     ERROR_FAILED_TO_OPEN_DEVICE = -1
     ERROR_I2C_BUS_ERROR_CHECK_THE_PULLUPS = -2
+    ERROR_I2C_SLAVE_NAK = -3
     def __str__(self):
         return self.name.replace("_", " ").title()
 
 class PyAnalogDiscoveryException(dwf.DwfApiException):
-    def __init__(self, status):
-        self.status = status
+    def __init__(self, status, message: str = None):
+        # The libdwf message is read when the exception is raised, as in
+        # dwf._ThrowIfError, not when it is printed.
+        super().__init__(status, dwf.GetLastErrorMsg() if (message is None) else message)
 
-    def __str__(self):
-        error_message = dwf.GetLastErrorMsg()
-        if (len(error_message) == 0):
-            return str(self.status)
+def _capacity(buffer, typecode: str) -> int:
+    ''' Returns how many typecode samples fit in a buffer of any item type.
+    '''
+    return memoryview(buffer).nbytes // array.array(typecode).itemsize
+
+def _valid_after(samples_valid: int, first_sample: int) -> int:
+    ''' Returns how many of the samples_valid acquired samples there are from
+            first_sample on. Raises ValueError when first_sample is past them.
+    '''
+    if (first_sample < 0 or first_sample > samples_valid):
+        raise ValueError("first sample %d is outside the %d valid samples" % (first_sample, samples_valid))
+    return samples_valid - first_sample
+
+def _head(buffer, count: int, typecode: str):
+    ''' Returns the first count typecode samples of a buffer, without copying:
+            the buffer itself when it holds exactly that, otherwise a view. A
+            buffer of another item size, such as a bytearray, is viewed as
+            typecode samples.
+    '''
+    item_size = array.array(typecode).itemsize
+    if (dwf.numpy is not None and isinstance(buffer, dwf.numpy.ndarray)):
+        if (buffer.itemsize != item_size):
+            return buffer.reshape(-1).view(dwf.numpy.uint8)[:count * item_size].view(typecode)
+        if (count == len(buffer)):
+            return buffer
+        return buffer[:count]
+    view = memoryview(buffer)
+    if (view.itemsize != item_size):
+        return view.cast('B')[:count * item_size].cast(typecode)
+    if (count == len(view)):
+        return buffer
+    return view[:count]
+
+class RawWaveform(object):
+    ''' Raw 16-bit AnalogIn samples together with the channel range, offset and
+        ADC resolution they were acquired with. Samples are kept as int16, a
+        quarter of the memory of volts in float64, and are only converted to
+        volts when to_volts() is called.
+    '''
+    def __init__(self, samples, voltage_range: float, voltage_offset: float, adc_bits: int):
+        self.samples = samples
+        self.voltage_range = voltage_range
+        self.voltage_offset = voltage_offset
+        self.adc_bits = adc_bits
+
+    def __len__(self):
+        return len(self.samples)
+
+    @property
+    def volts_per_count(self) -> float:
+        ''' The weight of one raw count. Raw samples are scaled to the full
+            16-bit range whatever the ADC resolution is.
+        '''
+        return self.voltage_range / 65536.0
+
+    @property
+    def resolution(self) -> float:
+        ''' The weight of one ADC code in volts.
+        '''
+        return self.voltage_range / float(1 << self.adc_bits)
+
+    def to_volts(self, out=None):
+        ''' Converts the samples to volts over the whole array at once. The
+            result is written into out (a float64 buffer) when given, otherwise
+            into a newly allocated buffer.
+        '''
+        scale = self.volts_per_count
+        if (out is None):
+            out = dwf.AllocateSamples('d', len(self.samples))
+        if (dwf.numpy is not None):
+            volts = dwf.numpy.frombuffer(out, dtype=dwf.numpy.float64, count=len(self.samples))
+            dwf.numpy.multiply(dwf.numpy.frombuffer(self.samples, dtype=dwf.numpy.int16, count=len(self.samples)), scale, out=volts)
+            volts += self.voltage_offset
         else:
-            return str(self.status) + "\n" + error_message
+            volts = memoryview(out).cast('B').cast('d')
+            for i, sample in enumerate(self.samples):
+                volts[i] = sample * scale + self.voltage_offset
+        return out
+
+_UNSET = object()
+
+class _SettingsShadow(object):
+    ''' The last value applied to each instrument setting of one device
+        handle. Every setter of the sessions goes through set(), which skips
+        the driver call (a USB round trip) when the value has not changed.
+        The shadow only knows about settings applied through it, so anything
+        that changes the device behind its back (instrument resets, streaming
+        engines, direct dwf calls) must invalidate the affected instrument.
+    '''
+    def __init__(self, hdwf: int):
+        self.hdwf = hdwf
+        self._values = {}
+        self.calls_elided = 0
+        self.changed_setters = None
+
+    def set(self, setter, *args) -> None:
+        ''' Calls setter(hdwf, *args) unless the same value was the last one
+            applied. The last argument is the value; the ones before it
+            (channel, node) select which setting it is.
+        '''
+        key = (setter,) + args[:-1]
+        value = args[-1]
+        if (self._values.get(key, _UNSET) == value):
+            self.calls_elided += 1
+            return
+        self._values.pop(key, None)
+        setter(self.hdwf, *args)
+        self._values[key] = value
+        self.changed(setter)
+
+    def changed(self, setter) -> None:
+        ''' Records that setter changed the device configuration, for the
+            configure() transaction in progress if any.
+        '''
+        if (self.changed_setters is not None):
+            self.changed_setters.add(setter.__name__)
+
+    def invalidate(self, instrument: str = None, channel: int = -1) -> None:
+        ''' Forgets the settings of an instrument, given as the dwf function
+            prefix ('AnalogIn', 'AnalogOut', 'DigitalIn', 'DigitalI2c'), of a
+            single channel of it, or of every instrument.
+        '''
+        if (instrument is None):
+            self._values.clear()
+            return
+        for key in list(self._values):
+            if (key[0].__name__.startswith(instrument) and (channel < 0 or (len(key) > 1 and key[1] == channel))):
+                del self._values[key]
+
+class _ConfigureTransaction(object):
+    ''' Context manager returned by PyAnalogDiscovery.configure(). Auto
+        configure is turned off on entry, so that setters only update the
+        driver; on a clean exit each instrument that was changed is configured
+        once, and the previous auto configure mode is restored. Transactions
+        may be nested; the outermost one applies the settings.
+    '''
+    # The order instruments are configured in, with the call that pushes the
+    # settings of each without starting it. Analog out uses the dynamic apply
+    # (3) so that a running generator keeps running.
+    _configure_calls = (
+        ('AnalogOut', lambda hdwf: dwf.AnalogOutConfigure(hdwf, -1, 3)),
+        ('AnalogIn', lambda hdwf: dwf.AnalogInConfigure(hdwf, True, False)),
+        ('DigitalIn', lambda hdwf: dwf.DigitalInConfigure(hdwf, True, False)),
+        ('AnalogIO', dwf.AnalogIOConfigure),
+        ('DigitalIO', dwf.DigitalIOConfigure),
+    )
+
+    def __init__(self, device):
+        self.device = device
+        self._depth = 0
+        self._auto_configure = None
+
+    def __enter__(self):
+        # Auto configure applies to the whole device, so the block holds the
+        # device lock: other threads cannot use any instrument until it ends.
+        self.device.locks.__enter__()
+        self._depth += 1
+        if (self._depth == 1):
+            try:
+                self._auto_configure = dwf.DeviceAutoConfigureGet(self.device.hdwf)
+                dwf.DeviceAutoConfigureSet(self.device.hdwf, 0)
+            except BaseException:
+                self._depth -= 1
+                self.device.locks.__exit__(None, None, None)
+                raise
+            self.device._shadow.changed_setters = set()
+        return self.device
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._depth -= 1
+        if (self._depth > 0):
+            self.device.locks.__exit__(exc_type, exc_value, traceback)
+            return False
+        shadow = self.device._shadow
+        changed_setters = shadow.changed_setters
+        shadow.changed_setters = None
+        try:
+            for instrument, configure in self._configure_calls:
+                if (any(name.startswith(instrument) for name in changed_setters)):
+                    if (exc_type is None):
+                        configure(self.device.hdwf)
+                    else:
+                        # The settings never reached the device; forget them
+                        # so that the next setter calls are not elided.
+                        shadow.invalidate(instrument)
+        finally:
+            try:
+                dwf.DeviceAutoConfigureSet(self.device.hdwf, self._auto_configure)
+            finally:
+                self.device.locks.__exit__(exc_type, exc_value, traceback)
+        return False
+
+class _InstrumentLock(object):
+    ''' The lock of one instrument of a device handle, taken by every method
+        of the sessions of that instrument. Holding it also holds the device
+        lock shared, so device-level calls wait until no instrument is in use.
+        It is reentrant, so a session method may call other session methods.
+
+        acquisitions counts the times the lock was taken and contentions the
+        times a thread had to wait for it, either behind another thread using
+        the instrument or behind a device-level call.
+    '''
+    def __init__(self, device_locks, name: str):
+        self.name = name
+        self.acquisitions = 0
+        self.contentions = 0
+        self._device_locks = device_locks
+        self._lock = threading.RLock()
+
+    def __enter__(self):
+        is_contended = self._device_locks._acquire_shared()
+        if (self._lock.acquire(blocking = False) == False):
+            is_contended = True
+            self._lock.acquire()
+        # Counted while holding the lock, so the counters need no lock of
+        # their own.
+        self.acquisitions += 1
+        if (is_contended):
+            self.contentions += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._lock.release()
+        self._device_locks._release_shared()
+        return False
+
+class _DeviceLocks(object):
+    ''' The locks of one device handle: one _InstrumentLock per instrument,
+        and the device lock itself (this object, used as a context manager),
+        which is taken exclusively by device-level calls (reset, configure
+        transactions, release) and shared by every instrument lock.
+
+        Guarantee: the FDwf* calls of different instruments of one device, as
+        named by their prefix (AnalogIn, AnalogOut, AnalogIO, DigitalIn,
+        DigitalIO, DigitalI2c), may run concurrently from different threads;
+        the calls of one instrument are serialized, each session method being
+        atomic; FDwfDevice* calls run alone. libdwf serializes its own calls,
+        so the locks are about keeping sequences of calls (set, configure,
+        status, read back) from interleaving within an instrument. Instruments still share
+        the DIO pins: two instruments driving the same pin is an error these
+        locks do not catch.
+
+        The device lock is reentrant, and the thread holding it may take
+        instrument locks (a configure() block calls session setters), but a
+        thread holding an instrument lock cannot make a device-level call.
+        Threads waiting for the device lock have priority over threads taking
+        instrument locks, so a reset is not starved by a busy instrument.
+    '''
+    def __init__(self):
+        self.acquisitions = 0
+        self.contentions = 0
+        self._condition = threading.Condition()
+        self._instruments = {}
+        self._shared = 0
+        self._waiting = 0
+        self._owner = None
+        self._depth = 0
+        self._held = threading.local()
+
+    def instrument(self, name: str) -> _InstrumentLock:
+        ''' Returns the lock of an instrument, by dwf function prefix. Take it
+            around direct dwf calls made while sessions are used from other
+            threads.
+        '''
+        with self._condition:
+            lock = self._instruments.get(name)
+            if (lock is None):
+                lock = _InstrumentLock(self, name)
+                self._instruments[name] = lock
+            return lock
+
+    def contentions_by_lock(self) -> dict:
+        ''' Returns the contention counter of every lock, by instrument name
+            and 'Device' for the device lock.
+        '''
+        with self._condition:
+            contentions = { name: lock.contentions for name, lock in self._instruments.items() }
+        contentions['Device'] = self.contentions
+        return contentions
+
+    def __enter__(self):
+        thread = threading.get_ident()
+        with self._condition:
+            if (self._owner == thread):
+                self._depth += 1
+                return self
+            if (getattr(self._held, 'count', 0) > 0):
+                raise RuntimeError("device-level call made while holding an instrument lock")
+            is_contended = False
+            self._waiting += 1
+            try:
+                while (self._owner is not None or self._shared > 0):
+                    is_contended = True
+                    self._condition.wait()
+            finally:
+                self._waiting -= 1
+            self._owner = thread
+            self._depth = 1
+            self.acquisitions += 1
+            if (is_contended):
+                self.contentions += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self._condition:
+            self._depth -= 1
+            if (self._depth == 0):
+                self._owner = None
+                self._condition.notify_all()
+        return False
+
+    def _acquire_shared(self) -> bool:
+        # Returns True when the thread had to wait for a device-level call.
+        held = getattr(self._held, 'count', 0)
+        is_contended = False
+        with self._condition:
+            if (held == 0 and self._owner != threading.get_ident()):
+                while (self._owner is not None or self._waiting > 0):
+                    is_contended = True
+                    self._condition.wait()
+            self._shared += 1
+        self._held.count = held + 1
+        return is_contended
+
+    def _release_shared(self) -> None:
+        self._held.count -= 1
+        with self._condition:
+            self._shared -= 1
+            if (self._shared == 0):
+                self._condition.notify_all()
+
+def _locked(method):
+    ''' Makes a session method hold the lock of its instrument.
+    '''
+    @functools.wraps(method)
+    def locked_method(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return locked_method
+
+class I2cBatch(object):
+    ''' A sequence of I2C write, read, write_read and delay operations,
+        possibly to different slave addresses, run in one call by
+        InterIntegratedCircuit.run(). Each method queues an operation and
+        returns its index.
+
+        The batch is compiled on its first run: write data is copied to ctypes
+        arrays and every read gets a fixed slice of the data bytearray, so
+        running it again allocates nothing. After a run, data holds the bytes
+        read by all the operations, offsets[index] where the bytes of an
+        operation start, and naks[index] its NAK index (zero when every byte
+        was acknowledged).
+    '''
+    def __init__(self):
+        self._operations = []
+        self._compiled = None
+        self._nak = c_int(0)
+        self.data = bytearray()
+        self.offsets = []
+        self.naks = array.array('i')
+
+    def __len__(self):
+        return len(self._operations)
+
+    def write(self, address: int, write_data) -> int:
+        return self._queue(address, write_data, 0)
+
+    def read(self, address: int, read_data_size: int) -> int:
+        return self._queue(address, b'', read_data_size)
+
+    def write_read(self, address: int, write_data, read_data_size: int) -> int:
+        return self._queue(address, write_data, read_data_size)
+
+    def delay(self, seconds: float) -> int:
+        self._operations.append((None, b'', 0, seconds))
+        self._compiled = None
+        return len(self._operations) - 1
+
+    def _queue(self, address: int, write_data, read_data_size: int) -> int:
+        self._operations.append((address, bytes(write_data), read_data_size, 0.0))
+        self._compiled = None
+        return len(self._operations) - 1
+
+    def compile(self) -> None:
+        ''' Prepares the ctypes arguments of every operation. It is called
+            by the first run after operations were queued.
+        '''
+        self.offsets = []
+        read_size = 0
+        for (address, write_data, read_data_size, seconds) in self._operations:
+            self.offsets.append(read_size)
+            read_size += read_data_size
+        self.data = bytearray(read_size)
+        self.naks = array.array('i', bytes(4 * len(self._operations)))
+        nak_reference = byref(self._nak)
+        compiled = []
+        for index, (address, write_data, read_data_size, seconds) in enumerate(self._operations):
+            if (address is None):
+                compiled.append((None, seconds))
+                continue
+            write_array = (c_uint8 * len(write_data)).from_buffer_copy(write_data) if (len(write_data) > 0) else None
+            read_array = (c_uint8 * read_data_size).from_buffer(self.data, self.offsets[index]) if (read_data_size > 0) else None
+            compiled.append(((address, write_array, len(write_data), read_array, read_data_size, nak_reference), 0.0))
+        self._compiled = compiled
+
+    def result(self, index: int) -> memoryview:
+        ''' Returns a view of the bytes read by an operation in the last run.
+        '''
+        return memoryview(self.data)[self.offsets[index]:self.offsets[index] + self._operations[index][2]]
+
+    def _run(self, hdwf: int) -> None:
+        if (self._compiled is None):
+            self.compile()
+        transfer = dwf.DigitalI2cWriteReadPrepared
+        naks = self.naks
+        nak = self._nak
+        for index, (arguments, seconds) in enumerate(self._compiled):
+            if (arguments is None):
+                time.sleep(seconds)
+                continue
+            transfer(hdwf, *arguments)
+            naks[index] = nak.value
 
 class AnalogDiscovery2Configuration(IntEnum):
     SCOPE_8K_WAVEGEN_4K_LOGIC_4K_PATTERNS_1K = 0
@@ -122,9 +556,17 @@ class PyAnalogDiscovery:
        form-factor device.  This class simply wraps that C-API, allowing us
        to control the device from python.
     '''
-    def __init__(self, configuration, device_name: str = None):
+    def __init__(self, configuration, device_name: str = None, pool: handlepool.HandlePool = None, serial_number: str = None):
         ''' Initialize the Analog Discovery library.  This must be called at least
             once for the application.
+
+            When a handlepool.HandlePool is given, the device handle is leased
+            from it instead of opened, and release() resets the device and
+            hands the handle back to the pool instead of closing it.
+
+            The device is found by its user name, which defaults to the one of
+            the device type; give serial_number to open a specific device when
+            several of the same type are connected.
         '''
         self.device_name = device_name
         self.configuration = configuration
@@ -133,42 +575,94 @@ class PyAnalogDiscovery:
         self.device_config_index = -1
         self.hdwf = dwf.hdwfNone
         self.user_name = ''
+        self._lease = None
 
         filter = dwf.EnumFilter.ALL
         if (type(configuration) == AnalogDiscovery2Configuration):
             filter = dwf.EnumFilter.ANALOG_DISCOVERY2
-            if (self.device_name == None):
+            if (self.device_name == None and serial_number == None):
                 self.device_name = "Discovery2"
         elif (type(configuration) == AnalogDiscoveryProConfiguration):
             filter = dwf.EnumFilter.ANALOG_DISCOVERY_PRO_3X50
-            if (self.device_name == None):
+            if (self.device_name == None and serial_number == None):
                 self.device_name = "ADP3450"
 
-        device_count = dwf.EnumDevices(filter)
-
-        for each_device_index in range(device_count):
-            if (self.device_name == dwf.EnumUserName(each_device_index)):
-                self.device_index = each_device_index
-                break
+        # Devices are looked up in the shared enumeration snapshot rather than
+        # enumerated again for every construction.
+        record = enumeration.find(user_name = self.device_name, serial_number = serial_number, filter = filter)
 
-        if (self.device_index < 0):
+        if (record is None):
             raise PyAnalogDiscoveryException(Status.ERROR_FAILED_TO_OPEN_DEVICE)
 
-        self.device_name = dwf.EnumDeviceName(self.device_index)
-        self.serial_num = dwf.EnumSN(self.device_index)
+        self.device_name = record.name
+        self.user_name = record.user_name
+        self.serial_num = record.serial_number
 
-        self.hdwf = dwf.DeviceConfigOpen(self.device_index, self.configuration)
+        if (pool is not None):
+            self._lease = pool.acquire(record.serial_number, self.configuration)
+            self.hdwf = self._lease.hdwf
+        else:
+            self.hdwf = enumeration.open_device(record, self.configuration)
+        self.device_index = record.index
 
         if (self.hdwf == dwf.hdwfNone):
             raise PyAnalogDiscoveryException(Status.ERROR_FAILED_TO_OPEN_DEVICE)
 
+        self.locks = _DeviceLocks()
+        self._shadow = _SettingsShadow(self.hdwf)
+        self._configure_transaction = _ConfigureTransaction(self)
+
 
     def release(self):
         ''' Finalize the AnalogDiscovery library.
         '''
-        dwf.DeviceClose(self.hdwf)
-        self.dwf = None
-        self.hdwf = None
+        with self.locks:
+            if (self._lease is not None):
+                self._lease.release()
+                self._lease = None
+            else:
+                enumeration.close_device(self.hdwf, self.serial_num)
+            self.dwf = None
+            self.hdwf = None
+
+    def configure(self):
+        ''' Returns a context manager that batches instrument configuration:
+
+                with device.configure():
+                    scope.configure_channel(0, 5.0)
+                    scope.configure_acquisition(1e6, 8192)
+                    wavegen.configure_channel(0, dwf.Function.SINE, 1e3, 1.0)
+
+            Auto configure is turned off for the duration of the block, so
+            setters only update the driver, and each instrument changed in the
+            block is configured once on exit (generators that are running keep
+            running). The previous auto configure mode is then restored. If
+            the block raises, nothing is pushed to the device.
+        '''
+        return self._configure_transaction
+
+    def reset(self) -> None:
+        ''' Resets every instrument of the device to its default
+            configuration and forgets the settings applied so far.
+        '''
+        with self.locks:
+            dwf.DeviceReset(self.hdwf)
+            self._shadow.invalidate()
+
+    def lock_contentions(self) -> dict:
+        ''' Returns how many times threads had to wait for each instrument
+            lock, by dwf function prefix, and for the device lock ('Device').
+            Sessions of different instruments can be used from different
+            threads; see _DeviceLocks for what runs concurrently.
+        '''
+        return self.locks.contentions_by_lock()
+
+    def invalidate_settings(self) -> None:
+        ''' Forgets the settings applied so far, so that the next configure
+            call of every session sends all of its settings again. Call this
+            after changing the configuration through the dwf module directly.
+        '''
+        self._shadow.invalidate()
 
 # #------------------------------------------------------------------------------
 
@@ -186,38 +680,46 @@ class PyAnalogDiscovery:
     class InterIntegratedCircuit(object):
         def __init__(self, outer, reset):
             self.hdwf = outer.hdwf
+            self._shadow = outer._shadow
             self.address = 0
+            self._lock = outer.locks.instrument('DigitalI2c')
             if (reset == True):
-                dwf.DigitalI2cReset(self.hdwf)
+                self.reset_instrument()
 
+        @_locked
         def configure_bus(self, i2c_clock_rate, address, scl_pin: int, sda_pin: int, clock_stretching_enabled: bool = True) -> None:
             ''' Configures the basic parameters of the I2C engine.
             '''
             is_bus_available = c_int()
             self.address = address
-            dwf.DigitalI2cRateSet(self.hdwf, i2c_clock_rate)
-            dwf.DigitalI2cSclSet(self.hdwf, scl_pin)
-            dwf.DigitalI2cSdaSet(self.hdwf, sda_pin)
+            self._shadow.set(dwf.DigitalI2cRateSet, i2c_clock_rate)
+            self._shadow.set(dwf.DigitalI2cSclSet, scl_pin)
+            self._shadow.set(dwf.DigitalI2cSdaSet, sda_pin)
             if (clock_stretching_enabled == True):
-                dwf.DigitalI2cStretchSet(self.hdwf, True)
+                self._shadow.set(dwf.DigitalI2cStretchSet, True)
             else:
-                dwf.DigitalI2cStretchSet(self.hdwf, False)
+                self._shadow.set(dwf.DigitalI2cStretchSet, False)
             is_bus_available = dwf.DigitalI2cClear(self.hdwf)
             if (is_bus_available == 0):
                 raise PyAnalogDiscoveryException(Status.ERROR_I2C_BUS_ERROR_CHECK_THE_PULLUPS)
 
+        @_locked
         def read(self, read_data_size: int) -> (List[int], int):
             ''' Performs a read on an I2C slave device.
             '''
             read_data_out, is_nak = dwf.DigitalI2cRead(self.hdwf, self.address, read_data_size)
             return read_data_out, is_nak
 
-        def write(self, write_data: List[int]) -> int:
-            ''' Performs a write on an I2C slave device.
+        @_locked
+        def write(self, write_data: List[int], address: int = None) -> int:
+            ''' Performs a write on an I2C slave device. write_data is a list
+                of ints or any bytes-like object. address overrides the
+                slave address of the session for this transfer.
             '''
-            is_nak = dwf.DigitalI2cWrite(self.hdwf, self.address, write_data)
+            is_nak = dwf.DigitalI2cWrite(self.hdwf, self.address if (address is None) else address, write_data)
             return is_nak
 
+        @_locked
         def write_read(self, write_data: List[int], read_data_size: int) -> (List[int], int):
             ''' Performs a write followed by read (combined format) on an I2C
                 slave device.
@@ -225,9 +727,571 @@ class PyAnalogDiscovery:
             read_data_out, is_nak = dwf.DigitalI2cWriteRead(self.hdwf, self.address, write_data, read_data_size)
             return read_data_out, is_nak
 
+        @_locked
+        def read_into(self, buffer, read_data_size: int = None) -> int:
+            ''' Performs a read on an I2C slave device straight into buffer (a
+                bytearray, memoryview or any writable buffer), filling the
+                whole buffer unless read_data_size is given. Returns the NAK
+                index. Nothing is allocated per call.
+            '''
+            return dwf.DigitalI2cReadInto(self.hdwf, self.address, buffer, read_data_size)
+
+        @_locked
+        def write_read_into(self, write_data, buffer, read_data_size: int = None, address: int = None) -> int:
+            ''' Performs a write followed by read (combined format) on an I2C
+                slave device, reading straight into buffer. write_data is a
+                list of ints or any bytes-like object. address overrides the
+                slave address of the session for this transfer. Returns the
+                NAK index.
+            '''
+            return dwf.DigitalI2cWriteReadInto(self.hdwf, self.address if (address is None) else address, write_data, buffer, read_data_size)
+
+        @_locked
+        def read_bytes(self, read_data_size: int) -> (bytes, int):
+            ''' Performs a read on an I2C slave device and returns the data as
+                bytes along with the NAK index.
+            '''
+            return dwf.DigitalI2cReadBytes(self.hdwf, self.address, read_data_size)
+
+        @_locked
+        def write_read_bytes(self, write_data, read_data_size: int) -> (bytes, int):
+            ''' Performs a write followed by read (combined format) on an I2C
+                slave device and returns the data as bytes along with the NAK
+                index.
+            '''
+            return dwf.DigitalI2cWriteReadBytes(self.hdwf, self.address, write_data, read_data_size)
+
+        @_locked
+        def run(self, batch: I2cBatch) -> I2cBatch:
+            ''' Runs every operation of an I2cBatch in order, and returns the
+                batch with its data, offsets and naks filled in. A NAK does
+                not stop the batch; check naks for the operations that matter.
+            '''
+            batch._run(self.hdwf)
+            return batch
+
+        @_locked
+        def dump(self, start: int = 0x00, end: int = 0xFF, chunk: int = 256) -> bytes:
+            ''' Reads the registers start to end (inclusive) of the slave and
+                returns them as bytes. The range is fetched in bursts of up to
+                chunk registers, each a register address write followed by an
+                auto-increment read, so the default reads a 256-register map in
+                one transaction. Raises ValueError unless
+                0 <= start <= end <= 0xFF.
+
+                Devices that do not auto-increment answer a burst with the
+                same register repeated rather than a NAK, so only chunk=1
+                reads them correctly. A burst the slave NAKs, as slaves that
+                limit the burst length do, is retried one 16-byte row at a
+                time before giving up.
+            '''
+            if (not (0 <= start <= end <= 0xFF)):
+                raise ValueError("register range 0x%02x-0x%02x is outside 0x00-0xff" % (start, end))
+            data = bytearray(end - start + 1)
+            view = memoryview(data)
+            chunk = max(1, chunk)
+            for offset in range(0, len(data), chunk):
+                count = min(chunk, len(data) - offset)
+                is_nak = dwf.DigitalI2cWriteReadInto(self.hdwf, self.address, [start + offset], view[offset:offset + count])
+                if (is_nak == 0):
+                    continue
+                if (count <= 16):
+                    raise PyAnalogDiscoveryException(Status.ERROR_I2C_SLAVE_NAK)
+                for row in range(offset, offset + count, 16):
+                    row_count = min(16, offset + count - row)
+                    is_nak = dwf.DigitalI2cWriteReadInto(self.hdwf, self.address, [start + row], view[row:row + row_count])
+                    if (is_nak != 0):
+                        raise PyAnalogDiscoveryException(Status.ERROR_I2C_SLAVE_NAK)
+            return bytes(data)
+
+        @_locked
+        def scan(self, strategy: I2cScanStrategy = I2cScanStrategy.QUICK_WRITE, first_address: int = 0x03, last_address: int = 0x77) -> List[int]:
+            ''' Probes every 7-bit address from first_address to last_address
+                on the bus set up by configure_bus, and returns the addresses
+                that acknowledged. The bus is not reconfigured between probes.
+
+                QUICK_WRITE addresses each device with a zero-length write,
+                the shortest transaction on the bus. READ_BYTE reads a single
+                byte instead, for devices that do not acknowledge a write
+                without data. WRITE_READ writes register 0 and reads one byte
+                back, the way i2cdetect used to probe.
+            '''
+            found = []
+            read_data = bytearray(1)
+            for address in range(first_address, last_address + 1):
+                if (strategy == I2cScanStrategy.QUICK_WRITE):
+                    is_nak = dwf.DigitalI2cWrite(self.hdwf, address, b'')
+                elif (strategy == I2cScanStrategy.READ_BYTE):
+                    is_nak = dwf.DigitalI2cReadInto(self.hdwf, address, read_data)
+                else:
+                    is_nak = dwf.DigitalI2cWriteReadInto(self.hdwf, address, b'\x00', read_data)
+                if (is_nak == 0):
+                    found.append(address)
+            return found
+
+        @_locked
+        def scan_buses(self, bus_pins: List[tuple], i2c_clock_rate = I2cClockRate.ONE_HUNDRED_KHZ, strategy: I2cScanStrategy = I2cScanStrategy.QUICK_WRITE,
+                       first_address: int = 0x03, last_address: int = 0x77, clock_stretching_enabled: bool = True) -> dict:
+            ''' Scans several buses in one session. bus_pins is a list of
+                (scl_pin, sda_pin) pairs; each bus is configured once and then
+                scanned. Returns a dictionary mapping each pair to the list of
+                addresses found, or to None when the bus is held low (missing
+                pull-ups). The session is left configured for the last bus.
+            '''
+            results = {}
+            address = self.address
+            for scl_pin, sda_pin in bus_pins:
+                try:
+                    self.configure_bus(i2c_clock_rate, address, scl_pin, sda_pin, clock_stretching_enabled)
+                except PyAnalogDiscoveryException as e:
+                    if (e.status != Status.ERROR_I2C_BUS_ERROR_CHECK_THE_PULLUPS):
+                        raise
+                    results[(scl_pin, sda_pin)] = None
+                    continue
+                results[(scl_pin, sda_pin)] = self.scan(strategy, first_address, last_address)
+            return results
+
+        @_locked
         def reset_instrument(self) -> None:
             ''' Resets the session configuration to default values, and resets
                 the device and driver software to a known state.
             '''
             dwf.DigitalI2cReset(self.hdwf)
+            self._shadow.invalidate('DigitalI2c')
+
+
+# #------------------------------------------------------------------------------
+
+    def acquire_oscilloscope(self, reset: bool = True):
+        ''' Creates and returns a new oscilloscope (AnalogIn) session for the
+            device. The session is used in all subsequent scope method calls.
+            This method should be called once per session.
 
+            The session keeps one sample buffer per channel, sized to the
+            instrument buffer, and reuses it for every read so that capturing a
+            frame does not allocate.
+        '''
+        return self.Oscilloscope(self, reset)
+
+    class Oscilloscope(object):
+        def __init__(self, outer, reset):
+            self.hdwf = outer.hdwf
+            self._sample_buffers = {}
+            self._raw_buffers = {}
+            self._adc_bits = None
+            self._shadow = outer._shadow
+            self._lock = outer.locks.instrument('AnalogIn')
+            if (reset == True):
+                self.reset_instrument()
+
+        @_locked
+        def configure_channel(self, channel: int, voltage_range: float, voltage_offset: float = 0.0, enabled: bool = True) -> None:
+            ''' Configures the vertical parameters of an AnalogIn channel.
+            '''
+            self._shadow.set(dwf.AnalogInChannelEnableSet, channel, enabled)
+            self._shadow.set(dwf.AnalogInChannelRangeSet, channel, voltage_range)
+            self._shadow.set(dwf.AnalogInChannelOffsetSet, channel, voltage_offset)
+
+        @_locked
+        def configure_acquisition(self, sample_rate: float, buffer_size: int) -> None:
+            ''' Configures the sample rate and the number of samples acquired
+                per frame.
+            '''
+            self._shadow.set(dwf.AnalogInFrequencySet, sample_rate)
+            self._shadow.set(dwf.AnalogInBufferSizeSet, buffer_size)
+
+        @_locked
+        def initiate(self) -> None:
+            ''' Starts an acquisition.
+            '''
+            dwf.AnalogInConfigure(self.hdwf, True, True)
+
+        @_locked
+        def is_done(self) -> bool:
+            ''' Reads the instrument status and returns True once the
+                acquisition has completed.
+            '''
+            return dwf.AnalogInStatus(self.hdwf, True) == dwf.InstrumentState.DONE
+
+        @_locked
+        def read(self, channel: int, out=None, first_sample: int = None, number_of_samples: int = None):
+            ''' Reads the samples of the last acquisition for a channel in
+                volts. Samples are copied straight into out (a float64 NumPy
+                array or any writable buffer) when given, otherwise into the
+                pooled buffer of the channel. The pooled buffer is overwritten
+                by the next read of the same channel; copy it if the data must
+                be kept.
+            '''
+            if (out is None):
+                out = self._sample_buffer(channel)
+            if (number_of_samples is None):
+                number_of_samples = min(_capacity(out, 'd'), _valid_after(dwf.AnalogInStatusSamplesValid(self.hdwf), first_sample or 0))
+            if (first_sample is None):
+                dwf.AnalogInStatusDataInto(self.hdwf, channel, out, number_of_samples)
+            else:
+                dwf.AnalogInStatusData2Into(self.hdwf, channel, out, first_sample, number_of_samples)
+            return _head(out, number_of_samples, 'd')
+
+        @_locked
+        def read_raw(self, channel: int, out=None, first_sample: int = 0, number_of_samples: int = None) -> RawWaveform:
+            ''' Reads the samples of the last acquisition for a channel as raw
+                16-bit ADC counts, along with the range, offset and ADC bits
+                needed to convert them to volts later. Samples go into out (an
+                int16 buffer) when given, otherwise into the pooled raw buffer
+                of the channel, which the next read_raw of the channel reuses.
+            '''
+            if (out is None):
+                out = self._sample_buffer(channel, self._raw_buffers, 'h')
+            if (number_of_samples is None):
+                number_of_samples = min(_capacity(out, 'h'), _valid_after(dwf.AnalogInStatusSamplesValid(self.hdwf), first_sample))
+            dwf.AnalogInStatusData16Into(self.hdwf, channel, out, first_sample, number_of_samples)
+            out = _head(out, number_of_samples, 'h')
+            if (self._adc_bits is None):
+                self._adc_bits = dwf.AnalogInBitsInfo(self.hdwf)
+            voltage_range = dwf.AnalogInChannelRangeGet(self.hdwf, channel)
+            voltage_offset = dwf.AnalogInChannelOffsetGet(self.hdwf, channel)
+            return RawWaveform(out, voltage_range, voltage_offset, self._adc_bits)
+
+        @_locked
+        def record(self, channels: List[int], sample_rate: float, chunk_size: int, chunk_count: int = 16, record_length: float = 0.0) -> streaming.AnalogInRecorder:
+            ''' Creates a record-mode streaming engine for the given channels.
+                The returned recorder is started with start() (or a with
+                statement) and yields fixed size chunks of chunk_size samples,
+                each reporting the samples lost or corrupt while it was filled.
+                A record_length of zero records until the recorder is stopped.
+            '''
+            # The recorder applies its own acquisition settings.
+            self._shadow.invalidate('AnalogIn')
+            return streaming.AnalogInRecorder(self.hdwf, channels, sample_rate, chunk_size, chunk_count, record_length, lock = self._lock)
+
+        @_locked
+        def reset_instrument(self) -> None:
+            ''' Resets the session configuration to default values.
+            '''
+            dwf.AnalogInReset(self.hdwf)
+            self._shadow.invalidate('AnalogIn')
+
+        def _sample_buffer(self, channel: int, pool: dict = None, typecode: str = 'd'):
+            if (pool is None):
+                pool = self._sample_buffers
+            buffer_size = dwf.AnalogInBufferSizeGet(self.hdwf)
+            sample_buffer = pool.get(channel)
+            if (sample_buffer is None or len(sample_buffer) != buffer_size):
+                sample_buffer = dwf.AllocateSamples(typecode, buffer_size)
+                pool[channel] = sample_buffer
+            return sample_buffer
+
+# #------------------------------------------------------------------------------
+
+    def acquire_logic_analyzer(self, reset: bool = True):
+        ''' Creates and returns a new logic analyzer (DigitalIn) session for
+            the device. The session is used in all subsequent logic analyzer
+            method calls. This method should be called once per session.
+
+            Captures are read in one call into a sample buffer whose item type
+            follows the sample format (8, 16 or 32 bits per sample).
+        '''
+        return self.LogicAnalyzer(self, reset)
+
+    class LogicAnalyzer(object):
+        def __init__(self, outer, reset):
+            self.hdwf = outer.hdwf
+            self._sample_format = None
+            self._sample_buffer = None
+            self._internal_clock = None
+            self._shadow = outer._shadow
+            self._lock = outer.locks.instrument('DigitalIn')
+            if (reset == True):
+                self.reset_instrument()
+
+        @_locked
+        def configure_acquisition(self, sample_rate: float, buffer_size: int, sample_format: int = 16) -> None:
+            ''' Configures the sample rate, the number of samples acquired per
+                capture and the sample format, in bits per sample (8, 16 or 32).
+            '''
+            if (self._internal_clock is None):
+                self._internal_clock = dwf.DigitalInInternalClockInfo(self.hdwf)
+            divider = max(1, int(round(self._internal_clock / sample_rate)))
+            self._shadow.set(dwf.DigitalInDividerSet, divider)
+            self._shadow.set(dwf.DigitalInBufferSizeSet, buffer_size)
+            self._shadow.set(dwf.DigitalInSampleFormatSet, sample_format)
+            self._sample_format = sample_format
+
+        @_locked
+        def initiate(self) -> None:
+            ''' Starts an acquisition.
+            '''
+            dwf.DigitalInConfigure(self.hdwf, True, True)
+
+        @_locked
+        def is_done(self) -> bool:
+            ''' Reads the instrument status and returns True once the
+                acquisition has completed.
+            '''
+            return dwf.DigitalInStatus(self.hdwf, True) == dwf.InstrumentState.DONE
+
+        @property
+        @_locked
+        def sample_format(self) -> int:
+            ''' The number of bits per sample, read from the device once.
+            '''
+            if (self._sample_format is None):
+                self._sample_format = dwf.DigitalInSampleFormatGet(self.hdwf)
+            return self._sample_format
+
+        @_locked
+        def read(self, out=None, first_sample: int = None, number_of_samples: int = None):
+            ''' Reads the samples of the last acquisition, packed one sample per
+                uint8, uint16 or uint32 item depending on the sample format.
+                Samples are copied straight into out (a buffer of that item
+                type, or of bytes) when given, otherwise into the pooled buffer
+                of the session, which the next read reuses.
+            '''
+            sample_size = self.sample_format // 8
+            typecode = dwf.DIGITAL_IN_SAMPLE_TYPECODES[self.sample_format]
+            if (out is None):
+                out = self._pooled_buffer()
+            if (number_of_samples is None):
+                number_of_samples = min(_capacity(out, typecode), _valid_after(dwf.DigitalInStatusSamplesValid(self.hdwf), first_sample or 0))
+            if (first_sample is None):
+                dwf.DigitalInStatusDataInto(self.hdwf, out, number_of_samples * sample_size)
+            else:
+                dwf.DigitalInStatusData2Into(self.hdwf, out, first_sample, number_of_samples * sample_size)
+            return _head(out, number_of_samples, typecode)
+
+        @_locked
+        def record(self, sample_rate: float, chunk_size: int, chunk_count: int = 16, sample_format: int = 16, record_samples: int = 0, spill_file = None) -> streaming.DigitalInRecorder:
+            ''' Creates a record-mode streaming engine for the logic analyzer.
+                The returned recorder is started with start() (or a with
+                statement) and yields chunks of chunk_size packed samples, each
+                reporting the samples lost or corrupt while it was filled. When
+                spill_file is given, every chunk consumed (by iteration or by
+                the start() callback) is also appended to it.
+            '''
+            self._sample_format = sample_format
+            # The recorder applies its own acquisition settings.
+            self._shadow.invalidate('DigitalIn')
+            return streaming.DigitalInRecorder(self.hdwf, sample_rate, chunk_size, chunk_count, sample_format, record_samples, spill_file = spill_file, lock = self._lock)
+
+        @_locked
+        def reset_instrument(self) -> None:
+            ''' Resets the session configuration to default values.
+            '''
+            dwf.DigitalInReset(self.hdwf)
+            self._shadow.invalidate('DigitalIn')
+            self._sample_format = None
+
+        def _pooled_buffer(self):
+            buffer_size = dwf.DigitalInBufferSizeGet(self.hdwf)
+            typecode = dwf.DIGITAL_IN_SAMPLE_TYPECODES[self.sample_format]
+            sample_buffer = self._sample_buffer
+            if (sample_buffer is None or len(sample_buffer) != buffer_size or memoryview(sample_buffer).itemsize != self.sample_format // 8):
+                sample_buffer = dwf.AllocateSamples(typecode, buffer_size)
+                self._sample_buffer = sample_buffer
+            return sample_buffer
+
+# #------------------------------------------------------------------------------
+
+    def acquire_waveform_generator(self, reset: bool = True):
+        ''' Creates and returns a new waveform generator (AnalogOut) session
+            for the device. The session is used in all subsequent waveform
+            generator method calls. This method should be called once per
+            session.
+        '''
+        return self.WaveformGenerator(self, reset)
+
+    class WaveformGenerator(object):
+        def __init__(self, outer, reset):
+            self.hdwf = outer.hdwf
+            self._data_info = {}
+            self._uploaded_digests = {}
+            self._shadow = outer._shadow
+            self._lock = outer.locks.instrument('AnalogOut')
+            if (reset == True):
+                self.reset_instrument()
+
+        @_locked
+        def configure_channel(self, channel: int, function: dwf.Function, frequency: float, amplitude: float, offset: float = 0.0, node: dwf.AnalogOutNode = dwf.AnalogOutNode.CARRIER) -> None:
+            ''' Configures the function, frequency, amplitude and offset of a
+                channel node.
+            '''
+            self._shadow.set(dwf.AnalogOutNodeEnableSet, channel, node, True)
+            self._shadow.set(dwf.AnalogOutNodeFunctionSet, channel, node, function)
+            self._shadow.set(dwf.AnalogOutNodeFrequencySet, channel, node, frequency)
+            self._shadow.set(dwf.AnalogOutNodeAmplitudeSet, channel, node, amplitude)
+            self._shadow.set(dwf.AnalogOutNodeOffsetSet, channel, node, offset)
+
+        @_locked
+        def upload_waveform(self, channel: int, samples, node: dwf.AnalogOutNode = dwf.AnalogOutNode.CARRIER) -> bool:
+            ''' Uploads a custom waveform, samples normalized to +/-1, in one
+                driver call. The length is checked against the limits of
+                AnalogOutNodeDataInfo. The digest of the last waveform uploaded
+                to each channel node is remembered, and uploading identical
+                samples again skips the transfer. Returns True when the samples
+                were sent to the device.
+            '''
+            data_info = self._data_info.get((channel, node))
+            if (data_info is None):
+                data_info = dwf.AnalogOutNodeDataInfo(self.hdwf, channel, node)
+                self._data_info[(channel, node)] = data_info
+            samples_min, samples_max = data_info
+            if (dwf.numpy is not None):
+                samples = dwf.numpy.ascontiguousarray(samples, dtype=dwf.numpy.float64)
+            elif (not isinstance(samples, array.array) or samples.typecode != 'd'):
+                samples = array.array('d', samples)
+            count = len(samples)
+            if (count < samples_min or count > samples_max):
+                raise ValueError("custom waveform has %d samples, channel %d accepts %d to %d" % (count, channel, samples_min, samples_max))
+            digest = hashlib.blake2b(memoryview(samples).cast('B'), digest_size = 16).digest()
+            # Set even when the samples are already on the device, since the
+            # channel may have been switched to another function since.
+            self._shadow.set(dwf.AnalogOutNodeFunctionSet, channel, node, dwf.Function.CUSTOM)
+            if (self._uploaded_digests.get((channel, node)) == digest):
+                return False
+            dwf.AnalogOutNodeDataSet(self.hdwf, channel, node, samples)
+            self._shadow.changed(dwf.AnalogOutNodeDataSet)
+            self._uploaded_digests[(channel, node)] = digest
+            return True
+
+        @_locked
+        def play(self, channel: int, blocks, sample_rate: float, amplitude: float, offset: float = 0.0, node: dwf.AnalogOutNode = dwf.AnalogOutNode.CARRIER, underrun_callback = None) -> streaming.AnalogOutPlayer:
+            ''' Plays a stream of sample blocks normalized to +/-1 on a channel
+                at sample_rate, feeding the device buffer from a background
+                thread. Returns the started streaming.AnalogOutPlayer; call
+                wait() to block until every sample has been played or stop()
+                to end playback early.
+            '''
+            # Play mode prefills the same device buffer as custom waveforms.
+            self._uploaded_digests.pop((channel, node), None)
+            # The player applies its own channel settings.
+            self._shadow.invalidate('AnalogOut', channel)
+            player = streaming.AnalogOutPlayer(self.hdwf, channel, blocks, sample_rate, amplitude, offset, node, underrun_callback, lock = self._lock)
+            player.start()
+            return player
+
+        @_locked
+        def start(self, channel: int = -1) -> None:
+            ''' Starts the generator on a channel, or on every enabled channel.
+            '''
+            dwf.AnalogOutConfigure(self.hdwf, channel, True)
+
+        @_locked
+        def stop(self, channel: int = -1) -> None:
+            ''' Stops the generator on a channel, or on every enabled channel.
+            '''
+            dwf.AnalogOutConfigure(self.hdwf, channel, False)
+
+        @_locked
+        def reset_instrument(self, channel: int = -1) -> None:
+            ''' Resets the session configuration of a channel, or of every
+                channel, to default values.
+            '''
+            dwf.AnalogOutReset(self.hdwf, channel)
+            self._shadow.invalidate('AnalogOut', channel)
+            if (channel < 0):
+                self._uploaded_digests.clear()
+            else:
+                for each_key in [key for key in self._uploaded_digests if key[0] == channel]:
+                    del self._uploaded_digests[each_key]
+
+# #------------------------------------------------------------------------------
+
+    def acquire_power_supply(self, reset: bool = True):
+        ''' Creates and returns a new power supply (AnalogIO) session for the
+            device. The session is used in all subsequent power supply method
+            calls. This method should be called once per session.
+        '''
+        return self.PowerSupply(self, reset)
+
+    class PowerSupply(object):
+        def __init__(self, outer, reset):
+            self.hdwf = outer.hdwf
+            self._shadow = outer._shadow
+            self._lock = outer.locks.instrument('AnalogIO')
+            if (reset == True):
+                self.reset_instrument()
+
+        @_locked
+        def configure_channel(self, channel: AnalogIoChannel, voltage: float, enabled: bool = True) -> None:
+            ''' Sets the voltage of a supply and enables or disables it. The
+                supplies only output once the master switch is on, see
+                enable().
+            '''
+            self._shadow.set(dwf.AnalogIOChannelNodeSet, channel, AnalogIoProperty.VOLTAGE, voltage)
+            self._shadow.set(dwf.AnalogIOChannelNodeSet, channel, AnalogIoProperty.ENABLE, 1.0 if (enabled == True) else 0.0)
+
+        @_locked
+        def enable(self, enabled: bool = True) -> None:
+            ''' Turns the master switch of the supplies on or off.
+            '''
+            self._shadow.set(dwf.AnalogIOEnableSet, enabled)
+
+        @_locked
+        def read(self, channel: AnalogIoChannel, property: AnalogIoProperty = AnalogIoProperty.VOLTAGE) -> float:
+            ''' Reads the device status and returns the measured value of a
+                supply property.
+            '''
+            dwf.AnalogIOStatus(self.hdwf)
+            return dwf.AnalogIOChannelNodeStatus(self.hdwf, channel, property)
+
+        @_locked
+        def reset_instrument(self) -> None:
+            ''' Resets the session configuration to default values, which
+                turns the supplies off.
+            '''
+            dwf.AnalogIOReset(self.hdwf)
+            self._shadow.invalidate('AnalogIO')
+
+# #------------------------------------------------------------------------------
+
+    def acquire_digital_io(self, reset: bool = True):
+        ''' Creates and returns a new static digital I/O (DigitalIO) session
+            for the device. The session is used in all subsequent digital I/O
+            method calls. This method should be called once per session.
+        '''
+        return self.DigitalIo(self, reset)
+
+    class DigitalIo(object):
+        def __init__(self, outer, reset):
+            self.hdwf = outer.hdwf
+            self._shadow = outer._shadow
+            self._lock = outer.locks.instrument('DigitalIO')
+            if (reset == True):
+                self.reset_instrument()
+            self._output_enable = dwf.DigitalIOOutputEnableGet(self.hdwf)
+            self._output = dwf.DigitalIOOutputGet(self.hdwf)
+
+        @_locked
+        def write(self, mask: int, value: int) -> None:
+            ''' Drives the DIO lines selected by mask to the matching bits of
+                value. Lines outside mask keep their direction and level.
+            '''
+            self._output_enable |= mask
+            self._output = (self._output & ~mask) | (value & mask)
+            self._shadow.set(dwf.DigitalIOOutputEnableSet, self._output_enable)
+            self._shadow.set(dwf.DigitalIOOutputSet, self._output)
+
+        @_locked
+        def release_lines(self, mask: int) -> None:
+            ''' Turns the DIO lines selected by mask back into inputs.
+            '''
+            self._output_enable &= ~mask
+            self._shadow.set(dwf.DigitalIOOutputEnableSet, self._output_enable)
+
+        @_locked
+        def read(self) -> int:
+            ''' Reads the device status and returns the state of every DIO
+                line, one bit per line.
+            '''
+            dwf.DigitalIOStatus(self.hdwf)
+            return dwf.DigitalIOInputStatus(self.hdwf)
+
+        @_locked
+        def reset_instrument(self) -> None:
+            ''' Resets the session configuration to default values, which
+                turns every line into an input.
+            '''
+            dwf.DigitalIOReset(self.hdwf)
+            self._shadow.invalidate('DigitalIO')
+            self._output_enable = 0
+            self._output = 0
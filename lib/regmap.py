@@ -0,0 +1,250 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Register maps for I2C slave devices, in the spirit of Linux regmap. A map
+# describes the registers of a chip and keeps a write-through cache of the
+# non-volatile ones, so that drivers can read their configuration as often as
+# they like without touching the bus. Reads of adjacent registers are merged
+# into one burst and deferred writes to adjacent registers are flushed as one
+# transaction.
+#
+#   regs = regmap.RegisterMap(i2c, [ regmap.Register('CONFIG', 0x01, width = 2),
+#                                    regmap.Register('TEMP', 0x05, width = 2, volatile = True, access = regmap.Access.READ_ONLY) ])
+#   regs.update_bits('CONFIG', 0x0100, 0x0100)
+#   temperature = regs.read('TEMP')
+
+from enum import IntEnum
+from typing import List
+from pyanalogdiscovery import PyAnalogDiscoveryException, Status
+
+class Access(IntEnum):
+    READ_WRITE = 0
+    READ_ONLY = 1
+    WRITE_ONLY = 2
+    def __str__(self):
+        return self.name.replace("_", " ").title()
+
+class Register(object):
+    ''' Describes one register of an I2C slave: its name, its 8-bit register
+        address, its width in bytes (multi-byte registers occupy consecutive
+        addresses), whether its value can change behind the host's back
+        (volatile registers are never served from the cache) and its access.
+    '''
+    def __init__(self, name: str, address: int, width: int = 1, volatile: bool = False, access: Access = Access.READ_WRITE, byte_order: str = 'big'):
+        self.name = name
+        self.address = address
+        self.width = width
+        self.volatile = volatile
+        self.access = access
+        self.byte_order = byte_order
+
+    @property
+    def is_readable(self) -> bool:
+        return (self.access != Access.WRITE_ONLY)
+
+    @property
+    def is_writable(self) -> bool:
+        return (self.access != Access.READ_ONLY)
+
+    @property
+    def is_cacheable(self) -> bool:
+        return (self.volatile == False and self.is_readable)
+
+    def __repr__(self):
+        return "Register(%r, 0x%02x, width=%d)" % (self.name, self.address, self.width)
+
+class RegisterMap(object):
+    ''' Cached view of the registers of one I2C slave, on top of an
+        InterIntegratedCircuit session or the RemoteInterIntegratedCircuit of
+        a device server. The slave address defaults to the one the session was
+        configured with.
+
+        The cache holds one byte per register address. Non-volatile registers
+        are filled by the first read or write and then served from the cache;
+        volatile registers always go to the bus. max_burst bounds the number
+        of bytes moved in one transaction, for slaves with a small
+        auto-increment window.
+
+        bus_reads and bus_writes count the transactions actually issued.
+    '''
+    def __init__(self, i2c, registers: List[Register], address: int = None, max_burst: int = 32):
+        self.i2c = i2c
+        self.address = i2c.address if (address is None) else address
+        self.max_burst = max_burst
+        self.registers = {}
+        for register in registers:
+            self.registers[register.name] = register
+        self._cache = bytearray(256)
+        self._valid = bytearray(256)
+        self._cache_view = memoryview(self._cache)
+        self._pending = {}
+        self._defer_depth = 0
+        self.bus_reads = 0
+        self.bus_writes = 0
+
+    def register(self, register) -> Register:
+        ''' Returns the Register description for a name or a Register.
+        '''
+        if (isinstance(register, Register)):
+            return register
+        return self.registers[register]
+
+    def read(self, register) -> int:
+        ''' Returns the value of a register, from the cache when it is valid.
+        '''
+        return self.read_many([register])[self.register(register).name]
+
+    def read_many(self, registers: list) -> dict:
+        ''' Returns a dictionary of register values by name. Registers missing
+            from the cache are fetched with as few bursts as possible: the
+            address ranges to read are sorted and merged when they touch, up
+            to max_burst bytes per transaction.
+        '''
+        registers = [ self.register(register) for register in registers ]
+        ranges = []
+        for register in registers:
+            if (register.is_readable == False):
+                raise ValueError("register %s is write-only" % register.name)
+            if (register.is_cacheable and self._is_cached(register)):
+                continue
+            ranges.append((register.address, register.address + register.width))
+        for start, stop in self._merge(ranges):
+            self._fetch(start, stop)
+        for register in registers:
+            if (register.is_cacheable):
+                self._valid[register.address:register.address + register.width] = b'\x01' * register.width
+        return { register.name: self._decode(register) for register in registers }
+
+    def write(self, register, value: int) -> None:
+        ''' Writes a register and updates the cache. Inside deferred() the
+            write is queued until the block ends or flush() is called.
+        '''
+        register = self.register(register)
+        if (register.is_writable == False):
+            raise ValueError("register %s is read-only" % register.name)
+        data = int(value).to_bytes(register.width, register.byte_order)
+        for offset in range(register.width):
+            self._pending[register.address + offset] = data[offset]
+        if (register.is_cacheable):
+            self._cache[register.address:register.address + register.width] = data
+            self._valid[register.address:register.address + register.width] = b'\x01' * register.width
+        if (self._defer_depth == 0):
+            self.flush()
+
+    def update_bits(self, register, mask: int, value: int) -> bool:
+        ''' Read-modify-write of the bits in mask. The read comes from the
+            cache for non-volatile registers, and nothing is written when the
+            bits already hold the value. Returns True if a write was issued or
+            queued.
+        '''
+        current = self.read(register)
+        updated = (current & ~mask) | (value & mask)
+        if (updated == current):
+            return False
+        self.write(register, updated)
+        return True
+
+    def deferred(self):
+        ''' Returns a context manager that queues writes until the block ends,
+            then flushes them with adjacent registers combined into single
+            transactions. Blocks may be nested; the outermost one flushes.
+        '''
+        return _DeferredWrites(self)
+
+    def flush(self) -> None:
+        ''' Sends the queued writes, one transaction per run of consecutive
+            register addresses (up to max_burst bytes each). When the slave
+            NAKs a run, that run and the ones after it stay queued and
+            PyAnalogDiscoveryException is raised.
+        '''
+        if (len(self._pending) == 0):
+            return
+        pending = self._pending
+        self._pending = {}
+        addresses = sorted(pending)
+        runs = self._merge([ (address, address + 1) for address in addresses ])
+        for index, (start, stop) in enumerate(runs):
+            write_data = bytearray(1 + stop - start)
+            write_data[0] = start
+            for address in range(start, stop):
+                write_data[1 + address - start] = pending[address]
+            self.bus_writes += 1
+            is_nak = self.i2c.write(write_data, address = self.address)
+            if (is_nak != 0):
+                # The run that was NAKed and the ones after it stay queued
+                # for the next flush().
+                for unsent_start, unsent_stop in runs[index:]:
+                    for address in range(unsent_start, unsent_stop):
+                        self._pending[address] = pending[address]
+                self.invalidate()
+                raise PyAnalogDiscoveryException(Status.ERROR_I2C_SLAVE_NAK)
+
+    def invalidate(self, register = None) -> None:
+        ''' Drops a register, or the whole map, from the cache so that the
+            next read goes to the bus. Use after resetting the slave.
+        '''
+        if (register is None):
+            self._valid[:] = bytes(len(self._valid))
+            return
+        register = self.register(register)
+        self._valid[register.address:register.address + register.width] = bytes(register.width)
+
+    def _is_cached(self, register: Register) -> bool:
+        return all(self._valid[register.address:register.address + register.width])
+
+    def _decode(self, register: Register) -> int:
+        return int.from_bytes(self._cache[register.address:register.address + register.width], register.byte_order)
+
+    def _merge(self, ranges: list) -> list:
+        merged = []
+        for start, stop in sorted(ranges):
+            if (len(merged) > 0 and start <= merged[-1][1] and max(stop, merged[-1][1]) - merged[-1][0] <= self.max_burst):
+                merged[-1][1] = max(stop, merged[-1][1])
+            else:
+                merged.append([start, stop])
+        return merged
+
+    def _fetch(self, start: int, stop: int) -> None:
+        self.bus_reads += 1
+        is_nak = self.i2c.write_read_into([start], self._cache_view[start:stop], address = self.address)
+        if (is_nak != 0):
+            raise PyAnalogDiscoveryException(Status.ERROR_I2C_SLAVE_NAK)
+
+class _DeferredWrites(object):
+    def __init__(self, regmap: RegisterMap):
+        self.regmap = regmap
+
+    def __enter__(self):
+        self.regmap._defer_depth += 1
+        return self.regmap
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.regmap._defer_depth -= 1
+        if (self.regmap._defer_depth == 0):
+            if (exc_type is None):
+                self.regmap.flush()
+            else:
+                self.regmap._pending = {}
+                self.regmap.invalidate()
+        return False
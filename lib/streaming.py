@@ -0,0 +1,592 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Record-mode streaming engines. A recorder owns a polling thread that drains
+# the device into a preallocated ring of fixed size chunks; consumers iterate
+# over the chunks (or receive them through a callback) without any per-chunk
+# sample allocation.
+
+import abc
+import array
+import contextlib
+import threading
+import time
+import dwf
+
+def _view(buffer, start: int, stop: int):
+    ''' Returns a zero-copy view of buffer[start:stop].
+    '''
+    if (dwf.numpy is not None and isinstance(buffer, dwf.numpy.ndarray)):
+        return buffer[start:stop]
+    return memoryview(buffer)[start:stop]
+
+class RecordChunk(object):
+    ''' A fixed size block of recorded samples. The chunk objects and their
+        sample views are allocated once with the ring and reused; the data of
+        a chunk is only valid until the consumer asks for the next chunk.
+
+        first_sample is the index of the first sample of the chunk in the
+        acquisition, counting the samples lost or dropped before it.
+
+        lost and corrupt are the sample counts the device reported as lost or
+        corrupt while this chunk was being filled. dropped counts the samples
+        discarded on the host just before this chunk because the consumer
+        fell a full ring behind.
+    '''
+    def __init__(self, views: list, chunk_size: int):
+        self._views = views
+        self.chunk_size = chunk_size
+        self.length = chunk_size
+        self.sequence = 0
+        self.first_sample = 0
+        self.lost = 0
+        self.corrupt = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, channel_position: int):
+        ''' Returns the samples of the n-th recorded channel.
+        '''
+        if (self.length == self.chunk_size):
+            return self._views[channel_position]
+        return self._views[channel_position][:self.length]
+
+    @property
+    def is_clean(self) -> bool:
+        return (self.lost == 0 and self.corrupt == 0 and self.dropped == 0)
+
+class ChunkRing(object):
+    ''' Single-producer, single-consumer ring of fixed size chunks holding one
+        sample buffer per channel. The producer only advances samples_written
+        and the consumer only advances chunks_read, so both sides run without
+        a lock; an Event only wakes up a consumer waiting for data.
+    '''
+    def __init__(self, typecode: str, channel_count: int, chunk_size: int, chunk_count: int):
+        if (chunk_size <= 0 or chunk_count < 2):
+            raise ValueError("a ring needs a positive chunk size and at least two chunks")
+        self.typecode = typecode
+        self.chunk_size = chunk_size
+        self.chunk_count = chunk_count
+        self.capacity = chunk_size * chunk_count
+        self.buffers = [dwf.AllocateSamples(typecode, self.capacity) for each_channel in range(channel_count)]
+        self._write_views = [memoryview(each_buffer) for each_buffer in self.buffers]
+        self.chunks = []
+        for each_chunk in range(chunk_count):
+            start = each_chunk * chunk_size
+            views = [_view(each_buffer, start, start + chunk_size) for each_buffer in self.buffers]
+            self.chunks.append(RecordChunk(views, chunk_size))
+        self.samples_written = 0
+        self.chunks_published = 0
+        self.chunks_read = 0
+        self.closed = False
+        self._data_ready = threading.Event()
+
+    def free_samples(self) -> int:
+        return self.capacity - (self.samples_written - self.chunks_read * self.chunk_size)
+
+    def write_views(self, count: int):
+        ''' Returns up to two (position, count) spans of the ring where the
+            next count samples go, splitting at the end of the buffers.
+        '''
+        position = self.samples_written % self.capacity
+        first = min(count, self.capacity - position)
+        if (first == count):
+            return ((position, count),)
+        return ((position, first), (0, count - first))
+
+    def channel_view(self, channel_position: int, position: int, count: int):
+        return self._write_views[channel_position][position:position + count]
+
+    def commit(self, count: int) -> list:
+        ''' Advances the write position by count samples and returns the
+            chunks completed by it, which still have to be published.
+        '''
+        self.samples_written += count
+        completed = []
+        while ((self.chunks_published + len(completed) + 1) * self.chunk_size <= self.samples_written):
+            completed.append(self.chunks[(self.chunks_published + len(completed)) % self.chunk_count])
+        return completed
+
+    def publish(self, count: int = 1) -> None:
+        self.chunks_published += count
+        self._data_ready.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self._data_ready.set()
+
+    def next_chunk(self, timeout: float = None):
+        ''' Waits for the next published chunk and returns it, or returns None
+            once the ring is closed and drained, or when timeout expires.
+        '''
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while (self.chunks_read >= self.chunks_published):
+            if (self.closed):
+                return None
+            self._data_ready.clear()
+            if (self.chunks_read < self.chunks_published or self.closed):
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if (remaining is not None and remaining <= 0):
+                return None
+            self._data_ready.wait(remaining)
+        return self.chunks[self.chunks_read % self.chunk_count]
+
+    def release(self) -> None:
+        ''' Hands the chunk returned by next_chunk back to the producer.
+        '''
+        self.chunks_read += 1
+
+class Recorder(abc.ABC):
+    ''' Base class of the record-mode streaming engines. Subclasses provide the
+        instrument specific _start, _stop, _status and _read methods; this class
+        runs the polling thread, fills the ring and tracks data loss.
+
+        When spill_file (a path or a binary file object) is given, the raw
+        samples of every consumed chunk are also appended to it, channel after
+        channel, by whichever consumer takes the chunk: the callback thread,
+        or the caller iterating over the recorder.
+
+        When lock (the instrument lock of a session) is given, the driver
+        calls of each poll are made holding it, and it is released while the
+        polling thread sleeps.
+    '''
+    def __init__(self, hdwf: int, typecode: str, channel_count: int, chunk_size: int, chunk_count: int = 16, poll_interval: float = 0.001, spill_file = None, lock = None):
+        self.hdwf = hdwf
+        self.lock = lock if (lock is not None) else contextlib.nullcontext()
+        self.poll_interval = poll_interval
+        self.spill_file = spill_file
+        self._spill = None
+        self.ring = ChunkRing(typecode, channel_count, chunk_size, chunk_count)
+        self.total_lost = 0
+        self.total_corrupt = 0
+        self.total_dropped = 0
+        self._pending_lost = 0
+        self._pending_corrupt = 0
+        self._pending_dropped = 0
+        self._sequence = 0
+        self._samples_produced = 0
+        self._error = None
+        self._stop_requested = False
+        self._thread = None
+        self._callback_thread = None
+
+    def start(self, callback=None) -> None:
+        ''' Starts the acquisition and the polling thread. When a callback is
+            given, it is called with every chunk from a dedicated consumer
+            thread; otherwise iterate over the recorder to consume chunks. The
+            ring has a single consumer, so a recorder started with a callback
+            cannot be iterated.
+        '''
+        if (self._thread is not None):
+            raise RuntimeError("recorder already started")
+        if (isinstance(self.spill_file, str)):
+            self._spill = open(self.spill_file, 'wb')
+        else:
+            self._spill = self.spill_file
+        with self.lock:
+            self._start()
+        self._thread = threading.Thread(target=self._poll_loop, name=type(self).__name__, daemon=True)
+        self._thread.start()
+        if (callback is not None):
+            self._callback_thread = threading.Thread(target=self._dispatch, args=(callback,), name=type(self).__name__ + "Callback", daemon=True)
+            self._callback_thread.start()
+
+    def stop(self) -> None:
+        ''' Stops the polling thread and the acquisition.
+        '''
+        self._stop_requested = True
+        if (self._thread is not None):
+            self._thread.join()
+        if (self._callback_thread is not None and self._callback_thread is not threading.current_thread()):
+            self._callback_thread.join()
+        if (self._spill is not None and self._spill is not self.spill_file):
+            self._spill.close()
+        self._raise_pending_error()
+
+    def chunks(self, timeout: float = None):
+        ''' Yields the recorded chunks in order until the recording ends. Each
+            chunk is handed back to the ring when the next one is requested.
+        '''
+        if (self._callback_thread is not None and self._callback_thread is not threading.current_thread()):
+            raise RuntimeError("recorder chunks are consumed by its callback")
+        while (True):
+            chunk = self.ring.next_chunk(timeout)
+            if (chunk is None):
+                self._raise_pending_error()
+                return
+            try:
+                if (self._spill is not None):
+                    for each_channel in range(len(self.ring.buffers)):
+                        self._spill.write(chunk[each_channel])
+                yield chunk
+            finally:
+                self.ring.release()
+
+    def __iter__(self):
+        return self.chunks()
+
+    def __enter__(self):
+        if (self._thread is None):
+            self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _dispatch(self, callback) -> None:
+        for each_chunk in self.chunks():
+            callback(each_chunk)
+
+    def _raise_pending_error(self) -> None:
+        if (self._error is not None):
+            error, self._error = self._error, None
+            raise error
+
+    def _poll_loop(self) -> None:
+        try:
+            while (not self._stop_requested):
+                with self.lock:
+                    is_done, available, lost, corrupt = self._status()
+                    self._samples_produced += lost
+                    self._pending_lost += lost
+                    self._pending_corrupt += corrupt
+                    self.total_lost += lost
+                    self.total_corrupt += corrupt
+                    stored = self._drain(available) if (available > 0) else 0
+                # Poll again right away only when samples were stored: with a
+                # full ring, everything is dropped until the consumer catches
+                # up, and polling at full speed would only burn the CPU and
+                # hold the lock.
+                if (stored > 0):
+                    continue
+                elif (is_done):
+                    break
+                else:
+                    time.sleep(self.poll_interval)
+        except Exception as e:
+            self._error = e
+        finally:
+            try:
+                with self.lock:
+                    self._stop()
+            except Exception as e:
+                if (self._error is None):
+                    self._error = e
+            self._flush()
+            self.ring.close()
+
+    def _drain(self, available: int) -> int:
+        # Returns the number of samples stored in the ring; the rest are
+        # dropped.
+        ring = self.ring
+        count = min(available, ring.free_samples())
+        device_index = 0
+        if (count > 0):
+            self._stamp_chunks(count)
+            for position, span in ring.write_views(count):
+                for channel_position in range(len(ring.buffers)):
+                    self._read(channel_position, ring.channel_view(channel_position, position, span), device_index, span)
+                device_index += span
+        # Publish first, so that the samples dropped after the stored ones are
+        # reported by the next chunk, the one they precede.
+        self._publish(ring.commit(count))
+        if (count < available):
+            self._drop(available - count)
+        self._samples_produced += available
+        return count
+
+    def _stamp_chunks(self, count: int) -> None:
+        # Sets first_sample on the chunks that start within the next count
+        # samples written to the ring.
+        ring = self.ring
+        boundary = -(-ring.samples_written // ring.chunk_size) * ring.chunk_size
+        while (boundary < ring.samples_written + count):
+            ring.chunks[(boundary // ring.chunk_size) % ring.chunk_count].first_sample = self._samples_produced + boundary - ring.samples_written
+            boundary += ring.chunk_size
+
+    def _drop(self, count: int) -> None:
+        # The consumer is a full ring behind. The samples are left unread in
+        # the device buffer, which the next status overwrites, so a poll loop
+        # that is already late is not slowed down further.
+        self._pending_dropped += count
+        self.total_dropped += count
+
+    def _publish(self, completed: list, length: int = None) -> None:
+        for each_chunk in completed:
+            each_chunk.sequence = self._sequence
+            each_chunk.length = each_chunk.chunk_size if length is None else length
+            each_chunk.lost, self._pending_lost = self._pending_lost, 0
+            each_chunk.corrupt, self._pending_corrupt = self._pending_corrupt, 0
+            each_chunk.dropped, self._pending_dropped = self._pending_dropped, 0
+            self._sequence += 1
+            self.ring.publish()
+
+    def _flush(self) -> None:
+        # Publish the samples of the last, partially filled chunk.
+        ring = self.ring
+        partial = ring.samples_written - ring.chunks_published * ring.chunk_size
+        if (partial > 0):
+            ring.samples_written += ring.chunk_size - partial
+            self._publish([ring.chunks[ring.chunks_published % ring.chunk_count]], partial)
+
+    @abc.abstractmethod
+    def _start(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _stop(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _status(self) -> (bool, int, int, int):
+        ''' Returns (is_done, available, lost, corrupt).
+        '''
+
+    @abc.abstractmethod
+    def _read(self, channel_position: int, view, device_index: int, count: int) -> None:
+        pass
+
+class AnalogInRecorder(Recorder):
+    ''' Streams AnalogIn samples, in volts, using the record acquisition mode.
+        Chunks hold one float64 view per recorded channel, in the order the
+        channels were given.
+    '''
+    def __init__(self, hdwf: int, channels: list, sample_rate: float, chunk_size: int, chunk_count: int = 16, record_length: float = 0.0, poll_interval: float = 0.001, lock = None):
+        Recorder.__init__(self, hdwf, 'd', len(channels), chunk_size, chunk_count, poll_interval, lock = lock)
+        self.channels = list(channels)
+        self.sample_rate = sample_rate
+        self.record_length = record_length
+
+    def _start(self) -> None:
+        for each_channel in range(dwf.AnalogInChannelCount(self.hdwf)):
+            dwf.AnalogInChannelEnableSet(self.hdwf, each_channel, each_channel in self.channels)
+        dwf.AnalogInAcquisitionModeSet(self.hdwf, dwf.AcquisitionMode.RECORD)
+        dwf.AnalogInFrequencySet(self.hdwf, self.sample_rate)
+        dwf.AnalogInRecordLengthSet(self.hdwf, self.record_length)
+        dwf.AnalogInConfigure(self.hdwf, False, True)
+
+    def _stop(self) -> None:
+        dwf.AnalogInConfigure(self.hdwf, False, False)
+
+    def _status(self) -> (bool, int, int, int):
+        state = dwf.AnalogInStatus(self.hdwf, True)
+        available, lost, corrupt = dwf.AnalogInStatusRecord(self.hdwf)
+        return (state == dwf.InstrumentState.DONE), available, lost, corrupt
+
+    def _read(self, channel_position: int, view, device_index: int, count: int) -> None:
+        dwf.AnalogInStatusData2Into(self.hdwf, self.channels[channel_position], view, device_index, count)
+
+class DigitalInRecorder(Recorder):
+    ''' Streams DigitalIn samples using the record acquisition mode. Chunks
+        hold a single view of packed samples, one uint8, uint16 or uint32 item
+        per sample depending on sample_format. A record_samples of zero records
+        until the recorder is stopped.
+    '''
+    def __init__(self, hdwf: int, sample_rate: float, chunk_size: int, chunk_count: int = 16, sample_format: int = 16, record_samples: int = 0, poll_interval: float = 0.001, spill_file = None, lock = None):
+        Recorder.__init__(self, hdwf, dwf.DIGITAL_IN_SAMPLE_TYPECODES[sample_format], 1, chunk_size, chunk_count, poll_interval, spill_file, lock)
+        self.sample_rate = sample_rate
+        self.sample_format = sample_format
+        self.sample_size = sample_format // 8
+        self.record_samples = record_samples
+
+    def _start(self) -> None:
+        divider = max(1, int(round(dwf.DigitalInInternalClockInfo(self.hdwf) / self.sample_rate)))
+        dwf.DigitalInAcquisitionModeSet(self.hdwf, dwf.AcquisitionMode.RECORD)
+        dwf.DigitalInDividerSet(self.hdwf, divider)
+        dwf.DigitalInSampleFormatSet(self.hdwf, self.sample_format)
+        dwf.DigitalInTriggerPositionSet(self.hdwf, self.record_samples)
+        dwf.DigitalInConfigure(self.hdwf, False, True)
+
+    def _stop(self) -> None:
+        dwf.DigitalInConfigure(self.hdwf, False, False)
+
+    def _status(self) -> (bool, int, int, int):
+        state = dwf.DigitalInStatus(self.hdwf, True)
+        available, lost, corrupt = dwf.DigitalInStatusRecord(self.hdwf)
+        return (state == dwf.InstrumentState.DONE), available, lost, corrupt
+
+    def _read(self, channel_position: int, view, device_index: int, count: int) -> None:
+        dwf.DigitalInStatusData2Into(self.hdwf, view, device_index, count * self.sample_size)
+
+class AnalogOutPlayer(object):
+    ''' Streams a waveform longer than the device buffer through the AnalogOut
+        play mode. blocks is an iterable (list, iterator or generator) of
+        sample blocks normalized to +/-1. The device buffer is prefilled before
+        the channel starts, then a background thread keeps it fed using the
+        free sample count reported by AnalogOutNodePlayStatus.
+
+        Samples the device reports as lost (the buffer ran empty and samples
+        were repeated) or corrupt are counted, and underrun_callback, when
+        given, is called from the feeder thread with the number of samples
+        lost each time an underrun is detected.
+
+        When lock (the instrument lock of a session) is given, the driver
+        calls of each poll are made holding it, as for recorders.
+    '''
+    def __init__(self, hdwf: int, channel: int, blocks, sample_rate: float, amplitude: float, offset: float = 0.0, node: dwf.AnalogOutNode = dwf.AnalogOutNode.CARRIER, underrun_callback = None, poll_interval: float = 0.001, lock = None):
+        self.hdwf = hdwf
+        self.lock = lock if (lock is not None) else contextlib.nullcontext()
+        self.channel = channel
+        self.node = node
+        self.sample_rate = sample_rate
+        self.amplitude = amplitude
+        self.offset = offset
+        self.underrun_callback = underrun_callback
+        self.poll_interval = poll_interval
+        self.samples_sent = 0
+        self.total_lost = 0
+        self.total_corrupt = 0
+        self._blocks = iter(blocks)
+        self._block = None
+        self._block_offset = 0
+        self._error = None
+        self._stop_requested = False
+        self._thread = None
+
+    def start(self) -> None:
+        ''' Configures the channel for play mode, prefills the device buffer
+            and starts the channel and the feeder thread.
+        '''
+        if (self._thread is not None):
+            raise RuntimeError("player already started")
+        # The source blocks are read without holding the lock, so that a slow
+        # generator does not hold up the other users of the device.
+        with self.lock:
+            samples_min, self.device_buffer_size = dwf.AnalogOutNodeDataInfo(self.hdwf, self.channel, self.node)
+        prefill = dwf.AllocateSamples('d', self.device_buffer_size)
+        prefill_count = self._take(memoryview(prefill), self.device_buffer_size)
+        if (prefill_count == 0):
+            raise ValueError("no samples to play")
+        # Pad a short waveform with silence up to the minimum the device accepts.
+        memoryview(prefill)[prefill_count:samples_min] = array.array('d', bytes(8 * max(samples_min - prefill_count, 0)))
+        with self.lock:
+            dwf.AnalogOutNodeEnableSet(self.hdwf, self.channel, self.node, True)
+            dwf.AnalogOutNodeFunctionSet(self.hdwf, self.channel, self.node, dwf.Function.PLAY)
+            dwf.AnalogOutNodeFrequencySet(self.hdwf, self.channel, self.node, self.sample_rate)
+            dwf.AnalogOutNodeAmplitudeSet(self.hdwf, self.channel, self.node, self.amplitude)
+            dwf.AnalogOutNodeOffsetSet(self.hdwf, self.channel, self.node, self.offset)
+            dwf.AnalogOutNodeDataSet(self.hdwf, self.channel, self.node, prefill, max(prefill_count, samples_min))
+            self.samples_sent = prefill_count
+            dwf.AnalogOutConfigure(self.hdwf, self.channel, True)
+        self._thread = threading.Thread(target=self._feed_loop, name=type(self).__name__, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        ''' Stops the feeder thread and the channel.
+        '''
+        self._stop_requested = True
+        self.wait()
+
+    def wait(self, timeout: float = None) -> bool:
+        ''' Waits for the waveform to be played entirely. Returns False when
+            the timeout expires first.
+        '''
+        if (self._thread is not None):
+            self._thread.join(timeout)
+            if (self._thread.is_alive()):
+                return False
+        if (self._error is not None):
+            error, self._error = self._error, None
+            raise error
+        return True
+
+    def __enter__(self):
+        if (self._thread is None):
+            self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _next_block(self) -> bool:
+        for each_block in self._blocks:
+            if (dwf.numpy is not None):
+                each_block = dwf.numpy.ascontiguousarray(each_block, dtype=dwf.numpy.float64)
+            elif (not (isinstance(each_block, array.array) and each_block.typecode == 'd')):
+                each_block = array.array('d', each_block)
+            if (len(each_block) > 0):
+                self._block = memoryview(each_block).cast('B').cast('d')
+                self._block_offset = 0
+                return True
+        self._block = None
+        return False
+
+    def _take(self, destination, count: int) -> int:
+        # Copies up to count samples from the source blocks into destination.
+        taken = 0
+        while (taken < count):
+            if (self._block is None or self._block_offset >= len(self._block)):
+                if (not self._next_block()):
+                    break
+            span = min(count - taken, len(self._block) - self._block_offset)
+            destination[taken:taken + span] = self._block[self._block_offset:self._block_offset + span]
+            self._block_offset += span
+            taken += span
+        return taken
+
+    def _send(self, free: int) -> None:
+        # Sends up to free samples of the current block straight from it.
+        span = min(free, len(self._block) - self._block_offset)
+        dwf.AnalogOutNodePlayData(self.hdwf, self.channel, self.node, self._block[self._block_offset:self._block_offset + span], span)
+        self._block_offset += span
+        self.samples_sent += span
+
+    def _feed_loop(self) -> None:
+        try:
+            has_data = (self._block is not None)
+            while (not self._stop_requested):
+                # The next block is fetched before the lock is taken, as in
+                # start().
+                if (has_data and self._block_offset >= len(self._block)):
+                    has_data = self._next_block()
+                with self.lock:
+                    dwf.AnalogOutStatus(self.hdwf, self.channel)
+                    free, lost, corrupt = dwf.AnalogOutNodePlayStatus(self.hdwf, self.channel, self.node)
+                    is_sending = (has_data and free > 0)
+                    if (is_sending):
+                        self._send(free)
+                self.total_corrupt += corrupt
+                if (lost > 0):
+                    self.total_lost += lost
+                    if (self.underrun_callback is not None):
+                        self.underrun_callback(lost)
+                if (is_sending):
+                    continue
+                elif (not has_data and free >= self.device_buffer_size):
+                    # Every sample sent has been played.
+                    break
+                else:
+                    time.sleep(self.poll_interval)
+        except Exception as e:
+            self._error = e
+        finally:
+            try:
+                with self.lock:
+                    dwf.AnalogOutConfigure(self.hdwf, self.channel, False)
+            except Exception as e:
+                if (self._error is None):
+                    self._error = e
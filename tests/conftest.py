@@ -0,0 +1,57 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Fixtures shared by the tests. Every test runs against dwfsim, the in-process
+# simulator of libdwf, so no device or driver is needed.
+
+import os
+import sys
+
+sys.path[:0] = [ os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), directory) for directory in ('lib', 'bin') ]
+
+import pytest
+import dwf
+import dwfsim
+import enumeration
+from pyanalogdiscovery import PyAnalogDiscovery, AnalogDiscoveryProConfiguration
+
+@pytest.fixture
+def simulator():
+    ''' A simulated Analog Discovery Pro, with an I2C slave at 0x18 whose
+        registers hold their own address.
+    '''
+    simulator = dwfsim.Simulator()
+    simulator.devices[0].add_i2c_slave(dwfsim.I2cRegisterMap(0x18, { register: register for register in range(256) }))
+    dwf.LibraryBackendSet(simulator)
+    # The shared enumeration snapshot may describe the devices of a previous
+    # simulator.
+    enumeration.invalidate()
+    return simulator
+
+@pytest.fixture
+def device(simulator):
+    device = PyAnalogDiscovery(AnalogDiscoveryProConfiguration(0))
+    yield device
+    if (device.hdwf is not None):
+        device.release()
@@ -0,0 +1,80 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+import pytest
+import dwf
+import dwfsim
+import asyncdiscovery
+import handlepool
+from pyanalogdiscovery import AnalogDiscoveryProConfiguration
+
+@pytest.fixture
+def slow_simulator():
+    simulator = dwfsim.Simulator(latencies = { 'FDwfDeviceConfigOpen': 0.3 })
+    dwf.LibraryBackendSet(simulator)
+    return simulator
+
+def test_open_that_timed_out_releases_the_device(slow_simulator):
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncdiscovery.AsyncPyAnalogDiscovery.open(AnalogDiscoveryProConfiguration(0), timeout = 0.05)
+        # The open completes in the background and the device is then closed.
+        await asyncio.sleep(0.5)
+        assert slow_simulator.devices[0].is_opened == False
+        assert slow_simulator._sessions == {}
+    asyncio.run(main())
+
+def test_open_that_timed_out_returns_the_pooled_handle(slow_simulator):
+    pool = handlepool.HandlePool()
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncdiscovery.AsyncPyAnalogDiscovery.open(AnalogDiscoveryProConfiguration(0), pool = pool, timeout = 0.05)
+        async with await asyncdiscovery.AsyncPyAnalogDiscovery.open(AnalogDiscoveryProConfiguration(0), pool = pool, timeout = 5) as device:
+            assert device.serial_num == slow_simulator.devices[0].serial_number
+        assert pool.opens == 1
+        assert pool.reuses == 1
+    asyncio.run(main())
+    pool.close_all()
+
+def test_capture_returns_the_samples_of_a_channel(simulator):
+    async def main():
+        async with await asyncdiscovery.AsyncPyAnalogDiscovery.open(AnalogDiscoveryProConfiguration(0)) as device:
+            scope = await device.acquire_oscilloscope()
+            await scope.configure_channel(0, 5.0)
+            await scope.configure_acquisition(1e6, 100)
+            samples = await scope.capture(0, timeout = 5)
+            assert len(samples) == 100
+            assert await device.call(dwf.AnalogInStatusSamplesValid, device.device.hdwf) == 100
+    asyncio.run(main())
+
+def test_open_finds_the_device_by_serial_number():
+    simulator = dwfsim.Simulator([ dwfsim.SimulatedDevice.analog_discovery_pro(serial_number = "SN:A"), dwfsim.SimulatedDevice.analog_discovery_pro(serial_number = "SN:B") ])
+    dwf.LibraryBackendSet(simulator)
+    async def main():
+        async with await asyncdiscovery.AsyncPyAnalogDiscovery.open(AnalogDiscoveryProConfiguration(0), serial_number = "SN:B") as device:
+            assert device.device.serial_num == "SN:B"
+            assert simulator.devices[1].is_opened == True
+    asyncio.run(main())
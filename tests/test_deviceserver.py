@@ -0,0 +1,185 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import os
+import socket
+import stat
+import tempfile
+import threading
+import time
+import pytest
+import dwf
+import deviceserver
+from pyanalogdiscovery import PyAnalogDiscovery, PyAnalogDiscoveryException, AnalogDiscovery2Configuration, AnalogDiscoveryProConfiguration, Status
+
+@pytest.fixture
+def server(simulator):
+    socket_directory = tempfile.mkdtemp()
+    server = deviceserver.DeviceServer(os.path.join(socket_directory, 'ad.sock'))
+    thread = threading.Thread(target = server.serve_forever, daemon = True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    os.rmdir(socket_directory)
+
+def _session(simulator):
+    return list(simulator._sessions.values())[0]
+
+def test_socket_is_private(server):
+    assert stat.S_IMODE(os.stat(server.socket_path).st_mode) == 0o600
+
+def test_default_socket_path_prefers_the_runtime_directory(monkeypatch, tmp_path):
+    monkeypatch.delenv('PYANALOGDISCOVERY_SOCKET', raising = False)
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    assert deviceserver.default_socket_path() == os.path.join(str(tmp_path), 'pyanalogdiscovery.sock')
+
+def test_each_connection_keeps_its_i2c_bus(server, simulator):
+    first = deviceserver.connect(server.socket_path)
+    second = deviceserver.connect(server.socket_path)
+    try:
+        first_i2c = first.acquire_inter_integrated_circuit()
+        second_i2c = second.acquire_inter_integrated_circuit()
+        first_i2c.configure_bus(400000, 0x18, 0, 1)
+        second_i2c.configure_bus(100000, 0x18, 2, 3)
+        assert first_i2c.write_read_bytes([0x05], 1) == (b'\x05', 0)
+        assert (_session(simulator).get('DigitalI2cRate'), _session(simulator).get('DigitalI2cScl')) == (400000, 0)
+        assert second_i2c.write_read_bytes([0x06], 1) == (b'\x06', 0)
+        assert (_session(simulator).get('DigitalI2cRate'), _session(simulator).get('DigitalI2cScl')) == (100000, 2)
+        call_count = simulator.call_count
+        second_i2c.write_read_bytes([0x06], 1)
+        assert simulator.call_count - call_count == 1
+    finally:
+        first.release()
+        second.release()
+
+def test_scope_capture_times_out(server, monkeypatch):
+    client = deviceserver.connect(server.socket_path)
+    try:
+        assert len(client.scope_capture(0, 5.0, 1e6, 100)) == 100
+        monkeypatch.setattr(server._oscilloscope, 'is_done', lambda: False)
+        with pytest.raises(TimeoutError):
+            client.scope_capture(0, 5.0, 1e6, 100, timeout = 0.1)
+        assert client.gpio_read() is not None
+    finally:
+        client.release()
+
+def test_remote_dump_rejects_registers_outside_the_map(server):
+    client = deviceserver.connect(server.socket_path)
+    try:
+        i2c = client.acquire_inter_integrated_circuit()
+        i2c.configure_bus(100000, 0x18, 0, 1)
+        assert i2c.dump(0x00, 0x0F) == bytes(range(16))
+        with pytest.raises(ValueError):
+            i2c.dump(0xF0, 0x110)
+    finally:
+        client.release()
+
+def test_remote_i2c_reports_naks_and_errors(server, simulator):
+    client = deviceserver.connect(server.socket_path)
+    try:
+        i2c = client.acquire_inter_integrated_circuit()
+        i2c.configure_bus(100000, 0x50, 0, 1)
+        assert i2c.write([0x00]) != 0
+        assert i2c.scan() == [0x18]
+        simulator.devices[0].i2c_bus_free = False
+        with pytest.raises(deviceserver.RemoteException) as error:
+            i2c.configure_bus(100000, 0x18, 0, 1)
+        assert error.value.status == Status.ERROR_I2C_BUS_ERROR_CHECK_THE_PULLUPS
+        assert i2c.scan_buses([ (0, 1) ]) == { (0, 1): None }
+    finally:
+        client.release()
+
+def test_gpio_lines_are_driven_and_read(server, simulator):
+    client = deviceserver.connect(server.socket_path)
+    try:
+        simulator.devices[0].digital_io_inputs = 0xF0
+        client.gpio_write(0x03, 0x01)
+        assert client.gpio_read() & 0xFF == 0xF1
+        client.gpio_write(0x02, 0x02)
+        assert client.gpio_read() & 0xFF == 0xF3
+    finally:
+        client.release()
+
+def test_open_device_prefers_a_running_server(server, monkeypatch):
+    monkeypatch.setenv('PYANALOGDISCOVERY_SOCKET', server.socket_path)
+    device = deviceserver.open_device()
+    try:
+        assert isinstance(device, deviceserver.DeviceClient)
+        assert device.serial_num == server.device.serial_num
+    finally:
+        device.release()
+
+def test_open_device_without_a_server_opens_the_device(simulator, monkeypatch, tmp_path):
+    monkeypatch.setenv('PYANALOGDISCOVERY_SOCKET', str(tmp_path / 'none.sock'))
+    device = deviceserver.open_device()
+    try:
+        assert isinstance(device, PyAnalogDiscovery)
+    finally:
+        device.release()
+
+def test_client_knows_what_the_server_serves(server):
+    client = deviceserver.connect(server.socket_path)
+    try:
+        assert client.user_name == "ADP3450"
+        assert client.serves(AnalogDiscoveryProConfiguration.SCOPE_32K_WAVEGEN_32K_LOGIC_32K_PATTERNS_16K, "ADP3450", server.device.serial_num) == True
+        assert client.serves(AnalogDiscoveryProConfiguration.SCOPE_64K_WAVEGEN_4K_LOGIC_8K_PATTERNS_1K) == False
+        assert client.serves(AnalogDiscovery2Configuration.SCOPE_8K_WAVEGEN_4K_LOGIC_4K_PATTERNS_1K) == False
+        assert client.serves(AnalogDiscoveryProConfiguration.SCOPE_32K_WAVEGEN_32K_LOGIC_32K_PATTERNS_16K, "other") == False
+        assert client.serves(AnalogDiscoveryProConfiguration.SCOPE_32K_WAVEGEN_32K_LOGIC_32K_PATTERNS_16K, serial_number = "SN:other") == False
+    finally:
+        client.release()
+
+def test_open_device_does_not_hand_out_another_configuration(server, monkeypatch):
+    monkeypatch.setenv('PYANALOGDISCOVERY_SOCKET', server.socket_path)
+    with pytest.raises(dwf.DwfApiException):
+        deviceserver.open_device(AnalogDiscoveryProConfiguration.SCOPE_64K_WAVEGEN_4K_LOGIC_8K_PATTERNS_1K)
+    with pytest.raises(PyAnalogDiscoveryException):
+        deviceserver.open_device(device_name = "other")
+
+def test_gpio_goes_through_the_digital_io_session(server, simulator):
+    client = deviceserver.connect(server.socket_path)
+    try:
+        client.gpio_write(0x01, 0x01)
+        call_count = simulator.call_count
+        client.gpio_write(0x01, 0x01)
+        assert simulator.call_count == call_count
+        assert server.device.locks.instrument('DigitalIO').acquisitions >= 2
+    finally:
+        client.release()
+
+def test_server_that_does_not_answer_times_out():
+    socket_directory = tempfile.mkdtemp()
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(os.path.join(socket_directory, 'ad.sock'))
+    listener.listen(1)
+    try:
+        started = time.monotonic()
+        assert deviceserver.connect(os.path.join(socket_directory, 'ad.sock'), timeout = 0.1) is None
+        assert time.monotonic() - started < 5.0
+    finally:
+        listener.close()
+        os.unlink(os.path.join(socket_directory, 'ad.sock'))
+        os.rmdir(socket_directory)
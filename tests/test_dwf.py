@@ -0,0 +1,108 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import ctypes
+import ctypes.util
+import os
+import re
+import subprocess
+import sys
+import pytest
+import dwf
+import dwfprototypes
+import dwfsim
+
+class _LibcBackend(ctypes.CDLL):
+    ''' A CDLL whose every entry point is the C library's abs(), to check the
+        prototypes dwf declares without the native libdwf.
+    '''
+    def __init__(self):
+        ctypes.CDLL.__init__(self, None)
+
+    def __getattr__(self, name: str):
+        return self._FuncPtr(("abs", self))
+
+@pytest.fixture
+def libc_backend():
+    dwf.LibraryBackendSet(_LibcBackend())
+    yield
+    dwf.LibraryBackendSet(dwfsim.Simulator())
+
+def _declarations():
+    with open(os.path.join(os.path.dirname(dwf.__file__), "dwf.py"), encoding = "utf-8-sig") as source:
+        return re.findall(r'^# DWFAPI int (FDwf\w+)\((.*)\);', source.read(), re.MULTILINE)
+
+def test_every_wrapped_entry_point_has_a_prototype():
+    declarations = _declarations()
+    assert len(declarations) > 400
+    for name, parameters in declarations:
+        assert name in dwfprototypes.PROTOTYPES, name
+        count = 0 if (parameters.strip() in ("", "void")) else len(parameters.split(","))
+        assert len(dwfprototypes.PROTOTYPES[name]) == count, name
+
+def test_prototypes_are_declared_on_a_native_library(libc_backend):
+    function = dwf._dwf.FDwfAnalogOutAmplitudeSet
+    assert function.argtypes == dwfprototypes.PROTOTYPES["FDwfAnalogOutAmplitudeSet"]
+    assert function.restype is ctypes.c_int
+    with pytest.raises(ctypes.ArgumentError):
+        dwf.AnalogOutAmplitudeSet("hdwf", 0, 1.0)
+
+def test_backend_switch_forgets_resolved_entry_points(libc_backend):
+    assert dwf._dwf.FDwfDeviceClose.argtypes == [ dwfprototypes.HDWF ]
+    simulator = dwfsim.Simulator()
+    dwf.LibraryBackendSet(simulator)
+    assert dwf.EnumDevices() == 1
+    assert simulator.call_count == 1
+
+def test_can_transmission_takes_up_to_eight_bytes(simulator):
+    dwf.EnumDevices()
+    hdwf = dwf.DeviceConfigOpen(0, 0)
+    dwf.DigitalCanTx(hdwf, -1, 0, 0, 0)
+    dwf.DigitalCanTx(hdwf, 0x123, 0, 0, 8, list(range(8)))
+    with pytest.raises(ValueError):
+        dwf.DigitalCanTx(hdwf, 0x123, 0, 0, 8, list(range(9)))
+    dwf.DeviceClose(hdwf)
+
+def test_import_does_not_load_the_library():
+    library = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "lib")
+    output = subprocess.check_output([ sys.executable, "-c", "import dwf; print(dwf.LibraryIsLoaded())" ], cwd = library)
+    assert output.strip() == b"False"
+
+def test_library_loads_on_first_call():
+    library = dwf._Library()
+    library._path = ctypes.util.find_library("c")
+    assert library.is_loaded() == False
+    with pytest.raises(AttributeError):
+        library.FDwfEnum
+    assert library.is_loaded() == True
+
+def test_library_load_surfaces_a_missing_library():
+    library = dwf._Library()
+    with pytest.raises(OSError):
+        library.load("/nonexistent/libdwf.so")
+    assert library.is_loaded() == False
+
+def test_backend_set_counts_as_loaded(simulator):
+    assert dwf.LibraryIsLoaded() == True
+    assert dwf.EnumDevices() == 1
@@ -0,0 +1,77 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import math
+import pytest
+import dwf
+import dwfsim
+
+def test_enumeration_lists_the_simulated_devices():
+    simulator = dwfsim.Simulator([ dwfsim.SimulatedDevice.analog_discovery2(serial_number = "SN:A", user_name = "left"), dwfsim.SimulatedDevice.analog_discovery_pro() ])
+    dwf.LibraryBackendSet(simulator)
+    assert dwf.EnumDevices() == 2
+    assert dwf.EnumSN(0) == "SN:A"
+    assert dwf.EnumUserName(0) == "left"
+    assert dwf.EnumDeviceType(1)[0] == dwf.Device.ANALOG_DISCOVERY_PRO_3X50
+    assert dwf.EnumConfig(0) == 7
+
+def test_open_marks_the_device_busy_until_closed(simulator):
+    dwf.EnumDevices()
+    hdwf = dwf.DeviceConfigOpen(0, 0)
+    assert simulator.devices[0].is_opened == True
+    assert dwf.EnumDeviceIsOpened(0) == True
+    dwf.DeviceClose(hdwf)
+    assert simulator.devices[0].is_opened == False
+
+def test_set_values_are_returned_by_get(simulator):
+    dwf.EnumDevices()
+    hdwf = dwf.DeviceConfigOpen(0, 0)
+    dwf.AnalogInFrequencySet(hdwf, 2.5e6)
+    assert dwf.AnalogInFrequencyGet(hdwf) == 2.5e6
+    dwf.DeviceClose(hdwf)
+
+def test_invalid_handle_reports_an_error(simulator):
+    with pytest.raises(dwf.DwfApiException) as error:
+        dwf.AnalogInFrequencyGet(1234)
+    assert error.value.message == "Invalid device handle provided"
+
+def test_i2c_register_map_follows_the_register_pointer(simulator):
+    dwf.EnumDevices()
+    hdwf = dwf.DeviceConfigOpen(0, 0)
+    assert dwf.DigitalI2cWrite(hdwf, 0x18, [0x10, 0xAA, 0xBB]) == 0
+    assert dwf.DigitalI2cWriteRead(hdwf, 0x18, [0x10], 3) == ([0xAA, 0xBB, 0x12], 0)
+    assert dwf.DigitalI2cWriteRead(hdwf, 0x50, [0x00], 1)[1] != 0
+    dwf.DeviceClose(hdwf)
+
+def test_analog_in_samples_the_channel_signal(simulator):
+    simulator.devices[0].analog_in_signals[0] = dwfsim.Sine(1000.0, amplitude = 2.0)
+    dwf.EnumDevices()
+    hdwf = dwf.DeviceConfigOpen(0, 0)
+    dwf.AnalogInFrequencySet(hdwf, 1e6)
+    dwf.AnalogInBufferSizeSet(hdwf, 1000)
+    dwf.AnalogInConfigure(hdwf, False, True)
+    assert dwf.AnalogInStatus(hdwf, True) == dwf.InstrumentState.DONE
+    samples = dwf.AnalogInStatusData(hdwf, 0, 1000)
+    assert samples[250] == pytest.approx(2.0 * math.sin(2.0 * math.pi * 1000.0 * 250 / 1e6), abs = 1e-3)
+    dwf.DeviceClose(hdwf)
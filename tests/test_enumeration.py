@@ -0,0 +1,91 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pytest
+import dwf
+import dwfsim
+import enumeration
+
+@pytest.fixture
+def two_devices():
+    simulator = dwfsim.Simulator([ dwfsim.SimulatedDevice.analog_discovery2(serial_number = "SN:A", user_name = "left"),
+                                   dwfsim.SimulatedDevice.analog_discovery_pro(serial_number = "SN:B", user_name = "right") ])
+    dwf.LibraryBackendSet(simulator)
+    return simulator
+
+def test_snapshot_serves_lookups(two_devices):
+    table = enumeration.DeviceTable()
+    record = table.find(serial_number = "SN:B")
+    assert (record.index, record.name, record.user_name) == (1, "Analog Discovery Pro 3450", "right")
+    assert record.config_info(0, dwf.ConfigInfo.ANALOG_IN_BUFFER_SIZE) == 32768
+    assert table.find(user_name = "left").serial_number == "SN:A"
+    assert [ each.serial_number for each in table.devices(dwf.EnumFilter.ANALOG_DISCOVERY2) ] == [ "SN:A" ]
+    assert table.scans == 1
+
+def test_miss_retakes_the_snapshot_once(two_devices):
+    table = enumeration.DeviceTable()
+    assert table.find(serial_number = "SN:C") is None
+    assert table.scans == 2
+    two_devices.devices.append(dwfsim.SimulatedDevice.analog_discovery2(serial_number = "SN:C"))
+    assert table.find(serial_number = "SN:C").index == 2
+    assert table.scans == 3
+
+def test_snapshot_expires_after_its_time_to_live(two_devices):
+    table = enumeration.DeviceTable(ttl = 0.0)
+    table.devices()
+    table.devices()
+    assert table.scans == 2
+    table = enumeration.DeviceTable(ttl = 60.0)
+    table.devices()
+    table.invalidate()
+    table.devices()
+    assert table.scans == 2
+
+def test_open_follows_a_device_that_moved(two_devices):
+    table = enumeration.DeviceTable()
+    record = table.find(serial_number = "SN:B")
+    del two_devices.devices[0]
+    dwf.EnumDevices()
+    hdwf = table.open_device(record)
+    assert hdwf != dwf.hdwfNone
+    assert record.index == 0
+    assert two_devices.devices[0].is_opened == True
+    dwf.DeviceClose(hdwf)
+
+def test_open_of_an_unplugged_device_fails(two_devices):
+    table = enumeration.DeviceTable()
+    record = table.find(serial_number = "SN:B")
+    del two_devices.devices[1]
+    dwf.EnumDevices()
+    assert table.open_device(record) == dwf.hdwfNone
+
+def test_open_and_close_keep_is_opened_current(two_devices):
+    table = enumeration.DeviceTable()
+    record = table.find(serial_number = "SN:A")
+    assert record.is_opened == False
+    hdwf = table.open_device(record)
+    assert record.is_opened == True
+    table.close_device(hdwf, record.serial_number)
+    assert record.is_opened == False
+    assert two_devices.devices[0].is_opened == False
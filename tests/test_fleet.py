@@ -0,0 +1,91 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import array
+import os
+import pytest
+import dwf
+import dwfsim
+import fleet
+
+# Workers are spawned processes: they import this module and install the
+# simulator through the fleet initializer.
+
+_SERIAL_NUMBERS = ("SN:A", "SN:B")
+
+def _simulate() -> dwfsim.Simulator:
+    simulator = dwfsim.Simulator([ dwfsim.SimulatedDevice.analog_discovery_pro(serial_number = serial_number) for serial_number in _SERIAL_NUMBERS ])
+    dwf.LibraryBackendSet(simulator)
+    return simulator
+
+def _serial_number(device) -> str:
+    return device.serial_num
+
+def _samples(device, count: int) -> array.array:
+    return array.array('d', range(count))
+
+def _bytes(device, count: int) -> tuple:
+    return bytes(range(256)) * (count // 256), memoryview(array.array('h', range(-count // 2, count // 2))).cast('B').cast('h')
+
+def _fail(device):
+    raise ValueError("job failed")
+
+def _crash(device):
+    os._exit(3)
+
+@pytest.fixture
+def devices():
+    _simulate()
+    devices = fleet.Fleet(initializer = _simulate, restart_delay = 0.1)
+    yield devices
+    devices.shutdown(cancel_futures = True)
+
+def test_jobs_run_on_the_requested_device(devices):
+    assert sorted(record.serial_number for record in devices.devices) == list(_SERIAL_NUMBERS)
+    assert devices.submit(_serial_number, serial_number = "SN:B").result(30) == "SN:B"
+    results = devices.broadcast(_serial_number)
+    assert { serial_number: future.result(30) for serial_number, future in results.items() } == { "SN:A": "SN:A", "SN:B": "SN:B" }
+    with pytest.raises(LookupError):
+        devices.submit(_serial_number, serial_number = "SN:C")
+
+def test_large_results_come_back_through_shared_memory(devices):
+    assert devices.submit(_samples, 100000).result(30) == array.array('d', range(100000))
+    assert devices.submit(_samples, 10).result(30) == array.array('d', range(10))
+    data, samples = devices.submit(_bytes, 65536).result(30)
+    assert data == bytes(range(256)) * 256
+    assert samples == array.array('h', range(-32768, 32768))
+
+def test_job_errors_carry_the_worker_traceback(devices):
+    with pytest.raises(ValueError) as error:
+        devices.submit(_fail).result(30)
+    assert isinstance(error.value.__cause__, fleet.RemoteTraceback)
+    assert "job failed" in str(error.value.__cause__)
+
+def test_crashed_worker_is_restarted(devices):
+    with pytest.raises(fleet.WorkerCrashedError) as error:
+        devices.submit(_crash, serial_number = "SN:A").result(30)
+    assert error.value.exitcode == 3
+    assert devices.submit(_serial_number, serial_number = "SN:A").result(30) == "SN:A"
+    stats = devices.stats()
+    assert (stats["SN:A"]['restarts'], stats["SN:A"]['jobs_failed'], stats["SN:A"]['jobs_done']) == (1, 1, 1)
@@ -0,0 +1,118 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import threading
+import time
+import pytest
+import dwf
+import dwfsim
+import enumeration
+import handlepool
+
+@pytest.fixture
+def two_devices():
+    devices = [ dwfsim.SimulatedDevice.analog_discovery2(serial_number = "SN:A"), dwfsim.SimulatedDevice.analog_discovery2(serial_number = "SN:B") ]
+    simulator = dwfsim.Simulator(devices, latencies = { 'FDwfDeviceConfigOpen': 0.5 })
+    dwf.LibraryBackendSet(simulator)
+    return simulator
+
+def test_released_handle_is_reused(two_devices):
+    pool = handlepool.HandlePool()
+    with pool.acquire("SN:A") as lease:
+        hdwf = lease.hdwf
+    with pool.acquire("SN:A") as lease:
+        assert lease.hdwf == hdwf
+    assert (pool.opens, pool.reuses) == (1, 1)
+    pool.close_all()
+    assert two_devices.devices[0].is_opened == False
+
+def test_open_does_not_block_other_devices(two_devices):
+    pool = handlepool.HandlePool()
+    pool.acquire("SN:B").release()
+    opening = threading.Thread(target = lambda: pool.acquire("SN:A").release())
+    opening.start()
+    time.sleep(0.05)
+    started = time.monotonic()
+    lease = pool.acquire("SN:B", timeout = 5)
+    assert time.monotonic() - started < 0.25
+    opening.join()
+    lease.release()
+    assert sorted(pool._handles) == ["SN:A", "SN:B"]
+    pool.close_all()
+
+def test_failed_open_leaves_no_placeholder(two_devices):
+    pool = handlepool.HandlePool()
+    with pytest.raises(LookupError):
+        pool.acquire("SN:none")
+    assert pool._handles == {}
+
+def test_leased_handle_times_out(two_devices):
+    pool = handlepool.HandlePool()
+    lease = pool.acquire("SN:A")
+    with pytest.raises(TimeoutError):
+        pool.acquire("SN:A", timeout = 0.05)
+    lease.release()
+    assert lease.hdwf == dwf.hdwfNone
+    pool.close_all()
+
+def test_other_configuration_reopens_the_device(two_devices):
+    pool = handlepool.HandlePool()
+    pool.acquire("SN:A", 0).release()
+    with pool.acquire("SN:A", 1) as lease:
+        assert lease.config_index == 1
+    assert (pool.opens, pool.reuses) == (2, 0)
+    pool.close_all()
+
+def test_idle_handles_are_reaped(two_devices):
+    pool = handlepool.HandlePool(idle_timeout = 0.05)
+    pool.acquire("SN:A").release()
+    assert two_devices.devices[0].is_opened == True
+    deadline = time.monotonic() + 5
+    while (len(pool._handles) > 0 and time.monotonic() < deadline):
+        time.sleep(0.01)
+    assert pool._handles == {}
+    assert two_devices.devices[0].is_opened == False
+
+def test_close_does_not_block_other_devices(two_devices, monkeypatch):
+    pool = handlepool.HandlePool()
+    pool.acquire("SN:A").release()
+    lease = pool.acquire("SN:B")
+    close_device = enumeration.close_device
+    def slow_close_device(hdwf, serial_number):
+        time.sleep(0.5)
+        close_device(hdwf, serial_number)
+    monkeypatch.setattr(enumeration, 'close_device', slow_close_device)
+    closing = threading.Thread(target = pool.close_idle)
+    closing.start()
+    time.sleep(0.05)
+    started = time.monotonic()
+    lease.release()
+    assert time.monotonic() - started < 0.25
+    with pool.acquire("SN:A", timeout = 5) as lease:
+        assert two_devices.devices[0].is_opened == True
+    closing.join()
+    assert pool.opens == 3
+    monkeypatch.undo()
+    pool.close_all()
@@ -0,0 +1,136 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pytest
+import dwfsim
+from pyanalogdiscovery import I2cBatch, I2cClockRate, I2cScanStrategy, PyAnalogDiscoveryException, Status
+
+@pytest.fixture
+def i2c(device):
+    i2c = device.acquire_inter_integrated_circuit()
+    i2c.configure_bus(I2cClockRate.ONE_HUNDRED_KHZ, 0x18, 0, 1)
+    return i2c
+
+def test_batch_runs_operations_in_order(i2c):
+    batch = I2cBatch()
+    batch.write(0x18, [0x20, 0xAA])
+    delay = batch.delay(0.001)
+    first = batch.write_read(0x18, [0x1F], 3)
+    second = batch.read(0x18, 2)
+    batch.write(0x50, b'\x00')
+    assert len(batch) == 5
+    assert i2c.run(batch) is batch
+    assert bytes(batch.result(first)) == bytes([0x1F, 0xAA, 0x21])
+    assert bytes(batch.result(second)) == bytes([0x22, 0x23])
+    assert batch.offsets[second] == 3
+    assert bytes(batch.result(delay)) == b''
+    assert list(batch.naks) == [0, 0, 0, 0, 1]
+
+def test_batch_addresses_several_slaves(simulator, i2c):
+    simulator.devices[0].add_i2c_slave(dwfsim.I2cRegisterMap(0x19, { 0x00: 0x55 }))
+    batch = I2cBatch()
+    batch.write_read(0x18, [0x00], 1)
+    batch.write_read(0x19, [0x00], 1)
+    i2c.run(batch)
+    assert bytes(batch.data) == bytes([0x00, 0x55])
+
+def test_batch_rerun_reuses_its_buffers(simulator, i2c):
+    batch = I2cBatch()
+    index = batch.write_read(0x18, [0x40], 1)
+    i2c.run(batch)
+    data = batch.data
+    simulator.devices[0].i2c_slaves[0x18].registers[0x40] = 0x99
+    i2c.run(batch)
+    assert batch.data is data
+    assert bytes(batch.result(index)) == b'\x99'
+
+def test_queueing_recompiles_the_batch(i2c):
+    batch = I2cBatch()
+    batch.write_read(0x18, [0x01], 1)
+    i2c.run(batch)
+    index = batch.write_read(0x18, [0x02], 2)
+    i2c.run(batch)
+    assert bytes(batch.data) == bytes([0x01, 0x02, 0x03])
+    assert bytes(batch.result(index)) == bytes([0x02, 0x03])
+
+def test_read_into_fills_the_buffer(i2c):
+    i2c.write([0x30])
+    buffer = bytearray(4)
+    assert i2c.read_into(buffer) == 0
+    assert buffer == bytes([0x30, 0x31, 0x32, 0x33])
+    assert i2c.read_into(memoryview(buffer)[1:], 2) == 0
+    assert buffer == bytes([0x30, 0x34, 0x35, 0x33])
+
+def test_write_read_into_reads_from_the_register(i2c):
+    buffer = bytearray(2)
+    assert i2c.write_read_into(b'\x80', buffer) == 0
+    assert buffer == bytes([0x80, 0x81])
+
+def test_bytes_variants_return_bytes(i2c):
+    assert i2c.write_read_bytes(b'\x10', 3) == (bytes([0x10, 0x11, 0x12]), 0)
+    assert i2c.read_bytes(2) == (bytes([0x13, 0x14]), 0)
+    assert i2c.write(bytearray([0x10, 0x01, 0x02])) == 0
+    assert i2c.write_read_bytes([0x10], 2) == (bytes([0x01, 0x02]), 0)
+
+def test_read_into_reports_a_nak(i2c):
+    i2c.address = 0x50
+    assert i2c.read_into(bytearray(1)) != 0
+
+@pytest.mark.parametrize("strategy", list(I2cScanStrategy))
+def test_scan_finds_the_slaves(simulator, i2c, strategy):
+    simulator.devices[0].add_i2c_slave(dwfsim.I2cRegisterMap(0x50))
+    assert i2c.scan(strategy) == [0x18, 0x50]
+    assert i2c.scan(strategy, 0x19, 0x4F) == []
+
+def test_scan_does_not_reconfigure_the_bus(simulator, i2c):
+    count = simulator.call_count
+    i2c.scan()
+    assert simulator.call_count - count == 0x77 - 0x03 + 1
+
+def test_scan_buses_reports_buses_without_pull_ups(simulator, i2c):
+    results = i2c.scan_buses([ (0, 1), (2, 3) ])
+    assert results == { (0, 1): [0x18], (2, 3): [0x18] }
+    simulator.devices[0].i2c_bus_free = False
+    assert i2c.scan_buses([ (0, 1) ]) == { (0, 1): None }
+    assert i2c.address == 0x18
+
+def test_dump_reads_the_register_range(i2c):
+    assert i2c.dump() == bytes(range(256))
+    assert i2c.dump(0xF0, 0xFF) == bytes(range(0xF0, 0x100))
+    assert i2c.dump(0x05, 0x05) == b'\x05'
+    for start, end in ((0xF0, 0x110), (0x20, 0x10), (-1, 0x05)):
+        with pytest.raises(ValueError):
+            i2c.dump(start, end)
+
+@pytest.mark.parametrize("chunk, transfers", [ (256, 1), (16, 16), (100, 3), (1, 256), (0, 256) ])
+def test_dump_reads_in_bursts_of_chunk_registers(simulator, i2c, chunk, transfers):
+    count = simulator.call_count
+    assert i2c.dump(chunk = chunk) == bytes(range(256))
+    assert simulator.call_count - count == transfers
+
+def test_dump_raises_when_the_slave_is_missing(i2c):
+    i2c.address = 0x50
+    with pytest.raises(PyAnalogDiscoveryException) as error:
+        i2c.dump(0x00, 0x0F)
+    assert error.value.status == Status.ERROR_I2C_SLAVE_NAK
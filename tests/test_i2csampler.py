@@ -0,0 +1,106 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import time
+import pytest
+import i2csampler
+from pyanalogdiscovery import I2cClockRate
+
+@pytest.fixture
+def i2c(device):
+    i2c = device.acquire_inter_integrated_circuit()
+    i2c.configure_bus(I2cClockRate.ONE_HUNDRED_KHZ, 0x18, 0, 1)
+    return i2c
+
+def test_due_jobs_run_as_one_batch(i2c):
+    sampler = i2csampler.I2cSampler(i2c)
+    temperature = sampler.add(0x18, 0x00, 2, period = 10.0)
+    humidity = sampler.add(0x18, 0x02, 2, period = 10.0)
+    pressure = sampler.add(0x18, 0x10, 1, period = 10.0)
+    missing = sampler.add(0x50, 0x00, 1, period = 10.0)
+    next_release = sampler.run_once()
+    assert next_release == pytest.approx(time.monotonic() + 10.0, abs = 1.0)
+    assert temperature.latest()[1] == bytes([0x00, 0x01])
+    assert humidity.latest()[1] == bytes([0x02, 0x03])
+    assert pressure.latest()[1] == bytes([0x10])
+    assert missing.latest() is None
+    stats = sampler.stats()
+    assert (stats['batches'], stats['transactions']) == (1, 3)
+    assert stats['jobs']['0x50:0x00']['naks'] == 1
+    assert stats['jobs']['0x18:0x00']['samples'] == 1
+
+def test_jobs_run_only_when_released(i2c):
+    sampler = i2csampler.I2cSampler(i2c)
+    job = sampler.add(0x18, 0x00, 1, period = 10.0, phase = 5.0)
+    sampler.run_once()
+    assert (job.samples, sampler.batches) == (0, 0)
+
+def test_history_keeps_the_last_samples(simulator, i2c):
+    sampler = i2csampler.I2cSampler(i2c)
+    job = sampler.add(0x18, 0x40, 1, period = 0.001, capacity = 3)
+    for value in range(5):
+        simulator.devices[0].i2c_slaves[0x18].registers[0x40] = value
+        sampler.run_once()
+        time.sleep(0.003)
+    assert job.samples == 5
+    assert [ data for timestamp, data in job.history() ] == [ b'\x02', b'\x03', b'\x04' ]
+    timestamps = [ timestamp for timestamp, data in job.history() ]
+    assert timestamps == sorted(timestamps)
+
+def test_batch_time_budget_serves_the_most_urgent_jobs(i2c):
+    sampler = i2csampler.I2cSampler(i2c, max_batch_time = 0.0005)
+    slow = sampler.add(0x18, 0x00, 1, period = 1.0)
+    fast = sampler.add(0x18, 0x20, 1, period = 0.1)
+    sampler.run_once()
+    assert (fast.samples, slow.samples) == (1, 0)
+
+def test_late_sample_counts_a_deadline_miss():
+    job = i2csampler.SampleJob(0x18, 0x00, 1, period = 1.0)
+    job.release = 10.0
+    job._advance(10.5)
+    assert (job.release, job.deadline_misses) == (11.0, 0)
+    job._advance(13.5)
+    assert (job.release, job.deadline_misses) == (13.0, 2)
+
+def test_plans_are_cached_per_set_of_jobs(i2c):
+    sampler = i2csampler.I2cSampler(i2c)
+    job = sampler.add(0x18, 0x00, 1, period = 0.001)
+    sampler.run_once()
+    plan = sampler._plan([ job ])
+    sampler.run_once()
+    assert sampler._plan([ job ]) is plan
+    sampler.remove(job)
+    assert sampler._plans == {}
+
+def test_background_sampling(i2c):
+    sampler = i2csampler.I2cSampler(i2c)
+    job = sampler.add(0x18, 0x00, 1, period = 0.01)
+    with sampler:
+        time.sleep(0.2)
+    assert job.samples >= 5
+    assert 0.0 < sampler.bus_utilization <= 1.0
+
+def test_add_rejects_reads_longer_than_a_burst(i2c):
+    with pytest.raises(ValueError):
+        i2csampler.I2cSampler(i2c, max_burst = 4).add(0x18, 0x00, 8, period = 1.0)
@@ -0,0 +1,81 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import io
+import json
+import sys
+import pytest
+import i2cscript
+from pyanalogdiscovery import I2cClockRate
+
+@pytest.fixture
+def i2c(device):
+    i2c = device.acquire_inter_integrated_circuit()
+    i2c.configure_bus(I2cClockRate.ONE_HUNDRED_KHZ, 0x18, 0, 1)
+    return i2c
+
+def test_parse_line_converts_arguments():
+    assert i2cscript.parse_line("set 0x18 0x20 0x57 0x58", 1, 'get') == ('set', (0x18, 0x20, 0x57, 0x58))
+    assert i2cscript.parse_line("0x18 0x00 16", 1, 'get') == ('get', (0x18, 0x00, 16))
+    assert i2cscript.parse_line("dump 0x18 0x10-0x3f", 1, 'get') == ('dump', (0x18, 0x10, 0x3f))
+    assert i2cscript.parse_line("  # comment", 1, 'get') is None
+
+@pytest.mark.parametrize('line', [ 'set 0x18 0x20 0x157', 'get 0x18 0x100', 'get 0x99 0', 'get 0x02 0', 'get 0x18 0x00 0',
+                                   'get 0x18 "0x20', 'get 0x18 zz', 'dump 0x18 0x20-0x10', 'dump 0x18 0x00-0x100', 'set 0x18 0x20' ])
+def test_parse_line_reports_malformed_lines(line):
+    with pytest.raises(i2cscript.ScriptError) as error:
+        i2cscript.parse_line(line, 7, 'get')
+    assert error.value.line_number == 7
+    assert str(error.value).startswith("line 7: ")
+
+def test_run_writes_results_as_they_complete(i2c):
+    output = io.StringIO()
+    lines = [ "# chip register bytes", "set 0x18 0x20 0x57 0x58", "get 0x18 0x20 2", "dump 0x18 0x00-0x03" ]
+    assert i2cscript.run(i2c, lines, 'get', output) == 0
+    assert output.getvalue() == "57 58\n00010203\n"
+
+def test_run_stops_at_the_first_malformed_line(i2c):
+    output = io.StringIO()
+    lines = [ "get 0x18 0x00", "get 0x18 0x100", "get 0x18 0x01" ]
+    assert i2cscript.run(i2c, lines, 'get', output, use_json = True) == 1
+    results = [ json.loads(line) for line in output.getvalue().splitlines() ]
+    assert results[0]['data'] == [0x00]
+    assert results[1]['line'] == 2 and 'error' in results[1]
+    assert len(results) == 2
+
+def test_run_file_leaves_stdin_open(i2c, monkeypatch):
+    stdin = io.StringIO("get 0x18 0x05\n")
+    monkeypatch.setattr(sys, 'stdin', stdin)
+    output = io.StringIO()
+    assert i2cscript.run_file(i2c, '-', 'get', output) == 0
+    assert output.getvalue() == "05\n"
+    assert stdin.closed == False
+
+def test_run_file_reads_a_script_file(i2c, tmp_path):
+    script = tmp_path / 'script.txt'
+    script.write_text("0x18 0x06 2\n")
+    output = io.StringIO()
+    assert i2cscript.run_file(i2c, str(script), 'get', output) == 0
+    assert output.getvalue() == "06 07\n"
@@ -0,0 +1,65 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import array
+import pytest
+
+def _capture(logic_analyzer, number_of_samples: int = 100, sample_format: int = 16):
+    logic_analyzer.configure_acquisition(1e6, number_of_samples, sample_format)
+    logic_analyzer.initiate()
+    while (logic_analyzer.is_done() == False):
+        pass
+
+@pytest.mark.parametrize('sample_format, typecode', [ (8, 'B'), (16, 'H'), (32, 'I') ])
+def test_read_packs_samples_in_the_sample_format(device, sample_format, typecode):
+    logic_analyzer = device.acquire_logic_analyzer()
+    _capture(logic_analyzer, sample_format = sample_format)
+    samples = logic_analyzer.read()
+    assert memoryview(samples).format == typecode
+    assert len(samples) == 100
+    assert list(samples) == [ sample_index & ((1 << sample_format) - 1) for sample_index in range(100) ]
+
+def test_read_into_a_caller_buffer(device):
+    logic_analyzer = device.acquire_logic_analyzer()
+    _capture(logic_analyzer)
+    samples = list(logic_analyzer.read())
+    out = array.array('H', bytes(2 * 100))
+    assert logic_analyzer.read(out = out) is out
+    assert list(out) == samples
+    assert list(logic_analyzer.read(first_sample = 10, number_of_samples = 5)) == samples[10:15]
+
+def test_read_into_a_byte_buffer_counts_samples(device):
+    logic_analyzer = device.acquire_logic_analyzer()
+    _capture(logic_analyzer)
+    samples = list(logic_analyzer.read())
+    assert list(logic_analyzer.read(out = bytearray(200))) == samples
+    assert list(logic_analyzer.read(out = bytearray(100))) == samples[:50]
+
+def test_read_from_first_sample_stops_at_the_valid_samples(device):
+    logic_analyzer = device.acquire_logic_analyzer()
+    _capture(logic_analyzer)
+    samples = list(logic_analyzer.read())
+    assert list(logic_analyzer.read(first_sample = 90)) == samples[90:]
+    with pytest.raises(ValueError):
+        logic_analyzer.read(first_sample = 101)
@@ -0,0 +1,103 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import array
+import pytest
+import dwf
+from pyanalogdiscovery import RawWaveform
+
+def _capture(scope, number_of_samples: int = 100):
+    scope.configure_channel(0, 5.0)
+    scope.configure_acquisition(1e6, number_of_samples)
+    scope.initiate()
+    while (scope.is_done() == False):
+        pass
+
+def test_read_fills_the_pooled_buffer(device):
+    scope = device.acquire_oscilloscope()
+    _capture(scope)
+    volts = scope.read(0)
+    assert len(volts) == 100
+    assert list(volts) == list(dwf.AnalogInStatusData(device.hdwf, 0, 100))
+
+def test_read_into_a_caller_buffer(device):
+    scope = device.acquire_oscilloscope()
+    _capture(scope)
+    volts = list(scope.read(0))
+    out = array.array('d', bytes(8 * 100))
+    assert scope.read(0, out = out) is out
+    assert list(out) == volts
+    assert list(scope.read(0, out = array.array('d', bytes(8 * 200)))) == volts
+    assert list(scope.read(0, first_sample = 10, number_of_samples = 20)) == volts[10:30]
+
+def test_read_into_a_numpy_array(device):
+    numpy = pytest.importorskip('numpy')
+    scope = device.acquire_oscilloscope()
+    _capture(scope)
+    volts = list(scope.read(0))
+    out = numpy.empty(100)
+    assert scope.read(0, out = out) is out
+    assert out.tolist() == volts
+
+def test_read_into_a_byte_buffer_counts_samples(device):
+    scope = device.acquire_oscilloscope()
+    _capture(scope)
+    volts = list(scope.read(0))
+    assert list(scope.read(0, out = bytearray(8 * 100))) == volts
+    assert list(scope.read(0, out = bytearray(8 * 50))) == volts[:50]
+    assert list(scope.read(0, out = array.array('B', bytes(800)))) == volts
+
+def test_read_from_first_sample_stops_at_the_valid_samples(device):
+    scope = device.acquire_oscilloscope()
+    _capture(scope)
+    volts = list(scope.read(0))
+    assert list(scope.read(0, first_sample = 90)) == volts[90:]
+    assert len(scope.read_raw(0, first_sample = 60).samples) == 40
+    with pytest.raises(ValueError):
+        scope.read(0, first_sample = 101)
+
+def test_read_rejects_a_buffer_of_another_type(device):
+    scope = device.acquire_oscilloscope()
+    _capture(scope)
+    with pytest.raises(ValueError):
+        scope.read(0, out = array.array('q', bytes(8 * 100)))
+    with pytest.raises(ValueError):
+        scope.read_raw(0, out = array.array('H', bytes(2 * 100)))
+
+def test_raw_samples_convert_to_the_volts_read(device):
+    scope = device.acquire_oscilloscope()
+    _capture(scope)
+    volts = list(scope.read(0))
+    raw = scope.read_raw(0)
+    assert len(raw) == 100
+    assert raw.adc_bits == 14
+    assert raw.resolution == pytest.approx(raw.voltage_range / 16384)
+    assert list(raw.to_volts()) == pytest.approx(volts, abs = raw.resolution)
+    out = array.array('d', bytes(8 * 100))
+    assert raw.to_volts(out = out) is out
+    assert list(out) == pytest.approx(volts, abs = raw.resolution)
+
+def test_raw_to_volts_applies_the_channel_offset():
+    raw = RawWaveform(array.array('h', [ -32768, 0, 16384 ]), 10.0, 1.5, 14)
+    assert list(raw.to_volts()) == pytest.approx([ -3.5, 1.5, 4.0 ])
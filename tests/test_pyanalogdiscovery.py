@@ -0,0 +1,166 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import threading
+import pytest
+import dwf
+from pyanalogdiscovery import I2cClockRate, PyAnalogDiscoveryException, Status
+
+def test_unchanged_settings_are_not_sent_again(simulator, device):
+    scope = device.acquire_oscilloscope()
+    scope.configure_channel(0, 5.0)
+    scope.configure_acquisition(1e6, 1000)
+    count = simulator.call_count
+    scope.configure_channel(0, 5.0)
+    scope.configure_acquisition(1e6, 1000)
+    assert simulator.call_count == count
+    assert device._shadow.calls_elided == 5
+    scope.configure_channel(0, 2.0)
+    assert simulator.call_count == count + 1
+    assert dwf.AnalogInChannelRangeGet(device.hdwf, 0) == 2.0
+
+def test_channels_are_shadowed_separately(device):
+    scope = device.acquire_oscilloscope()
+    scope.configure_channel(0, 5.0)
+    elided = device._shadow.calls_elided
+    scope.configure_channel(1, 5.0)
+    assert device._shadow.calls_elided == elided
+
+def test_instrument_reset_invalidates_its_settings(simulator, device):
+    i2c = device.acquire_inter_integrated_circuit()
+    scope = device.acquire_oscilloscope()
+    i2c.configure_bus(I2cClockRate.ONE_HUNDRED_KHZ, 0x18, 0, 1)
+    scope.configure_acquisition(1e6, 1000)
+    i2c.reset_instrument()
+    elided = device._shadow.calls_elided
+    i2c.configure_bus(I2cClockRate.ONE_HUNDRED_KHZ, 0x18, 0, 1)
+    scope.configure_acquisition(1e6, 1000)
+    assert device._shadow.calls_elided == elided + 2
+
+def test_device_reset_invalidates_every_setting(device):
+    scope = device.acquire_oscilloscope()
+    scope.configure_acquisition(1e6, 1000)
+    device.reset()
+    elided = device._shadow.calls_elided
+    scope.configure_acquisition(1e6, 1000)
+    assert device._shadow.calls_elided == elided
+
+def test_invalidate_settings_covers_direct_dwf_calls(device):
+    scope = device.acquire_oscilloscope()
+    scope.configure_acquisition(1e6, 1000)
+    dwf.AnalogInFrequencySet(device.hdwf, 2e6)
+    device.invalidate_settings()
+    scope.configure_acquisition(1e6, 1000)
+    assert dwf.AnalogInFrequencyGet(device.hdwf) == 1e6
+
+def _record_calls(monkeypatch, name: str) -> list:
+    calls = []
+    function = getattr(dwf, name)
+    def recording(*args):
+        calls.append(args)
+        return function(*args)
+    monkeypatch.setattr(dwf, name, recording)
+    return calls
+
+def test_configure_block_configures_each_changed_instrument_once(device, monkeypatch):
+    scope = device.acquire_oscilloscope()
+    analog_in_calls = _record_calls(monkeypatch, 'AnalogInConfigure')
+    analog_out_calls = _record_calls(monkeypatch, 'AnalogOutConfigure')
+    with device.configure():
+        assert dwf.DeviceAutoConfigureGet(device.hdwf) == 0
+        scope.configure_channel(0, 5.0)
+        with device.configure():
+            scope.configure_channel(1, 5.0)
+        assert len(analog_in_calls) == 0
+        scope.configure_acquisition(1e6, 1000)
+    assert analog_in_calls == [ (device.hdwf, True, False) ]
+    assert analog_out_calls == []
+    assert dwf.DeviceAutoConfigureGet(device.hdwf) != 0
+
+def test_configure_block_without_changes_configures_nothing(device, monkeypatch):
+    scope = device.acquire_oscilloscope()
+    scope.configure_channel(0, 5.0)
+    analog_in_calls = _record_calls(monkeypatch, 'AnalogInConfigure')
+    with device.configure():
+        scope.configure_channel(0, 5.0)
+    assert analog_in_calls == []
+
+def test_configure_block_that_raised_is_forgotten(device, monkeypatch):
+    scope = device.acquire_oscilloscope()
+    with pytest.raises(KeyError):
+        with device.configure():
+            scope.configure_channel(0, 2.0)
+            raise KeyError
+    analog_in_calls = _record_calls(monkeypatch, 'AnalogInConfigure')
+    calls_elided = device._shadow.calls_elided
+    with device.configure():
+        scope.configure_channel(0, 2.0)
+    assert device._shadow.calls_elided == calls_elided
+    assert len(analog_in_calls) == 1
+
+def _hold(lock, held: threading.Event, resume: threading.Event):
+    with lock:
+        held.set()
+        resume.wait(5)
+
+def test_instruments_are_used_concurrently(device):
+    scope = device.acquire_oscilloscope()
+    i2c = device.acquire_inter_integrated_circuit()
+    held, resume = threading.Event(), threading.Event()
+    holder = threading.Thread(target = _hold, args = (device.locks.instrument('AnalogIn'), held, resume))
+    holder.start()
+    assert held.wait(5)
+    i2c.configure_bus(I2cClockRate.ONE_HUNDRED_KHZ, 0x18, 0, 1)
+    assert i2c.write_read_bytes([0x05], 1) == (b'\x05', 0)
+    configured = threading.Thread(target = scope.configure_channel, args = (0, 5.0))
+    configured.start()
+    configured.join(0.1)
+    assert configured.is_alive()
+    resume.set()
+    configured.join(5)
+    holder.join(5)
+    contentions = device.lock_contentions()
+    assert contentions['AnalogIn'] == 1
+    assert contentions['DigitalI2c'] == 0
+    assert contentions['Device'] == 0
+
+def test_device_calls_wait_for_the_instruments(device):
+    held, resume = threading.Event(), threading.Event()
+    holder = threading.Thread(target = _hold, args = (device.locks.instrument('DigitalI2c'), held, resume))
+    holder.start()
+    assert held.wait(5)
+    reset = threading.Thread(target = device.reset)
+    reset.start()
+    reset.join(0.1)
+    assert reset.is_alive()
+    resume.set()
+    reset.join(5)
+    holder.join(5)
+    assert device.lock_contentions()['Device'] == 1
+
+def test_exception_message_is_read_when_raised(simulator):
+    simulator._last_error = (dwf.ErrorCodes.INVALID_PARAMETER0, "first")
+    exception = PyAnalogDiscoveryException(Status.ERROR_I2C_SLAVE_NAK)
+    simulator._last_error = (dwf.ErrorCodes.INVALID_PARAMETER0, "second")
+    assert str(exception) == "Error I2C Slave Nak\nfirst"
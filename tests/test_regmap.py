@@ -0,0 +1,155 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import os
+import tempfile
+import threading
+import pytest
+import deviceserver
+import regmap
+from pyanalogdiscovery import I2cClockRate, PyAnalogDiscoveryException
+
+_REGISTERS = [ regmap.Register('CONFIG', 0x01, width = 2),
+               regmap.Register('MODE', 0x03),
+               regmap.Register('TEMP', 0x05, width = 2, volatile = True, access = regmap.Access.READ_ONLY),
+               regmap.Register('COMMAND', 0x10, access = regmap.Access.WRITE_ONLY),
+               regmap.Register('LIMIT', 0x20, byte_order = 'little') ]
+
+@pytest.fixture
+def registers(simulator, device):
+    i2c = device.acquire_inter_integrated_circuit()
+    i2c.configure_bus(I2cClockRate.ONE_HUNDRED_KHZ, 0x18, 0, 1)
+    return regmap.RegisterMap(i2c, _REGISTERS)
+
+def _slave(simulator):
+    return simulator.devices[0].i2c_slaves[0x18]
+
+def test_non_volatile_reads_are_cached(simulator, registers):
+    assert registers.read('CONFIG') == 0x0102
+    _slave(simulator).registers[0x01] = 0xFF
+    assert registers.read('CONFIG') == 0x0102
+    assert registers.bus_reads == 1
+    registers.invalidate('CONFIG')
+    assert registers.read('CONFIG') == 0xFF02
+    assert registers.bus_reads == 2
+
+def test_volatile_reads_go_to_the_bus(simulator, registers):
+    assert registers.read('TEMP') == 0x0506
+    _slave(simulator).registers[0x05] = 0x11
+    assert registers.read('TEMP') == 0x1106
+    assert registers.bus_reads == 2
+
+def test_adjacent_reads_are_merged(registers):
+    assert registers.read_many([ 'MODE', 'CONFIG', 'TEMP', 'LIMIT' ]) == { 'CONFIG': 0x0102, 'MODE': 0x03, 'TEMP': 0x0506, 'LIMIT': 0x20 }
+    assert registers.bus_reads == 3
+
+def test_reads_are_split_at_max_burst(registers):
+    registers.max_burst = 2
+    registers.read_many([ 'CONFIG', 'MODE' ])
+    assert registers.bus_reads == 2
+
+def test_writes_go_through_the_cache(simulator, registers):
+    registers.write('CONFIG', 0xABCD)
+    assert _slave(simulator).registers[0x01:0x03] == bytes([0xAB, 0xCD])
+    assert registers.read('CONFIG') == 0xABCD
+    assert (registers.bus_reads, registers.bus_writes) == (0, 1)
+    registers.write('LIMIT', 0x7F)
+    assert registers.read('LIMIT') == 0x7F
+
+def test_update_bits_skips_writes_that_change_nothing(simulator, registers):
+    assert registers.update_bits('MODE', 0x01, 0x01) == False
+    assert registers.update_bits('MODE', 0x0C, 0x08) == True
+    assert _slave(simulator).registers[0x03] == 0x0B
+    assert (registers.bus_reads, registers.bus_writes) == (1, 1)
+
+def test_deferred_writes_are_combined(simulator, registers):
+    with registers.deferred():
+        registers.write('CONFIG', 0x1111)
+        with registers.deferred():
+            registers.write('MODE', 0x22)
+        registers.write('COMMAND', 0x33)
+        assert registers.bus_writes == 0
+    assert registers.bus_writes == 2
+    assert _slave(simulator).registers[0x01:0x04] == bytes([0x11, 0x11, 0x22])
+    assert _slave(simulator).registers[0x10] == 0x33
+
+def test_deferred_block_that_raised_sends_nothing(simulator, registers):
+    with pytest.raises(RuntimeError):
+        with registers.deferred():
+            registers.write('MODE', 0x44)
+            raise RuntimeError()
+    assert registers.bus_writes == 0
+    assert _slave(simulator).registers[0x03] == 0x03
+    assert registers.read('MODE') == 0x03
+
+def test_access_is_enforced(registers):
+    with pytest.raises(ValueError):
+        registers.write('TEMP', 0)
+    with pytest.raises(ValueError):
+        registers.read('COMMAND')
+
+def test_missing_slave_raises(registers):
+    registers.address = 0x50
+    with pytest.raises(PyAnalogDiscoveryException):
+        registers.read('MODE')
+    with pytest.raises(PyAnalogDiscoveryException):
+        registers.write('MODE', 0)
+
+def test_nak_keeps_the_unsent_writes_queued(simulator, registers, monkeypatch):
+    write = registers.i2c.write
+    naks = [ 0, 1 ]
+    def write_once(write_data, address = None):
+        if (naks.pop(0) != 0):
+            return 1
+        return write(write_data, address = address)
+    monkeypatch.setattr(registers.i2c, 'write', write_once)
+    with pytest.raises(PyAnalogDiscoveryException):
+        with registers.deferred():
+            registers.write('CONFIG', 0x1111)
+            registers.write('COMMAND', 0x33)
+            registers.write('LIMIT', 0x44)
+    assert _slave(simulator).registers[0x01:0x03] == bytes([0x11, 0x11])
+    assert _slave(simulator).registers[0x10] == 0x10
+    monkeypatch.undo()
+    registers.flush()
+    assert _slave(simulator).registers[0x10] == 0x33
+    assert _slave(simulator).registers[0x20] == 0x44
+
+def test_register_map_works_over_a_device_server(simulator):
+    socket_directory = tempfile.mkdtemp()
+    server = deviceserver.DeviceServer(os.path.join(socket_directory, 'ad.sock'))
+    threading.Thread(target = server.serve_forever, daemon = True).start()
+    client = deviceserver.connect(server.socket_path)
+    try:
+        i2c = client.acquire_inter_integrated_circuit()
+        i2c.configure_bus(I2cClockRate.ONE_HUNDRED_KHZ, 0x50, 0, 1)
+        registers = regmap.RegisterMap(i2c, _REGISTERS, address = 0x18)
+        assert registers.read_many([ 'CONFIG', 'MODE' ]) == { 'CONFIG': 0x0102, 'MODE': 0x03 }
+        registers.write('MODE', 0x0B)
+        assert _slave(simulator).registers[0x03] == 0x0B
+    finally:
+        client.release()
+        server.shutdown()
+        server.server_close()
+        os.rmdir(socket_directory)
@@ -0,0 +1,164 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import io
+import threading
+import time
+import pytest
+import dwf
+import streaming
+
+def test_analog_in_recorder_delivers_every_channel(device):
+    scope = device.acquire_oscilloscope()
+    recorder = scope.record([0, 1], 1e6, 1024, chunk_count = 64, record_length = 0.016384)
+    with recorder:
+        chunks = [ (chunk.sequence, chunk.first_sample, len(chunk[0]), len(chunk[1])) for chunk in recorder ]
+    assert chunks == [ (sequence, sequence * 1024, 1024, 1024) for sequence in range(16) ]
+    assert recorder.total_lost == recorder.total_dropped == 0
+
+def test_recorder_counts_overflow_samples_without_reading_them(device, monkeypatch):
+    samples_read = []
+    status_data = dwf.AnalogInStatusData2Into
+    def counting_status_data(hdwf, channel, buffer, index, count):
+        samples_read.append(count)
+        return status_data(hdwf, channel, buffer, index, count)
+    monkeypatch.setattr(dwf, 'AnalogInStatusData2Into', counting_status_data)
+    scope = device.acquire_oscilloscope()
+    recorder = scope.record([0], 1e6, 256, chunk_count = 2, record_length = 0.02)
+    delivered = 0
+    with recorder:
+        for chunk in recorder:
+            delivered += chunk.length
+            time.sleep(0.01)
+    assert recorder.total_dropped > 0
+    assert delivered + recorder.total_dropped == 20000
+    assert sum(samples_read) == delivered
+
+def test_recorder_hooks_are_abstract():
+    with pytest.raises(TypeError):
+        streaming.Recorder(1, 'd', 1, 16)
+
+def test_recorder_with_a_full_ring_does_not_spin(device, monkeypatch):
+    status_calls = []
+    status_record = dwf.AnalogInStatusRecord
+    monkeypatch.setattr(dwf, 'AnalogInStatusRecord', lambda hdwf: (status_calls.append(hdwf), status_record(hdwf))[1])
+    scope = device.acquire_oscilloscope()
+    recorder = scope.record([0], 1e6, 256, chunk_count = 2)
+    recorder.poll_interval = 0.01
+    with recorder:
+        next(iter(recorder))
+        status_calls.clear()
+        time.sleep(0.2)
+        # The consumer holds a chunk and the ring is full: the poller sleeps.
+        assert len(status_calls) < 40
+
+def test_chunk_positions_count_lost_and_dropped_samples(device):
+    scope = device.acquire_oscilloscope()
+    recorder = scope.record([0], 1e6, 256, chunk_count = 2, record_length = 0.02)
+    chunks = []
+    with recorder:
+        for chunk in recorder:
+            chunks.append((chunk.first_sample, chunk.length, chunk.dropped))
+            time.sleep(0.01)
+    assert recorder.total_dropped > 0
+    # Each chunk starts where the previous one ended plus the samples dropped
+    # in between.
+    for (first_sample, length, _), (next_first_sample, _, dropped) in zip(chunks, chunks[1:]):
+        assert next_first_sample == first_sample + length + dropped
+
+def test_digital_in_recorder_writes_consumed_chunks_to_the_spill_file(device):
+    logic_analyzer = device.acquire_logic_analyzer()
+    spill = io.BytesIO()
+    recorder = logic_analyzer.record(1e6, 1024, chunk_count = 8, record_samples = 64 * 1024, spill_file = spill)
+    with recorder:
+        sequences = [ chunk.sequence for chunk in recorder ]
+    # A chunk taken by another consumer would leave a gap in the sequence.
+    assert sequences == list(range(len(sequences)))
+    assert len(sequences) * 1024 + recorder.total_dropped == 64 * 1024
+    assert len(spill.getvalue()) == len(sequences) * 1024 * 2
+
+def test_recorder_with_callback_cannot_be_iterated(device):
+    logic_analyzer = device.acquire_logic_analyzer()
+    recorder = logic_analyzer.record(1e6, 1024, chunk_count = 8, record_samples = 8 * 1024)
+    sequences = []
+    recorder.start(callback = lambda chunk: sequences.append(chunk.sequence))
+    try:
+        with pytest.raises(RuntimeError):
+            next(iter(recorder))
+        recorder._thread.join(5)
+    finally:
+        recorder.stop()
+    assert sequences == list(range(len(sequences)))
+    assert len(sequences) * 1024 + recorder.total_dropped == 8 * 1024
+
+def test_player_streams_every_block_in_order(device, monkeypatch):
+    sent = []
+    data_set = dwf.AnalogOutNodeDataSet
+    play_data = dwf.AnalogOutNodePlayData
+    def recording_data_set(hdwf, channel, node, samples, count = None):
+        sent.append(list(memoryview(samples).cast('B').cast('d')[:count]))
+        return data_set(hdwf, channel, node, samples, count)
+    def recording_play_data(hdwf, channel, node, samples, count):
+        sent.append(list(samples[:count]))
+        return play_data(hdwf, channel, node, samples, count)
+    monkeypatch.setattr(dwf, 'AnalogOutNodeDataSet', recording_data_set)
+    monkeypatch.setattr(dwf, 'AnalogOutNodePlayData', recording_play_data)
+    waveform_generator = device.acquire_waveform_generator()
+    blocks = ([ (index * 3000 + sample) / 1e5 for sample in range(3000) ] for index in range(30))
+    underruns = []
+    player = waveform_generator.play(0, blocks, 1e6, 1.0, underrun_callback = underruns.append)
+    with player:
+        assert player.wait(5) == True
+    assert player.samples_sent == 90000
+    assert [ sample for each_call in sent for sample in each_call ] == [ sample / 1e5 for sample in range(90000) ]
+    assert player.total_lost == sum(underruns)
+
+def test_player_pads_a_short_waveform(device):
+    waveform_generator = device.acquire_waveform_generator()
+    player = waveform_generator.play(0, [[0.1] * 5], 1e6, 1.0)
+    with player:
+        assert player.wait(5) == True
+    assert player.samples_sent == 5
+
+def test_player_reads_its_source_without_holding_the_lock(device):
+    waveform_generator = device.acquire_waveform_generator()
+    source_waiting = threading.Event()
+    source_resume = threading.Event()
+    def blocks():
+        yield [0.1] * 40000
+        source_waiting.set()
+        source_resume.wait(5)
+        yield [0.2] * 1000
+    def configure():
+        with device.configure():
+            pass
+    player = waveform_generator.play(0, blocks(), 1e6, 1.0)
+    with player:
+        assert source_waiting.wait(5)
+        configured = threading.Thread(target = configure)
+        configured.start()
+        configured.join(2)
+        source_resume.set()
+        assert not configured.is_alive()
+    assert player.samples_sent == 41000
@@ -0,0 +1,51 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2021 Charles Armstrap <charles@armstrap.org>
+# If you like this library, consider donating to: https://bit.ly/armstrap-opensource-dev
+# Anything helps.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pytest
+import dwf
+
+def test_identical_waveform_is_uploaded_once(device, monkeypatch):
+    uploads = []
+    data_set = dwf.AnalogOutNodeDataSet
+    monkeypatch.setattr(dwf, 'AnalogOutNodeDataSet', lambda *args: (uploads.append(args), data_set(*args))[1])
+    waveform_generator = device.acquire_waveform_generator()
+    samples = [0.0, 0.5, 1.0, 0.5] * 64
+    assert waveform_generator.upload_waveform(0, samples) == True
+    assert waveform_generator.upload_waveform(0, list(samples)) == False
+    assert waveform_generator.upload_waveform(0, samples[::-1]) == True
+    assert len(uploads) == 2
+
+def test_upload_waveform_restores_the_custom_function(device):
+    waveform_generator = device.acquire_waveform_generator()
+    samples = [0.0, 0.5, 1.0, 0.5] * 64
+    assert waveform_generator.upload_waveform(0, samples) == True
+    waveform_generator.configure_channel(0, dwf.Function.SINE, 1e3, 1.0)
+    assert waveform_generator.upload_waveform(0, samples) == False
+    assert dwf.AnalogOutNodeFunctionGet(device.hdwf, 0, dwf.AnalogOutNode.CARRIER) == dwf.Function.CUSTOM
+
+def test_upload_waveform_checks_the_length(device):
+    waveform_generator = device.acquire_waveform_generator()
+    samples_min, samples_max = dwf.AnalogOutNodeDataInfo(device.hdwf, 0, dwf.AnalogOutNode.CARRIER)
+    with pytest.raises(ValueError):
+        waveform_generator.upload_waveform(0, [0.0] * (samples_max + 1))